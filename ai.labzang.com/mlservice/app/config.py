@@ -1,8 +1,15 @@
 """
 Titanic Service 설정
+
+다른 모듈은 get_config() 로 프로세스에 하나인 설정을 읽습니다.
 """
+import logging
+from functools import lru_cache
+
 from common.config import BaseServiceConfig
 
+logger = logging.getLogger(__name__)
+
 
 class TitanicServiceConfig(BaseServiceConfig):
     """타이타닉 서비스 설정"""
@@ -10,7 +17,49 @@ class TitanicServiceConfig(BaseServiceConfig):
     service_version: str = "1.0.0"
     port: int = 9010
     
+    # NLP 스트리밍 요청 본문 설정
+    nlp_max_body_bytes: int = 64 * 1024 * 1024  # 요청 본문 최대 크기 (bytes)
+    nlp_token_chunk_size: int = 10000  # 한 번에 처리하는 토큰 수
+    nlp_stream_root: str = ""  # 스트리밍 빈도 분석을 허용하는 디렉토리 루트 (비어 있으면 app/nlp/data)
+    
+    # 타이타닉 제출 파일 보존 정책
+    submission_max_artifacts: int = 20  # 남겨 둘 최대 제출 파일 수
+    submission_max_age_days: float = 7  # 이 기간 동안 사용되지 않은 제출 파일은 삭제
+    
+    # 타이타닉 모델 레지스트리 보존 정책 (모델 이름별로 현재 버전 외에 남겨 둘 최근 버전 수, 0 이하이면 삭제하지 않음)
+    registry_keep_versions: int = 5
+    registry_prune_grace_seconds: float = 600  # 현재 버전에서 밀려난 버전을 삭제하지 않고 남겨 두는 시간 (초)
+    
+    # 서울 범죄 지오코딩 캐시 유지 기간
+    geocode_cache_ttl_days: float = 90  # 검색 결과가 있는 항목
+    geocode_negative_ttl_hours: float = 24  # 검색 결과가 없는 항목
+    
+    # 서울 범죄 지오코딩 요청 설정
+    geocode_concurrency: int = 8  # 최대 동시 요청 수
+    geocode_rate_limit: float = 20.0  # 초당 최대 요청 수 (0 이하이면 제한 없음)
+    geocode_timeout_seconds: float = 5.0  # 요청 하나의 시간 제한
+    geocode_max_retries: int = 3  # 429/5xx/연결 오류 최대 재시도 횟수
+    
+    # 서울 범죄 데이터(crime.csv) 변경 확인 간격 (초, 0이면 매 조회마다 확인)
+    crime_data_check_seconds: float = 1.0
+    
     class Config:
         env_file = ".env"
         case_sensitive = False
 
+
+@lru_cache(maxsize=1)
+def get_config() -> TitanicServiceConfig:
+    """
+    프로세스 공용 설정 (처음 호출할 때 한 번 읽음)
+
+    환경 변수나 .env 값이 올바르지 않으면 경고를 남기고 기본값 설정을 반환합니다.
+
+    Returns:
+        TitanicServiceConfig 객체
+    """
+    try:
+        return TitanicServiceConfig()
+    except Exception as e:
+        logger.warning(f"설정을 읽지 못해 기본값을 사용합니다: {e}")
+        return TitanicServiceConfig.model_construct()
@@ -98,7 +98,8 @@ async def get_heatmap_data():
             data={
                 "districts": data_dict,
                 "total_count": len(data_dict),
-                "columns": list(heatmap_data.columns)
+                "columns": list(heatmap_data.columns),
+                "data_version": service.data_version
             },
             message="히트맵 데이터 조회 완료"
         )
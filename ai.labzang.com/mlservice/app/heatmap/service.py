@@ -14,6 +14,9 @@ import seaborn as sns
 from io import BytesIO
 import base64
 
+from app.seoul_crime.crime_aggregation import CRIME_TYPES
+from app.seoul_crime.crime_repository import CrimeSnapshot, get_repository
+
 # 공통 모듈 경로 추가
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
@@ -24,9 +27,6 @@ except ImportError:
     import logging
     logger = logging.getLogger("seoul_crime_heatmap_service")
 
-# CSV 파일 경로
-CRIME_CSV_PATH = Path(__file__).parent.parent / "seoul_crime" / "save" / "crime.csv"
-
 # 한글 폰트 설정 (matplotlib)
 import platform
 def setup_korean_font():
@@ -70,24 +70,32 @@ class SeoulCrimeHeatmapService:
     def __init__(self):
         """서비스 초기화"""
         self.crime_data: Optional[pd.DataFrame] = None
+        self.data_version: Optional[int] = None  # crime_data 스냅샷 버전
+        self._snapshot: Optional[CrimeSnapshot] = None
         self.heatmap_data: Optional[pd.DataFrame] = None
         logger.info("SeoulCrimeHeatmapService 초기화 완료")
     
     def load_crime_data(self) -> pd.DataFrame:
         """
-        범죄 데이터 CSV 파일 로드
+        범죄 데이터 로드 (공유 읽기 전용 스냅샷)
+        
+        crime.csv 가 바뀌어 스냅샷 버전이 올라가면 이전 버전으로 만든 히트맵 데이터를 지웁니다.
         
         Returns:
             pd.DataFrame: 범죄 데이터
         """
-        if self.crime_data is None:
-            try:
-                logger.info(f"범죄 데이터 로드 중: {CRIME_CSV_PATH}")
-                self.crime_data = pd.read_csv(CRIME_CSV_PATH, encoding='utf-8')
-                logger.info(f"범죄 데이터 로드 완료: {len(self.crime_data)}개 관서")
-            except Exception as e:
-                logger.error(f"범죄 데이터 로드 실패: {e}")
-                raise
+        try:
+            snapshot = get_repository().snapshot()
+        except Exception as e:
+            logger.error(f"범죄 데이터 로드 실패: {e}")
+            raise
+        if snapshot.version != self.data_version:
+            if self.data_version is not None:
+                logger.info(f"범죄 데이터 갱신: v{self.data_version} → v{snapshot.version}")
+            self._snapshot = snapshot
+            self.crime_data = snapshot.table
+            self.data_version = snapshot.version
+            self.heatmap_data = None
         return self.crime_data
     
     def parse_number(self, value: Any) -> int:
@@ -113,48 +121,16 @@ class SeoulCrimeHeatmapService:
         Returns:
             pd.DataFrame: 자치구별 범죄 발생 건수 (범죄 유형별)
         """
-        crime_df = self.load_crime_data()
-        
-        # 범죄 유형별 컬럼명 매핑
-        crime_types = {
-            '살인': '살인 발생',
-            '강도': '강도 발생',
-            '강간': '강간 발생',
-            '절도': '절도 발생',
-            '폭력': '폭력 발생'
-        }
-        
-        # 자치구별로 범죄 발생 건수 집계
-        district_crimes = {}
+        self.load_crime_data()
         
-        for _, row in crime_df.iterrows():
-            district = row['자치구']
-            if pd.isna(district):
-                continue
-            
-            if district not in district_crimes:
-                district_crimes[district] = {
-                    '살인': 0,
-                    '강도': 0,
-                    '강간': 0,
-                    '절도': 0,
-                    '폭력': 0
-                }
-            
-            # 각 범죄 유형별로 합산
-            for crime_type, column_name in crime_types.items():
-                district_crimes[district][crime_type] += self.parse_number(row[column_name])
-        
-        # DataFrame으로 변환
-        data_list = []
-        for district, crimes in district_crimes.items():
-            row = {'자치구': district}
-            row.update(crimes)
-            # 전체 범죄 건수 계산
-            row['범죄'] = sum(crimes.values())
-            data_list.append(row)
+        # 스냅샷에서 한 번 계산한 자치구별 범죄 유형별 발생 건수 사용
+        district_crimes = self._snapshot.districts
+        result_df = district_crimes[['자치구'] + [f'{crime_type} 발생' for crime_type in CRIME_TYPES]].rename(
+            columns={f'{crime_type} 발생': crime_type for crime_type in CRIME_TYPES}
+        )
+        # 전체 범죄 건수
+        result_df = result_df.assign(범죄=district_crimes['범죄건수'])
         
-        result_df = pd.DataFrame(data_list)
         logger.info(f"자치구별 범죄 데이터 집계 완료: {len(result_df)}개 자치구")
         return result_df
     
@@ -196,6 +172,7 @@ class SeoulCrimeHeatmapService:
         Returns:
             pd.DataFrame: 히트맵용 데이터 (자치구별 정규화된 범죄 비율)
         """
+        self.load_crime_data()
         if self.heatmap_data is not None:
             return self.heatmap_data
         
@@ -330,6 +307,8 @@ class SeoulCrimeHeatmapService:
     def reset(self) -> None:
         """서비스 상태 초기화"""
         self.crime_data = None
+        self.data_version = None
+        self._snapshot = None
         self.heatmap_data = None
         logger.info("서비스 상태 초기화 완료")
 
@@ -104,7 +104,8 @@ async def get_crime_data():
             data={
                 "districts": data_dict,
                 "total_count": len(data_dict),
-                "average": float(average)
+                "average": float(average),
+                "data_version": service.data_version
             },
             message="서울 범죄 데이터 조회 완료"
         )
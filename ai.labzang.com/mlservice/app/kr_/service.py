@@ -9,6 +9,8 @@ import pandas as pd
 import folium
 import json
 
+from app.seoul_crime.crime_repository import CrimeSnapshot, get_repository
+
 # 공통 모듈 경로 추가
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
@@ -19,8 +21,7 @@ except ImportError:
     import logging
     logger = logging.getLogger("seoul_crime_map_service")
 
-# CSV 파일 경로
-CRIME_CSV_PATH = Path(__file__).parent.parent / "seoul_crime" / "save" / "crime.csv"
+# GeoJSON 파일 경로 (범죄 데이터는 crime_repository 의 공유 스냅샷 사용)
 GEOJSON_PATH = Path(__file__).parent.parent / "seoul_crime" / "data" / "kr-state.json"
 
 # 서울 중심 좌표
@@ -34,6 +35,8 @@ class SeoulCrimeMapService:
     def __init__(self):
         """서비스 초기화"""
         self.crime_data: Optional[pd.DataFrame] = None
+        self.data_version: Optional[int] = None  # crime_data 스냅샷 버전
+        self._snapshot: Optional[CrimeSnapshot] = None
         self.geo_data: Optional[Dict[str, Any]] = None
         self.district_crime_data: Optional[pd.DataFrame] = None
         self.map: Optional[folium.Map] = None
@@ -41,19 +44,25 @@ class SeoulCrimeMapService:
     
     def load_crime_data(self) -> pd.DataFrame:
         """
-        범죄 데이터 CSV 파일 로드
+        범죄 데이터 로드 (공유 읽기 전용 스냅샷)
+        
+        crime.csv 가 바뀌어 스냅샷 버전이 올라가면 이전 버전으로 만든 집계를 지웁니다.
         
         Returns:
             pd.DataFrame: 범죄 데이터
         """
-        if self.crime_data is None:
-            try:
-                logger.info(f"범죄 데이터 로드 중: {CRIME_CSV_PATH}")
-                self.crime_data = pd.read_csv(CRIME_CSV_PATH, encoding='utf-8')
-                logger.info(f"범죄 데이터 로드 완료: {len(self.crime_data)}개 관서")
-            except Exception as e:
-                logger.error(f"범죄 데이터 로드 실패: {e}")
-                raise
+        try:
+            snapshot = get_repository().snapshot()
+        except Exception as e:
+            logger.error(f"범죄 데이터 로드 실패: {e}")
+            raise
+        if snapshot.version != self.data_version:
+            if self.data_version is not None:
+                logger.info(f"범죄 데이터 갱신: v{self.data_version} → v{snapshot.version}")
+            self._snapshot = snapshot
+            self.crime_data = snapshot.table
+            self.data_version = snapshot.version
+            self.district_crime_data = None
         return self.crime_data
     
     def load_geo_data(self) -> Dict[str, Any]:
@@ -97,57 +106,12 @@ class SeoulCrimeMapService:
         Returns:
             pd.DataFrame: 자치구별 범죄 발생 건수 및 검거 건수
         """
+        self.load_crime_data()
         if self.district_crime_data is not None:
             return self.district_crime_data
         
-        crime_df = self.load_crime_data()
-        
-        # 자치구별로 범죄 발생 건수 및 검거 건수 합산
-        district_crimes = {}
-        
-        for _, row in crime_df.iterrows():
-            district = row['자치구']
-            if pd.isna(district):
-                continue
-            
-            # 범죄 발생 건수 합산
-            total_crimes = (
-                self.parse_number(row['살인 발생']) +
-                self.parse_number(row['강도 발생']) +
-                self.parse_number(row['강간 발생']) +
-                self.parse_number(row['절도 발생']) +
-                self.parse_number(row['폭력 발생'])
-            )
-            
-            # 검거 건수 합산
-            total_arrests = (
-                self.parse_number(row['살인 검거']) +
-                self.parse_number(row['강도 검거']) +
-                self.parse_number(row['강간 검거']) +
-                self.parse_number(row['절도 검거']) +
-                self.parse_number(row['폭력 검거'])
-            )
-            
-            if district not in district_crimes:
-                district_crimes[district] = {'범죄건수': 0, '검거건수': 0}
-            district_crimes[district]['범죄건수'] += total_crimes
-            district_crimes[district]['검거건수'] += total_arrests
-        
-        # DataFrame으로 변환
-        data_list = []
-        for district, data in district_crimes.items():
-            crime_count = data['범죄건수']
-            arrest_count = data['검거건수']
-            # 검거율 계산 (발생 건수가 0이면 0%)
-            arrest_rate = (arrest_count / crime_count * 100) if crime_count > 0 else 0.0
-            data_list.append({
-                '자치구': district,
-                '범죄건수': crime_count,
-                '검거건수': arrest_count,
-                '검거율': arrest_rate
-            })
-        
-        self.district_crime_data = pd.DataFrame(data_list)
+        # 스냅샷에서 한 번 계산한 자치구별 발생/검거 건수와 검거율 사용
+        self.district_crime_data = self._snapshot.districts[['자치구', '범죄건수', '검거건수', '검거율']].copy()
         
         logger.info(f"자치구별 범죄 데이터 집계 완료: {len(self.district_crime_data)}개 자치구")
         return self.district_crime_data
@@ -536,6 +500,8 @@ class SeoulCrimeMapService:
     def reset(self) -> None:
         """서비스 상태 초기화"""
         self.crime_data = None
+        self.data_version = None
+        self._snapshot = None
         self.geo_data = None
         self.district_crime_data = None
         self.map = None
@@ -1,6 +1,7 @@
 """
 Titanic Service - FastAPI 애플리케이션
 """
+import importlib
 import sys
 import csv
 import os
@@ -8,32 +9,8 @@ from pathlib import Path
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
-try:
-    from app.seoul_crime.seoul_router import router as seoul_router
-except ImportError:
-    seoul_router = None
-
-try:
-    from app.us_unemployment.router import router as usa_router
-except ImportError:
-    usa_router = None
-
-try:
-    from app.kr_.router import router as kr_router
-except ImportError:
-    kr_router = None
-
-try:
-    from app.heatmap.router import router as heatmap_router
-except ImportError:
-    heatmap_router = None
-
-try:
-    from app.nlp.nlp_router import router as nlp_router
-except ImportError:
-    nlp_router = None
-
-# 공통 모듈 경로 추가 (최우선)
+
+# 공통 모듈 경로 추가 (최우선, 라우터 import 전)
 current_file = Path(__file__).resolve()
 base_dir = current_file.parent.parent  # /app (Docker) 또는 mlservice (로컬)
 
@@ -47,35 +24,33 @@ if os.path.exists("/app"):
     if "/app" not in sys.path:
         sys.path.insert(0, "/app")
 
-# 설정 로드 (경로 설정 후)
-try:
-    from app.config import TitanicServiceConfig
-    config = TitanicServiceConfig()
-except Exception as e:
-    # config.py를 찾을 수 없는 경우 기본값 사용
-    class Config:
-        service_name = "mlservice"
-        service_version = "1.0.0"
-        port = 9010
-    config = Config()
-
-# 라우터 및 공통 모듈 import
-LoggingMiddleware = None
-try:
-    from app.titanic.titanic_router import router as titanic_router
-    from common.middleware import LoggingMiddleware
-    from common.utils import setup_logging
-except ImportError as e:
-    # 모듈을 찾을 수 없는 경우 기본값 사용
-    from fastapi import APIRouter
-    titanic_router = APIRouter()
-    def setup_logging(name):
-        import logging
-        return logging.getLogger(name)
+# 설정 및 공통 모듈 (모든 라우터가 사용하므로 찾을 수 없으면 시작하지 않음)
+from app.config import get_config
+from common.middleware import LoggingMiddleware
+from common.utils import setup_logging
+from app.titanic.titanic_router import router as titanic_router
+
+config = get_config()
 
 # 로깅 설정
 logger = setup_logging(config.service_name)
 
+
+def _optional_router(module: str):
+    """선택 라우터 import (의존 패키지가 없으면 이유를 남기고 건너뜀)"""
+    try:
+        return importlib.import_module(module).router
+    except ImportError as e:
+        logger.warning(f"{module} 라우터를 불러오지 못해 제외합니다: {e}")
+        return None
+
+
+seoul_router = _optional_router("app.seoul_crime.seoul_router")
+usa_router = _optional_router("app.us_unemployment.router")
+kr_router = _optional_router("app.kr_.router")
+heatmap_router = _optional_router("app.heatmap.router")
+nlp_router = _optional_router("app.nlp.nlp_router")
+
 # FastAPI 앱 생성
 app = FastAPI(
     title="Titanic Service API",
@@ -164,8 +139,7 @@ app.add_middleware(
 )
 
 # 미들웨어 추가
-if LoggingMiddleware is not None:
-    app.add_middleware(LoggingMiddleware)
+app.add_middleware(LoggingMiddleware)
 
 app.include_router(titanic_router, prefix="/titanic")
 if seoul_router is not None:
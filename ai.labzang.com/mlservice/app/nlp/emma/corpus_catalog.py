@@ -0,0 +1,242 @@
+"""
+NLTK 말뭉치 통계 카탈로그
+
+말뭉치의 파일별 어휘 통계(토큰 수, 어휘 크기, 어휘 다양성, 상위 단어,
+문장 수, 평균 문장 길이)를 프로세스 풀로 병렬 계산하여 JSON으로 저장합니다.
+말뭉치 파일의 크기/수정 시각 지문(fingerprint)이 바뀐 경우에만 다시 계산합니다.
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import nltk
+from nltk import FreqDist
+from nltk.tokenize import RegexpTokenizer, sent_tokenize
+
+logger = logging.getLogger(__name__)
+
+# 카탈로그 저장 위치 (워드클라우드와 같은 save 폴더)
+CATALOG_DIR = Path(__file__).resolve().parent.parent / "save" / "corpus_stats"
+
+# 파일별 상위 단어 개수 기본값
+DEFAULT_TOP_N = 20
+
+
+def _file_signature(corpus, fileid: str) -> Dict[str, Any]:
+    """
+    말뭉치 파일의 크기와 수정 시각 반환
+
+    zip으로 배포된 말뭉치는 개별 파일 대신 zip 파일의 정보를 사용합니다.
+    """
+    pointer = corpus.abspath(fileid)
+    zipfile = getattr(pointer, "zipfile", None)
+    path = zipfile.filename if zipfile is not None else str(pointer)
+    stat = os.stat(path)
+    return {"fileid": fileid, "size": stat.st_size, "mtime": stat.st_mtime_ns}
+
+
+def _compute_file_stats(corpus_name: str, fileid: str, top_n: int) -> Dict[str, Any]:
+    """
+    말뭉치 파일 하나의 통계 계산 (프로세스 풀 작업 함수)
+
+    Args:
+        corpus_name: 말뭉치 이름
+        fileid: 파일 ID
+        top_n: 반환할 상위 단어 개수
+
+    Returns:
+        파일 통계 딕셔너리
+    """
+    corpus = getattr(nltk.corpus, corpus_name)
+    raw_text = corpus.raw(fileid)
+
+    tokens = RegexpTokenizer(r"[\w]+").tokenize(raw_text)
+    freqdist = FreqDist(tokens)
+    sentence_count = len(sent_tokenize(raw_text))
+
+    token_count = len(tokens)
+    vocabulary_size = len(freqdist)
+    return {
+        "fileid": fileid,
+        "token_count": token_count,
+        "vocabulary_size": vocabulary_size,
+        "lexical_diversity": vocabulary_size / token_count if token_count else 0.0,
+        "sentence_count": sentence_count,
+        "avg_sentence_length": token_count / sentence_count if sentence_count else 0.0,
+        "top_words": [{"word": w, "count": c} for w, c in freqdist.most_common(top_n)],
+    }
+
+
+class CorpusCatalog:
+    """
+    말뭉치 통계 카탈로그
+
+    계산 결과는 말뭉치별 JSON 파일로 저장되며, 조회 시에는 파일 지문만
+    비교하므로 말뭉치가 바뀌지 않았다면 즉시 반환됩니다.
+    """
+
+    def __init__(self, catalog_dir: Optional[Path] = None, max_workers: Optional[int] = None):
+        """
+        CorpusCatalog 초기화
+
+        Args:
+            catalog_dir: 카탈로그 저장 폴더 (기본값: app/nlp/save/corpus_stats)
+            max_workers: 프로세스 풀 크기 (기본값: CPU 코어 수)
+        """
+        self.catalog_dir = Path(catalog_dir) if catalog_dir else CATALOG_DIR
+        self.max_workers = max_workers
+        self._catalogs: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._building: set = set()
+
+    def _catalog_path(self, corpus_name: str) -> Path:
+        return self.catalog_dir / f"{corpus_name}.json"
+
+    def fingerprint(self, corpus_name: str) -> str:
+        """
+        말뭉치 파일 목록, 크기, 수정 시각으로 만든 지문 반환
+
+        Args:
+            corpus_name: 말뭉치 이름
+
+        Returns:
+            sha1 지문 문자열
+        """
+        corpus = getattr(nltk.corpus, corpus_name, None)
+        if corpus is None:
+            raise ValueError(f"알 수 없는 말뭉치입니다: {corpus_name}")
+        signatures = [_file_signature(corpus, fileid) for fileid in corpus.fileids()]
+        payload = json.dumps(signatures, sort_keys=True).encode("utf-8")
+        return hashlib.sha1(payload).hexdigest()
+
+    def load(self, corpus_name: str) -> Optional[Dict[str, Any]]:
+        """
+        저장된 카탈로그 반환 (메모리 → 디스크 순서로 조회)
+
+        Args:
+            corpus_name: 말뭉치 이름
+
+        Returns:
+            카탈로그 딕셔너리 또는 None
+        """
+        catalog = self._catalogs.get(corpus_name)
+        if catalog is not None:
+            return catalog
+
+        path = self._catalog_path(corpus_name)
+        if not path.exists():
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            catalog = json.load(f)
+        self._catalogs[corpus_name] = catalog
+        return catalog
+
+    def is_fresh(self, corpus_name: str, catalog: Optional[Dict[str, Any]] = None) -> bool:
+        """카탈로그가 현재 말뭉치 파일과 일치하는지 확인"""
+        catalog = catalog if catalog is not None else self.load(corpus_name)
+        if catalog is None:
+            return False
+        return catalog.get("fingerprint") == self.fingerprint(corpus_name)
+
+    def build(self, corpus_name: str, top_n: int = DEFAULT_TOP_N) -> Dict[str, Any]:
+        """
+        말뭉치 전체 파일의 통계를 프로세스 풀로 계산하여 저장
+
+        Args:
+            corpus_name: 말뭉치 이름
+            top_n: 파일별 상위 단어 개수
+
+        Returns:
+            새로 계산된 카탈로그 딕셔너리
+        """
+        corpus = getattr(nltk.corpus, corpus_name, None)
+        if corpus is None:
+            raise ValueError(f"알 수 없는 말뭉치입니다: {corpus_name}")
+
+        fingerprint = self.fingerprint(corpus_name)
+        fileids = corpus.fileids()
+        logger.info(f"말뭉치 통계 계산 시작: {corpus_name} ({len(fileids)}개 파일)")
+
+        started = datetime.now()
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            files = list(executor.map(
+                _compute_file_stats,
+                [corpus_name] * len(fileids),
+                fileids,
+                [top_n] * len(fileids),
+            ))
+        elapsed = (datetime.now() - started).total_seconds()
+
+        catalog = {
+            "corpus_name": corpus_name,
+            "fingerprint": fingerprint,
+            "top_n": top_n,
+            "file_count": len(files),
+            "built_at": datetime.now().isoformat(),
+            "build_seconds": elapsed,
+            "files": files,
+        }
+
+        # 임시 파일에 쓴 뒤 교체하여 읽는 쪽이 반쯤 쓰인 파일을 보지 않도록 함
+        self.catalog_dir.mkdir(parents=True, exist_ok=True)
+        path = self._catalog_path(corpus_name)
+        tmp_path = path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(catalog, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+        self._catalogs[corpus_name] = catalog
+        logger.info(f"말뭉치 통계 계산 완료: {corpus_name} ({elapsed:.2f}초)")
+        return catalog
+
+    def refresh(self, corpus_name: str, top_n: int = DEFAULT_TOP_N) -> Dict[str, Any]:
+        """
+        말뭉치가 바뀐 경우에만 카탈로그를 다시 계산
+
+        같은 말뭉치에 대한 계산이 이미 진행 중이면 기존 카탈로그를 반환합니다.
+
+        Args:
+            corpus_name: 말뭉치 이름
+            top_n: 파일별 상위 단어 개수
+
+        Returns:
+            최신 카탈로그 딕셔너리
+        """
+        catalog = self.load(corpus_name)
+        if catalog is not None and catalog.get("top_n", 0) >= top_n and self.is_fresh(corpus_name, catalog):
+            return catalog
+
+        with self._lock:
+            if corpus_name in self._building and catalog is not None:
+                return catalog
+            self._building.add(corpus_name)
+        try:
+            return self.build(corpus_name, top_n)
+        finally:
+            with self._lock:
+                self._building.discard(corpus_name)
+
+    def get_file_stats(self, corpus_name: str, fileid: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        저장된 카탈로그에서 파일 통계 조회
+
+        Args:
+            corpus_name: 말뭉치 이름
+            fileid: 파일 ID (None이면 전체 파일)
+
+        Returns:
+            파일 통계 리스트
+        """
+        catalog = self.load(corpus_name)
+        if catalog is None:
+            return []
+        files = catalog.get("files", [])
+        if fileid is None:
+            return files
+        return [f for f in files if f["fileid"] == fileid]
@@ -18,11 +18,14 @@ from nltk.tokenize import sent_tokenize, word_tokenize, RegexpTokenizer
 from nltk.stem import PorterStemmer, LancasterStemmer, WordNetLemmatizer
 from nltk.tag import pos_tag, untag
 from nltk import Text, FreqDist
-from wordcloud import WordCloud
 import matplotlib.pyplot as plt
 import os
 from pathlib import Path
 from datetime import datetime
+from app.nlp.emma.corpus_catalog import CorpusCatalog, DEFAULT_TOP_N
+from app.nlp.emma.stream_counter import StreamingFreqDistJob, StreamingFreqDistResult, get_job_status
+from app.nlp.emma.wordcloud_pool import WordCloudRendererPool
+import threading
 
 
 class NLPService:
@@ -60,6 +63,16 @@ class NLPService:
         
         # Text 객체 저장용
         self.text_objects = {}
+        
+        # 말뭉치 통계 카탈로그
+        self.corpus_catalog = CorpusCatalog()
+        
+        # 실행 중인 스트리밍 빈도 분석 작업 ID
+        self._running_stream_jobs = set()
+        self._stream_jobs_lock = threading.Lock()
+        
+        # 글꼴을 미리 읽어 둔 워드클라우드 렌더러 풀
+        self.wordcloud_pool = WordCloudRendererPool()
     
     # *********
     # 말뭉치 관련 메서드
@@ -105,6 +118,22 @@ class NLPService:
         """
         return self.get_corpus_raw("gutenberg", "austen-emma.txt")
     
+    def get_corpus_stats(self, corpus_name: str = "gutenberg", top_n: int = DEFAULT_TOP_N):
+        """
+        말뭉치 파일별 통계 카탈로그 반환
+        
+        말뭉치 파일이 바뀌지 않았다면 저장된 카탈로그를 그대로 반환하고,
+        바뀐 경우에만 프로세스 풀로 다시 계산합니다.
+        
+        Args:
+            corpus_name: 말뭉치 이름 (기본값: "gutenberg")
+            top_n: 파일별 상위 단어 개수
+            
+        Returns:
+            카탈로그 딕셔너리
+        """
+        return self.corpus_catalog.refresh(corpus_name, top_n)
+    
     # ************
     # 토큰 생성 메서드
     # ************
@@ -399,6 +428,67 @@ class NLPService:
         
         return self.create_freqdist(names_list)
     
+    def create_streaming_freqdist_job(self, directory: str, mode: str = "words", **options):
+        """
+        디렉토리 단위 스트리밍 빈도 분석 작업 생성
+        
+        텍스트 전체를 메모리에 올리지 않고 청크 단위로 집계하므로
+        create_freqdist / extract_names_from_corpus 로 처리할 수 없는 대용량 데이터에 사용합니다.
+        
+        Args:
+            directory: 분석할 텍스트 파일 디렉토리 (허용 루트 기준 경로)
+            mode: "words"(전체 단어) 또는 "names"(고유명사)
+            **options: pattern, chunk_bytes, stopwords, max_workers
+            
+        Returns:
+            StreamingFreqDistJob 객체
+        """
+        return StreamingFreqDistJob(directory, mode=mode, **options)
+    
+    def run_streaming_freqdist_job(self, job: StreamingFreqDistJob):
+        """
+        스트리밍 빈도 분석 작업 실행 (같은 작업이 실행 중이면 무시)
+        
+        Args:
+            job: StreamingFreqDistJob 객체
+            
+        Returns:
+            작업 상태 딕셔너리 (이미 실행 중이면 None)
+        """
+        with self._stream_jobs_lock:
+            if job.job_id in self._running_stream_jobs:
+                return None
+            self._running_stream_jobs.add(job.job_id)
+        try:
+            return job.run()
+        finally:
+            with self._stream_jobs_lock:
+                self._running_stream_jobs.discard(job.job_id)
+    
+    def get_streaming_freqdist_status(self, job_id: str):
+        """
+        스트리밍 빈도 분석 작업 상태 반환
+        
+        Args:
+            job_id: 작업 ID
+            
+        Returns:
+            작업 상태 딕셔너리 또는 None
+        """
+        return get_job_status(job_id)
+    
+    def get_streaming_freqdist(self, job_id: str):
+        """
+        완료된 스트리밍 빈도 분석 결과 반환
+        
+        Args:
+            job_id: 작업 ID
+            
+        Returns:
+            StreamingFreqDistResult 객체
+        """
+        return StreamingFreqDistResult(job_id)
+    
     def get_word_stats(self, freqdist, word: str):
         """
         단어 통계 정보 반환
@@ -429,6 +519,118 @@ class NLPService:
     # 워드클라우드 메서드
     # ***********
     
+    def _wordcloud_filepath(self, filename: str = None, save_path: str = None):
+        """워드클라우드 저장 경로 생성 (save 폴더가 없으면 생성)"""
+        if save_path is None:
+            # 현재 파일의 위치를 기준으로 save 폴더 찾기
+            current_file = Path(__file__).resolve()
+            save_dir = current_file.parent.parent / "save"
+        else:
+            save_dir = Path(save_path)
+        
+        save_dir.mkdir(parents=True, exist_ok=True)
+        
+        if filename is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"wordcloud_{timestamp}.png"
+        elif not filename.endswith('.png'):
+            filename = f"{filename}.png"
+        
+        return save_dir / filename
+    
+    def render_wordcloud(self, freqdist, quality: str = "full", font: str = "auto",
+                         width: int = 1000, height: int = 600,
+                         background_color: str = "white", random_state: int = 0,
+                         filename: str = None, save_path: str = None, save: bool = True):
+        """
+        렌더러 풀을 사용한 워드클라우드 생성
+        
+        Args:
+            freqdist: FreqDist 객체
+            quality: 품질 단계 ("preview", "standard", "full")
+            font: 글꼴 이름 ("auto", "default", "d2coding")
+            width: 이미지 너비
+            height: 이미지 높이
+            background_color: 배경색
+            random_state: 랜덤 시드
+            filename: 저장할 파일명 (기본값: None, 자동 생성)
+            save_path: 저장할 폴더 경로 (기본값: None, app/nlp/save 사용)
+            save: 파일 저장 여부
+            
+        Returns:
+            wordcloud, tier, font, width, height, render_ms (저장 시 filepath) 딕셔너리
+        """
+        result = self.wordcloud_pool.render(
+            freqdist,
+            tier=quality,
+            font=font,
+            width=width,
+            height=height,
+            background_color=background_color,
+            random_state=random_state
+        )
+        if save:
+            filepath = self._wordcloud_filepath(filename, save_path)
+            result["wordcloud"].to_file(str(filepath))
+            result["filepath"] = str(filepath)
+        return result
+    
+    def render_wordcloud_progressive(self, freqdist, quality: str = "full", font: str = "auto",
+                                     width: int = 1000, height: int = 600,
+                                     background_color: str = "white", random_state: int = 0,
+                                     filename: str = None, save_path: str = None):
+        """
+        미리보기를 즉시 생성하고 요청한 품질의 렌더는 백그라운드에서 실행
+        
+        Args:
+            freqdist: FreqDist 객체
+            quality: 백그라운드 렌더 품질 단계
+            font: 글꼴 이름
+            width: 이미지 너비
+            height: 이미지 높이
+            background_color: 배경색
+            random_state: 랜덤 시드
+            filename: 백그라운드 렌더 결과 파일명
+            save_path: 저장할 폴더 경로
+            
+        Returns:
+            (미리보기 결과 딕셔너리, 백그라운드 렌더 ID) 튜플
+        """
+        options = dict(font=font, width=width, height=height,
+                       background_color=background_color, random_state=random_state)
+        preview = self.render_wordcloud(freqdist, quality="preview", save=False, **options)
+        
+        # 파일명은 등록 시점에 정해 두어 같은 초에 들어온 요청끼리 겹치지 않게 함
+        filepath = self._wordcloud_filepath(filename, save_path)
+        
+        def save_result(result):
+            result["wordcloud"].to_file(str(filepath))
+            return {"filepath": str(filepath)}
+        
+        render_id = self.wordcloud_pool.submit(freqdist, on_complete=save_result, tier=quality, **options)
+        return preview, render_id
+    
+    def get_wordcloud_render(self, render_id: str):
+        """
+        백그라운드 워드클라우드 렌더 상태 반환
+        
+        Args:
+            render_id: 렌더 ID
+            
+        Returns:
+            상태 딕셔너리 또는 None
+        """
+        return self.wordcloud_pool.get_render(render_id)
+    
+    def get_wordcloud_render_stats(self):
+        """
+        품질 단계별 워드클라우드 렌더 시간 통계 반환
+        
+        Returns:
+            단계 이름 → 통계 딕셔너리
+        """
+        return self.wordcloud_pool.stats()
+    
     def generate_wordcloud(self, freqdist, width: int = 1000, 
                           height: int = 600, background_color: str = "white",
                           random_state: int = 0, show: bool = True,
@@ -449,44 +651,24 @@ class NLPService:
         Returns:
             WordCloud 객체와 저장된 파일 경로 튜플 (filepath, WordCloud)
         """
-        wc = WordCloud(
-            width=width, 
-            height=height, 
-            background_color=background_color, 
-            random_state=random_state
+        result = self.render_wordcloud(
+            freqdist,
+            quality="full",
+            width=width,
+            height=height,
+            background_color=background_color,
+            random_state=random_state,
+            filename=filename,
+            save_path=save_path
         )
-        wc.generate_from_frequencies(freqdist)
-        
-        # 저장 경로 설정
-        if save_path is None:
-            # 현재 파일의 위치를 기준으로 save 폴더 찾기
-            current_file = Path(__file__).resolve()
-            save_dir = current_file.parent.parent / "save"
-        else:
-            save_dir = Path(save_path)
-        
-        # save 폴더가 없으면 생성
-        save_dir.mkdir(parents=True, exist_ok=True)
-        
-        # 파일명 생성
-        if filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"wordcloud_{timestamp}.png"
-        elif not filename.endswith('.png'):
-            filename = f"{filename}.png"
-        
-        # 전체 파일 경로
-        filepath = save_dir / filename
-        
-        # 이미지 저장
-        wc.to_file(str(filepath))
+        wc = result["wordcloud"]
         
         if show:
             plt.imshow(wc)
             plt.axis("off")
             plt.show()
         
-        return str(filepath), wc
+        return result["filepath"], wc
 
 
 # 사용 예제
@@ -0,0 +1,452 @@
+"""
+대용량 텍스트 스트리밍 빈도 분석 (Out-of-core map-reduce)
+
+수 GB 단위의 텍스트 디렉토리(크롤러 덤프 등)를 한 번에 메모리에 올리지 않고
+고정 크기 청크로 나누어 프로세스 풀에서 토큰화/집계(map)한 뒤,
+부분 집계를 트리 형태로 병합(reduce)합니다.
+
+- 청크/병합 결과는 작업 폴더에 체크포인트로 저장되어 중단된 작업을 이어서 실행할 수 있습니다.
+- 최종 FreqDist는 SQLite 파일로 저장되어 상위 단어/단어별 빈도를 바로 조회할 수 있습니다.
+- 분석할 디렉토리는 설정의 허용 루트(nlp_stream_root) 안에 있어야 하며, glob 패턴은 루트 밖을
+  가리킬 수 없습니다 (요청 본문으로 서버의 임의 파일을 읽지 못하게 함).
+"""
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from nltk.tag import pos_tag
+from nltk.tokenize import RegexpTokenizer
+
+from app.config import get_config
+
+logger = logging.getLogger(__name__)
+
+# 작업 폴더 위치
+JOBS_DIR = Path(__file__).resolve().parent.parent / "save" / "stream_jobs"
+
+# 분석을 허용하는 디렉토리 루트 (설정값이 비어 있으면 app/nlp/data)
+STREAM_ROOT = Path(get_config().nlp_stream_root or Path(__file__).resolve().parent.parent / "data")
+
+# 기본 청크 크기 (바이트)
+DEFAULT_CHUNK_BYTES = 32 * 1024 * 1024
+
+# 청크 경계를 맞출 때 한 번에 읽는 크기
+_BOUNDARY_READ = 4096
+
+# 청크 경계로 사용하는 ASCII 공백 (UTF-8 멀티바이트 문자의 일부가 될 수 없음)
+_WHITESPACE = frozenset(b" \t\n\r\x0b\x0c")
+
+DEFAULT_NAME_STOPWORDS = ["Mr.", "Mrs.", "Miss", "Mr", "Mrs", "Dear"]
+
+
+# ***********
+# 파일 입출력 헬퍼
+# ***********
+
+def _write_json_atomic(path: Path, payload: Any) -> None:
+    """임시 파일에 쓴 뒤 교체 (중단되어도 반쯤 쓰인 파일이 남지 않음)"""
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def _read_counter(path: Path) -> Counter:
+    with open(path, "r", encoding="utf-8") as f:
+        return Counter(json.load(f))
+
+
+def _resolve_directory(directory: str, pattern: str, root: Path) -> Path:
+    """
+    요청한 디렉토리/패턴을 허용 루트 안으로 제한
+
+    Args:
+        directory: 루트 기준 상대 경로 (루트 안의 절대 경로도 허용)
+        pattern: 대상 파일 glob 패턴
+        root: 허용 루트
+
+    Returns:
+        루트 안의 실제 디렉토리 경로
+
+    Raises:
+        ValueError: 루트 밖의 디렉토리, 절대 경로 패턴, '..' 이 들어간 패턴
+    """
+    parts = pattern.replace("\\", "/").split("/")
+    if not pattern or Path(pattern).is_absolute() or pattern.startswith(("/", "\\")) or ".." in parts:
+        raise ValueError(f"허용하지 않는 패턴입니다: {pattern}")
+    root = root.resolve()
+    resolved = (root / directory).resolve()
+    if not resolved.is_relative_to(root):
+        raise ValueError(f"허용된 루트 밖의 디렉토리입니다: {directory}")
+    return resolved
+
+
+def _seek_to_whitespace(f, limit: Optional[int] = None) -> None:
+    """파일 위치를 다음 공백 문자 다음으로 이동 (limit을 넘으면 중단)"""
+    while limit is None or f.tell() < limit:
+        block = f.read(_BOUNDARY_READ)
+        if not block:
+            return
+        for i, byte in enumerate(block):
+            if byte in _WHITESPACE:
+                f.seek(f.tell() - len(block) + i + 1)
+                return
+
+
+def _read_chunk(path: str, start: int, end: int) -> str:
+    """
+    [start, end) 구간을 토큰이 잘리지 않도록 공백 경계에 맞춰 읽기
+
+    start가 단어 중간이면 그 단어는 이전 청크의 몫이므로 건너뛰고,
+    end에서 끝나지 않은 단어는 이 청크에서 끝까지 읽습니다.
+    ASCII 공백에서만 자르므로 멀티바이트 문자도 잘리지 않습니다.
+    """
+    with open(path, "rb") as f:
+        if start > 0:
+            f.seek(start - 1)
+            if f.read(1)[0] not in _WHITESPACE:
+                _seek_to_whitespace(f, limit=end)
+        begin = f.tell()
+        if begin >= end:
+            return ""
+        data = bytearray(f.read(end - begin))
+        while data and data[-1] not in _WHITESPACE:
+            block = f.read(_BOUNDARY_READ)
+            if not block:
+                break
+            for i, byte in enumerate(block):
+                if byte in _WHITESPACE:
+                    data += block[:i]
+                    return data.decode("utf-8", errors="ignore")
+            data += block
+    return data.decode("utf-8", errors="ignore")
+
+
+# ***********
+# map / reduce 작업 함수 (프로세스 풀에서 실행)
+# ***********
+
+def _count_chunk(task: Dict[str, Any]) -> int:
+    """
+    청크 하나를 토큰화/집계하여 부분 결과 파일로 저장
+
+    Args:
+        task: 청크 정보 (index, path, start, end, mode, stopwords, output)
+
+    Returns:
+        처리한 청크 인덱스
+    """
+    text = _read_chunk(task["path"], task["start"], task["end"])
+    tokens = RegexpTokenizer(r"[\w]+").tokenize(text)
+
+    if task["mode"] == "names":
+        stopwords = set(task["stopwords"])
+        counts = Counter(
+            t[0] for t in pos_tag(tokens)
+            if t[1] == "NNP" and t[0] not in stopwords
+        )
+    else:
+        counts = Counter(tokens)
+
+    _write_json_atomic(Path(task["output"]), counts)
+    return task["index"]
+
+
+def _merge_partials(left: str, right: str, output: str) -> str:
+    """부분 집계 파일 두 개를 병합하여 저장"""
+    counts = _read_counter(Path(left))
+    counts.update(_read_counter(Path(right)))
+    _write_json_atomic(Path(output), counts)
+    return output
+
+
+# ***********
+# 스트리밍 빈도 분석 작업
+# ***********
+
+class StreamingFreqDistJob:
+    """
+    디렉토리 단위 스트리밍 빈도 분석 작업
+
+    같은 (디렉토리, 모드, 청크 크기, 불용어) 조합은 같은 작업 ID를 가지므로,
+    다시 실행하면 저장된 체크포인트부터 이어서 진행합니다.
+    """
+
+    def __init__(self, directory: str, mode: str = "words", pattern: str = "**/*",
+                 chunk_bytes: int = DEFAULT_CHUNK_BYTES, stopwords: Optional[List[str]] = None,
+                 max_workers: Optional[int] = None, jobs_dir: Optional[Path] = None,
+                 root: Optional[Path] = None):
+        """
+        StreamingFreqDistJob 초기화
+
+        Args:
+            directory: 분석할 텍스트 파일 디렉토리 (허용 루트 기준 상대 경로)
+            mode: "words"(전체 단어) 또는 "names"(고유명사, extract_names_from_corpus와 동일)
+            pattern: 대상 파일 glob 패턴
+            chunk_bytes: 청크 크기 (바이트)
+            stopwords: names 모드에서 제외할 단어 리스트
+            max_workers: 프로세스 풀 크기 (기본값: CPU 코어 수)
+            jobs_dir: 작업 폴더 위치 (기본값: app/nlp/save/stream_jobs)
+            root: 분석을 허용하는 디렉토리 루트 (기본값: 설정의 nlp_stream_root)
+
+        Raises:
+            ValueError: 루트 밖의 디렉토리 또는 루트 밖을 가리키는 패턴
+            FileNotFoundError: 디렉토리가 없는 경우
+        """
+        if mode not in ("words", "names"):
+            raise ValueError(f"지원하지 않는 모드입니다: {mode}")
+        if chunk_bytes <= 0:
+            raise ValueError("chunk_bytes는 0보다 커야 합니다")
+
+        self.root = Path(root or STREAM_ROOT).resolve()
+        self.directory = _resolve_directory(directory, pattern, self.root)
+        if not self.directory.is_dir():
+            raise FileNotFoundError(f"디렉토리를 찾을 수 없습니다: {self.directory}")
+
+        self.mode = mode
+        self.pattern = pattern
+        self.chunk_bytes = chunk_bytes
+        self.stopwords = list(stopwords) if stopwords is not None else list(DEFAULT_NAME_STOPWORDS)
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+        key = json.dumps([str(self.directory), mode, pattern, chunk_bytes, sorted(self.stopwords)])
+        self.job_id = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+        self.job_dir = Path(jobs_dir or JOBS_DIR) / self.job_id
+        self.partials_dir = self.job_dir / "partials"
+        self.manifest_path = self.job_dir / "manifest.json"
+        self.state_path = self.job_dir / "state.json"
+        self.result_path = self.job_dir / "freqdist.sqlite"
+
+    # *********
+    # 작업 계획
+    # *********
+
+    def _plan(self) -> Dict[str, Any]:
+        """
+        대상 파일을 청크로 나눈 작업 계획 생성 (이미 있으면 재사용)
+
+        파일 크기/수정 시각이 계획과 다르면 체크포인트가 무효이므로 새로 계획합니다.
+        """
+        files = sorted(
+            p for p in self.directory.glob(self.pattern)
+            # 루트 밖을 가리키는 심볼릭 링크는 제외
+            if p.is_file() and not p.name.startswith(".") and p.resolve().is_relative_to(self.root)
+        )
+        signature = [[str(p), p.stat().st_size, p.stat().st_mtime_ns] for p in files]
+
+        if self.manifest_path.exists():
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+            if manifest.get("signature") == signature:
+                return manifest
+            logger.info(f"[{self.job_id}] 입력 파일이 변경되어 체크포인트를 초기화합니다")
+            for stale in self.partials_dir.glob("*.json"):
+                stale.unlink()
+            for stale in (self.result_path, self.state_path):
+                if stale.exists():
+                    stale.unlink()
+
+        chunks = []
+        for path, size, _ in signature:
+            for start in range(0, size, self.chunk_bytes):
+                chunks.append({"path": path, "start": start, "end": min(start + self.chunk_bytes, size)})
+
+        manifest = {
+            "job_id": self.job_id,
+            "directory": str(self.directory),
+            "mode": self.mode,
+            "pattern": self.pattern,
+            "chunk_bytes": self.chunk_bytes,
+            "stopwords": self.stopwords,
+            "signature": signature,
+            "total_bytes": sum(s for _, s, _ in signature),
+            "chunks": chunks,
+            "created_at": datetime.now().isoformat(),
+        }
+        self.partials_dir.mkdir(parents=True, exist_ok=True)
+        _write_json_atomic(self.manifest_path, manifest)
+        return manifest
+
+    def _update_state(self, **fields: Any) -> None:
+        state = self.status()
+        state.update(fields, updated_at=datetime.now().isoformat())
+        _write_json_atomic(self.state_path, state)
+
+    def status(self) -> Dict[str, Any]:
+        """작업 진행 상태 반환"""
+        if self.state_path.exists():
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        return {"job_id": self.job_id, "status": "pending"}
+
+    # *********
+    # map / reduce 단계
+    # *********
+
+    def _map(self, executor: ProcessPoolExecutor, chunks: List[Dict[str, Any]]) -> List[Path]:
+        """완료되지 않은 청크만 집계 (동시에 제출하는 작업 수를 제한하여 메모리 유지)"""
+        outputs = [self.partials_dir / f"chunk_{i:06d}.json" for i in range(len(chunks))]
+        pending = [
+            {**chunk, "index": i, "mode": self.mode, "stopwords": self.stopwords, "output": str(outputs[i])}
+            for i, chunk in enumerate(chunks) if not outputs[i].exists()
+        ]
+        done_count = len(chunks) - len(pending)
+        if done_count:
+            logger.info(f"[{self.job_id}] 체크포인트에서 재개: {done_count}/{len(chunks)} 청크 완료")
+
+        in_flight = set()
+        queue = iter(pending)
+        max_in_flight = self.max_workers * 2
+        while True:
+            for task in queue:
+                in_flight.add(executor.submit(_count_chunk, task))
+                if len(in_flight) >= max_in_flight:
+                    break
+            if not in_flight:
+                break
+            finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                future.result()
+                done_count += 1
+            self._update_state(status="mapping", chunks_done=done_count, chunks_total=len(chunks))
+        return outputs
+
+    def _reduce(self, executor: ProcessPoolExecutor, partials: List[Path]) -> Path:
+        """부분 집계를 쌍으로 병렬 병합하는 트리 리덕션"""
+        level = 0
+        while len(partials) > 1:
+            next_level: List[Path] = []
+            futures = []
+            for i in range(0, len(partials) - 1, 2):
+                output = self.partials_dir / f"level{level + 1}_{i // 2:06d}.json"
+                next_level.append(output)
+                if not output.exists():
+                    futures.append(executor.submit(_merge_partials, str(partials[i]), str(partials[i + 1]), str(output)))
+            if len(partials) % 2 == 1:
+                next_level.append(partials[-1])
+            for future in futures:
+                future.result()
+            level += 1
+            self._update_state(status="reducing", reduce_level=level, partials_remaining=len(next_level))
+            partials = next_level
+        return partials[0]
+
+    def _persist(self, counts: Counter) -> None:
+        """최종 FreqDist를 조회 가능한 SQLite 파일로 저장"""
+        tmp_path = self.result_path.with_name(self.result_path.name + ".tmp")
+        if tmp_path.exists():
+            tmp_path.unlink()
+        conn = sqlite3.connect(tmp_path)
+        try:
+            conn.execute("CREATE TABLE freq (word TEXT PRIMARY KEY, count INTEGER NOT NULL) WITHOUT ROWID")
+            conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            conn.executemany("INSERT INTO freq VALUES (?, ?)", counts.items())
+            conn.execute("CREATE INDEX idx_freq_count ON freq (count DESC)")
+            conn.executemany("INSERT INTO meta VALUES (?, ?)", [
+                ("total_count", str(sum(counts.values()))),
+                ("unique_count", str(len(counts))),
+                ("mode", self.mode),
+            ])
+            conn.commit()
+        finally:
+            conn.close()
+        os.replace(tmp_path, self.result_path)
+
+    def run(self) -> Dict[str, Any]:
+        """
+        작업 실행 (체크포인트가 있으면 이어서 실행)
+
+        Returns:
+            최종 작업 상태 딕셔너리
+        """
+        manifest = self._plan()
+        if self.result_path.exists() and self.status().get("status") == "completed":
+            return self.status()
+
+        chunks = manifest["chunks"]
+        started = datetime.now()
+        self._update_state(status="running", started_at=started.isoformat(),
+                           total_bytes=manifest["total_bytes"], chunks_total=len(chunks))
+        logger.info(f"[{self.job_id}] 스트리밍 빈도 분석 시작: {len(chunks)}개 청크, {manifest['total_bytes']} bytes")
+
+        try:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                partials = self._map(executor, chunks)
+                final = self._reduce(executor, partials) if partials else None
+
+            counts = _read_counter(final) if final is not None else Counter()
+            self._persist(counts)
+        except Exception as e:
+            self._update_state(status="failed", error=str(e))
+            raise
+
+        elapsed = (datetime.now() - started).total_seconds()
+        self._update_state(
+            status="completed",
+            total_count=sum(counts.values()),
+            unique_count=len(counts),
+            elapsed_seconds=elapsed,
+            mb_per_second=(manifest["total_bytes"] / 1024 / 1024 / elapsed) if elapsed else None,
+        )
+        logger.info(f"[{self.job_id}] 스트리밍 빈도 분석 완료 ({elapsed:.2f}초)")
+        return self.status()
+
+
+# ***********
+# 결과 조회
+# ***********
+
+def get_job_status(job_id: str, jobs_dir: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+    """작업 ID로 저장된 진행 상태 조회 (없으면 None)"""
+    state_path = Path(jobs_dir or JOBS_DIR) / job_id / "state.json"
+    if not state_path.exists():
+        return None
+    with open(state_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+class StreamingFreqDistResult:
+    """SQLite로 저장된 최종 FreqDist 조회"""
+
+    def __init__(self, job_id: str, jobs_dir: Optional[Path] = None):
+        self.path = Path(jobs_dir or JOBS_DIR) / job_id / "freqdist.sqlite"
+        if not self.path.exists():
+            raise FileNotFoundError(f"완료된 작업 결과를 찾을 수 없습니다: {job_id}")
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(f"file:{self.path}?mode=ro", uri=True)
+
+    def summary(self) -> Dict[str, Any]:
+        """전체 단어 수, 고유 단어 수, 모드 반환"""
+        with self._connect() as conn:
+            meta = dict(conn.execute("SELECT key, value FROM meta"))
+        return {
+            "total_count": int(meta.get("total_count", 0)),
+            "unique_count": int(meta.get("unique_count", 0)),
+            "mode": meta.get("mode"),
+        }
+
+    def most_common(self, num: int = 10) -> List[Tuple[str, int]]:
+        """가장 출현 빈도가 높은 단어 반환"""
+        with self._connect() as conn:
+            return conn.execute(
+                "SELECT word, count FROM freq ORDER BY count DESC, word LIMIT ?", (num,)
+            ).fetchall()
+
+    def counts(self, words: Iterable[str]) -> Dict[str, int]:
+        """단어별 출현 횟수 반환 (없는 단어는 0)"""
+        words = list(words)
+        result = {w: 0 for w in words}
+        with self._connect() as conn:
+            for word in words:
+                row = conn.execute("SELECT count FROM freq WHERE word = ?", (word,)).fetchone()
+                if row:
+                    result[word] = row[0]
+        return result
@@ -0,0 +1,309 @@
+"""
+대용량 토큰 리스트 요청 본문 스트리밍 파서
+
+FastAPI의 Body(...)는 본문 전체를 파이썬 객체로 변환한 뒤 핸들러를 호출하므로
+수십 MB의 토큰 리스트는 원본 크기의 몇 배 메모리를 사용합니다.
+이 모듈은 요청 본문을 받는 대로 파싱하여 "tokens" 배열을 청크 단위로 넘겨줍니다.
+
+지원 형식:
+- application/json: {"tokens": [...], ...기타 옵션}
+- application/x-ndjson: 한 줄에 JSON 값 하나 (옵션은 쿼리 파라미터)
+- text/plain: 한 줄에 토큰 하나 (옵션은 쿼리 파라미터)
+"""
+import codecs
+import json
+import logging
+import re
+from json.decoder import WHITESPACE
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from fastapi import HTTPException, Request
+
+from app.config import get_config
+
+logger = logging.getLogger(__name__)
+
+# 요청 본문 최대 크기, 한 번에 넘기는 토큰 수
+MAX_BODY_BYTES = get_config().nlp_max_body_bytes
+TOKEN_CHUNK_SIZE = get_config().nlp_token_chunk_size
+
+NDJSON_MEDIA_TYPES = ("application/x-ndjson", "application/jsonl")
+PLAIN_MEDIA_TYPES = ("text/plain",)
+
+# 아직 다 도착하지 않은 값 하나의 최대 길이 (문자 수)
+MAX_PENDING_CHARS = 1024 * 1024
+
+_decoder = json.JSONDecoder()
+# 문자열 본문 (닫는 따옴표 또는 끝나지 않은 이스케이프 앞에서 멈춤)
+_STRING_BODY = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL)
+# 숫자/리터럴 값 뒤에 오는 구분 문자
+_SCALAR_END = re.compile(r"[\s,\]}]")
+# 객체/배열 값을 닫을 수 있는 문자
+_CLOSE = re.compile(r"[\]}]")
+
+
+class TokenStreamParser:
+    """
+    {"tokens": [...], ...} 형태의 JSON 객체를 점진적으로 파싱하는 파서
+
+    feed()로 받은 문자열 조각에서 완성된 토큰만 꺼내고,
+    "tokens" 이외의 최상위 키는 options 딕셔너리에 모읍니다.
+    멤버/원소 사이에는 쉼표가 정확히 하나 있어야 하며(앞뒤 쉼표, 빠진 쉼표는 ValueError),
+    토큰은 문자열/숫자 같은 스칼라 값만 허용합니다.
+
+    값이 여러 조각에 걸쳐 도착하면 새로 도착한 부분만 훑어 값이 끝날 수 있을 때(닫는 따옴표,
+    구분 문자, 닫는 괄호)에만 다시 디코딩하므로 긴 값도 본문 길이에 비례한 시간에 처리합니다.
+    아직 끝나지 않은 값 하나가 max_pending_chars 를 넘으면 ValueError 입니다.
+    """
+
+    (_OBJECT_START, _FIRST_KEY, _KEY, _COLON, _VALUE, _MEMBER_END,
+     _FIRST_ITEM, _ITEM, _ITEM_END, _DONE) = range(10)
+
+    def __init__(self, field: str = "tokens", max_pending_chars: int = MAX_PENDING_CHARS):
+        self.field = field
+        self.max_pending_chars = max_pending_chars
+        self.options: Dict[str, Any] = {}
+        self._buffer = ""
+        self._pos = 0
+        self._scanned = 0  # 끝나지 않은 값에서 이미 훑어본 위치
+        self._state = self._OBJECT_START
+        self._key: Optional[str] = None
+
+    def _skip_whitespace(self) -> None:
+        self._pos = WHITESPACE.match(self._buffer, self._pos).end()
+
+    def _may_end(self) -> bool:
+        """
+        현재 위치의 값이 지금까지 도착한 본문 안에서 끝날 수 있는지 확인
+
+        이전 조각에서 훑어본 부분은 건너뛰고 새로 도착한 부분만 확인합니다.
+        """
+        start = self._pos
+        scanned = max(self._scanned, start + 1)
+        if self._buffer[start] == '"':
+            # 이스케이프되지 않은 닫는 따옴표까지 (끝나지 않은 이스케이프 앞에서 멈춘 경우 다음에 이어서 확인)
+            end = _STRING_BODY.match(self._buffer, scanned).end()
+            self._scanned = end
+            return end < len(self._buffer) and self._buffer[end] == '"'
+        pattern = _CLOSE if self._buffer[start] in "[{" else _SCALAR_END
+        found = pattern.search(self._buffer, scanned) is not None
+        self._scanned = len(self._buffer)
+        return found
+
+    def _pending(self) -> None:
+        """끝나지 않은 값의 길이 제한 확인"""
+        if len(self._buffer) - self._pos > self.max_pending_chars:
+            raise ValueError(f"끝나지 않은 JSON 값이 너무 깁니다 (최대 {self.max_pending_chars}자)")
+
+    def _decode(self, eof: bool):
+        """
+        현재 위치의 JSON 값 하나를 디코딩 (값이 아직 다 도착하지 않았으면 None)
+
+        숫자처럼 끝이 구분되지 않는 값은 뒤에 구분 문자가 도착한 뒤에만 확정합니다.
+        ("2." 까지 도착했으면 2 로 확정하지 않고 다음 조각을 기다림)
+        """
+        if not eof and not self._may_end():
+            self._pending()
+            return None
+        try:
+            value, end = _decoder.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError:
+            if eof:
+                raise ValueError("JSON 형식이 올바르지 않습니다")
+            # 닫는 괄호가 중첩된 값의 것이었던 경우 등: 다음 조각을 기다림
+            self._pending()
+            return None
+        self._pos = end
+        self._scanned = 0
+        return (value,)
+
+    def _token(self, value: Any) -> Any:
+        """토큰 값 검증 (객체/배열은 토큰 하나로 받지 않음)"""
+        if isinstance(value, (dict, list)):
+            raise ValueError(f"{self.field} 의 토큰은 문자열이나 숫자여야 합니다: {json.dumps(value)[:50]}")
+        return value
+
+    def feed(self, text: str, eof: bool = False) -> List[Any]:
+        """
+        문자열 조각을 추가하고 완성된 토큰 리스트 반환
+
+        Args:
+            text: 새로 도착한 본문 조각
+            eof: 본문의 마지막 조각 여부
+
+        Returns:
+            이번 조각으로 완성된 토큰 리스트
+
+        Raises:
+            ValueError: JSON 형식이 올바르지 않거나 토큰이 스칼라 값이 아닌 경우
+        """
+        self._scanned = max(self._scanned - self._pos, 0)
+        self._buffer = self._buffer[self._pos:] + text
+        self._pos = 0
+        tokens: List[Any] = []
+
+        while True:
+            self._skip_whitespace()
+            if self._pos >= len(self._buffer):
+                break
+            char = self._buffer[self._pos]
+
+            if self._state == self._OBJECT_START:
+                if char != "{":
+                    raise ValueError("요청 본문은 JSON 객체여야 합니다")
+                self._pos += 1
+                self._state = self._FIRST_KEY
+            elif self._state in (self._FIRST_KEY, self._KEY):
+                if char == "}" and self._state == self._FIRST_KEY:
+                    self._pos += 1
+                    self._state = self._DONE
+                    continue
+                if char != '"':
+                    raise ValueError("JSON 형식이 올바르지 않습니다 (키는 문자열이어야 하며 쉼표는 멤버 사이에 하나만 허용)")
+                decoded = self._decode(eof)
+                if decoded is None:
+                    break
+                self._key = decoded[0]
+                self._state = self._COLON
+            elif self._state == self._COLON:
+                if char != ":":
+                    raise ValueError("JSON 형식이 올바르지 않습니다")
+                self._pos += 1
+                self._state = self._VALUE
+            elif self._state == self._VALUE:
+                if self._key == self.field and char == "[":
+                    self._pos += 1
+                    self._state = self._FIRST_ITEM
+                    continue
+                if char in ",}":
+                    raise ValueError(f"JSON 형식이 올바르지 않습니다 ({self._key} 의 값이 없습니다)")
+                decoded = self._decode(eof)
+                if decoded is None:
+                    break
+                if self._key == self.field:
+                    # 단일 문자열도 토큰 하나로 허용 (기존 엔드포인트와 동일)
+                    tokens.append(self._token(decoded[0]))
+                else:
+                    self.options[self._key] = decoded[0]
+                self._state = self._MEMBER_END
+            elif self._state == self._MEMBER_END:
+                if char not in ",}":
+                    raise ValueError("JSON 형식이 올바르지 않습니다 (멤버 사이에 쉼표가 없습니다)")
+                self._pos += 1
+                self._state = self._KEY if char == "," else self._DONE
+            elif self._state in (self._FIRST_ITEM, self._ITEM):
+                if char == "]" and self._state == self._FIRST_ITEM:
+                    self._pos += 1
+                    self._state = self._MEMBER_END
+                    continue
+                if char in ",]":
+                    raise ValueError(f"JSON 형식이 올바르지 않습니다 ({self.field} 배열의 쉼표 위치)")
+                decoded = self._decode(eof)
+                if decoded is None:
+                    break
+                tokens.append(self._token(decoded[0]))
+                self._state = self._ITEM_END
+            elif self._state == self._ITEM_END:
+                if char not in ",]":
+                    raise ValueError(f"JSON 형식이 올바르지 않습니다 ({self.field} 배열의 토큰 사이에 쉼표가 없습니다)")
+                self._pos += 1
+                self._state = self._ITEM if char == "," else self._MEMBER_END
+            else:
+                raise ValueError("JSON 객체 뒤에 불필요한 데이터가 있습니다")
+
+        if eof and self._state != self._DONE:
+            raise ValueError("JSON 본문이 완전하지 않습니다")
+        return tokens
+
+
+class TokenStream:
+    """
+    요청 본문에서 토큰을 청크 단위로 읽는 비동기 이터레이터
+
+    사용 예:
+        stream = TokenStream(request)
+        async for chunk in stream:
+            freqdist.update(chunk)
+        width = stream.options.get("width", 1000)
+    """
+
+    def __init__(self, request: Request, chunk_size: int = TOKEN_CHUNK_SIZE,
+                 max_bytes: int = MAX_BODY_BYTES, field: str = "tokens"):
+        self.request = request
+        self.chunk_size = chunk_size
+        self.max_bytes = max_bytes
+        self.field = field
+        self.token_count = 0
+        self.body_bytes = 0
+
+        media_type = request.headers.get("content-type", "application/json").split(";")[0].strip().lower()
+        if media_type in NDJSON_MEDIA_TYPES:
+            self.format = "ndjson"
+        elif media_type in PLAIN_MEDIA_TYPES:
+            self.format = "text"
+        else:
+            self.format = "json"
+
+        # 줄 단위 형식은 옵션을 쿼리 파라미터로 받음
+        self.options: Dict[str, Any] = {} if self.format == "json" else dict(request.query_params)
+        self._parser = TokenStreamParser(field) if self.format == "json" else None
+
+    def _check_size(self, size: int) -> None:
+        if size > self.max_bytes:
+            raise HTTPException(
+                status_code=413,
+                detail=f"요청 본문이 허용 크기({self.max_bytes} bytes)를 초과했습니다"
+            )
+
+    def _parse_lines(self, pending: str, text: str, eof: bool):
+        """줄 단위 형식에서 완성된 줄을 토큰으로 변환"""
+        pending += text
+        lines = pending.split("\n")
+        pending = "" if eof else lines.pop()
+        tokens = []
+        for line in lines:
+            line = line.rstrip("\r")
+            if not line.strip():
+                continue
+            if self.format == "ndjson":
+                value = json.loads(line)
+                if isinstance(value, (dict, list)):
+                    raise ValueError(f"{self.field} 의 토큰은 문자열이나 숫자여야 합니다: {line[:50]}")
+                tokens.append(value)
+            else:
+                tokens.append(line)
+        return pending, tokens
+
+    async def __aiter__(self) -> AsyncIterator[List[Any]]:
+        content_length = self.request.headers.get("content-length")
+        if content_length and content_length.isdigit():
+            self._check_size(int(content_length))
+
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        pending = ""
+        chunk: List[Any] = []
+
+        def consume(text: str, eof: bool) -> List[Any]:
+            nonlocal pending
+            if self._parser is not None:
+                return self._parser.feed(text, eof=eof)
+            pending, tokens = self._parse_lines(pending, text, eof)
+            return tokens
+
+        async for data in self.request.stream():
+            self.body_bytes += len(data)
+            self._check_size(self.body_bytes)
+            for token in consume(decoder.decode(data), eof=False):
+                chunk.append(token)
+                if len(chunk) >= self.chunk_size:
+                    self.token_count += len(chunk)
+                    yield chunk
+                    chunk = []
+
+        chunk.extend(consume(decoder.decode(b"", final=True), eof=True))
+        if self._parser is not None:
+            self.options = self._parser.options
+        while chunk:
+            head, chunk = chunk[:self.chunk_size], chunk[self.chunk_size:]
+            self.token_count += len(head)
+            yield head
@@ -0,0 +1,275 @@
+"""
+워드클라우드 렌더러 풀
+
+WordCloud 객체를 요청마다 새로 만들면 단어 하나를 배치할 때마다 글꼴 파일을
+디스크에서 다시 읽고, 썸네일 크기의 미리보기도 전체 해상도로 배치를 계산합니다.
+이 모듈은 글꼴 파일을 메모리에 한 번만 읽어 두고, (글꼴, 품질 단계)별로
+미리 만든 렌더러를 큐에 담아 재사용합니다.
+
+품질 단계:
+- preview: 1/4 해상도 배치, 상위 50개 단어 (즉시 반환용)
+- standard: 1/2 해상도 배치 후 2배 확대 출력, 상위 100개 단어
+- full: 원본 해상도 배치, 상위 200개 단어
+"""
+import copy
+import logging
+import queue
+import re
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from random import Random
+from typing import Any, Callable, Dict, Optional
+
+from wordcloud import WordCloud
+from wordcloud.wordcloud import FONT_PATH
+
+logger = logging.getLogger(__name__)
+
+# 번들 글꼴 위치
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+# 글꼴 이름 → 글꼴 파일 경로
+FONTS = {
+    "default": Path(FONT_PATH),
+    "d2coding": DATA_DIR / "D2Coding.ttf",
+}
+
+# 품질 단계별 설정 (resolution: 배치 계산 해상도 비율, scale: 출력 확대 배율)
+QUALITY_TIERS = {
+    "preview": {"resolution": 0.25, "scale": 1, "max_words": 50},
+    "standard": {"resolution": 0.5, "scale": 2, "max_words": 100},
+    "full": {"resolution": 1.0, "scale": 1, "max_words": 200},
+}
+
+# 한글이 포함된 단어 판별용
+_HANGUL = re.compile(r"[ㄱ-ㆎ가-힣]")
+
+# 보관할 백그라운드 렌더 상태 개수
+MAX_TRACKED_RENDERS = 100
+
+
+class PreloadedFont:
+    """
+    메모리에 읽어 둔 글꼴 파일
+
+    PIL의 ImageFont.truetype은 파일 객체를 받으면 read() 결과로 글꼴을 만들기 때문에,
+    WordCloud의 font_path 자리에 이 객체를 넣으면 글꼴 크기를 바꿀 때마다
+    디스크를 다시 읽지 않습니다.
+    """
+
+    def __init__(self, name: str, path: Path):
+        self.name = name
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._data = f.read()
+
+    def read(self, size: int = -1) -> bytes:
+        return self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def select_font(words, font: str = "auto") -> str:
+    """
+    단어 목록에 맞는 글꼴 이름 반환
+
+    Args:
+        words: 단어 목록
+        font: 글꼴 이름 ("auto"이면 한글 포함 여부로 선택)
+
+    Returns:
+        FONTS에 등록된 글꼴 이름
+    """
+    if font != "auto":
+        if font not in FONTS:
+            raise ValueError(f"지원하지 않는 글꼴입니다: {font} (사용 가능: {', '.join(FONTS)})")
+        return font
+    for word in words:
+        if _HANGUL.search(str(word)):
+            return "d2coding"
+    return "default"
+
+
+class WordCloudRendererPool:
+    """
+    (글꼴, 품질 단계)별 WordCloud 렌더러 풀
+
+    렌더러는 큐에서 꺼내 쓰고 돌려주므로 동시에 실행되는 렌더 수도
+    풀 크기로 제한됩니다. 전체 품질 렌더는 백그라운드 스레드에서 실행할 수 있습니다.
+    """
+
+    def __init__(self, pool_size: int = 2, fonts: Optional[Dict[str, Path]] = None,
+                 tiers: Optional[Dict[str, Dict[str, Any]]] = None):
+        """
+        WordCloudRendererPool 초기화
+
+        Args:
+            pool_size: (글꼴, 품질 단계)별 렌더러 개수
+            fonts: 글꼴 이름 → 파일 경로 (기본값: FONTS)
+            tiers: 품질 단계 설정 (기본값: QUALITY_TIERS)
+        """
+        self.pool_size = pool_size
+        self.tiers = tiers or QUALITY_TIERS
+        self.fonts: Dict[str, PreloadedFont] = {}
+        for name, path in (fonts or FONTS).items():
+            try:
+                self.fonts[name] = PreloadedFont(name, path)
+            except OSError as e:
+                logger.warning(f"글꼴을 불러오지 못했습니다: {name} ({path}): {e}")
+
+        self._pools: Dict[tuple, queue.Queue] = {}
+        for font_name, font in self.fonts.items():
+            for tier_name, tier in self.tiers.items():
+                pool = queue.Queue()
+                for _ in range(pool_size):
+                    pool.put(WordCloud(font_path=font, max_words=tier["max_words"], scale=tier["scale"]))
+                self._pools[(font_name, tier_name)] = pool
+
+        self._executor = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="wordcloud")
+        self._renders: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._stats: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+        logger.info(f"워드클라우드 렌더러 풀 준비 완료: 글꼴 {list(self.fonts)}, 단계 {list(self.tiers)}")
+
+    def render(self, frequencies, tier: str = "full", font: str = "auto",
+               width: int = 1000, height: int = 600, background_color: str = "white",
+               random_state: int = 0) -> Dict[str, Any]:
+        """
+        풀의 렌더러로 워드클라우드 생성
+
+        Args:
+            frequencies: 단어 → 빈도 매핑 (FreqDist 포함)
+            tier: 품질 단계 이름
+            font: 글꼴 이름 ("auto"이면 자동 선택)
+            width: 출력 이미지 기준 너비
+            height: 출력 이미지 기준 높이
+            background_color: 배경색
+            random_state: 랜덤 시드
+
+        Returns:
+            wordcloud(렌더 결과 WordCloud), tier, font, width, height, render_ms 딕셔너리
+        """
+        if tier not in self.tiers:
+            raise ValueError(f"지원하지 않는 품질 단계입니다: {tier} (사용 가능: {', '.join(self.tiers)})")
+        font_name = select_font(frequencies.keys(), font)
+        if font_name not in self.fonts:
+            raise ValueError(f"글꼴 파일을 사용할 수 없습니다: {font_name}")
+
+        settings = self.tiers[tier]
+        layout_width = max(int(width * settings["resolution"]), 16)
+        layout_height = max(int(height * settings["resolution"]), 16)
+
+        pool = self._pools[(font_name, tier)]
+        renderer = pool.get()
+        started = time.perf_counter()
+        try:
+            renderer.width = layout_width
+            renderer.height = layout_height
+            renderer.background_color = background_color
+            # WordCloud 생성자와 같이 정수 시드는 Random 객체로 변환
+            renderer.random_state = Random(random_state) if isinstance(random_state, int) else random_state
+            renderer.generate_from_frequencies(frequencies)
+            # 배치 결과는 generate 때마다 새 객체로 교체되므로 얕은 복사로 분리
+            wordcloud = copy.copy(renderer)
+        finally:
+            pool.put(renderer)
+        render_ms = (time.perf_counter() - started) * 1000
+        self._record(tier, render_ms)
+
+        return {
+            "wordcloud": wordcloud,
+            "tier": tier,
+            "font": font_name,
+            "width": int(layout_width * settings["scale"]),
+            "height": int(layout_height * settings["scale"]),
+            "render_ms": round(render_ms, 2),
+        }
+
+    def submit(self, frequencies, on_complete: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+               **options) -> str:
+        """
+        백그라운드 렌더 등록
+
+        Args:
+            frequencies: 단어 → 빈도 매핑
+            on_complete: 렌더 결과를 받아 상태에 추가할 값을 반환하는 함수 (예: 파일 저장)
+            **options: render()와 동일한 옵션
+
+        Returns:
+            렌더 ID
+        """
+        render_id = uuid.uuid4().hex
+        with self._lock:
+            self._renders[render_id] = {"status": "pending", "tier": options.get("tier", "full")}
+            while len(self._renders) > MAX_TRACKED_RENDERS:
+                self._renders.popitem(last=False)
+
+        # 요청 처리 중 원본이 바뀌지 않도록 복사본으로 렌더
+        frequencies = dict(frequencies)
+
+        def run():
+            self._update(render_id, status="running")
+            try:
+                result = self.render(frequencies, **options)
+                extra = on_complete(result) if on_complete else {}
+                self._update(render_id, status="completed", result=result, **(extra or {}))
+            except Exception as e:
+                logger.error(f"백그라운드 워드클라우드 렌더 실패: {render_id}: {e}")
+                self._update(render_id, status="failed", error=str(e))
+
+        self._executor.submit(run)
+        return render_id
+
+    def _update(self, render_id: str, **values) -> None:
+        with self._lock:
+            if render_id in self._renders:
+                self._renders[render_id].update(values)
+
+    def get_render(self, render_id: str) -> Optional[Dict[str, Any]]:
+        """
+        백그라운드 렌더 상태 반환
+
+        Args:
+            render_id: 렌더 ID
+
+        Returns:
+            상태 딕셔너리 (완료 시 result 포함) 또는 None
+        """
+        with self._lock:
+            state = self._renders.get(render_id)
+            return dict(state) if state is not None else None
+
+    def _record(self, tier: str, render_ms: float) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(
+                tier, {"count": 0, "total_ms": 0.0, "min_ms": render_ms, "max_ms": render_ms}
+            )
+            stats["count"] += 1
+            stats["total_ms"] += render_ms
+            stats["min_ms"] = min(stats["min_ms"], render_ms)
+            stats["max_ms"] = max(stats["max_ms"], render_ms)
+            stats["last_ms"] = render_ms
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        품질 단계별 렌더 시간 통계 반환
+
+        Returns:
+            단계 이름 → count, avg_ms, min_ms, max_ms, last_ms 딕셔너리
+        """
+        with self._lock:
+            return {
+                tier: {
+                    "count": s["count"],
+                    "avg_ms": round(s["total_ms"] / s["count"], 2),
+                    "min_ms": round(s["min_ms"], 2),
+                    "max_ms": round(s["max_ms"], 2),
+                    "last_ms": round(s["last_ms"], 2),
+                }
+                for tier, s in self._stats.items()
+            }
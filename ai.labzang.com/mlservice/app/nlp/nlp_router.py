@@ -1,7 +1,8 @@
 """
 NLP 자연어 처리 관련 라우터
 """
-from fastapi import APIRouter, HTTPException, Query, Body
+from fastapi import APIRouter, HTTPException, Query, Body, BackgroundTasks, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import Response
 from typing import List, Dict, Any, Optional
 from pathlib import Path
@@ -13,6 +14,7 @@ import base64
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
 from app.nlp.emma.nlp_service import NLPService
+from app.nlp.emma.token_stream import TokenStream
 from common.utils import create_response, create_error_response
 import logging
 
@@ -32,6 +34,34 @@ def get_service() -> NLPService:
     return _service_instance
 
 
+# 토큰 리스트를 스트리밍으로 받는 엔드포인트의 요청 본문 문서
+# (JSON 객체 또는 한 줄에 토큰 하나씩인 줄 단위 형식)
+TOKEN_STREAM_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "application/json": {
+                "schema": {
+                    "type": "object",
+                    "properties": {"tokens": {"type": "array", "items": {"type": "string"}}},
+                    "required": ["tokens"],
+                }
+            },
+            "application/x-ndjson": {"schema": {"type": "string", "description": "한 줄에 JSON 문자열 하나"}},
+            "text/plain": {"schema": {"type": "string", "description": "한 줄에 토큰 하나"}},
+        },
+    }
+}
+
+
+def _option(options: Dict[str, Any], key: str, default: Any) -> Any:
+    """스트림 옵션 값 반환 (쿼리 파라미터로 받은 문자열은 기본값 타입으로 변환)"""
+    value = options.get(key, default)
+    if value is None or default is None or isinstance(value, type(default)):
+        return value
+    return type(default)(value)
+
+
 @router.get("/")
 async def nlp_root():
     """NLP 서비스 루트"""
@@ -62,6 +92,59 @@ async def get_corpus_fileids(corpus_name: str = Query(default="gutenberg", descr
         )
 
 
+@router.get("/corpus/stats")
+async def get_corpus_stats(
+    background_tasks: BackgroundTasks,
+    corpus_name: str = Query(default="gutenberg", description="말뭉치 이름"),
+    fileid: Optional[str] = Query(default=None, description="파일 ID (생략 시 전체 파일)"),
+    top_n: int = Query(default=20, ge=1, le=200, description="파일별 상위 단어 개수")
+):
+    """
+    말뭉치 파일별 통계 카탈로그 반환
+    
+    - 토큰 수, 어휘 크기, 어휘 다양성, 상위 단어, 문장 수, 평균 문장 길이
+    - 저장된 카탈로그를 즉시 반환하고, 말뭉치가 바뀐 경우 백그라운드에서 다시 계산
+    - 카탈로그가 아직 없으면 최초 1회 계산 후 반환
+    """
+    try:
+        service = get_service()
+        catalog = service.corpus_catalog.load(corpus_name)
+        stale = False
+        
+        if catalog is None or catalog.get("top_n", 0) < top_n:
+            catalog = await run_in_threadpool(service.get_corpus_stats, corpus_name, top_n)
+        elif not service.corpus_catalog.is_fresh(corpus_name, catalog):
+            stale = True
+            background_tasks.add_task(service.get_corpus_stats, corpus_name, top_n)
+        
+        files = catalog.get("files", [])
+        if fileid is not None:
+            files = [f for f in files if f["fileid"] == fileid]
+            if not files:
+                raise HTTPException(status_code=404, detail=f"파일을 찾을 수 없습니다: {fileid}")
+        files = [{**f, "top_words": f["top_words"][:top_n]} for f in files]
+        
+        return create_response(
+            data={
+                "corpus_name": corpus_name,
+                "built_at": catalog.get("built_at"),
+                "stale": stale,
+                "file_count": len(files),
+                "files": files
+            },
+            message=f"{corpus_name} 말뭉치 통계를 반환했습니다" + (" (갱신 중)" if stale else "")
+        )
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"말뭉치 통계 조회 중 오류가 발생했습니다: {str(e)}"
+        )
+
+
 @router.get("/corpus/raw")
 async def get_corpus_raw(
     corpus_name: str = Query(..., description="말뭉치 이름"),
@@ -332,26 +415,31 @@ async def lemmatize(
 # POS 태깅 엔드포인트
 # **********
 
-@router.post("/pos/tag")
-async def pos_tag(
-    request: Dict[str, Any] = Body(..., description="토큰 리스트")
-):
-    """품사 태깅"""
+@router.post("/pos/tag", openapi_extra=TOKEN_STREAM_BODY)
+async def pos_tag(request: Request):
+    """
+    품사 태깅
+    
+    - 요청 본문의 tokens 배열을 스트리밍으로 읽어 청크 단위로 태깅
+    - 청크 경계의 토큰은 앞뒤 문맥 없이 태깅될 수 있음
+    """
     try:
-        tokens = request.get("tokens", [])
-        if isinstance(tokens, str):
-            tokens = [tokens]
+        service = get_service()
+        tagged = []
         
-        if not tokens:
-            raise ValueError("tokens 필드가 필요합니다")
+        stream = TokenStream(request)
+        async for chunk in stream:
+            tagged.extend(await run_in_threadpool(service.pos_tag, chunk))
         
-        service = get_service()
-        tagged = service.pos_tag(tokens)
+        if not tagged:
+            raise ValueError("tokens 필드가 필요합니다")
         
         return create_response(
-            data={"tokens": tokens, "tagged": tagged},
+            data={"tokens": [token for token, _ in tagged], "tagged": tagged},
             message="품사 태깅이 완료되었습니다"
         )
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -474,18 +562,24 @@ async def find_similar_words(
 # 빈도 분석 엔드포인트
 # ***********
 
-@router.post("/freqdist/create")
-async def create_freqdist(
-    request: Dict[str, Any] = Body(..., description="토큰 리스트")
-):
-    """FreqDist 객체 생성"""
+@router.post("/freqdist/create", openapi_extra=TOKEN_STREAM_BODY)
+async def create_freqdist(request: Request):
+    """
+    FreqDist 객체 생성
+    
+    - 요청 본문의 tokens 배열을 스트리밍으로 읽어 청크 단위로 집계
+    - application/x-ndjson, text/plain(한 줄에 토큰 하나) 형식도 지원
+    """
     try:
-        tokens = request.get("tokens", [])
-        if not tokens:
-            raise ValueError("tokens 필드가 필요합니다")
-        
         service = get_service()
-        freqdist = service.create_freqdist(tokens)
+        freqdist = service.create_freqdist([])
+        
+        stream = TokenStream(request)
+        async for chunk in stream:
+            freqdist.update(chunk)
+        
+        if not stream.token_count:
+            raise ValueError("tokens 필드가 필요합니다")
         
         # FreqDist를 딕셔너리로 변환
         freq_dict = dict(freqdist)
@@ -498,6 +592,8 @@ async def create_freqdist(
             },
             message="FreqDist 객체가 생성되었습니다"
         )
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -540,6 +636,78 @@ async def extract_names_from_corpus(
         )
 
 
+@router.post("/freqdist/stream")
+async def create_streaming_freqdist(
+    background_tasks: BackgroundTasks,
+    request: Dict[str, Any] = Body(..., description="디렉토리 및 청크 설정")
+):
+    """
+    대용량 텍스트 디렉토리 스트리밍 빈도 분석 작업 시작
+    
+    - 파일을 고정 크기 청크로 읽어 프로세스 풀에서 집계 후 트리 리덕션으로 병합
+    - 같은 설정으로 다시 호출하면 체크포인트부터 이어서 실행
+    - mode: "words"(전체 단어) 또는 "names"(고유명사)
+    - directory 는 설정의 허용 루트(nlp_stream_root) 기준 경로이며, 루트 밖을 가리키면 400
+    """
+    try:
+        directory = request.get("directory", "")
+        if not directory:
+            raise ValueError("directory 필드가 필요합니다")
+        
+        options = {
+            key: request[key]
+            for key in ("pattern", "chunk_bytes", "stopwords", "max_workers")
+            if request.get(key) is not None
+        }
+        
+        service = get_service()
+        job = service.create_streaming_freqdist_job(directory, mode=request.get("mode", "words"), **options)
+        background_tasks.add_task(service.run_streaming_freqdist_job, job)
+        
+        return create_response(
+            data={"job_id": job.job_id, "status": job.status()},
+            message="스트리밍 빈도 분석 작업이 시작되었습니다"
+        )
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"스트리밍 빈도 분석 작업 생성 중 오류가 발생했습니다: {str(e)}"
+        )
+
+
+@router.get("/freqdist/stream/{job_id}")
+async def get_streaming_freqdist(
+    job_id: str,
+    num: int = Query(default=10, ge=1, le=1000, description="반환할 상위 단어 개수"),
+    words: Optional[List[str]] = Query(default=None, description="빈도를 조회할 단어 목록")
+):
+    """스트리밍 빈도 분석 작업 상태 및 (완료 시) 결과 조회"""
+    service = get_service()
+    status = service.get_streaming_freqdist_status(job_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail=f"작업을 찾을 수 없습니다: {job_id}")
+    
+    data = {"job_id": job_id, "status": status}
+    if status.get("status") == "completed":
+        try:
+            result = service.get_streaming_freqdist(job_id)
+            data.update(result.summary())
+            data["most_common"] = [{"word": w, "count": c} for w, c in result.most_common(num)]
+            if words:
+                data["frequencies"] = result.counts(words)
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"스트리밍 빈도 분석 결과 조회 중 오류가 발생했습니다: {str(e)}"
+            )
+    
+    return create_response(data=data, message="스트리밍 빈도 분석 작업 상태를 반환했습니다")
+
+
 @router.post("/freqdist/most-common")
 async def get_most_common(
     request: Dict[str, Any] = Body(..., description="토큰 리스트 및 개수")
@@ -576,58 +744,90 @@ async def get_most_common(
 # 워드클라우드 엔드포인트
 # ***********
 
-@router.post("/wordcloud/generate")
-async def generate_wordcloud(
-    request: Dict[str, Any] = Body(..., description="토큰 리스트 및 워드클라우드 설정")
-):
-    """워드클라우드 생성 및 이미지 반환"""
+def _image_base64(wc) -> str:
+    """WordCloud 이미지를 PNG Base64 문자열로 변환"""
+    img_buffer = io.BytesIO()
+    wc.to_image().save(img_buffer, format='PNG')
+    return base64.b64encode(img_buffer.getvalue()).decode('utf-8')
+
+
+@router.post("/wordcloud/generate", openapi_extra=TOKEN_STREAM_BODY)
+async def generate_wordcloud(request: Request):
+    """
+    워드클라우드 생성 및 이미지 반환
+    
+    - 요청 본문의 tokens 배열을 스트리밍으로 읽어 청크 단위로 집계
+    - 줄 단위 형식에서는 width, height 등 설정을 쿼리 파라미터로 전달
+    - quality: "preview", "standard", "full" (기본값: full)
+    - font: "auto", "default", "d2coding" (auto는 한글이 있으면 D2Coding 사용)
+    - progressive: true이면 미리보기를 즉시 반환하고 요청한 품질은 백그라운드에서 렌더
+      (결과는 GET /nlp/wordcloud/render/{render_id} 로 조회)
+    """
     try:
-        tokens = request.get("tokens", [])
-        width = request.get("width", 1000)
-        height = request.get("height", 600)
-        background_color = request.get("background_color", "white")
-        random_state = request.get("random_state", 0)
-        
-        if not tokens:
-            raise ValueError("tokens 필드가 필요합니다")
-        
         service = get_service()
-        freqdist = service.create_freqdist(tokens)
+        freqdist = service.create_freqdist([])
         
-        # 파일명 생성 (선택적)
-        filename = request.get("filename", None)
+        stream = TokenStream(request)
+        async for chunk in stream:
+            freqdist.update(chunk)
         
-        # 워드클라우드 생성 및 저장
-        filepath, wc = service.generate_wordcloud(
-            freqdist, 
-            width=width, 
-            height=height, 
-            background_color=background_color,
-            random_state=random_state,
-            show=False,
-            filename=filename
-        )
+        if not stream.token_count:
+            raise ValueError("tokens 필드가 필요합니다")
         
-        # 이미지를 바이트로 변환
-        img_buffer = io.BytesIO()
-        wc.to_image().save(img_buffer, format='PNG')
-        img_buffer.seek(0)
-        img_bytes = img_buffer.getvalue()
+        options = stream.options
+        render_options = {
+            "quality": _option(options, "quality", "full"),
+            "font": _option(options, "font", "auto"),
+            "width": _option(options, "width", 1000),
+            "height": _option(options, "height", 600),
+            "background_color": _option(options, "background_color", "white"),
+            "random_state": _option(options, "random_state", 0),
+            # 파일명 생성 (선택적)
+            "filename": options.get("filename", None),
+        }
+        progressive = str(options.get("progressive", False)).lower() in ("true", "1")
+        
+        if progressive:
+            preview, render_id = await run_in_threadpool(
+                service.render_wordcloud_progressive, freqdist, **render_options
+            )
+            image = await run_in_threadpool(_image_base64, preview["wordcloud"])
+            return create_response(
+                data={
+                    "image_base64": image,
+                    "quality": preview["tier"],
+                    "font": preview["font"],
+                    "width": preview["width"],
+                    "height": preview["height"],
+                    "format": "PNG",
+                    "render_ms": preview["render_ms"],
+                    "render_id": render_id,
+                    "render_quality": render_options["quality"],
+                },
+                message="미리보기 워드클라우드를 생성했습니다 (전체 렌더는 백그라운드에서 진행 중)"
+            )
         
-        # Base64 인코딩
-        img_base64 = base64.b64encode(img_bytes).decode('utf-8')
+        # 워드클라우드 생성 및 저장
+        result = await run_in_threadpool(service.render_wordcloud, freqdist, **render_options)
+        filepath = result["filepath"]
+        image = await run_in_threadpool(_image_base64, result["wordcloud"])
         
         return create_response(
             data={
-                "image_base64": img_base64,
+                "image_base64": image,
                 "filepath": filepath,
                 "filename": Path(filepath).name,
-                "width": width,
-                "height": height,
-                "format": "PNG"
+                "quality": result["tier"],
+                "font": result["font"],
+                "width": result["width"],
+                "height": result["height"],
+                "format": "PNG",
+                "render_ms": result["render_ms"],
             },
             message=f"워드클라우드가 생성되고 저장되었습니다: {filepath}"
         )
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -636,3 +836,43 @@ async def generate_wordcloud(
             detail=f"워드클라우드 생성 중 오류가 발생했습니다: {str(e)}"
         )
 
+
+@router.get("/wordcloud/render/{render_id}")
+async def get_wordcloud_render(
+    render_id: str,
+    include_image: bool = Query(default=True, description="완료 시 이미지 Base64 포함 여부")
+):
+    """백그라운드 워드클라우드 렌더 상태 및 결과 조회"""
+    service = get_service()
+    state = service.get_wordcloud_render(render_id)
+    if state is None:
+        raise HTTPException(status_code=404, detail=f"렌더를 찾을 수 없습니다: {render_id}")
+    
+    result = state.pop("result", None)
+    data = {"render_id": render_id, **state}
+    if result is not None:
+        data.update({
+            "font": result["font"],
+            "width": result["width"],
+            "height": result["height"],
+            "render_ms": result["render_ms"],
+        })
+        if state.get("filepath"):
+            data["filename"] = Path(state["filepath"]).name
+        if include_image:
+            # PNG 인코딩은 큰 이미지에서 수백 ms 걸리므로 이벤트 루프 밖에서 실행
+            data["image_base64"] = await run_in_threadpool(_image_base64, result["wordcloud"])
+            data["format"] = "PNG"
+    
+    return create_response(data=data, message="워드클라우드 렌더 상태를 반환했습니다")
+
+
+@router.get("/wordcloud/stats")
+async def get_wordcloud_stats():
+    """품질 단계별 워드클라우드 렌더 시간 통계"""
+    service = get_service()
+    return create_response(
+        data={"tiers": service.get_wordcloud_render_stats()},
+        message="워드클라우드 렌더 시간 통계를 반환했습니다"
+    )
+
@@ -0,0 +1,105 @@
+"""
+관서별 범죄 통계 → 자치구별 집계 (벡터 연산)
+
+crime.csv 는 "1,395" 처럼 천 단위 쉼표가 들어간 건수를 문자열로 담고 있습니다.
+load_crime_table() 에서 읽을 때 한 번만 정수 컬럼으로 변환하고,
+aggregate_by_district() 는 groupby 한 번으로 범죄 유형별 발생/검거 건수와 검거율, 합계를 계산합니다.
+
+by 인자로 묶음 기준을 바꿀 수 있어(예: ['연도', '시도', '자치구']) 전국/여러 해 관서 표도 같은 방식으로 집계합니다.
+"""
+import logging
+from pathlib import Path
+from typing import List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# 범죄 유형 (crime.csv 컬럼: "<유형> 발생", "<유형> 검거")
+CRIME_TYPES = ['살인', '강도', '강간', '절도', '폭력']
+OCCURRENCE_COLUMNS = [f'{crime_type} 발생' for crime_type in CRIME_TYPES]
+ARREST_COLUMNS = [f'{crime_type} 검거' for crime_type in CRIME_TYPES]
+COUNT_COLUMNS = OCCURRENCE_COLUMNS + ARREST_COLUMNS
+
+DISTRICT_COLUMN = '자치구'
+
+
+def load_crime_table(path: Union[str, Path]) -> pd.DataFrame:
+    """
+    관서별 범죄 통계 CSV 로드 (건수 컬럼은 정수)
+
+    Args:
+        path: CSV 파일 경로
+
+    Returns:
+        pd.DataFrame: 관서별 범죄 통계 (빈 건수는 0)
+    """
+    df = pd.read_csv(path, encoding='utf-8-sig', thousands=',')
+    return to_count_columns(df)
+
+
+def to_count_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    건수 컬럼을 int64 로 변환 (이미 정수인 컬럼은 그대로)
+
+    read_csv(thousands=',') 로 읽지 않은 표(쉼표가 남은 문자열)도 받을 수 있도록
+    문자열 컬럼만 쉼표를 제거한 뒤 숫자로 변환합니다.
+
+    Args:
+        df: 관서별 범죄 통계
+
+    Returns:
+        pd.DataFrame: 건수 컬럼이 정수인 표
+    """
+    missing = [column for column in COUNT_COLUMNS if column not in df.columns]
+    if missing:
+        raise ValueError(f"범죄 통계에 필요한 컬럼이 없습니다: {missing}")
+
+    converted = {}
+    for column in COUNT_COLUMNS:
+        values = df[column]
+        if values.dtype == np.int64:
+            continue
+        if not pd.api.types.is_numeric_dtype(values):
+            values = pd.to_numeric(values.astype('string').str.replace(',', '', regex=False), errors='coerce')
+        converted[column] = values.fillna(0).astype(np.int64)
+    return df.assign(**converted) if converted else df
+
+
+def aggregate_by_district(df: pd.DataFrame, by: Optional[Sequence[str]] = None) -> pd.DataFrame:
+    """
+    자치구별 범죄 발생/검거 건수 집계
+
+    결과 컬럼:
+    - 묶음 기준 컬럼 (기본값: 자치구)
+    - 범죄 유형별 "<유형> 발생", "<유형> 검거", "<유형> 검거율"
+    - 범죄건수, 검거건수 (전체 유형 합계), 검거율 (%, 발생 건수가 0이면 0)
+
+    Args:
+        df: load_crime_table() 결과 (또는 건수 컬럼을 가진 표)
+        by: 묶음 기준 컬럼 목록 (기본값: ['자치구']), 값이 비어 있는 행은 제외
+
+    Returns:
+        pd.DataFrame: 묶음별 집계 (처음 나온 순서)
+    """
+    keys: List[str] = list(by) if by else [DISTRICT_COLUMN]
+    df = to_count_columns(df)
+
+    grouped = df.groupby(keys, sort=False, dropna=True)[COUNT_COLUMNS].sum()
+    occurrences = grouped[OCCURRENCE_COLUMNS].to_numpy()
+    arrests = grouped[ARREST_COLUMNS].to_numpy()
+
+    result = grouped.copy()
+    rates = _rate(arrests, occurrences)
+    for i, crime_type in enumerate(CRIME_TYPES):
+        result[f'{crime_type} 검거율'] = rates[:, i]
+    result['범죄건수'] = occurrences.sum(axis=1)
+    result['검거건수'] = arrests.sum(axis=1)
+    result['검거율'] = _rate(result['검거건수'].to_numpy(), result['범죄건수'].to_numpy())
+    return result.reset_index()
+
+
+def _rate(arrests: np.ndarray, occurrences: np.ndarray) -> np.ndarray:
+    """검거율 (%) - 발생 건수가 0이면 0"""
+    return np.where(occurrences > 0, arrests / np.maximum(occurrences, 1) * 100, 0.0)
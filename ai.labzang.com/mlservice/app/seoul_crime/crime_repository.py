@@ -0,0 +1,192 @@
+"""
+서울 범죄 데이터(crime.csv) 공유 저장소
+
+kr_(범죄지도), heatmap(히트맵), seoul_crime(전처리) 모듈이 같은 crime.csv 를 각자 읽어 따로 들고 있지 않도록
+프로세스에 하나인 저장소가 파일을 한 번 읽어 읽기 전용 스냅샷(CrimeSnapshot)으로 함께 사용하게 합니다.
+
+- 스냅샷은 관서별 표(table)와 자치구별 집계(districts)를 담고, 배열은 쓰기 금지로 표시합니다
+  (값을 바꾸려면 copy() 후 수정)
+- snapshot() 은 최대 check_interval 초마다 파일의 수정 시각/크기를 확인하여 바뀌었으면 다시 읽고
+  참조를 한 번에 교체합니다. 읽는 중인 요청은 이전 스냅샷을 그대로 사용합니다.
+- 새 파일을 읽지 못하면(쓰는 중인 파일 등) 이전 스냅샷을 유지합니다.
+- publish(): 임시 파일에 쓴 뒤 os.replace 로 바꾸고 바로 새 스냅샷을 만듭니다 (SeoulService.preprocess)
+- version 은 스냅샷을 새로 만들 때마다 1씩 증가하며, 스냅샷에서 계산한 값을 캐시하는 쪽은 이 값을 키로 사용합니다.
+"""
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from app.config import get_config
+from app.seoul_crime.crime_aggregation import aggregate_by_district, load_crime_table
+
+logger = logging.getLogger(__name__)
+
+# crime.csv 위치 (SeoulService.preprocess 저장 위치)
+CRIME_CSV_PATH = Path(__file__).resolve().parent / "save" / "crime.csv"
+
+# 파일 변경 확인 간격 (초)
+CHECK_INTERVAL_SECONDS = get_config().crime_data_check_seconds
+
+
+def _freeze(df: pd.DataFrame) -> pd.DataFrame:
+    """numpy 배열 컬럼을 쓰기 금지로 표시한 표 (공유 스냅샷 보호)"""
+    columns = {}
+    for column in df.columns:
+        values = df[column].to_numpy(copy=True) if isinstance(df[column].dtype, np.dtype) else df[column].array
+        if isinstance(values, np.ndarray):
+            values.setflags(write=False)
+        columns[column] = values
+    return pd.DataFrame(columns, index=df.index, copy=False)
+
+
+class CrimeSnapshot:
+    """crime.csv 한 버전의 읽기 전용 스냅샷"""
+
+    def __init__(self, version: int, path: Path, mtime_ns: int, size: int, table: pd.DataFrame):
+        self.version = version
+        self.path = path
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.loaded_at = time.time()
+        self.table = _freeze(table)
+        self.districts = _freeze(aggregate_by_district(table))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": self.version,
+            "path": str(self.path),
+            "rows": len(self.table),
+            "districts": len(self.districts),
+            "size": self.size,
+            "modified_at": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.mtime_ns / 1e9)),
+            "loaded_at": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.loaded_at)),
+        }
+
+
+class CrimeDataRepository:
+    """버전이 붙은 crime.csv 스냅샷 저장소 (파일이 바뀌면 다시 읽음)"""
+
+    def __init__(self, path: Optional[Path] = None, check_interval: float = CHECK_INTERVAL_SECONDS):
+        """
+        CrimeDataRepository 초기화 (파일은 처음 조회할 때 읽음)
+
+        Args:
+            path: crime.csv 경로 (기본값: app/seoul_crime/save/crime.csv)
+            check_interval: 파일 변경 확인 간격 (초)
+        """
+        self.path = Path(path) if path else CRIME_CSV_PATH
+        self.check_interval = check_interval
+        self.reloads = 0
+        self._snapshot: Optional[CrimeSnapshot] = None
+        self._version = 0
+        self._failed: Optional[tuple] = None  # 읽지 못한 파일의 (수정 시각, 크기)
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def version(self) -> int:
+        """현재 스냅샷 버전 (아직 읽지 않았으면 0)"""
+        return self._version
+
+    def snapshot(self) -> CrimeSnapshot:
+        """
+        현재 스냅샷 반환 (확인 간격이 지났으면 파일 변경 확인)
+
+        Returns:
+            CrimeSnapshot: 읽기 전용 스냅샷
+
+        Raises:
+            FileNotFoundError: 파일이 없고 읽어 둔 스냅샷도 없는 경우
+        """
+        snapshot = self._snapshot
+        if snapshot is not None and time.monotonic() - self._checked_at < self.check_interval:
+            return snapshot
+        return self.refresh()
+
+    def refresh(self, force: bool = False) -> CrimeSnapshot:
+        """
+        파일이 바뀌었으면(force 이면 항상) 다시 읽어 스냅샷 교체
+
+        Args:
+            force: 수정 시각/크기가 같아도 다시 읽을지 여부
+
+        Returns:
+            CrimeSnapshot: 현재 스냅샷
+        """
+        with self._lock:
+            self._checked_at = time.monotonic()
+            current = self._snapshot
+            try:
+                stat = self.path.stat()
+            except FileNotFoundError:
+                if current is None:
+                    raise
+                logger.warning(f"범죄 데이터 파일이 없어 이전 스냅샷(v{current.version})을 유지합니다: {self.path}")
+                return current
+            signature = (stat.st_mtime_ns, stat.st_size)
+            if not force and current is not None and signature in ((current.mtime_ns, current.size), self._failed):
+                return current
+
+            try:
+                # 읽기 전에 확인한 수정 시각을 저장하므로 읽는 중에 파일이 바뀌면 다음 확인에서 다시 읽음
+                table = load_crime_table(self.path)
+                snapshot = CrimeSnapshot(self._version + 1, self.path, stat.st_mtime_ns, stat.st_size, table)
+            except Exception as e:
+                if current is None:
+                    raise
+                self._failed = signature
+                logger.warning(f"범죄 데이터를 다시 읽지 못해 이전 스냅샷(v{current.version})을 유지합니다: {e}")
+                return current
+
+            self._snapshot = snapshot
+            self._version = snapshot.version
+            self._failed = None
+            if current is not None:
+                self.reloads += 1
+            logger.info(f"범죄 데이터 스냅샷 v{snapshot.version} 로드: {len(snapshot.table)}개 관서, "
+                        f"{len(snapshot.districts)}개 자치구 ({self.path})")
+            return snapshot
+
+    def publish(self, df: pd.DataFrame) -> CrimeSnapshot:
+        """
+        새 crime.csv 저장 후 스냅샷 교체
+
+        임시 파일에 쓴 뒤 os.replace 로 바꾸므로 다른 프로세스가 쓰는 중인 파일을 읽지 않습니다.
+
+        Args:
+            df: 관서별 범죄 통계 (crime.csv 컬럼)
+
+        Returns:
+            CrimeSnapshot: 새 스냅샷
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f".{self.path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            df.to_csv(tmp_path, index=False, encoding='utf-8-sig')
+            os.replace(tmp_path, self.path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        return self.refresh(force=True)
+
+    def status(self) -> Dict[str, Any]:
+        """현재 스냅샷 정보와 다시 읽은 횟수"""
+        return {**self.snapshot().to_dict(), "reloads": self.reloads, "check_interval": self.check_interval}
+
+
+_repository: Optional[CrimeDataRepository] = None
+_repository_lock = threading.Lock()
+
+
+def get_repository() -> CrimeDataRepository:
+    """프로세스 공용 범죄 데이터 저장소"""
+    global _repository
+    with _repository_lock:
+        if _repository is None:
+            _repository = CrimeDataRepository()
+        return _repository
@@ -0,0 +1,277 @@
+"""
+지오코딩 결과 영구 캐시 (SQLite)
+
+경찰서 주소처럼 바뀌지 않는 검색어를 매번 외부 API 로 다시 조회하지 않도록
+(제공자, 정규화한 검색어, 언어) → 결과 목록을 저장합니다.
+
+- 검색어는 NFKC 정규화, 앞뒤 공백 제거, 연속 공백 축소, 소문자 변환 후 키로 사용
+- 결과가 있는 항목은 ttl_seconds, 결과가 없는 항목(빈 목록)은 negative_ttl_seconds 동안 유지
+  (API 오류는 저장하지 않으므로 다음 호출에서 다시 조회)
+- warm(): JSON/JSONL 파일에서 일괄 적재 (오프라인 실행/테스트용 고정 데이터),
+  export(): 현재 캐시를 같은 형식으로 저장
+"""
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from app.config import get_config
+
+logger = logging.getLogger(__name__)
+
+# 캐시 저장 위치
+CACHE_PATH = Path(__file__).resolve().parent / "save" / "geocode_cache.sqlite"
+
+# 유지 기간 (검색 결과가 있는 항목 / 없는 항목)
+TTL_SECONDS = get_config().geocode_cache_ttl_days * 24 * 3600
+NEGATIVE_TTL_SECONDS = get_config().geocode_negative_ttl_hours * 3600
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_query(query: str) -> str:
+    """
+    캐시 키로 쓰는 검색어 정규화
+
+    Args:
+        query: 주소 또는 장소명
+
+    Returns:
+        정규화된 검색어
+    """
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", str(query))).strip().lower()
+
+
+class GeocodeCache:
+    """
+    (제공자, 검색어, 언어) → 지오코딩 결과 저장소
+
+    여러 워커 프로세스가 같은 파일을 함께 사용할 수 있도록 WAL 모드를 사용하고,
+    스레드마다 새 연결을 엽니다.
+    """
+
+    def __init__(self, path: Optional[Path] = None, ttl_seconds: float = TTL_SECONDS,
+                 negative_ttl_seconds: float = NEGATIVE_TTL_SECONDS):
+        """
+        GeocodeCache 초기화
+
+        Args:
+            path: SQLite 파일 경로 (기본값: app/seoul_crime/save/geocode_cache.sqlite)
+            ttl_seconds: 결과가 있는 항목의 유지 기간
+            negative_ttl_seconds: 결과가 없는 항목의 유지 기간
+        """
+        self.path = Path(path) if path else CACHE_PATH
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS geocode ("
+                " provider TEXT NOT NULL, query TEXT NOT NULL, language TEXT NOT NULL,"
+                " result TEXT NOT NULL, empty INTEGER NOT NULL,"
+                " created_at REAL NOT NULL, expires_at REAL NOT NULL,"
+                " PRIMARY KEY (provider, query, language))"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def get(self, provider: str, query: str, language: str = "ko") -> Optional[List[Dict[str, Any]]]:
+        """
+        저장된 결과 조회
+
+        Args:
+            provider: 지오코딩 제공자 ("kakao", "google")
+            query: 검색어
+            language: 언어
+
+        Returns:
+            결과 목록 (결과 없음으로 저장된 경우 빈 목록), 없거나 만료되었으면 None
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT result FROM geocode WHERE provider = ? AND query = ? AND language = ? AND expires_at > ?",
+                (provider, normalize_query(query), language, time.time())
+            ).fetchone()
+        self._count(row is not None)
+        return json.loads(row[0]) if row is not None else None
+
+    def put(self, provider: str, query: str, language: str, result: List[Dict[str, Any]],
+            ttl_seconds: Optional[float] = None) -> None:
+        """
+        결과 저장 (빈 목록은 negative_ttl_seconds 동안 유지)
+
+        Args:
+            provider: 지오코딩 제공자
+            query: 검색어
+            language: 언어
+            result: 지오코딩 결과 목록
+            ttl_seconds: 유지 기간 (기본값: 결과 유무에 따른 기본 유지 기간)
+        """
+        self.put_many(provider, [(query, language, result)], ttl_seconds)
+
+    def put_many(self, provider: str, entries: List[Tuple[str, str, List[Dict[str, Any]]]],
+                 ttl_seconds: Optional[float] = None) -> int:
+        """
+        여러 결과를 한 트랜잭션으로 저장
+
+        Args:
+            provider: 지오코딩 제공자
+            entries: (검색어, 언어, 결과 목록) 리스트
+            ttl_seconds: 유지 기간 (기본값: 결과 유무에 따른 기본 유지 기간)
+
+        Returns:
+            저장한 항목 수
+        """
+        now = time.time()
+        rows = []
+        for query, language, result in entries:
+            ttl = ttl_seconds if ttl_seconds is not None else \
+                (self.ttl_seconds if result else self.negative_ttl_seconds)
+            rows.append((provider, normalize_query(query), language,
+                         json.dumps(result, ensure_ascii=False), int(not result), now, now + ttl))
+        with self._connect() as conn:
+            conn.executemany("INSERT OR REPLACE INTO geocode VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+        return len(rows)
+
+    def purge_expired(self) -> int:
+        """
+        만료된 항목 삭제
+
+        Returns:
+            삭제한 항목 수
+        """
+        with self._connect() as conn:
+            return conn.execute("DELETE FROM geocode WHERE expires_at <= ?", (time.time(),)).rowcount
+
+    def stats(self) -> Dict[str, Any]:
+        """항목 수(결과 있음/없음/만료)와 이 프로세스의 적중/실패 횟수"""
+        now = time.time()
+        with self._connect() as conn:
+            positive, negative, expired = conn.execute(
+                "SELECT COALESCE(SUM(empty = 0 AND expires_at > ?), 0), COALESCE(SUM(empty = 1 AND expires_at > ?), 0),"
+                " COALESCE(SUM(expires_at <= ?), 0) FROM geocode",
+                (now, now, now)
+            ).fetchone()
+        return {
+            "path": str(self.path),
+            "entries": positive,
+            "negative_entries": negative,
+            "expired_entries": expired,
+            "hits": self.hits,
+            "misses": self.misses,
+            "ttl_seconds": self.ttl_seconds,
+            "negative_ttl_seconds": self.negative_ttl_seconds,
+        }
+
+    # ***********
+    # 파일 적재 / 저장
+    # ***********
+
+    @staticmethod
+    def parse_entries(text: str, jsonl: bool = False) -> List[Dict[str, Any]]:
+        """
+        JSON 또는 JSONL 고정 데이터 해석
+
+        지원 형식:
+        - JSONL: 한 줄에 {"provider", "query", "language", "result"} 하나
+        - JSON 배열: 위 객체의 배열
+        - JSON 객체: {검색어: 결과 목록} (provider/language 는 warm() 인자 사용)
+
+        Args:
+            text: 파일 내용
+            jsonl: JSONL 형식 여부
+
+        Returns:
+            항목 딕셔너리 리스트
+        """
+        if jsonl:
+            return [json.loads(line) for line in text.splitlines() if line.strip()]
+        data = json.loads(text)
+        if isinstance(data, dict):
+            return [{"query": query, "result": result} for query, result in data.items()]
+        return list(data)
+
+    def warm(self, source: Union[str, Path, List[Dict[str, Any]]], provider: str = "kakao",
+             language: str = "ko", ttl_seconds: Optional[float] = None) -> int:
+        """
+        파일 또는 항목 목록에서 결과를 일괄 적재
+
+        Args:
+            source: JSON/JSONL 파일 경로 (확장자 .jsonl 이면 JSONL) 또는 parse_entries 결과
+            provider: 항목에 provider 가 없을 때 사용할 제공자
+            language: 항목에 language 가 없을 때 사용할 언어
+            ttl_seconds: 유지 기간 (기본값: 결과 유무에 따른 기본 유지 기간)
+
+        Returns:
+            적재한 항목 수
+        """
+        if isinstance(source, (str, Path)):
+            entries = self.parse_entries(Path(source).read_text(encoding="utf-8"), Path(source).suffix == ".jsonl")
+        else:
+            entries = source
+        grouped: Dict[str, List[Tuple[str, str, List[Dict[str, Any]]]]] = {}
+        for entry in entries:
+            if not isinstance(entry, dict) or "query" not in entry or not isinstance(entry.get("result", []), list):
+                raise ValueError(f"지오코딩 고정 데이터 형식이 올바르지 않습니다: {entry}")
+            grouped.setdefault(entry.get("provider", provider), []).append(
+                (entry["query"], entry.get("language", language), entry.get("result", []))
+            )
+        count = sum(self.put_many(name, items, ttl_seconds) for name, items in grouped.items())
+        logger.info(f"지오코딩 캐시 적재: {count}건")
+        return count
+
+    def export(self, path: Union[str, Path], include_expired: bool = False) -> int:
+        """
+        현재 캐시를 JSONL 파일로 저장 (warm() 으로 다시 적재 가능)
+
+        Args:
+            path: 저장할 파일 경로
+            include_expired: 만료된 항목 포함 여부
+
+        Returns:
+            저장한 항목 수
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT provider, query, language, result FROM geocode"
+                + ("" if include_expired else " WHERE expires_at > ?")
+                + " ORDER BY provider, query, language",
+                () if include_expired else (time.time(),)
+            ).fetchall()
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            for provider, query, language, result in rows:
+                f.write(json.dumps({"provider": provider, "query": query, "language": language,
+                                    "result": json.loads(result)}, ensure_ascii=False) + "\n")
+        return len(rows)
+
+
+_cache: Optional[GeocodeCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> GeocodeCache:
+    """프로세스 공용 지오코딩 캐시"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = GeocodeCache()
+        return _cache
@@ -0,0 +1,273 @@
+"""
+카카오맵 비동기 지오코딩 클라이언트
+
+여러 검색어를 httpx.AsyncClient 하나(연결 풀 재사용)로 동시에 조회합니다.
+
+- 동시 요청 수는 concurrency 개로 제한 (asyncio.Semaphore)
+- 초당 요청 수는 토큰 버킷으로 제한 (처음 burst 개는 바로 보내고 이후 rate_limit 개/초)
+- 429, 5xx, 연결/시간 초과 오류는 지수 백오프 + 지터로 재시도 (Retry-After 헤더가 있으면 그만큼 대기,
+  최대 max_retry_after 초)
+- 결과는 입력 순서대로 반환하며, 같은 검색어(정규화 기준)는 한 번만 조회
+- 캐시(GeocodeCache)를 넘기면 캐시에 없는 검색어만 조회하고 결과를 저장 (재시도 후에도 실패한 검색어는 저장하지 않음)
+
+동기 코드에서는 run_sync(geocoder.geocode_many(...)) 로 실행합니다.
+"""
+import asyncio
+import concurrent.futures
+import logging
+import math
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar, Union
+
+import httpx
+
+from app.config import get_config
+from app.seoul_crime.geocode_cache import GeocodeCache, normalize_query
+
+logger = logging.getLogger(__name__)
+
+# 요청 설정
+CONCURRENCY = get_config().geocode_concurrency
+RATE_LIMIT = get_config().geocode_rate_limit
+REQUEST_TIMEOUT = get_config().geocode_timeout_seconds
+MAX_RETRIES = get_config().geocode_max_retries
+
+# 재시도 대기 시간 (초): 지터 상한 = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** 시도 횟수)
+BACKOFF_BASE = 0.2
+BACKOFF_MAX = 5.0
+# Retry-After 헤더 대기 시간 상한 (초, 서버가 큰 값을 보내도 요청 하나가 오래 멈추지 않도록)
+RETRY_AFTER_MAX = 30.0
+
+KAKAO_LOCAL_URL = "https://dapi.kakao.com/v2/local"
+
+T = TypeVar("T")
+
+
+def format_documents(address: str, docs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    카카오맵 keyword 검색 결과를 Google Maps API 호환 형태로 변환 (첫 번째 문서만 사용)
+
+    Args:
+        address: 검색어 (로그용)
+        docs: 응답의 documents 목록
+
+    Returns:
+        결과 목록 (검색 결과가 없으면 빈 목록)
+    """
+    if not docs:
+        logger.warning(f"카카오맵 검색 결과 없음: query='{address}'")
+        return []
+
+    doc = docs[0]
+    # 가능한 필드 순서대로 주소 결정
+    formatted_address = (
+        doc.get('address_name', '') or
+        doc.get('road_address_name', '') or
+        doc.get('place_name', '')
+    )
+
+    # 좌표
+    lat = float(doc.get('y', 0))
+    lng = float(doc.get('x', 0))
+
+    # 주소 컴포넌트
+    address_info = doc.get('address', {}) or doc.get('road_address', {})
+    formatted_result = [{
+        'formatted_address': formatted_address,
+        'geometry': {
+            'location': {
+                'lat': lat,
+                'lng': lng
+            }
+        },
+        'address_components': [
+            {
+                'long_name': address_info.get('region_1depth_name', ''),
+                'short_name': address_info.get('region_1depth_name', ''),
+                'types': ['administrative_area_level_1']
+            },
+            {
+                'long_name': address_info.get('region_2depth_name', ''),
+                'short_name': address_info.get('region_2depth_name', ''),
+                'types': ['administrative_area_level_2']
+            },
+            {
+                'long_name': address_info.get('region_3depth_name', ''),
+                'short_name': address_info.get('region_3depth_name', ''),
+                'types': ['locality']
+            }
+        ]
+    }]
+
+    logger.info(
+        f"카카오맵 검색 성공: query='{address}', "
+        f"formatted='{formatted_address}', lat={lat}, lng={lng}"
+    )
+    return formatted_result
+
+
+def run_sync(coro: Awaitable[T]) -> T:
+    """
+    동기 코드에서 코루틴 실행
+
+    현재 스레드에 실행 중인 이벤트 루프가 있으면(async 엔드포인트에서 동기 함수를 호출한 경우)
+    별도 스레드의 새 이벤트 루프에서 실행합니다.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+class TokenBucket:
+    """초당 rate 개, 최대 burst 개까지 모아 둘 수 있는 토큰 버킷 (대기 순서대로 발급)"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = max(burst, 1)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class AsyncGeocoder:
+    """
+    카카오맵 keyword 검색 비동기 클라이언트
+
+    geocode_many() 호출 하나가 AsyncClient 하나를 열고 닫으므로 호출 안의 요청은 연결을 재사용합니다.
+    """
+
+    def __init__(self, api_key: Union[str, Callable[[], str]], base_url: str = KAKAO_LOCAL_URL,
+                 concurrency: int = CONCURRENCY, rate_limit: float = RATE_LIMIT,
+                 timeout: float = REQUEST_TIMEOUT, max_retries: int = MAX_RETRIES,
+                 max_retry_after: float = RETRY_AFTER_MAX, cache: Optional[GeocodeCache] = None,
+                 transport: Optional[httpx.AsyncBaseTransport] = None):
+        """
+        AsyncGeocoder 초기화
+
+        Args:
+            api_key: REST API 키 또는 키를 반환하는 함수 (캐시에 없는 검색어가 있을 때만 호출)
+            base_url: API 기본 URL (로컬 스텁 서버로 바꿔 테스트 가능)
+            concurrency: 최대 동시 요청 수
+            rate_limit: 초당 최대 요청 수 (0 이하이면 제한 없음, 재시도 포함)
+            timeout: 요청 하나의 시간 제한 (초)
+            max_retries: 429/5xx/연결 오류 최대 재시도 횟수
+            max_retry_after: Retry-After 헤더 대기 시간 상한 (초)
+            cache: 지오코딩 캐시 (없으면 항상 조회)
+            transport: httpx 전송 계층 (기본값: 연결 풀)
+        """
+        self._api_key = api_key
+        self.base_url = base_url.rstrip("/")
+        self.concurrency = max(concurrency, 1)
+        self.rate_limit = rate_limit
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.max_retry_after = max_retry_after
+        self.cache = cache
+        self.transport = transport
+        self.api_calls = 0  # 재시도 포함 실제 요청 수
+        self.retries = 0
+        self.cache_hits = 0  # 캐시에서 찾은 검색어 수
+
+    def _key(self) -> str:
+        return self._api_key() if callable(self._api_key) else self._api_key
+
+    async def _search(self, client: httpx.AsyncClient, bucket: TokenBucket,
+                      semaphore: asyncio.Semaphore, address: str) -> Optional[List[Dict[str, Any]]]:
+        """검색어 하나 조회 (재시도 후에도 실패하면 None)"""
+        async with semaphore:
+            for attempt in range(self.max_retries + 1):
+                await bucket.acquire()
+                self.api_calls += 1
+                retry_after = None
+                try:
+                    response = await client.get("/search/keyword.json", params={"query": address})
+                    if response.status_code == 429 or response.status_code >= 500:
+                        reason = f"HTTP {response.status_code}"
+                        retry_after = response.headers.get("Retry-After")
+                    else:
+                        response.raise_for_status()
+                        return format_documents(address, response.json().get("documents", []))
+                except httpx.HTTPStatusError as e:
+                    # 429/5xx 이외의 오류 (인증 오류 등)는 재시도해도 같으므로 바로 실패
+                    logger.error(f"카카오맵 API HTTP 오류 ({e.response.status_code}): query='{address}'")
+                    return None
+                except httpx.TransportError as e:
+                    reason = f"{type(e).__name__}: {e}"
+
+                if attempt == self.max_retries:
+                    logger.error(f"카카오맵 API 호출 실패 ({reason}, {attempt + 1}회 시도): query='{address}'")
+                    return None
+                try:
+                    delay = float(retry_after)
+                except (TypeError, ValueError):
+                    delay = math.nan
+                if math.isfinite(delay):
+                    delay = min(max(delay, 0.0), self.max_retry_after)
+                else:
+                    delay = random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+                self.retries += 1
+                logger.warning(f"카카오맵 API 재시도 {attempt + 1}/{self.max_retries} ({reason}, "
+                               f"{delay:.2f}초 후): query='{address}'")
+                await asyncio.sleep(delay)
+        return None
+
+    async def geocode_many(self, addresses: List[str], language: str = "ko") -> List[List[Dict[str, Any]]]:
+        """
+        여러 검색어 동시 조회
+
+        Args:
+            addresses: 검색어 목록
+            language: 언어 (캐시 키)
+
+        Returns:
+            입력 순서대로의 결과 목록 (검색 결과가 없거나 실패한 검색어는 빈 목록)
+        """
+        found: Dict[str, List[Dict[str, Any]]] = {}
+        pending: Dict[str, str] = {}
+        for address in addresses:
+            key = normalize_query(address)
+            if key in found or key in pending:
+                continue
+            cached = self.cache.get("kakao", address, language) if self.cache is not None else None
+            if cached is not None:
+                found[key] = cached
+                self.cache_hits += 1
+            else:
+                pending[key] = address
+
+        if pending:
+            started = time.perf_counter()
+            bucket = TokenBucket(self.rate_limit, self.concurrency)
+            semaphore = asyncio.Semaphore(self.concurrency)
+            limits = httpx.Limits(max_connections=self.concurrency, max_keepalive_connections=self.concurrency)
+            async with httpx.AsyncClient(base_url=self.base_url, timeout=self.timeout, limits=limits,
+                                         headers={"Authorization": f"KakaoAK {self._key()}"},
+                                         transport=self.transport) as client:
+                results = await asyncio.gather(*(self._search(client, bucket, semaphore, address)
+                                                 for address in pending.values()))
+            succeeded = [(address, language, result)
+                         for address, result in zip(pending.values(), results) if result is not None]
+            if self.cache is not None and succeeded:
+                self.cache.put_many("kakao", succeeded)
+            found.update((key, result or []) for key, result in zip(pending, results))
+            logger.info(f"카카오맵 동시 조회 {len(pending)}건 완료: {time.perf_counter() - started:.2f}초 "
+                        f"(요청 {self.api_calls}회, 재시도 {self.retries}회, 실패 {len(pending) - len(succeeded)}건)")
+
+        return [found[normalize_query(address)] for address in addresses]
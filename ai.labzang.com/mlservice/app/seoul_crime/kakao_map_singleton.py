@@ -4,6 +4,10 @@ from pathlib import Path
 import requests
 from dotenv import load_dotenv
 
+from app.seoul_crime.geocode_cache import GeocodeCache, get_cache
+from app.seoul_crime.geocode_client import (KAKAO_LOCAL_URL, REQUEST_TIMEOUT, AsyncGeocoder,
+                                              format_documents, run_sync)
+
 logger = logging.getLogger(__name__)
 
 
@@ -13,8 +17,13 @@ class KakaoMapSingleton:
     def __new__(cls):
         if cls._instance is None:  # 인스턴스가 없으면 생성
             cls._instance = super(KakaoMapSingleton, cls).__new__(cls)
-            cls._instance._api_key = cls._instance._retrieve_api_key()  # API 키 가져오기
-            cls._instance._base_url = "https://dapi.kakao.com/v2/local"  # 카카오맵 API 기본 URL
+            cls._instance._api_key = None  # API 키 (캐시에 없는 검색어를 처음 조회할 때 가져옴)
+            # 카카오맵 API 기본 URL (KAKAO_LOCAL_BASE_URL 로 로컬 스텁 서버 지정 가능)
+            cls._instance._base_url = os.getenv('KAKAO_LOCAL_BASE_URL', KAKAO_LOCAL_URL)
+            cls._instance._cache = get_cache()  # 지오코딩 결과 영구 캐시
+            cls._instance._session = requests.Session()  # 연결 재사용 (단건 조회용)
+            cls._instance.api_calls = 0  # 이 프로세스에서 실제로 호출한 API 횟수 (재시도 포함)
+            cls._instance.cache_hits = 0  # 이 프로세스에서 캐시로 응답한 검색어 수
         return cls._instance  # 기존 인스턴스 반환
 
     def _retrieve_api_key(self):
@@ -56,77 +65,63 @@ class KakaoMapSingleton:
         return api_key
 
     def get_api_key(self):
-        """저장된 API 키 반환"""
+        """저장된 API 키 반환 (아직 가져오지 않았으면 가져옴)"""
+        if self._api_key is None:
+            self._api_key = self._retrieve_api_key()
         return self._api_key
 
-    def geocode(self, address, language='ko'):
+    @property
+    def cache(self) -> GeocodeCache:
+        return self._cache
+
+    def geocode(self, address, language='ko', use_cache=True):
         """
         주소 또는 장소명을 좌표로 변환 (카카오맵 API, keyword 검색)
         Google Maps API 호환 형태로 반환
+
+        캐시에 있는 검색어(결과 없음 포함)는 API 를 호출하지 않으며, API 키도 필요하지 않습니다.
+        API 오류는 캐시에 저장하지 않습니다.
+        """
+        if use_cache:
+            cached = self._cache.get("kakao", address, language)
+            if cached is not None:
+                self.cache_hits += 1
+                logger.info(f"카카오맵 캐시 사용: query='{address}' ({'결과 있음' if cached else '결과 없음'})")
+                return cached
+
+        result = self._search(address)
+        if result is None:
+            return []
+        self._cache.put("kakao", address, language, result)
+        return result
+
+    def geocode_many(self, addresses, language='ko', use_cache=True):
+        """
+        여러 검색어를 동시에 변환 (입력 순서 유지)
+
+        캐시에 없는 검색어만 AsyncGeocoder 로 동시 조회합니다.
+        (연결 재사용, 동시 요청 수/초당 요청 수 제한, 429/5xx 재시도)
         """
+        geocoder = AsyncGeocoder(self.get_api_key, base_url=self._base_url, cache=self._cache if use_cache else None)
+        results = run_sync(geocoder.geocode_many(list(addresses), language))
+        self.api_calls += geocoder.api_calls
+        self.cache_hits += geocoder.cache_hits
+        return results
+
+    def _search(self, address):
+        """카카오맵 keyword 검색 API 호출 (오류이면 None, 결과가 없으면 빈 목록)"""
         url = f"{self._base_url}/search/keyword.json"
-        headers = {'Authorization': f'KakaoAK {self._api_key}'}
+        headers = {'Authorization': f'KakaoAK {self.get_api_key()}'}
         params = {'query': address}
 
         try:
-            response = requests.get(url, headers=headers, params=params)
+            self.api_calls += 1
+            response = self._session.get(url, headers=headers, params=params, timeout=REQUEST_TIMEOUT)
             if response.status_code == 403:
                 logger.error(f"카카오맵 API 403 오류 - 응답: {response.text}")
                 logger.error(f"사용된 API 키(앞 10자): {self._api_key[:10]}...")
             response.raise_for_status()
-
-            result = response.json()
-            docs = result.get('documents', [])
-            if not docs:
-                logger.warning(f"카카오맵 검색 결과 없음: query='{address}'")
-                return []
-
-            doc = docs[0]
-            # 가능한 필드 순서대로 주소 결정
-            formatted_address = (
-                doc.get('address_name', '') or
-                doc.get('road_address_name', '') or
-                doc.get('place_name', '')
-            )
-
-            # 좌표
-            lat = float(doc.get('y', 0))
-            lng = float(doc.get('x', 0))
-
-            # 주소 컴포넌트
-            address_info = doc.get('address', {}) or doc.get('road_address', {})
-            formatted_result = [{
-                'formatted_address': formatted_address,
-                'geometry': {
-                    'location': {
-                        'lat': lat,
-                        'lng': lng
-                    }
-                },
-                'address_components': [
-                    {
-                        'long_name': address_info.get('region_1depth_name', ''),
-                        'short_name': address_info.get('region_1depth_name', ''),
-                        'types': ['administrative_area_level_1']
-                    },
-                    {
-                        'long_name': address_info.get('region_2depth_name', ''),
-                        'short_name': address_info.get('region_2depth_name', ''),
-                        'types': ['administrative_area_level_2']
-                    },
-                    {
-                        'long_name': address_info.get('region_3depth_name', ''),
-                        'short_name': address_info.get('region_3depth_name', ''),
-                        'types': ['locality']
-                    }
-                ]
-            }]
-
-            logger.info(
-                f"카카오맵 검색 성공: query='{address}', "
-                f"formatted='{formatted_address}', lat={lat}, lng={lng}"
-            )
-            return formatted_result
+            return format_documents(address, response.json().get('documents', []))
 
         except requests.exceptions.HTTPError as e:
             if e.response is not None and e.response.status_code == 403:
@@ -134,8 +129,7 @@ class KakaoMapSingleton:
             else:
                 code = e.response.status_code if e.response is not None else "N/A"
                 logger.error(f"카카오맵 API HTTP 오류 ({code}): {str(e)}")
-            return []
+            return None
         except requests.exceptions.RequestException as e:
             logger.error(f"카카오맵 API 호출 오류: {str(e)}")
-            return []
-
+            return None
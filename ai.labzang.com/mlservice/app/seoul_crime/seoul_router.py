@@ -1,7 +1,7 @@
 """
 타이타닉 관련 라우터
 """
-from fastapi import APIRouter, HTTPException, Query, Body
+from fastapi import APIRouter, HTTPException, Query, Body, File, UploadFile
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 import sys
@@ -59,4 +59,75 @@ async def preprocess_data():
         raise HTTPException(
             status_code=500,
             detail=f"전처리 중 오류가 발생했습니다: {str(e)}"
-        )
\ No newline at end of file
+        )
+
+@router.get("/crime-data")
+async def crime_data_status():
+    """
+    공유 범죄 데이터(crime.csv) 스냅샷 상태
+    - kr_(범죄지도), heatmap(히트맵) 서비스가 함께 사용하는 읽기 전용 스냅샷
+    - 전처리로 파일이 바뀌면 버전이 올라가고 두 서비스의 캐시가 새 버전으로 교체됨
+    """
+    try:
+        service = get_service()
+        return create_response(
+            data=service.crime_data_status(),
+            message="범죄 데이터 상태를 조회했습니다"
+        )
+    except FileNotFoundError as e:
+        raise HTTPException(
+            status_code=404,
+            detail=f"범죄 데이터 파일을 찾을 수 없습니다: {str(e)}"
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"범죄 데이터 조회 중 오류가 발생했습니다: {str(e)}"
+        )
+
+@router.get("/geocode-cache")
+async def geocode_cache_stats():
+    """
+    지오코딩 캐시 상태
+    - 경찰서 주소 검색 결과는 SQLite 캐시에 저장되어 다음 전처리부터 API 를 호출하지 않음
+    - 결과가 없는 검색어도 짧은 기간 동안 저장 (API 오류는 저장하지 않음)
+    """
+    try:
+        service = get_service()
+        return create_response(
+            data=service.geocode_cache_stats(),
+            message="지오코딩 캐시 상태를 조회했습니다"
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"지오코딩 캐시 조회 중 오류가 발생했습니다: {str(e)}"
+        )
+
+
+@router.post("/geocode-cache/warm")
+async def warm_geocode_cache(
+    file: UploadFile = File(..., description='JSON ({검색어: 결과 목록} 또는 항목 배열) 또는 JSONL 파일'),
+    language: str = Query("ko", description="항목에 language 가 없을 때 사용할 언어")
+):
+    """
+    지오코딩 캐시 일괄 적재
+    - 항목 형식: {"query": 검색어, "language": "ko", "result": 카카오맵 geocode 결과 목록}
+    - 파일 이름이 .jsonl 이면 한 줄에 항목 하나
+    """
+    try:
+        service = get_service()
+        text = (await file.read()).decode("utf-8-sig")
+        result = service.warm_geocode_cache(text, jsonl=(file.filename or "").endswith(".jsonl"),
+                                            language=language)
+        return create_response(
+            data=result,
+            message=f"지오코딩 캐시에 {result['loaded']}건을 적재했습니다"
+        )
+    except (ValueError, UnicodeDecodeError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"지오코딩 캐시 적재 중 오류가 발생했습니다: {str(e)}"
+        )
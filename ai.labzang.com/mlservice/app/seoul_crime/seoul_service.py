@@ -1,11 +1,14 @@
 from poplib import POP3
+import json
 import sys
+from typing import Any, Dict
 from pathlib import Path
 import pandas as pd
 import numpy as np
 from app.seoul_crime.seoul_method import SeoulMethod
 from app.seoul_crime.seoul_data import SeoulData
 from app.seoul_crime.kakao_map_singleton import KakaoMapSingleton
+from app.seoul_crime.crime_repository import get_repository
 
 try:
     from common.utils import setup_logging
@@ -102,32 +105,37 @@ class SeoulService:
         else:
             logger.warning("KakaoMapSingleton: 다른 객체입니다 (싱글턴 패턴 오류)")
         
-        kakao = KakaoMapSingleton() # 카카오맵 객체 생성
+        kakao = KakaoMapSingleton() # 카카오맵 객체 생성 (검색 결과는 지오코딩 캐시에 저장되어 다음 실행부터 재사용)
+        api_calls_before = kakao.api_calls
+        cache_hits_before = kakao.cache_hits
         logger.info(f"총 {len(station_names)}개 경찰서 주소 검색 중...")
         
-        for idx, name in enumerate(station_names, 1):
-            try:
-                tmp = kakao.geocode(name, language='ko')
-                if tmp and len(tmp) > 0:
-                    formatted_addr = tmp[0].get("formatted_address", "")
-                    logger.info(f"[{idx}/{len(station_names)}] {name}의 검색 결과: {formatted_addr}")
-                    station_addrs.append(formatted_addr)
-                    tmp_loc = tmp[0].get("geometry", {})
-                    location = tmp_loc.get('location', {})
-                    station_lats.append(location.get('lat', 0.0))
-                    station_lngs.append(location.get('lng', 0.0))
-                else:
-                    logger.warning(f"[{idx}/{len(station_names)}] {name}의 검색 결과가 없습니다.")
-                    station_addrs.append("")
-                    station_lats.append(0.0)
-                    station_lngs.append(0.0)
-            except Exception as e:
-                logger.error(f"[{idx}/{len(station_names)}] {name} 검색 중 오류 발생: {str(e)}")
+        # 캐시에 없는 경찰서만 동시에 조회 (결과는 입력 순서대로)
+        try:
+            results = kakao.geocode_many(station_names, language='ko')
+        except Exception as e:
+            logger.error(f"경찰서 주소 검색 중 오류 발생: {str(e)}")
+            results = [[] for _ in station_names]
+
+        for idx, (name, tmp) in enumerate(zip(station_names, results), 1):
+            if tmp and len(tmp) > 0:
+                formatted_addr = tmp[0].get("formatted_address", "")
+                logger.info(f"[{idx}/{len(station_names)}] {name}의 검색 결과: {formatted_addr}")
+                station_addrs.append(formatted_addr)
+                tmp_loc = tmp[0].get("geometry", {})
+                location = tmp_loc.get('location', {})
+                station_lats.append(location.get('lat', 0.0))
+                station_lngs.append(location.get('lng', 0.0))
+            else:
+                logger.warning(f"[{idx}/{len(station_names)}] {name}의 검색 결과가 없습니다.")
                 station_addrs.append("")
                 station_lats.append(0.0)
                 station_lngs.append(0.0)
         
-        logger.info(f"주소 검색 완료. 검색된 주소 리스트: {station_addrs}")
+        api_calls = kakao.api_calls - api_calls_before
+        cache_hits = kakao.cache_hits - cache_hits_before
+        logger.info(f"주소 검색 완료 (API 호출 {api_calls}회(재시도 포함), 캐시 사용 {cache_hits}건). "
+                    f"검색된 주소 리스트: {station_addrs}")
         
         # 주소에서 자치구 추출
         gu_names = []
@@ -162,8 +170,7 @@ class SeoulService:
         logger.info("😎😎😎😎카카오맵 실행 완료😎😎😎😎")
 
         # crime 를 save 폴더에 csv 파일로 저장 (컬럼 순서 정렬)
-        save_path = Path(self.data.sname)
-        save_path.mkdir(parents=True, exist_ok=True)
+        # 공유 저장소를 통해 저장하여 kr_/heatmap 서비스가 재시작 없이 새 스냅샷을 사용
         desired_cols = [
             '관서명', '살인 발생', '살인 검거',
             '강도 발생', '강도 검거',
@@ -175,9 +182,9 @@ class SeoulService:
         ordered_cols = [c for c in desired_cols if c in crime.columns]
         rest_cols = [c for c in crime.columns if c not in ordered_cols]
         crime_sorted = crime[ordered_cols + rest_cols]
-        out_file = save_path / "crime.csv"
-        crime_sorted.to_csv(out_file, index=False, encoding='utf-8-sig')
-        logger.info(f"👽👽👽👽crime 데이터프레임을 {out_file} 에 저장했습니다.👽👽👽👽")
+        repository = get_repository()
+        snapshot = repository.publish(crime_sorted)
+        logger.info(f"👽👽👽👽crime 데이터프레임을 {repository.path} 에 저장했습니다. (v{snapshot.version})👽👽👽👽")
 
 
         return {
@@ -194,6 +201,49 @@ class SeoulService:
             "crime_preview": crime.head(20).to_dict(orient='records'),
             "pop_preview": pop.head(3).to_dict(orient='records'),
             "cctv_pop_preview": cctv_pop.head(3).to_dict(orient='records'),
+            "geocode_api_calls": api_calls,
+            "geocode_cache_hits": cache_hits,
+            "crime_data_version": snapshot.version,
             "message": "데이터 전처리 및 머지가 완료되었습니다"
         }
+
+    def crime_data_status(self) -> Dict[str, Any]:
+        """
+        공유 범죄 데이터(crime.csv) 스냅샷 상태
+
+        Returns:
+            버전, 관서/자치구 수, 파일 수정 시각, 로드 시각, 다시 읽은 횟수 딕셔너리
+        """
+        return get_repository().status()
+
+    def geocode_cache_stats(self) -> Dict[str, Any]:
+        """
+        지오코딩 캐시 상태
+
+        Returns:
+            항목 수(결과 있음/없음/만료), 적중/실패 횟수, 유지 기간, 실제 API 호출 횟수(재시도 포함),
+            캐시로 응답한 검색어 수 딕셔너리
+        """
+        kakao = KakaoMapSingleton()
+        return {**kakao.cache.stats(), "api_calls": kakao.api_calls, "cache_hits": kakao.cache_hits}
+
+    def warm_geocode_cache(self, text: str, jsonl: bool = False, language: str = 'ko') -> Dict[str, Any]:
+        """
+        고정 데이터로 지오코딩 캐시 일괄 적재
+
+        Args:
+            text: JSON/JSONL 내용 (GeocodeCache.parse_entries 형식)
+            jsonl: JSONL 형식 여부
+            language: 항목에 language 가 없을 때 사용할 언어
+
+        Returns:
+            적재한 항목 수와 캐시 상태 딕셔너리
+        """
+        cache = KakaoMapSingleton().cache
+        try:
+            entries = cache.parse_entries(text, jsonl)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"JSON 형식이 올바르지 않습니다: {e}")
+        loaded = cache.warm(entries, provider="kakao", language=language)
+        return {"loaded": loaded, **self.geocode_cache_stats()}
         
\ No newline at end of file
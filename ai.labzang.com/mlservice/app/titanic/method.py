@@ -1,4 +1,5 @@
 from app.titanic.datasets import DataSets
+from app.titanic import titanic_columnar
 import pandas as pd
 import numpy as np
 from icecream import ic
@@ -13,10 +14,10 @@ class TitanicMethod(object):
 
 
     def read_csv(self, fname: str) -> pd.DataFrame:
-        # CSV 파일을 읽어와서 데이터프레임 작성
+        # CSV 파일을 읽어와서 데이터프레임 작성 (컬럼형 캐시 사용, 원본이 바뀌면 다시 변환)
         current_dir = os.path.dirname(os.path.abspath(__file__))
         csv_path = os.path.join(current_dir, fname)
-        return pd.read_csv(csv_path)
+        return titanic_columnar.read_csv(csv_path)
 
     def create_train(self, df: pd.DataFrame, label: str) -> pd.DataFrame:
         # Survived 값을 제거한 데이터프레임 작성
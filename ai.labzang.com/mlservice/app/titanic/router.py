@@ -1,11 +1,10 @@
 """
 Titanic 관련 라우터
 """
-from fastapi import APIRouter, Query
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Query, Request
 from typing import Optional
-import os
 from app.titanic.service import get_top_10_passengers, get_passengers_by_survival_probability, TitanicService
+from app.titanic.titanic_submissions import artifact_response, get_store
 
 router = APIRouter(prefix="/titanic", tags=["titanic"])
 
@@ -143,7 +142,7 @@ async def evaluate_model():
     summary="캐글 제출 파일 생성",
     description="최고 성능 모델을 사용하여 테스트 데이터에 대한 예측을 수행하고 캐글 제출용 CSV 파일을 생성합니다."
 )
-async def submit_model():
+async def submit_model(request: Request):
     """
     캐글 제출 파일 생성
     - 전처리, 모델링, 학습, 평가를 순차적으로 실행
@@ -166,6 +165,9 @@ async def submit_model():
     
     # 제출 파일 생성
     result = service.submit()
+    for model_result in result['all_models']:
+        model_result['download_url'] = request.url_for(
+            "download_submission", filename=model_result['filename']).path
     
     return {
         "status": "success",
@@ -182,21 +184,15 @@ async def submit_model():
     summary="제출 파일 다운로드",
     description="생성된 캐글 제출 CSV 파일을 다운로드합니다."
 )
-async def download_submission(filename: str):
+async def download_submission(filename: str, request: Request):
     """
     제출 파일 다운로드
-    - 생성된 제출 CSV 파일을 다운로드합니다.
+    - 생성된 제출 CSV 파일을 다운로드합니다. (ETag/If-None-Match, Range 지원)
     """
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    download_dir = os.path.join(current_dir, 'download')
-    filepath = os.path.join(download_dir, filename)
+    artifact = get_store().get(filename)
     
-    if not os.path.exists(filepath):
+    if artifact is None:
         from fastapi import HTTPException
         raise HTTPException(status_code=404, detail=f"파일을 찾을 수 없습니다: {filename}")
     
-    return FileResponse(
-        path=filepath,
-        filename=filename,
-        media_type='text/csv'
-    )
\ No newline at end of file
+    return artifact_response(artifact, request.headers)
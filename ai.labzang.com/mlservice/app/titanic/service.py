@@ -1,11 +1,9 @@
 """
 Titanic 서비스 모듈
 """
-import os
 import csv
 from typing import List, Dict
 from fastapi import HTTPException
-import pandas as pd
 import numpy as np
 from sklearn import (
     model_selection,
@@ -20,20 +18,19 @@ from app.titanic.method import TitanicMethod
 from datasets import Dataset
 from icecream import ic
 from app.titanic.datasets import DataSets
+from app.titanic.titanic_passengers import load_store
+from app.titanic.titanic_submissions import get_store
 
 
 
 def get_top_10_passengers():
-    """상위 10명 승객 정보 조회 (임시 함수)"""
-    return []
+    """상위 10명 승객 정보 조회 (승객 번호 순, 상주 승객 저장소 사용)"""
+    return load_store().query(sort="passenger_id", limit=10)["passengers"]
 
 
 def get_passengers_by_survival_probability(limit: int = 10):
-    """생존 가능성 분석 (임시 함수)"""
-    return {
-        'high_survival': [],
-        'low_survival': []
-    }
+    """생존 가능성 분석 (생존 점수 상위/하위 limit명)"""
+    return load_store().extremes(limit)
 
 
 class TitanicService:
@@ -231,13 +228,8 @@ class TitanicService:
         # 테스트 데이터 준비
         X_test = self.this.test.drop(columns=['PassengerId'], errors='ignore')
         
-        # download 디렉토리 생성
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        download_dir = os.path.join(current_dir, 'download')
-        os.makedirs(download_dir, exist_ok=True)
-        
-        # 타임스탬프 생성
-        timestamp = pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')
+        # 제출 파일 저장소 (같은 예측은 기존 파일 재사용, 오래된 파일은 보존 정책에 따라 삭제)
+        store = get_store()
         
         # 모든 모델에 대해 제출 파일 생성
         results = []
@@ -253,16 +245,10 @@ class TitanicService:
             # 예측 수행
             predictions = model.predict(X_test)
             
-            # 제출용 DataFrame 생성
-            submission_df = pd.DataFrame({
-                'PassengerId': self.this.test['PassengerId'],
-                'Survived': predictions.astype(int)
-            })
-            
             # CSV 파일 저장
-            filename = f'submission_{model_name}_{timestamp}.csv'
-            filepath = os.path.join(download_dir, filename)
-            submission_df.to_csv(filepath, index=False)
+            artifact, _ = store.put(self.this.test['PassengerId'].to_numpy(), predictions, model_name)
+            filename = artifact.filename
+            filepath = str(artifact.path)
             
             # 모델 정확도 가져오기
             model_accuracy = self.model_scores.get(model_name, None)
@@ -283,7 +269,6 @@ class TitanicService:
                 'accuracy': model_accuracy,
                 'filepath': filepath,
                 'filename': filename,
-                'download_url': f"/titanic/download/{filename}",
                 'predictions_count': len(predictions),
                 'survived_count': int(predictions.sum()),
                 'deceased_count': int(len(predictions) - predictions.sum())
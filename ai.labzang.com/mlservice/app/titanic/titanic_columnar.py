@@ -0,0 +1,266 @@
+"""
+타이타닉 CSV 컬럼형 바이너리 캐시
+
+train.csv / test.csv 를 처음 한 번만 파싱하여 컬럼형 바이너리 파일로 저장하고,
+이후에는 pd.read_csv 대신 메모리 맵으로 읽습니다.
+
+- 숫자 컬럼: dtype 그대로 저장 → copy-on-write 메모리 맵 뷰로 복사 없이 참조
+  (호출하는 쪽에서 값을 바꿔도 캐시 파일은 그대로)
+- 문자열 컬럼: int32 범주 코드 + 범주 값 목록(meta.json)으로 저장 후 원래 dtype으로 복원
+- 캐시 폴더 이름은 원본 파일 내용의 sha256 이므로, 내용이 같은
+  app/titanic/*.csv 와 app/resources/titanic/*.csv 는 캐시 하나를 함께 사용
+- 원본 경로별 크기/수정 시각/sha256 을 기록해 두고, 크기나 수정 시각이 바뀌면
+  해시를 다시 계산하여 내용이 달라졌을 때만 새로 변환
+
+저장 구조:
+    save/columnar/
+        sources.json                원본 경로 → {size, mtime_ns, sha256}
+        <sha256>/meta.json          원본 경로, 크기, 수정 시각, 해시, 컬럼 목록(dtype, 위치, 범주 값)
+        <sha256>/columns.bin        컬럼 값 또는 범주 코드를 8바이트 정렬로 이어 붙인 파일
+"""
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+logger = logging.getLogger(__name__)
+
+# 저장 형식이 바뀌면 올려서 기존 캐시를 무효화
+CACHE_VERSION = "1"
+
+# 캐시 저장 위치
+CACHE_DIR = Path(__file__).resolve().parent / "save" / "columnar"
+
+# 컬럼 값을 이어 붙인 데이터 파일 이름
+DATA_FILE = "columns.bin"
+
+
+def file_sha256(path: Union[str, Path], chunk_size: int = 1 << 20) -> str:
+    """파일 내용의 sha256"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(chunk_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ColumnarCache:
+    """CSV → 컬럼형 바이너리 캐시 (원본마다 columns.bin 한 파일, np.memmap 으로 읽음)"""
+
+    def __init__(self, root: Optional[Path] = None):
+        """
+        ColumnarCache 초기화
+
+        Args:
+            root: 캐시 폴더 (기본값: app/titanic/save/columnar)
+        """
+        self.root = Path(root) if root else CACHE_DIR
+        self._sources: Optional[Dict[str, Dict[str, Any]]] = None
+        self._meta: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    # ***********
+    # 원본 파일 확인
+    # ***********
+
+    def _sources_path(self) -> Path:
+        return self.root / "sources.json"
+
+    def _read_sources(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self._sources_path(), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _write_sources(self, sources: Dict[str, Dict[str, Any]]) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self._sources_path().with_name(f".sources.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(sources, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, self._sources_path())
+
+    def source_hash(self, path: Path) -> str:
+        """
+        원본 파일의 sha256 (크기와 수정 시각이 기록과 같으면 다시 계산하지 않음)
+
+        Args:
+            path: 원본 CSV 경로
+
+        Returns:
+            sha256 문자열
+        """
+        path = Path(path).resolve()
+        stat = os.stat(path)
+        with self._lock:
+            if self._sources is None:
+                self._sources = self._read_sources()
+            record = self._sources.get(str(path))
+            if record and record["size"] == stat.st_size and record["mtime_ns"] == stat.st_mtime_ns:
+                return record["sha256"]
+
+            # 다른 프로세스가 기록했을 수 있으므로 파일에서 다시 확인
+            sources = self._read_sources()
+            record = sources.get(str(path))
+            if record and record["size"] == stat.st_size and record["mtime_ns"] == stat.st_mtime_ns:
+                self._sources = sources
+                return record["sha256"]
+
+            sha256 = file_sha256(path)
+            sources[str(path)] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": sha256}
+            self._write_sources(sources)
+            self._sources = sources
+            if record and record["sha256"] != sha256:
+                logger.info(f"[컬럼형 캐시] 원본 변경 감지: {path}")
+                # 더 이상 어떤 원본도 가리키지 않는 이전 캐시는 삭제
+                if all(r["sha256"] != record["sha256"] for r in sources.values()):
+                    shutil.rmtree(self._entry_dir(record["sha256"]), ignore_errors=True)
+                    self._meta.pop(record["sha256"], None)
+            return sha256
+
+    # ***********
+    # 변환 / 읽기
+    # ***********
+
+    def _entry_dir(self, sha256: str) -> Path:
+        return self.root / sha256
+
+    def build(self, path: Path, sha256: str) -> Path:
+        """
+        CSV를 파싱하여 컬럼형 바이너리로 저장 (임시 폴더에 쓴 뒤 이름을 바꿔 교체)
+
+        Args:
+            path: 원본 CSV 경로
+            sha256: 원본 파일 해시
+
+        Returns:
+            캐시 폴더 경로
+        """
+        path = Path(path).resolve()
+        stat = os.stat(path)
+        df = pd.read_csv(path)
+
+        target = self._entry_dir(sha256)
+        tmp = target.with_name(f".{sha256}.{os.getpid()}.tmp")
+        tmp.mkdir(parents=True, exist_ok=True)
+        columns = []
+        offset = 0
+        with open(tmp / DATA_FILE, "wb") as f:
+            for name in df.columns:
+                series = df[name]
+                column = {"name": name, "dtype": str(series.dtype)}
+                if series.dtype.kind in "biuf":
+                    values = np.ascontiguousarray(series.to_numpy())
+                    column["encoding"] = "plain"
+                else:
+                    codes, categories = pd.factorize(series)
+                    values = codes.astype(np.int32)
+                    column["encoding"] = "categorical"
+                    column["categories"] = [str(c) for c in categories]
+                # 8바이트 정렬
+                padding = -offset % 8
+                f.write(b"\0" * padding)
+                offset += padding
+                column.update({"storage": values.dtype.str, "offset": offset})
+                f.write(values.tobytes())
+                offset += values.nbytes
+                columns.append(column)
+
+        meta = {
+            "version": CACHE_VERSION,
+            "source": str(path),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": sha256,
+            "rows": len(df),
+            "columns": columns,
+            "created_at": datetime.now().isoformat(),
+        }
+        with open(tmp / "meta.json", "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False)
+        try:
+            os.replace(tmp, target)
+        except OSError:
+            # 다른 프로세스가 먼저 저장한 경우
+            shutil.rmtree(tmp, ignore_errors=True)
+        logger.info(f"[컬럼형 캐시] 변환 완료: {path.name} {df.shape} → {target}")
+        return target
+
+    def _load_meta(self, sha256: str) -> Optional[Dict[str, Any]]:
+        """캐시 메타 정보 (프로세스 안에서는 한 번만 읽고, 범주 값은 object 배열로 변환해 둠)"""
+        meta = self._meta.get(sha256)
+        if meta is not None:
+            return meta
+        meta_path = self._entry_dir(sha256) / "meta.json"
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        except FileNotFoundError:
+            return None
+        if meta.get("version") != CACHE_VERSION:
+            shutil.rmtree(self._entry_dir(sha256), ignore_errors=True)
+            return None
+        for column in meta["columns"]:
+            if column["encoding"] == "categorical":
+                # 결측(코드 -1)은 마지막 칸의 NaN으로 매핑
+                column["lookup"] = np.array(column["categories"] + [np.nan], dtype=object)
+        self._meta[sha256] = meta
+        return meta
+
+    def _load_entry(self, sha256: str, meta: Dict[str, Any]) -> DataFrame:
+        # 파일 하나를 copy-on-write로 매핑한 뒤 컬럼별 뷰를 만듦
+        buffer = np.memmap(self._entry_dir(sha256) / DATA_FILE, dtype=np.uint8, mode="c")
+        rows = meta["rows"]
+        data = {}
+        for column in meta["columns"]:
+            values = np.ndarray((rows,), dtype=column["storage"], buffer=buffer, offset=column["offset"])
+            if column["encoding"] == "categorical":
+                values = pd.array(column["lookup"].take(values), dtype=column["dtype"])
+            data[column["name"]] = values
+        # copy=False: 숫자 컬럼은 메모리 맵을 그대로 참조
+        return pd.DataFrame(data, copy=False)
+
+    def read_csv(self, path: Union[str, Path]) -> DataFrame:
+        """
+        pd.read_csv 대체 (캐시가 없거나 원본이 바뀌었으면 변환 후 읽기)
+
+        Args:
+            path: 원본 CSV 경로
+
+        Returns:
+            DataFrame (숫자 컬럼은 copy-on-write 메모리 맵)
+        """
+        sha256 = self.source_hash(Path(path))
+        meta = self._load_meta(sha256)
+        if meta is None:
+            self.build(Path(path), sha256)
+            meta = self._load_meta(sha256)
+        return self._load_entry(sha256, meta)
+
+
+_default_cache: Optional[ColumnarCache] = None
+
+
+def read_csv(path: Union[str, Path]) -> DataFrame:
+    """
+    기본 캐시(app/titanic/save/columnar)를 사용하는 pd.read_csv 대체 함수
+
+    Args:
+        path: 원본 CSV 경로
+
+    Returns:
+        DataFrame
+    """
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ColumnarCache()
+    return _default_cache.read_csv(path)
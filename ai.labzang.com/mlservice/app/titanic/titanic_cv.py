@@ -0,0 +1,513 @@
+"""
+타이타닉 모델 × 폴드 교차 검증 그리드
+
+TitanicMethod.accuracy_by_* 는 모델마다 cross_val_score(n_jobs=1)로
+10-Fold를 순서대로 실행합니다. 이 모듈은 (모델, 폴드) 조합 하나하나를
+프로세스 풀 작업으로 나누어 동시에 실행합니다.
+
+- 폴드 분할은 한 번만 계산하여 폴드 번호 배열로 공유
+- 피처 행렬, 라벨, 폴드 번호는 공유 메모리에 한 번 올리고 작업자는 복사 없이 참조
+- 모델별 실제 소요 시간(wall)과 학습 시간 합계를 함께 반환
+- run_fold_tasks 는 (모델, 파라미터, 폴드) 임의 작업 목록을 같은 방식으로 실행 (하이퍼파라미터 탐색용)
+- 폴드 점수 저장소(FoldScoreStore)를 넘기면 (데이터 해시, 모델 클래스와 전체 파라미터, 폴드 시드/번호)가
+  같은 칸은 다시 학습하지 않고 저장된 점수를 사용
+- 작업자에서 측정한 CPU 시간과 tracemalloc 최대 메모리는 모델별로 묶어 현재 계측 실행(titanic_profile)에 기록
+"""
+import functools
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import sklearn
+from sklearn.base import BaseEstimator, ClassifierMixin
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import SGDClassifier
+from sklearn.model_selection import KFold
+from sklearn.naive_bayes import GaussianNB
+from sklearn.neighbors import KNeighborsClassifier
+from sklearn.preprocessing import StandardScaler
+from sklearn.svm import SVC
+from sklearn.tree import DecisionTreeClassifier
+
+from app.titanic import titanic_profile
+
+logger = logging.getLogger(__name__)
+
+
+class ScaledSGDClassifier(ClassifierMixin, BaseEstimator):
+    """
+    표준화 + SGD 로지스틱 회귀 (partial_fit 지원)
+
+    SGDClassifier 는 피처 크기에 민감하므로 fit() 할 때 StandardScaler 를 한 번 학습하여 모델과 함께 저장하고,
+    partial_fit() 은 같은 스케일러로 변환한 새 행만 반영합니다. (새 배치로 스케일러를 다시 학습하지 않음)
+    average=True(평균 SGD)이므로 작은 배치 하나가 그동안 학습한 가중치를 뒤집지 않습니다.
+    """
+
+    def __init__(self, loss: str = "log_loss", penalty: str = "l2", alpha: float = 1e-4,
+                 learning_rate: str = "optimal", eta0: float = 0.01, average: bool = True,
+                 max_iter: int = 1000, tol: float = 1e-3, random_state: Optional[int] = None):
+        self.loss = loss
+        self.penalty = penalty
+        self.alpha = alpha
+        self.learning_rate = learning_rate
+        self.eta0 = eta0
+        self.average = average
+        self.max_iter = max_iter
+        self.tol = tol
+        self.random_state = random_state
+
+    def _sgd(self) -> SGDClassifier:
+        return SGDClassifier(loss=self.loss, penalty=self.penalty, alpha=self.alpha,
+                             learning_rate=self.learning_rate, eta0=self.eta0, average=self.average,
+                             max_iter=self.max_iter, tol=self.tol, random_state=self.random_state)
+
+    def fit(self, X, y):
+        self.scaler_ = StandardScaler().fit(X)
+        self.sgd_ = self._sgd().fit(self.scaler_.transform(X), y)
+        self.classes_ = self.sgd_.classes_
+        return self
+
+    def partial_fit(self, X, y, classes=None):
+        if not hasattr(self, "scaler_"):
+            self.scaler_ = StandardScaler().fit(X)
+            self.sgd_ = self._sgd()
+        self.sgd_.partial_fit(self.scaler_.transform(X), y, classes=classes)
+        self.classes_ = self.sgd_.classes_
+        return self
+
+    def decision_function(self, X):
+        return self.sgd_.decision_function(self.scaler_.transform(X))
+
+    def predict_proba(self, X):
+        return self.sgd_.predict_proba(self.scaler_.transform(X))
+
+    def predict(self, X):
+        return self.sgd_.predict(self.scaler_.transform(X))
+
+
+# 결과 키 → (표시 이름, 모델 클래스, 파라미터)
+# TitanicMethod.accuracy_by_* 와 같은 설정이며, 오래 걸리는 모델부터 배치
+MODEL_SPECS: Dict[str, Tuple[str, type, Dict[str, Any]]] = {
+    "svm": ("SVM", SVC, {}),
+    "random_forest": ("Random Forest", RandomForestClassifier, {"n_estimators": 13}),
+    "knn": ("KNN", KNeighborsClassifier, {"n_neighbors": 13}),
+    "decision_tree": ("Decision Tree", DecisionTreeClassifier, {}),
+    "naive_bayes": ("Naive Bayes", GaussianNB, {}),
+    # partial_fit 을 지원하는 로지스틱 회귀 (새 라벨 승객 점진 학습용, 학습 데이터로 표준화)
+    "logistic_regression": ("Logistic Regression (SGD)", ScaledSGDClassifier, {"loss": "log_loss", "random_state": 0}),
+}
+
+# 결과 반환 순서 (기존 evaluate 응답 순서)
+RESULT_ORDER = ["knn", "decision_tree", "random_forest", "naive_bayes", "svm", "logistic_regression"]
+
+# 폴드 점수 저장 위치 (evaluate, 하이퍼파라미터 탐색, 모든 워커 프로세스가 함께 사용)
+STORE_PATH = Path(__file__).resolve().parent / "save" / "cv" / "fold_scores.sqlite"
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_executor(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """
+    교차 검증용 프로세스 풀 반환 (요청마다 프로세스를 새로 띄우지 않도록 재사용)
+
+    Args:
+        max_workers: 작업자 수 (기본값: CPU 코어 수)
+
+    Returns:
+        ProcessPoolExecutor 객체
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(max_workers=max_workers or os.cpu_count())
+        return _executor
+
+
+def compute_folds(n_samples: int, n_splits: int = 10, random_state: int = 0) -> np.ndarray:
+    """
+    행별 검증 폴드 번호 계산 (TitanicMethod.create_k_fold 와 같은 분할)
+
+    Args:
+        n_samples: 행 수
+        n_splits: 폴드 수
+        random_state: 셔플 시드
+
+    Returns:
+        길이 n_samples의 폴드 번호 배열
+    """
+    folds = np.empty(n_samples, dtype=np.int8)
+    k_fold = KFold(n_splits=n_splits, shuffle=True, random_state=random_state)
+    for fold, (_, test_index) in enumerate(k_fold.split(np.empty(n_samples))):
+        folds[test_index] = fold
+    return folds
+
+
+class SharedArrays:
+    """
+    여러 numpy 배열을 공유 메모리 블록 하나에 올려 두는 컨테이너
+
+    작업자에게는 이름과 (키, dtype, shape, offset) 목록만 전달합니다.
+    """
+
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        self.layout: List[Tuple[str, str, Tuple[int, ...], int]] = []
+        offset = 0
+        for key, array in arrays.items():
+            # 8바이트 정렬
+            offset = (offset + 7) // 8 * 8
+            self.layout.append((key, array.dtype.str, array.shape, offset))
+            offset += array.nbytes
+        self.shm = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+        for (key, dtype, shape, start), array in zip(self.layout, arrays.values()):
+            view = np.ndarray(shape, dtype=dtype, buffer=self.shm.buf, offset=start)
+            view[...] = array
+            del view
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def release(self) -> None:
+        self.shm.close()
+        self.shm.unlink()
+
+
+def _attach(name: str, layout) -> Tuple[shared_memory.SharedMemory, Dict[str, np.ndarray]]:
+    try:
+        # 블록 해제는 생성한 프로세스가 담당하므로 작업자에서는 추적하지 않음 (Python 3.13+)
+        shm = shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        shm = shared_memory.SharedMemory(name=name)
+    arrays = {
+        key: np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=offset)
+        for key, dtype, shape, offset in layout
+    }
+    return shm, arrays
+
+
+def _fit_fold(shm_name: str, layout, model_name: str, fold: int,
+              params: Optional[Dict[str, Any]] = None, trace_memory: bool = False) -> Dict[str, Any]:
+    """
+    (모델, 폴드) 한 칸 학습 및 검증 (프로세스 풀 작업 함수)
+
+    Args:
+        params: 모델 파라미터 (기본값: MODEL_SPECS 설정)
+        trace_memory: 작업자 프로세스에서 tracemalloc 최대 메모리 측정 여부
+
+    Returns:
+        model, fold, score, started, finished, cpu_seconds (params 지정 시 params,
+        trace_memory 시 peak_kb 포함) 딕셔너리
+    """
+    started, cpu_started = time.time(), time.process_time()
+    if trace_memory:
+        tracemalloc.start()
+    shm, arrays = _attach(shm_name, layout)
+    try:
+        X, y, folds = arrays["X"], arrays["y"], arrays["folds"]
+        test_mask = folds == fold
+        _, model_class, default_params = MODEL_SPECS[model_name]
+        clf = model_class(**(default_params if params is None else params))
+        clf.fit(X[~test_mask], y[~test_mask])
+        score = float(np.mean(clf.predict(X[test_mask]) == y[test_mask]))
+        del X, y, folds, test_mask, arrays
+    finally:
+        shm.close()
+        if trace_memory:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+    cell = {"model": model_name, "fold": fold, "score": score,
+            "started": started, "finished": time.time(),
+            "cpu_seconds": round(time.process_time() - cpu_started, 6)}
+    if params is not None:
+        cell["params"] = params
+    if trace_memory:
+        cell["peak_kb"] = round(peak / 1024, 1)
+    return cell
+
+
+def _profile_cells(cells: List[Dict[str, Any]], wall_seconds: float, rows: int) -> None:
+    """작업자에서 측정한 칸별 시간/메모리를 모델별로 묶어 현재 계측 실행에 기록"""
+    record = titanic_profile.add("fold_tasks", category="cv", rows_in=rows,
+                                 wall_ms=round(wall_seconds * 1000, 3), tasks=len(cells))
+    if record is None:
+        return
+    by_model: Dict[str, List[Dict[str, Any]]] = {}
+    for cell in cells:
+        by_model.setdefault(cell["model"], []).append(cell)
+    for model, runs in by_model.items():
+        runs = [c for c in runs if "error" not in c]
+        peaks = [c["peak_kb"] for c in runs if "peak_kb" in c]
+        child = titanic_profile.Stage(f"fit.{model}", "cv", rows)
+        child.wall_ms = round(sum(c["finished"] - c["started"] for c in runs) * 1000, 3)
+        child.cpu_ms = round(sum(c["cpu_seconds"] for c in runs) * 1000, 3)
+        child.peak_kb = max(peaks) if peaks else None
+        child.extra = {"folds": len(runs)}
+        record.children.append(child)
+    record.cpu_ms = round(sum(c.cpu_ms for c in record.children), 3)
+    peaks = [c.peak_kb for c in record.children if c.peak_kb is not None]
+    record.peak_kb = max(peaks) if peaks else None
+
+
+def run_fold_tasks(X: np.ndarray, y: np.ndarray, tasks: List[Tuple[str, Optional[Dict[str, Any]], int]],
+                   n_splits: int = 10, random_state: int = 0,
+                   executor: Optional[ProcessPoolExecutor] = None,
+                   on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+                   trace_memory: Optional[bool] = None) -> List[Dict[str, Any]]:
+    """
+    (모델, 파라미터, 폴드) 작업 목록을 프로세스 풀에서 병렬 실행
+
+    Args:
+        X: 피처 행렬
+        y: 라벨 배열
+        tasks: (모델 키, 파라미터 또는 None, 폴드 번호) 리스트
+        n_splits: 폴드 수
+        random_state: 폴드 셔플 시드
+        executor: 사용할 프로세스 풀 (기본값: 공유 풀)
+        on_progress: 작업 한 칸이 끝날 때마다 호출할 함수
+        trace_memory: 작업자에서 tracemalloc 최대 메모리 측정 여부 (기본값: 현재 계측 실행 설정)
+
+    Returns:
+        작업별 결과 딕셔너리 리스트 (완료 순서, 실패한 칸은 error 포함)
+    """
+    if not tasks:
+        return []
+    if trace_memory is None:
+        trace_memory = titanic_profile.memory_enabled()
+    started = time.time()
+    executor = executor or get_executor()
+    shared = SharedArrays({
+        "X": np.ascontiguousarray(X, dtype=np.float64),
+        "y": np.ascontiguousarray(y),
+        "folds": compute_folds(len(X), n_splits, random_state),
+    })
+    cells: List[Dict[str, Any]] = []
+    try:
+        futures = {
+            executor.submit(_fit_fold, shared.name, shared.layout, model, fold, params,
+                            trace_memory): (model, params, fold)
+            for model, params, fold in tasks
+        }
+        for completed, future in enumerate(as_completed(futures), start=1):
+            model, params, fold = futures[future]
+            try:
+                cell = future.result()
+            except Exception as e:
+                cell = {"model": model, "fold": fold, "error": str(e)}
+                if params is not None:
+                    cell["params"] = params
+            cells.append(cell)
+            if on_progress is not None:
+                on_progress({**cell, "completed": completed, "total": len(futures)})
+    finally:
+        shared.release()
+    _profile_cells(cells, time.time() - started, len(X))
+    return cells
+
+
+@functools.lru_cache(maxsize=4096)
+def _estimator_key(model: str, params_json: Optional[str]) -> str:
+    _, model_class, default_params = MODEL_SPECS[model]
+    params = default_params if params_json is None else json.loads(params_json)
+    return json.dumps({
+        "estimator": f"{model_class.__module__}.{model_class.__qualname__}",
+        "sklearn": sklearn.__version__,
+        "params": model_class(**params).get_params(),
+    }, sort_keys=True, default=str)
+
+
+def estimator_key(model: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    모델 클래스와 실제 적용되는 전체 파라미터(기본값 포함)로 만든 키
+
+    파라미터를 생략했든 기본값을 직접 지정했든 같은 모델이면 같은 키가 되므로,
+    evaluate(MODEL_SPECS 설정)와 하이퍼파라미터 탐색이 같은 폴드 점수를 함께 사용합니다.
+
+    Args:
+        model: 모델 키 (MODEL_SPECS)
+        params: 모델 파라미터 (기본값: MODEL_SPECS 설정)
+
+    Returns:
+        JSON 문자열
+    """
+    return _estimator_key(model, None if params is None else json.dumps(params, sort_keys=True))
+
+
+class FoldScoreStore:
+    """
+    (데이터 키, 모델, 폴드) → 검증 점수 저장소 (SQLite)
+
+    데이터 키는 전처리된 피처 행렬/라벨 내용과 폴드 분할 설정(폴드 수, 시드)의 해시이고,
+    모델 키는 estimator_key() 이므로 데이터, 분할, 모델 설정 중 하나라도 바뀐 칸만 다시 계산합니다.
+    WAL 모드 SQLite 파일 하나를 모든 워커 프로세스가 함께 사용하며 재시작 후에도 유지됩니다.
+    random_state=None 인 모델(MODEL_SPECS의 트리 모델)은 실행마다 점수가 조금씩 달라지는데,
+    저장소를 쓰면 처음 계산한 점수가 고정되어 반복 평가 결과가 일정해집니다.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        FoldScoreStore 초기화
+
+        Args:
+            path: SQLite 파일 경로 (기본값: app/titanic/save/cv/fold_scores.sqlite)
+        """
+        self.path = Path(path) if path else STORE_PATH
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS fold_scores ("
+                " data_key TEXT NOT NULL, estimator TEXT NOT NULL,"
+                " fold INTEGER NOT NULL, score REAL NOT NULL, fit_seconds REAL,"
+                " created_at TEXT NOT NULL,"
+                " PRIMARY KEY (data_key, estimator, fold))"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        # 스레드마다 새 연결 사용 (작업 스레드와 요청 스레드가 다름)
+        return sqlite3.connect(self.path, timeout=30)
+
+    @staticmethod
+    def data_key(X: np.ndarray, y: np.ndarray, n_splits: int, random_state: int) -> str:
+        """
+        점수를 재사용할 수 있는 범위를 나타내는 키
+
+        Args:
+            X: 피처 행렬
+            y: 라벨 배열
+            n_splits: 폴드 수
+            random_state: 폴드 셔플 시드
+
+        Returns:
+            sha1 문자열
+        """
+        X = np.ascontiguousarray(X, dtype=np.float64)
+        y = np.ascontiguousarray(y)
+        digest = hashlib.sha1()
+        digest.update(json.dumps({"X": X.shape, "y": [y.shape, y.dtype.str],
+                                  "n_splits": n_splits, "random_state": random_state}).encode("utf-8"))
+        digest.update(X.tobytes())
+        digest.update(y.tobytes())
+        return digest.hexdigest()
+
+    def load(self, data_key: str) -> Dict[Tuple[str, int], float]:
+        """
+        저장된 폴드 점수 조회
+
+        Args:
+            data_key: 데이터 키
+
+        Returns:
+            (모델 키, 폴드) → 점수 딕셔너리
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT estimator, fold, score FROM fold_scores WHERE data_key = ?", (data_key,)
+            ).fetchall()
+        return {(estimator, fold): score for estimator, fold, score in rows}
+
+    def save(self, data_key: str, cells: List[Dict[str, Any]]) -> None:
+        """
+        폴드 점수 저장 (실패한 칸은 저장하지 않음)
+
+        Args:
+            data_key: 데이터 키
+            cells: run_fold_tasks 결과 리스트
+        """
+        now = datetime.now().isoformat()
+        rows = [
+            (data_key, estimator_key(c["model"], c.get("params")), c["fold"], c["score"],
+             round(c["finished"] - c["started"], 4), now)
+            for c in cells if "error" not in c
+        ]
+        if not rows:
+            return
+        with self._connect() as conn:
+            conn.executemany("INSERT OR REPLACE INTO fold_scores VALUES (?, ?, ?, ?, ?, ?)", rows)
+
+
+def run_cv_grid(X: np.ndarray, y: np.ndarray, models: Optional[List[str]] = None,
+                n_splits: int = 10, random_state: int = 0,
+                executor: Optional[ProcessPoolExecutor] = None,
+                on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+                store: Optional[FoldScoreStore] = None) -> Dict[str, Any]:
+    """
+    모델 × 폴드 교차 검증을 프로세스 풀에서 병렬 실행
+
+    Args:
+        X: 피처 행렬
+        y: 라벨 배열
+        models: 평가할 모델 키 목록 (기본값: 전체)
+        n_splits: 폴드 수
+        random_state: 폴드 셔플 시드
+        executor: 사용할 프로세스 풀 (기본값: 공유 풀)
+        on_progress: (모델, 폴드) 한 칸이 끝날 때마다 호출할 함수
+        store: 폴드 점수 저장소 (지정하면 저장된 칸은 건너뛰고 새로 계산한 칸만 저장)
+
+    Returns:
+        results(모델별 accuracy, fold_scores, wall_seconds, fit_seconds, cached, status),
+        wall_seconds(전체 소요 시간), computed/cached(새로 계산한/저장소에서 읽은 칸 수) 딕셔너리
+    """
+    models = [m for m in MODEL_SPECS if models is None or m in models]
+    started = time.time()
+
+    cached: Dict[str, Dict[int, float]] = {m: {} for m in models}
+    data_key = None
+    if store is not None:
+        data_key = FoldScoreStore.data_key(X, y, n_splits, random_state)
+        scores = store.load(data_key)
+        for model in models:
+            key = estimator_key(model)
+            for fold in range(n_splits):
+                if (key, fold) in scores:
+                    cached[model][fold] = scores[(key, fold)]
+
+    tasks = [(model, None, fold) for model in models for fold in range(n_splits) if fold not in cached[model]]
+    cells: Dict[str, List[Dict[str, Any]]] = {m: [] for m in models}
+    errors: Dict[str, str] = {}
+    computed = run_fold_tasks(X, y, tasks, n_splits, random_state, executor, on_progress)
+    if store is not None:
+        store.save(data_key, computed)
+    for cell in computed:
+        if "error" in cell:
+            errors.setdefault(cell["model"], cell["error"])
+        else:
+            cells[cell["model"]].append(cell)
+
+    results = {}
+    for model in sorted(models, key=RESULT_ORDER.index):
+        label = MODEL_SPECS[model][0]
+        if model in errors:
+            logger.error(f"  {label} 평가 실패: {errors[model]}")
+            results[model] = {"accuracy": None, "status": f"error: {errors[model]}"}
+            continue
+        fresh = cells[model]
+        scores = {**cached[model], **{c["fold"]: c["score"] for c in fresh}}
+        fold_scores = [scores[fold] for fold in range(n_splits)]
+        accuracy = round(np.mean(fold_scores) * 100, 2)
+        results[model] = {
+            "accuracy": float(accuracy),
+            "status": "success",
+            "fold_scores": [round(score, 4) for score in fold_scores],
+            # 저장소에서 읽은 칸은 학습하지 않았으므로 시간에 포함하지 않음
+            "wall_seconds": round(max(c["finished"] for c in fresh) - min(c["started"] for c in fresh), 4)
+            if fresh else 0.0,
+            "fit_seconds": round(sum(c["finished"] - c["started"] for c in fresh), 4),
+            "cached": len(cached[model]),
+        }
+        logger.info(f"  {label} 검증 정확도: {accuracy}% ({results[model]['wall_seconds']}초, "
+                    f"저장된 폴드 {len(cached[model])}개)")
+
+    return {"results": results, "wall_seconds": round(time.time() - started, 4),
+            "computed": len(computed), "cached": sum(len(c) for c in cached.values())}
@@ -0,0 +1,261 @@
+"""
+배열 기반 랜덤 포레스트 추론 엔진
+
+RandomForestClassifier.predict_proba 는 호출마다 입력 검증, 트리별 작업 분배 등
+고정 비용이 커서 한두 건씩 들어오는 온라인 추론에서는 실제 계산보다 오래 걸립니다.
+이 모듈은 학습된 포레스트의 모든 트리를 연속된 NumPy 배열 하나로 펼치고,
+(샘플, 트리) 전체를 깊이 단위로 한 번에 내려가며 예측합니다.
+리프에 닿은 (샘플, 트리) 칸은 다음 단계 작업 목록에서 빠지므로 깊고 불균형한
+트리에서도 실제 경로 길이만큼만 계산하며, 큰 배치는 행을 나눠 캐시 안에서 처리합니다.
+타이타닉 피처는 모두 범주형이어서 큰 배치에는 같은 행이 반복되므로, 서로 다른 행만
+계산한 뒤 원래 순서로 펼칩니다.
+
+펼친 배열 (전체 트리의 노드를 이어 붙인 전역 인덱스 기준):
+    feature    분기 피처 번호
+    threshold  분기 임계값 (x <= threshold 이면 왼쪽)
+    left/right 자식 노드 (리프는 자기 자신)
+    value      노드별 클래스 확률 (sklearn과 같은 방식으로 정규화)
+    roots      트리별 루트 노드
+
+sklearn과 같은 결과를 내도록 입력을 float32로 바꿔 비교하고,
+트리별 확률을 트리 순서대로 더한 뒤 트리 수로 나눕니다.
+"""
+import logging
+from typing import Any, Dict, Tuple
+
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.tree import DecisionTreeClassifier
+
+logger = logging.getLogger(__name__)
+
+# sklearn.tree._tree.TREE_LEAF
+_TREE_LEAF = -1
+
+# 한 번에 처리할 (샘플, 트리) 칸 수
+_CHUNK_CELLS = 1 << 16
+
+# 이 행 수 이상이면 중복 행을 한 번만 계산
+_DEDUPE_MIN_ROWS = 256
+
+
+class FlatForest:
+    """
+    연속 배열로 펼친 분류 트리 묶음
+
+    predict_proba / predict / classes_ 를 제공하므로 sklearn 분류기 대신 그대로 사용할 수 있습니다.
+    """
+
+    def __init__(self, feature: np.ndarray, threshold: np.ndarray, left: np.ndarray, right: np.ndarray,
+                 value: np.ndarray, roots: np.ndarray, max_depth: int, n_features: int,
+                 classes: np.ndarray):
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.value = value
+        self.roots = roots
+        self.max_depth = max_depth
+        self.n_features = n_features
+        self.classes_ = classes
+        # 탐색용 파생 배열: children[2 * node + 0/1] = 왼쪽/오른쪽 자식
+        self.children = np.column_stack([left, right]).ravel()
+        self.is_leaf = left == np.arange(len(left), dtype=left.dtype)
+
+    @property
+    def n_trees(self) -> int:
+        return len(self.roots)
+
+    @property
+    def n_nodes(self) -> int:
+        return len(self.feature)
+
+    @classmethod
+    def from_sklearn(cls, model) -> "FlatForest":
+        """
+        학습된 RandomForestClassifier / DecisionTreeClassifier를 배열로 변환
+
+        Args:
+            model: 학습된 sklearn 분류기 (단일 출력)
+
+        Returns:
+            FlatForest 객체
+        """
+        if isinstance(model, RandomForestClassifier):
+            trees = [estimator.tree_ for estimator in model.estimators_]
+        elif isinstance(model, DecisionTreeClassifier):
+            trees = [model.tree_]
+        else:
+            raise ValueError(f"지원하지 않는 모델입니다: {type(model).__name__}")
+        if model.n_outputs_ != 1:
+            raise ValueError("단일 출력 분류기만 변환할 수 있습니다")
+
+        n_classes = len(model.classes_)
+        features, thresholds, lefts, rights, values, roots = [], [], [], [], [], []
+        offset = 0
+        max_depth = 0
+        for tree in trees:
+            n = tree.node_count
+            node = np.arange(offset, offset + n, dtype=np.int32)
+            is_leaf = tree.children_left == _TREE_LEAF
+
+            features.append(np.where(is_leaf, 0, tree.feature).astype(np.int32))
+            thresholds.append(np.where(is_leaf, np.inf, tree.threshold))
+            lefts.append(np.where(is_leaf, node, tree.children_left + offset).astype(np.int32))
+            rights.append(np.where(is_leaf, node, tree.children_right + offset).astype(np.int32))
+
+            # DecisionTreeClassifier.predict_proba 와 같은 정규화
+            proba = tree.value[:, 0, :n_classes].astype(np.float64)
+            normalizer = proba.sum(axis=1)[:, np.newaxis]
+            normalizer[normalizer == 0.0] = 1.0
+            values.append(proba / normalizer)
+
+            roots.append(offset)
+            max_depth = max(max_depth, tree.max_depth)
+            offset += n
+
+        forest = cls(
+            feature=np.concatenate(features),
+            threshold=np.concatenate(thresholds),
+            left=np.concatenate(lefts),
+            right=np.concatenate(rights),
+            value=np.ascontiguousarray(np.concatenate(values)),
+            roots=np.asarray(roots, dtype=np.int32),
+            max_depth=int(max_depth),
+            n_features=int(model.n_features_in_),
+            classes=np.asarray(model.classes_),
+        )
+        logger.info(f"[포레스트 변환] 트리 {forest.n_trees}개, 노드 {forest.n_nodes}개, 최대 깊이 {forest.max_depth}")
+        return forest
+
+    def apply(self, X: np.ndarray) -> np.ndarray:
+        """
+        (샘플, 트리)별 도달한 리프 노드 계산
+
+        Args:
+            X: (n_samples, n_features) 피처 행렬
+
+        Returns:
+            (n_samples, n_trees) 전역 리프 노드 인덱스
+        """
+        X = np.asarray(X)
+        if X.ndim != 2 or X.shape[1] != self.n_features:
+            raise ValueError(f"입력 피처 수가 {self.n_features}개여야 합니다: {X.shape}")
+        # sklearn 트리와 같은 정밀도로 비교 (float32로 저장한 뒤 임계값과 비교)
+        X32 = np.ascontiguousarray(X, dtype=np.float32)
+        if np.isnan(X32).any():
+            raise ValueError("입력에 결측값(NaN)이 있습니다")
+
+        leaves = np.empty((len(X32), self.n_trees), dtype=np.int32)
+        # (샘플, 트리) 작업 배열이 캐시에 머물도록 행을 나눠 처리
+        chunk = max(1, _CHUNK_CELLS // self.n_trees)
+        for start in range(0, len(X32), chunk):
+            leaves[start:start + chunk] = self._descend(X32[start:start + chunk])
+        return leaves
+
+    def _descend(self, X32: np.ndarray) -> np.ndarray:
+        """행 묶음 하나를 루트부터 리프까지 내려보냄 (리프에 닿은 칸은 작업 목록에서 제외)"""
+        n_samples = len(X32)
+        flat_X = X32.ravel()
+        nodes = np.tile(self.roots, n_samples)
+        x_offset = np.repeat(np.arange(n_samples, dtype=np.int64) * self.n_features, self.n_trees)
+
+        active = np.flatnonzero(~self.is_leaf[nodes])
+        current = nodes[active]
+        offset = x_offset[active]
+        while len(active):
+            go_right = flat_X[offset + self.feature[current]] > self.threshold[current]
+            current = self.children[2 * current + go_right]
+            alive = ~self.is_leaf[current]
+            n_alive = np.count_nonzero(alive)
+            # 리프에 닿은 칸이 충분히 많을 때만 작업 목록을 줄임 (리프는 자기 자신을 가리키므로 남아 있어도 안전)
+            if n_alive < len(current) * 3 // 4:
+                nodes[active] = current
+                keep = np.flatnonzero(alive)
+                active, current, offset = active[keep], current[keep], offset[keep]
+            elif n_alive == 0:
+                break
+        nodes[active] = current
+        return nodes.reshape(n_samples, self.n_trees)
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        """
+        클래스별 확률 (RandomForestClassifier.predict_proba 와 같은 값)
+
+        Args:
+            X: (n_samples, n_features) 피처 행렬
+
+        Returns:
+            (n_samples, n_classes) 확률 배열
+        """
+        X = np.asarray(X)
+        if X.ndim == 2 and len(X) >= _DEDUPE_MIN_ROWS:
+            # 범주형 피처라 큰 배치에는 같은 행이 많음 → 서로 다른 행만 계산 후 펼침 (행별 결과는 동일)
+            X32 = np.ascontiguousarray(X, dtype=np.float32)
+            first, inverse = _unique_rows(X32)
+            if len(first) * 2 <= len(X):
+                return self._accumulate(self.apply(X32[first]))[inverse]
+        return self._accumulate(self.apply(X))
+
+    def _accumulate(self, leaves: np.ndarray) -> np.ndarray:
+        """리프별 확률을 트리 순서대로 더해 평균"""
+        proba = np.zeros((len(leaves), self.value.shape[1]), dtype=np.float64)
+        # 트리 순서대로 누적해야 부동소수점 합이 sklearn과 같음
+        for t in range(self.n_trees):
+            proba += self.value[leaves[:, t]]
+        proba /= self.n_trees
+        return proba
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """클래스 예측"""
+        return self.classes_.take(np.argmax(self.predict_proba(X), axis=1))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "n_trees": self.n_trees,
+            "n_nodes": self.n_nodes,
+            "max_depth": self.max_depth,
+            "n_features": self.n_features,
+            "nbytes": int(sum(a.nbytes for a in (self.feature, self.threshold, self.left,
+                                                  self.right, self.value, self.roots))),
+        }
+
+
+def _unique_rows(X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    서로 다른 행 찾기 (np.unique(axis=0)보다 빠르도록 열별 코드를 혼합 진법 정수 키로 합침)
+
+    Args:
+        X: (n_samples, n_features) 배열
+
+    Returns:
+        (서로 다른 행의 첫 위치, 행별 서로 다른 행 번호) 튜플
+    """
+    key = np.zeros(len(X), dtype=np.int64)
+    radix = 1
+    for j in range(X.shape[1]):
+        values, codes = np.unique(X[:, j], return_inverse=True)
+        radix *= len(values)
+        if radix >= 1 << 62:
+            # 키가 int64를 넘으면 행 바이트 단위로 비교
+            rows = np.ascontiguousarray(X).view(np.dtype((np.void, X.dtype.itemsize * X.shape[1]))).ravel()
+            _, first, inverse = np.unique(rows, return_index=True, return_inverse=True)
+            return first, inverse.ravel()
+        key = key * len(values) + codes.ravel()
+    _, first, inverse = np.unique(key, return_index=True, return_inverse=True)
+    return first, inverse.ravel()
+
+
+def compile_model(model):
+    """
+    변환 가능한 트리 모델이면 FlatForest로, 아니면 그대로 반환
+
+    Args:
+        model: 학습된 sklearn 분류기
+
+    Returns:
+        FlatForest 또는 원래 모델
+    """
+    if isinstance(model, (RandomForestClassifier, DecisionTreeClassifier)) and model.n_outputs_ == 1:
+        return FlatForest.from_sklearn(model)
+    return model
@@ -0,0 +1,188 @@
+"""
+타이타닉 백그라운드 작업 관리
+
+evaluate / submit 처럼 수 초가 걸리는 작업을 HTTP 요청 밖에서 실행합니다.
+
+- 작업은 크기가 제한된 스레드 풀에서 실행되고, 호출 즉시 작업 ID를 반환
+- 같은 (작업 종류, 데이터 지문) 작업이 실행 중이면 새로 만들지 않고 기존 작업을 반환
+- 완료된 결과는 데이터 지문이 바뀔 때까지 캐시하여 같은 요청에 바로 반환
+- 진행 상황(모델, 폴드 단위)은 이벤트 목록으로 쌓여 폴링/SSE로 조회
+"""
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 보관할 작업 수 (오래된 완료 작업부터 제거)
+MAX_TRACKED_JOBS = 100
+
+ProgressCallback = Callable[[Dict[str, Any]], None]
+
+
+class Job:
+    """백그라운드 작업 한 건"""
+
+    def __init__(self, kind: str, fingerprint: str):
+        self.job_id = uuid.uuid4().hex
+        self.kind = kind
+        self.fingerprint = fingerprint
+        self.status = "pending"
+        self.created_at = datetime.now().isoformat()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self.events: List[Dict[str, Any]] = []
+        self._condition = threading.Condition()
+
+    @property
+    def done(self) -> bool:
+        return self.status in ("completed", "failed")
+
+    def emit(self, event: Dict[str, Any]) -> None:
+        """진행 이벤트 추가 후 대기 중인 구독자 깨움"""
+        with self._condition:
+            self.events.append({"seq": len(self.events), "time": time.time(), **event})
+            self._condition.notify_all()
+
+    def wait(self, after: int, timeout: float) -> List[Dict[str, Any]]:
+        """
+        after 번째 이후 이벤트가 생기거나 작업이 끝날 때까지 대기
+
+        Args:
+            after: 이미 받은 이벤트 수
+            timeout: 최대 대기 시간(초)
+
+        Returns:
+            새 이벤트 리스트
+        """
+        with self._condition:
+            if len(self.events) <= after and not self.done:
+                self._condition.wait(timeout)
+            return self.events[after:]
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """
+        작업이 끝날 때까지 대기
+
+        Args:
+            timeout: 최대 대기 시간(초, 기본값: 무제한)
+
+        Returns:
+            작업 종료 여부
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: self.done, timeout)
+
+    def to_dict(self, include_result: bool = True) -> Dict[str, Any]:
+        data = {
+            "job_id": self.job_id,
+            "kind": self.kind,
+            "fingerprint": self.fingerprint,
+            "status": self.status,
+            "created_at": self.created_at,
+            "progress": self.events[-1] if self.events else None,
+        }
+        if self.started_at is not None:
+            end = self.finished_at or time.time()
+            data["elapsed_seconds"] = round(end - self.started_at, 4)
+        if self.error is not None:
+            data["error"] = self.error
+        if include_result and self.result is not None:
+            data["result"] = self.result
+        return data
+
+
+class JobManager:
+    """
+    작업 실행기
+
+    in-flight 작업과 완료 결과를 (작업 종류, 데이터 지문) 키로 관리합니다.
+    """
+
+    def __init__(self, max_workers: int = 2):
+        """
+        JobManager 초기화
+
+        Args:
+            max_workers: 동시에 실행할 작업 수
+        """
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="titanic-job")
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._by_key: Dict[tuple, Job] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, kind: str, fingerprint: str, fn: Callable[[ProgressCallback], Dict[str, Any]]) -> Job:
+        """
+        작업 등록 (실행 중이거나 결과가 캐시된 같은 작업이 있으면 그 작업 반환)
+
+        Args:
+            kind: 작업 종류 ("evaluate", "submit")
+            fingerprint: 데이터 지문 (바뀌면 이전 결과는 무효)
+            fn: 진행 콜백을 받아 결과 딕셔너리를 반환하는 함수
+
+        Returns:
+            Job 객체
+        """
+        key = (kind, fingerprint)
+        with self._lock:
+            existing = self._by_key.get(key)
+            if existing is not None and existing.status != "failed":
+                logger.info(f"[작업] 기존 {kind} 작업 재사용: {existing.job_id} ({existing.status})")
+                return existing
+
+            # 데이터가 바뀐 같은 종류의 이전 결과는 캐시에서 제거
+            for stale in [k for k in self._by_key if k[0] == kind and k[1] != fingerprint]:
+                if self._by_key[stale].done:
+                    del self._by_key[stale]
+
+            job = Job(kind, fingerprint)
+            self._jobs[job.job_id] = job
+            self._by_key[key] = job
+            self._trim()
+
+        self._executor.submit(self._run, job, fn)
+        logger.info(f"[작업] {kind} 작업 등록: {job.job_id}")
+        return job
+
+    def _trim(self) -> None:
+        """완료된 오래된 작업부터 제거 (캐시된 결과로 쓰이는 작업은 유지)"""
+        cached = {id(job) for job in self._by_key.values()}
+        for job_id in list(self._jobs):
+            if len(self._jobs) <= MAX_TRACKED_JOBS:
+                break
+            job = self._jobs[job_id]
+            if job.done and id(job) not in cached:
+                del self._jobs[job_id]
+
+    def _run(self, job: Job, fn: Callable[[ProgressCallback], Dict[str, Any]]) -> None:
+        job.started_at = time.time()
+        job.status = "running"
+        job.emit({"stage": "started"})
+        try:
+            job.result = fn(job.emit)
+            job.status = "completed"
+        except Exception as e:
+            logger.error(f"[작업] {job.kind} 작업 실패: {job.job_id}: {e}")
+            job.error = str(e)
+            job.status = "failed"
+        finally:
+            job.finished_at = time.time()
+            job.emit({"stage": job.status})
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """작업 ID로 작업 조회"""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list(self) -> List[Dict[str, Any]]:
+        """전체 작업 요약 (최근 순)"""
+        with self._lock:
+            jobs = list(self._jobs.values())
+        return [job.to_dict(include_result=False) for job in reversed(jobs)]
@@ -0,0 +1,163 @@
+"""
+타이타닉 새 라벨 승객 점진 학습
+
+새로 라벨이 붙은 승객은 원본 필드 그대로 JSONL 파일에 추가하고,
+- 점진 학습이 가능한 모델(GaussianNB, SGD 로지스틱 회귀)은 현재 버전 복사본에 partial_fit 으로
+  새 행만 반영하여 바로 새 버전으로 등록하고,
+- 한 번에 학습해야 하는 모델(SVC, 랜덤 포레스트 등)은 train + 누적 라벨 전체로 다시 학습하는
+  백그라운드 작업을 예약합니다.
+
+원본 필드로 저장하므로 전처리 규칙이 바뀌어도 새 인코더로 다시 인코딩할 수 있습니다.
+
+저장 구조:
+    save/learn/labeled.jsonl    한 줄에 승객 한 명 (INPUT_FIELDS + Survived)
+"""
+import copy
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.titanic.titanic_predict import PREDICT_FEATURES
+from app.titanic.titanic_score import INPUT_FIELDS
+
+logger = logging.getLogger(__name__)
+
+# 라벨 승객 저장 위치
+LABELED_PATH = Path(__file__).resolve().parent / "save" / "learn" / "labeled.jsonl"
+
+# partial_fit 으로 바로 갱신하는 모델 (나머지는 전체 재학습 작업에서 갱신)
+INCREMENTAL_MODELS = ("naive_bayes", "logistic_regression")
+
+# 한 번에 받을 수 있는 최대 승객 수
+MAX_BATCH = 10_000
+
+
+def labels(passengers: List[Dict[str, Any]]) -> np.ndarray:
+    """
+    승객 목록의 Survived 값 검증 후 배열로 변환
+
+    Args:
+        passengers: Survived(0 또는 1)를 포함한 승객 원본 필드 목록
+
+    Returns:
+        int64 라벨 배열
+    """
+    y = []
+    for i, passenger in enumerate(passengers):
+        value = passenger.get("Survived")
+        if value not in (0, 1):
+            raise ValueError(f"{i}번째 승객의 Survived 값은 0 또는 1이어야 합니다: {value!r}")
+        y.append(int(value))
+    return np.asarray(y, dtype=np.int64)
+
+
+def columns(passengers: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """승객 목록 → TitanicEncoder.encode_columns 입력 (필드별 배열)"""
+    return {field: [p.get(field) for p in passengers]
+            for field in INPUT_FIELDS if any(field in p for p in passengers)}
+
+
+def partial_update(estimator, X: np.ndarray, y: np.ndarray):
+    """
+    학습된 모델의 복사본에 새 행을 partial_fit 으로 반영 (원본 모델은 그대로 두어 현재 버전과 분리)
+
+    Args:
+        estimator: partial_fit 을 지원하는 학습된 모델
+        X: 새 피처 행렬
+        y: 새 라벨 배열
+
+    Returns:
+        갱신된 모델 복사본
+    """
+    updated = copy.deepcopy(estimator)
+    updated.partial_fit(X, y, classes=updated.classes_)
+    return updated
+
+
+class LabeledStore:
+    """누적 라벨 승객 저장소 (JSONL, 여러 워커가 함께 추가)"""
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        LabeledStore 초기화
+
+        Args:
+            path: JSONL 파일 경로 (기본값: app/titanic/save/learn/labeled.jsonl)
+        """
+        self.path = Path(path) if path else LABELED_PATH
+        self._lock = threading.Lock()
+        # (파일 크기, 인코딩 키) → (X, y)
+        self._cache: Optional[Tuple[int, str, np.ndarray, np.ndarray]] = None
+
+    def append(self, passengers: List[Dict[str, Any]]) -> int:
+        """
+        승객 추가 (필드 검증은 호출하는 쪽에서 인코딩으로 먼저 확인)
+
+        Args:
+            passengers: Survived 를 포함한 승객 원본 필드 목록
+
+        Returns:
+            추가 후 전체 라벨 승객 수
+        """
+        lines = "".join(
+            json.dumps({k: p[k] for k in (*INPUT_FIELDS, "Survived") if k in p}, ensure_ascii=False) + "\n"
+            for p in passengers
+        )
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            # O_APPEND 한 번의 write 로 추가하여 다른 워커의 추가와 줄이 섞이지 않도록 함
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, lines.encode("utf-8"))
+            finally:
+                os.close(fd)
+        return self.count()
+
+    def load(self) -> List[Dict[str, Any]]:
+        """저장된 전체 라벨 승객"""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return [json.loads(line) for line in f if line.strip()]
+        except FileNotFoundError:
+            return []
+
+    def count(self) -> int:
+        """저장된 라벨 승객 수"""
+        try:
+            with open(self.path, "rb") as f:
+                return sum(1 for line in f if line.strip())
+        except FileNotFoundError:
+            return 0
+
+    def arrays(self, encoder, key: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        전체 라벨 승객을 인코딩한 (X, y) (파일 크기와 인코딩 키가 같으면 이전 결과 재사용)
+
+        Args:
+            encoder: TitanicEncoder
+            key: 인코더를 구분하는 키 (전처리 산출물 지문)
+
+        Returns:
+            (X, y) 튜플 (라벨 승객이 없으면 0행 배열)
+        """
+        try:
+            size = os.stat(self.path).st_size
+        except FileNotFoundError:
+            size = 0
+        cache = self._cache
+        if cache is not None and cache[0] == size and cache[1] == key:
+            return cache[2], cache[3]
+
+        passengers = self.load()
+        if passengers:
+            X = encoder.encode_columns(columns(passengers))
+            y = labels(passengers)
+        else:
+            X, y = np.empty((0, len(PREDICT_FEATURES)), dtype=np.float64), np.empty(0, dtype=np.int64)
+        self._cache = (size, key, X, y)
+        return X, y
@@ -0,0 +1,141 @@
+"""
+타이타닉 전체 입력 공간 예측 테이블
+
+전처리 후 예측 피처(Pclass, Embarked, Fare 구간, Gender, Title, Age 그룹)는 모두
+값이 몇 개뿐인 범주형이어서 가능한 입력 조합이 수천 개에 불과합니다.
+이 모듈은 모델 버전마다 전체 조합을 한 번 예측하여 생존 확률을 조밀한 배열에 저장하고,
+이후 예측은 혼합 진법(mixed-radix) 인덱스로 배열을 읽기만 합니다.
+따라서 예측 비용이 모델 복잡도(SVC 서포트 벡터 수, 트리 수 등)와 무관합니다.
+
+인덱스: 피처 j의 값이 axes[j]의 k_j 번째 값일 때
+    index = Σ k_j × strides[j]    (strides[-1] = 1, strides[j] = strides[j+1] × len(axes[j+1]))
+
+테이블은 레지스트리의 모델 버전 폴더에 lut.npz 로 저장되므로 버전마다 한 번만 계산합니다.
+"""
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# 레지스트리 버전 폴더 안의 테이블 파일 이름
+TABLE_FILE = "lut.npz"
+
+
+def feature_axes(state: Dict[str, Any], pclass_values: Sequence[float]) -> List[np.ndarray]:
+    """
+    PREDICT_FEATURES 순서의 피처별 가능한 값 목록
+
+    Args:
+        state: TitanicPipeline 학습 상태
+        pclass_values: 학습 데이터의 Pclass 값 목록
+
+    Returns:
+        피처별 정렬된 값 배열 리스트
+    """
+    n_fare_bands = len(state["fare_edges"]) - 1
+    axes = [
+        sorted(set(float(v) for v in pclass_values)),                                   # Pclass
+        sorted(set(state["embarked_mapping"].values())),                                # Embarked
+        sorted(set(range(1, n_fare_bands + 1)) | {state["fare_fill"]}),                 # Fare
+        sorted(set(state["gender_mapping"].values())),                                  # Gender
+        sorted(set(state["title_mapping"].values()) | {state["title_fill"]}),           # Title
+        sorted(set(state["age_mapping"].values())),                                     # Age
+    ]
+    return [np.asarray(axis, dtype=np.float64) for axis in axes]
+
+
+class PredictionTable:
+    """모델 한 버전의 전체 입력 공간 생존 확률 테이블"""
+
+    def __init__(self, axes: List[np.ndarray], probabilities: np.ndarray):
+        self.axes = axes
+        self.probabilities = probabilities
+        self.shape = tuple(len(axis) for axis in axes)
+        strides = np.ones(len(axes), dtype=np.int64)
+        for j in range(len(axes) - 2, -1, -1):
+            strides[j] = strides[j + 1] * self.shape[j + 1]
+        self.strides = strides
+        # 단건 조회용 값 → 위치 딕셔너리
+        self._positions = [{float(v): k for k, v in enumerate(axis)} for axis in axes]
+
+    @property
+    def size(self) -> int:
+        return int(np.prod(self.shape))
+
+    @staticmethod
+    def grid(axes: List[np.ndarray]) -> np.ndarray:
+        """전체 조합을 인덱스 순서대로 나열한 (size, n_features) 행렬"""
+        mesh = np.meshgrid(*axes, indexing="ij")
+        return np.column_stack([m.ravel() for m in mesh])
+
+    @classmethod
+    def build(cls, model, axes: List[np.ndarray]) -> "PredictionTable":
+        """
+        모델로 전체 입력 공간의 생존 확률 계산
+
+        Args:
+            model: predict_proba / classes_ 를 가진 학습된 모델
+            axes: feature_axes() 결과
+
+        Returns:
+            PredictionTable 객체
+        """
+        survived = list(model.classes_).index(1)
+        probabilities = model.predict_proba(cls.grid(axes))[:, survived]
+        return cls(axes, np.ascontiguousarray(probabilities, dtype=np.float64))
+
+    def save(self, path: Path) -> None:
+        """임시 파일에 쓴 뒤 교체하여 저장"""
+        tmp = path.with_name(f".{path.stem}.{os.getpid()}.tmp.npz")
+        np.savez(tmp, probabilities=self.probabilities,
+                 **{f"axis_{j}": axis for j, axis in enumerate(self.axes)})
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["PredictionTable"]:
+        """저장된 테이블 로드 (없으면 None)"""
+        if not path.exists():
+            return None
+        with np.load(path) as data:
+            n_axes = sum(1 for key in data.files if key.startswith("axis_"))
+            axes = [data[f"axis_{j}"] for j in range(n_axes)]
+            return cls(axes, data["probabilities"])
+
+    def matches(self, axes: List[np.ndarray]) -> bool:
+        """같은 입력 공간으로 만든 테이블인지 확인"""
+        return len(axes) == len(self.axes) and all(
+            np.array_equal(a, b) for a, b in zip(axes, self.axes))
+
+    def index(self, X: np.ndarray) -> np.ndarray:
+        """
+        피처 행렬의 행별 테이블 인덱스 (입력 공간 밖의 행은 -1)
+
+        Args:
+            X: (n_samples, n_features) 인코딩된 피처 행렬
+
+        Returns:
+            인덱스 배열
+        """
+        if len(X) == 1:
+            row = X[0]
+            index = 0
+            for value, positions, stride in zip(row, self._positions, self.strides):
+                position = positions.get(float(value))
+                if position is None:
+                    return np.array([-1])
+                index += position * int(stride)
+            return np.array([index])
+
+        index = np.zeros(len(X), dtype=np.int64)
+        valid = np.ones(len(X), dtype=bool)
+        for j, axis in enumerate(self.axes):
+            position = np.searchsorted(axis, X[:, j])
+            position = np.minimum(position, len(axis) - 1)
+            valid &= axis[position] == X[:, j]
+            index += position * self.strides[j]
+        index[~valid] = -1
+        return index
@@ -13,6 +13,7 @@ from sklearn.model_selection import cross_val_score
 from sklearn.model_selection import train_test_split
 from sklearn.model_selection import KFold
 from app.titanic.titanic_dataset import TitanicDataSet
+from app.titanic import titanic_columnar
 import logging
 
 logger = logging.getLogger(__name__)
@@ -23,7 +24,8 @@ class TitanicMethod(object):
         self.dataset = TitanicDataSet()
 
     def read_csv(self, fname: str) -> pd.DataFrame:
-        return pd.read_csv(fname)
+        # 컬럼형 캐시 사용 (원본이 바뀌면 다시 변환)
+        return titanic_columnar.read_csv(fname)
 
     def create_df(self, df: DataFrame, label: str) -> pd.DataFrame:
         """
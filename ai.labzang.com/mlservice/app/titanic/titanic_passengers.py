@@ -0,0 +1,500 @@
+"""
+타이타닉 승객 조회 저장소
+
+승객을 컬럼별 작은 dtype NumPy 배열(코드는 int8, 나이는 float32, 이름은 범주 코드)로 메모리에 상주시키고,
+자주 쓰는 필터(등급, 성별, 나이 구간, 요금)와 정렬 키마다 정렬 인덱스를 만들어 둡니다.
+
+- 등급/성별/나이 구간: 값으로 정렬한 행 번호 + 값별 시작 위치 (값 하나의 행 목록이 연속 구간)
+- 요금: 요금순 행 번호 + 정렬된 요금 (범위 조회는 searchsorted 두 번, 요금 정렬 순서와 공유)
+- 정렬 키(승객 번호, 생존 점수, 요금, 나이) × 방향: 행 순서와 그 역순열(행 → 순위), 처음 쓸 때 생성
+- 생존 점수: (성별, 등급, 나이 구간) 그룹의 라벨 생존율을 전체 생존율 쪽으로 평활한 값 (bincount)
+
+조회는 가장 좁은 필터 인덱스의 후보 행에 나머지 필터를 벡터 연산으로 적용한 뒤
+순위가 커서보다 뒤인 행 중 가장 앞선 limit개를 argpartition 으로 고릅니다.
+필터가 넓어 후보가 많으면 정렬 순서를 커서 위치부터 블록 단위로 훑습니다.
+커서는 (저장소 버전, 정렬 키, 방향, 마지막 순위)를 담은 문자열이므로 다음 페이지도 같은 비용입니다.
+"""
+import base64
+import json
+import logging
+import os
+import threading
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+from pandas.api.types import union_categoricals
+
+from app.titanic.titanic_pipeline import AGE_BINS, AGE_LABELS, EMBARKED_MAPPING, GENDER_MAPPING
+from app.titanic.titanic_scale import CHUNK_SIZE, READ_DTYPES
+
+logger = logging.getLogger(__name__)
+
+# 기본 승객 파일
+TRAIN_PATH = Path(__file__).resolve().parent.parent / "resources" / "titanic" / "train.csv"
+
+# 저장소에 올릴 컬럼과 읽기 dtype
+PASSENGER_DTYPES = {"PassengerId": "int64", **READ_DTYPES}
+
+# 정렬 키 (같은 이름의 컬럼 기준)
+SORT_KEYS = ("passenger_id", "score", "fare", "age")
+
+# 생존 점수 평활 강도 (그룹 라벨이 이 수만큼 전체 생존율을 따른다고 봄)
+PRIOR_WEIGHT = 5.0
+
+# 한 번에 반환할 수 있는 최대 승객 수
+MAX_LIMIT = 1_000
+
+_SEX_LABELS = {code: label for label, code in GENDER_MAPPING.items()}
+_EMBARKED_LABELS = {code: label for label, code in EMBARKED_MAPPING.items()}
+
+
+def _codes(values: pd.Series, mapping: Dict[str, int]) -> np.ndarray:
+    """문자열 Series → int8 코드 (결측/모르는 값은 -1)"""
+    categorical = values.array if isinstance(values.dtype, pd.CategoricalDtype) else pd.Categorical(values)
+    lookup = np.array([mapping.get(c, -1) for c in categorical.categories] + [-1], dtype=np.int8)
+    return lookup[categorical.codes]
+
+
+def age_bands(age: np.ndarray) -> np.ndarray:
+    """나이 → AGE_LABELS 위치 (TitanicPipeline age_ratio 와 같은 구간, 결측은 Unknown)"""
+    age = np.where(np.isnan(age), -0.5, age)
+    return (np.searchsorted(np.asarray(AGE_BINS, dtype=np.float64), age, side="left") - 1).astype(np.int8)
+
+
+class PassengerStore:
+    """컬럼형 승객 저장소 (만든 뒤에는 값이 바뀌지 않음)"""
+
+    def __init__(self, columns: Dict[str, np.ndarray], names: pd.Categorical):
+        """
+        PassengerStore 초기화
+
+        Args:
+            columns: passenger_id, survived(-1: 모름), pclass, sex, age, fare, embarked 배열
+                (fare 는 요청의 요금 경계와 그대로 비교하도록 float64)
+            names: 승객 이름 (범주형)
+        """
+        self.passenger_id = columns["passenger_id"]
+        self.survived = columns["survived"]
+        self.pclass = columns["pclass"]
+        self.sex = columns["sex"]
+        self.age = columns["age"]
+        self.fare = columns["fare"]
+        self.embarked = columns["embarked"]
+        self.names = names
+        self.age_band = age_bands(self.age)
+        self.rows = len(self.passenger_id)
+        self.version = uuid.uuid4().hex[:12]
+
+        # (등급, 성별, 나이 구간) 조합 그룹: 그룹별 값과 행 → 그룹 번호
+        key = (self.pclass.astype(np.int64) * 100 + (self.sex.astype(np.int64) + 1)) * 100 + self.age_band
+        keys, group = np.unique(key, return_inverse=True)
+        self.group = group.astype(np.int32)
+        self.group_pclass = keys // 10_000
+        self.group_sex = (keys // 100) % 100 - 1
+        self.group_age_band = keys % 100
+        self.score = self._survival_score()
+        self._survived_counts = np.bincount(self.survived.astype(np.int64) + 1, minlength=3)
+
+        # (정렬 키, 내림차순 여부) → 정렬 인덱스
+        self._orders: Dict[Tuple[str, bool], Dict[str, np.ndarray]] = {}
+        self._group_cache: Dict[Tuple, np.ndarray] = {}
+        self._lock = threading.Lock()
+        self._fare_index = self.order("fare")
+        self._fare_sorted = self.fare[self._fare_index["order"]]
+
+    # ***********
+    # 생성
+    # ***********
+
+    @classmethod
+    def from_frames(cls, frames: Iterable[DataFrame]) -> "PassengerStore":
+        """
+        원본 형식 DataFrame 청크로 저장소 생성 (청크마다 작은 dtype 배열로 바꿔 이어 붙임)
+
+        Args:
+            frames: PassengerId, Pclass, Name, Sex, Age, Fare, Embarked(, Survived) 컬럼의 청크
+
+        Returns:
+            PassengerStore 객체
+        """
+        parts: Dict[str, List[np.ndarray]] = {key: [] for key in
+                                              ("passenger_id", "survived", "pclass", "sex", "age", "fare", "embarked")}
+        names: List[pd.Categorical] = []
+        for frame in frames:
+            n = len(frame)
+            parts["passenger_id"].append(frame["PassengerId"].to_numpy(dtype=np.int64))
+            parts["survived"].append(frame["Survived"].to_numpy(dtype=np.int8) if "Survived" in frame.columns
+                                     else np.full(n, -1, dtype=np.int8))
+            parts["pclass"].append(frame["Pclass"].to_numpy(dtype=np.int8))
+            parts["sex"].append(_codes(frame["Sex"], GENDER_MAPPING))
+            parts["age"].append(frame["Age"].to_numpy(dtype=np.float32, na_value=np.nan))
+            parts["fare"].append(frame["Fare"].to_numpy(dtype=np.float64, na_value=np.nan))
+            parts["embarked"].append(_codes(frame["Embarked"], EMBARKED_MAPPING))
+            names.append(pd.Categorical(frame["Name"]))
+        if not names:
+            raise ValueError("승객 데이터가 비어 있습니다")
+        columns = {key: np.concatenate(arrays) for key, arrays in parts.items()}
+        store = cls(columns, union_categoricals(names) if len(names) > 1 else names[0])
+        logger.info(f"[승객 저장소] {store.rows:,}명 적재 (버전 {store.version})")
+        return store
+
+    @classmethod
+    def from_csv(cls, path: Union[str, Path], chunk_size: int = CHUNK_SIZE) -> "PassengerStore":
+        """CSV 파일을 청크로 읽어 저장소 생성"""
+        return cls.from_frames(pd.read_csv(path, chunksize=chunk_size, dtype=PASSENGER_DTYPES,
+                                           usecols=lambda column: column in PASSENGER_DTYPES))
+
+    def _survival_score(self) -> np.ndarray:
+        """(등급, 성별, 나이 구간) 그룹별 라벨 생존율을 전체 생존율 쪽으로 평활한 점수"""
+        labeled = self.survived >= 0
+        if not labeled.any():
+            return np.full(self.rows, np.nan, dtype=np.float32)
+        n_groups = len(self.group_pclass)
+        prior = float(self.survived[labeled].mean())
+        survived = np.bincount(self.group[labeled], weights=self.survived[labeled], minlength=n_groups)
+        counts = np.bincount(self.group[labeled], minlength=n_groups)
+        rates = (survived + PRIOR_WEIGHT * prior) / (counts + PRIOR_WEIGHT)
+        return rates[self.group].astype(np.float32)
+
+    # ***********
+    # 인덱스
+    # ***********
+
+    def _sort_values(self, key: str) -> np.ndarray:
+        if key not in SORT_KEYS:
+            raise ValueError(f"정렬 키가 올바르지 않습니다: {key} ({', '.join(SORT_KEYS)})")
+        return getattr(self, key)
+
+    def order(self, key: str, descending: bool = False) -> Dict[str, np.ndarray]:
+        """
+        정렬 키의 인덱스 (처음 요청할 때 만들어 보관)
+
+        값이 같으면 승객 번호 오름차순, 결측은 방향과 무관하게 맨 뒤입니다.
+
+        Returns:
+            order(순위 → 행), rank(행 → 순위),
+            group_keys(그룹 번호 × 행 수 + 순위, 오름차순), group_bounds(group_keys 의 그룹별 [시작, 끝)) 딕셔너리
+        """
+        cached = self._orders.get((key, descending))
+        if cached is not None:
+            return cached
+        with self._lock:
+            cached = self._orders.get((key, descending))
+            if cached is None:
+                values = self._sort_values(key)
+                primary = -values.astype(np.float64) if descending else values
+                order = np.lexsort((self.passenger_id, primary)).astype(np.int32)
+                rank = np.empty(self.rows, dtype=np.int32)
+                rank[order] = np.arange(self.rows, dtype=np.int32)
+                # 순위순 행의 그룹 번호로 안정 정렬하면 그룹 안에서는 순위순이 유지되므로
+                # (그룹, 순위)를 합친 키가 전체에서 오름차순 (여러 그룹의 커서 위치를 searchsorted 한 번으로 찾음)
+                groups = self.group[order]
+                by_group = np.argsort(groups, kind="stable")
+                counts = np.bincount(self.group, minlength=len(self.group_pclass))
+                cached = self._orders[(key, descending)] = {
+                    "order": order,
+                    "rank": rank,
+                    "group_keys": groups[by_group].astype(np.int64) * self.rows + by_group,
+                    "group_bounds": np.concatenate([[0], np.cumsum(counts)]),
+                }
+        return cached
+
+    # ***********
+    # 필터
+    # ***********
+
+    @staticmethod
+    def _filters(pclass: Optional[Sequence[int]] = None, sex: Optional[Sequence[str]] = None,
+                 age_band: Optional[Sequence[str]] = None, fare_min: Optional[float] = None,
+                 fare_max: Optional[float] = None, survived: Optional[int] = None) -> Dict[str, Any]:
+        """조회 조건 검증 후 코드로 변환"""
+        filters: Dict[str, Any] = {}
+        if pclass:
+            filters["pclass"] = sorted({int(p) for p in pclass})
+        if sex:
+            unknown = [s for s in sex if s not in GENDER_MAPPING]
+            if unknown:
+                raise ValueError(f"Sex 값이 올바르지 않습니다: {unknown[0]} (male, female)")
+            filters["sex"] = sorted({GENDER_MAPPING[s] for s in sex})
+        if age_band:
+            unknown = [a for a in age_band if a not in AGE_LABELS]
+            if unknown:
+                raise ValueError(f"나이 구간이 올바르지 않습니다: {unknown[0]} ({', '.join(AGE_LABELS)})")
+            filters["age_band"] = sorted({AGE_LABELS.index(a) for a in age_band})
+        if fare_min is not None or fare_max is not None:
+            low = -np.inf if fare_min is None else float(fare_min)
+            high = np.inf if fare_max is None else float(fare_max)
+            if low > high:
+                raise ValueError(f"fare_min({low})이 fare_max({high})보다 큽니다")
+            filters["fare"] = (low, high)
+        if survived is not None:
+            if survived not in (0, 1):
+                raise ValueError(f"survived 값은 0 또는 1이어야 합니다: {survived}")
+            filters["survived"] = survived
+        return filters
+
+    def _groups(self, filters: Dict[str, Any]) -> Optional[np.ndarray]:
+        """등급/성별/나이 구간 조건에 맞는 그룹 번호 (조건이 없으면 None, 조건별로 보관)"""
+        key = tuple(tuple(filters[name]) if name in filters else None for name in ("pclass", "sex", "age_band"))
+        if key == (None, None, None):
+            return None
+        groups = self._group_cache.get(key)
+        if groups is None:
+            mask = np.ones(len(self.group_pclass), dtype=bool)
+            for wanted, values in zip(key, (self.group_pclass, self.group_sex, self.group_age_band)):
+                if wanted is not None:
+                    mask &= np.isin(values, wanted)
+            groups = self._group_cache[key] = np.flatnonzero(mask)
+        return groups
+
+    def _mask(self, rows: np.ndarray, filters: Dict[str, Any], groups: Optional[np.ndarray] = None) -> np.ndarray:
+        """행 번호 배열에 필터를 벡터 연산으로 적용한 마스크 (groups 를 넘기면 그룹 조건은 이미 만족한 것으로 봄)"""
+        mask = np.ones(len(rows), dtype=bool)
+        if groups is None:
+            wanted = self._groups(filters)
+            if wanted is not None:
+                mask &= np.isin(self.group[rows], wanted)
+        if "fare" in filters:
+            fare = self.fare[rows]
+            low, high = filters["fare"]
+            mask &= (fare >= low) & (fare <= high)
+        if "survived" in filters:
+            mask &= self.survived[rows] == filters["survived"]
+        return mask
+
+    def _select(self, filters: Dict[str, Any], index: Dict[str, np.ndarray], after: int, limit: int) -> np.ndarray:
+        """
+        조건에 맞는 행 중 순위가 after 보다 뒤인 앞쪽 limit개의 순위 (오름차순)
+
+        - 조건 없음: 순위 after+1 부터 그대로
+        - 등급/성별/나이 구간만: 그룹마다 순위순으로 모아 둔 구간에서 after 다음 limit개씩 꺼내 합친 뒤 argpartition
+        - 요금/생존 조건 포함: 아래 방법 중 추정 비용(훑는 행 수)이 가장 작은 것
+            fare:       요금 범위 행에 나머지 조건을 적용한 뒤 argpartition
+            groups:     조건에 맞는 그룹의 커서 뒤 행 전체에 요금/생존 조건을 적용한 뒤 argpartition
+            group_scan: 그룹마다 커서 뒤 구간을 블록 단위로 훑어 limit개씩 모은 뒤 argpartition
+                        (limit개가 모이면 다음 순위가 그 limit번째보다 뒤인 그룹은 더 훑지 않음)
+            scan:       정렬 순서를 after 다음 위치부터 블록 단위로 훑음 (그룹 조건이 없을 때)
+          훑는 비용은 각 조건의 비율을 곱한 추정 선택도로 limit / 선택도 로 계산합니다.
+        """
+        if not filters:
+            return np.arange(after + 1, min(after + 1 + limit, self.rows))
+
+        groups = self._groups(filters)
+        bounds = index["group_bounds"]
+        group_keys = index["group_keys"]
+        if groups is not None:
+            starts = np.searchsorted(group_keys, groups * self.rows + after, side="right")
+            ends = bounds[groups + 1]
+            if "fare" not in filters and "survived" not in filters:
+                # 그룹마다 커서 다음 위치부터 최대 limit개 (그룹 수 × limit 크기의 배열 연산 한 번)
+                positions = starts[:, None] + np.arange(limit)
+                return self._first(group_keys[positions[positions < ends[:, None]]] % self.rows, limit)
+
+        rest = 1.0
+        costs: Dict[str, float] = {}
+        if "fare" in filters:
+            low, high = filters["fare"]
+            lo = int(np.searchsorted(self._fare_sorted, low, side="left"))
+            hi = int(np.searchsorted(self._fare_sorted, high, side="right"))
+            rest *= (hi - lo) / self.rows
+            costs["fare"] = hi - lo
+        if "survived" in filters:
+            rest *= self._survived_counts[filters["survived"] + 1] / self.rows
+        rest = max(rest, 1.0 / self.rows)
+        if groups is not None:
+            costs["groups"] = int((ends - starts).sum())
+            costs["group_scan"] = len(groups) * limit / rest
+        else:
+            costs["scan"] = limit / rest
+        method = min(costs, key=costs.get)
+
+        if method == "fare":
+            rows = self._fare_index["order"][lo:hi]
+            ranks = index["rank"][rows[self._mask(rows, filters)]]
+            return self._first(ranks[ranks > after], limit)
+
+        if method == "groups":
+            ranks = np.concatenate([group_keys[a:b] for a, b in zip(starts.tolist(), ends.tolist())]) % self.rows
+            return self._first(ranks[self._mask(index["order"][ranks], filters, groups)], limit)
+
+        if method == "group_scan":
+            found: List[np.ndarray] = []
+            need = np.full(len(groups), limit)
+            block = max(64, 2 * limit)
+            active = np.flatnonzero(starts < ends)
+            while len(active):
+                positions = starts[active, None] + np.arange(block)
+                valid = positions < ends[active, None]
+                ranks = group_keys[positions[valid]] % self.rows
+                hits = self._mask(index["order"][ranks], filters, groups)
+                owner = np.repeat(np.arange(len(active)), valid.sum(axis=1))
+                need[active] -= np.bincount(owner[hits], minlength=len(active))
+                found.append(ranks[hits])
+                starts[active] += block
+                active = active[(starts[active] < ends[active]) & (need[active] > 0)]
+                total = sum(len(f) for f in found)
+                if len(active) and total >= limit:
+                    # 그룹 안 순위는 오름차순이므로, 다음에 볼 순위가 지금까지의 limit번째보다 뒤인 그룹은 중단
+                    threshold = np.partition(np.concatenate(found), limit - 1)[limit - 1]
+                    active = active[group_keys[starts[active]] % self.rows < threshold]
+                block = min(block * 2, 1 << 16)
+            return self._first(np.concatenate(found) if found else np.empty(0, dtype=np.int64), limit)
+
+        # 정렬 순서를 after 다음 위치부터 블록 단위로 훑음 (블록 크기는 두 배씩 증가)
+        order = index["order"]
+        found = []
+        position, block, total = after + 1, max(256, 4 * limit), 0
+        while position < self.rows and total < limit:
+            hits = position + np.flatnonzero(self._mask(order[position:position + block], filters))
+            found.append(hits)
+            total += len(hits)
+            position += block
+            block *= 2
+        return np.concatenate(found)[:limit] if found else np.empty(0, dtype=np.int64)
+
+    @staticmethod
+    def _first(ranks: np.ndarray, limit: int) -> np.ndarray:
+        """가장 앞선 limit개 순위를 argpartition 으로 고른 뒤 정렬"""
+        if len(ranks) > limit:
+            ranks = ranks[np.argpartition(ranks, limit - 1)[:limit]]
+        return np.sort(ranks)
+
+    # ***********
+    # 조회
+    # ***********
+
+    def _encode_cursor(self, sort: str, descending: bool, rank: int) -> str:
+        payload = json.dumps({"v": self.version, "s": sort, "d": descending, "r": rank}, separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+    def _decode_cursor(self, cursor: str, sort: str, descending: bool) -> int:
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+            version, cursor_sort, cursor_descending, rank = payload["v"], payload["s"], payload["d"], int(payload["r"])
+        except (ValueError, KeyError, TypeError):
+            raise ValueError("커서 형식이 올바르지 않습니다")
+        if version != self.version:
+            raise ValueError("승객 데이터가 다시 적재되어 커서가 만료되었습니다. 첫 페이지부터 다시 조회해주세요.")
+        if cursor_sort != sort or cursor_descending != descending:
+            raise ValueError("커서의 정렬 조건이 요청과 다릅니다")
+        return rank
+
+    def query(self, pclass: Optional[Sequence[int]] = None, sex: Optional[Sequence[str]] = None,
+              age_band: Optional[Sequence[str]] = None, fare_min: Optional[float] = None,
+              fare_max: Optional[float] = None, survived: Optional[int] = None,
+              sort: str = "passenger_id", descending: bool = False, limit: int = 10,
+              cursor: Optional[str] = None) -> Dict[str, Any]:
+        """
+        필터/정렬 조회 (커서 페이지네이션)
+
+        Args:
+            pclass: 등급 목록
+            sex: 성별 목록 (male, female)
+            age_band: 나이 구간 목록 (AGE_LABELS)
+            fare_min: 최소 요금 (포함)
+            fare_max: 최대 요금 (포함)
+            survived: 생존 여부 (0, 1)
+            sort: 정렬 키 (passenger_id, score, fare, age)
+            descending: 내림차순 여부
+            limit: 페이지 크기 (1 ~ MAX_LIMIT)
+            cursor: 이전 응답의 next_cursor
+
+        Returns:
+            passengers, count, next_cursor(마지막 페이지면 None) 딕셔너리
+        """
+        if not 1 <= limit <= MAX_LIMIT:
+            raise ValueError(f"limit 은 1 이상 {MAX_LIMIT} 이하여야 합니다: {limit}")
+        filters = self._filters(pclass, sex, age_band, fare_min, fare_max, survived)
+        index = self.order(sort, descending)
+        after = self._decode_cursor(cursor, sort, descending) if cursor else -1
+
+        # 다음 페이지 존재 여부를 알기 위해 한 개 더 고름
+        ranks = self._select(filters, index, after, limit + 1)
+        page = ranks[:limit]
+        return {
+            "passengers": self.records(index["order"][page]),
+            "count": len(page),
+            "next_cursor": self._encode_cursor(sort, descending, int(page[-1])) if len(ranks) > limit else None,
+        }
+
+    def extremes(self, k: int, pclass: Optional[Sequence[int]] = None, sex: Optional[Sequence[str]] = None,
+                 age_band: Optional[Sequence[str]] = None, fare_min: Optional[float] = None,
+                 fare_max: Optional[float] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        생존 점수 상위/하위 k명 (생존 점수 내림차순/오름차순 인덱스에서 k명을 argpartition 으로 선택)
+
+        Args:
+            k: 그룹별 승객 수 (1 ~ MAX_LIMIT)
+            pclass, sex, age_band, fare_min, fare_max: query()와 같은 필터
+
+        Returns:
+            high_survival, low_survival 승객 목록 딕셔너리
+        """
+        if not 1 <= k <= MAX_LIMIT:
+            raise ValueError(f"k 는 1 이상 {MAX_LIMIT} 이하여야 합니다: {k}")
+        filters = self._filters(pclass, sex, age_band, fare_min, fare_max)
+        result = {}
+        for label, descending in (("high_survival", True), ("low_survival", False)):
+            index = self.order("score", descending)
+            result[label] = self.records(index["order"][self._select(filters, index, -1, k)])
+        return result
+
+    def records(self, rows: np.ndarray) -> List[Dict[str, Any]]:
+        """행 번호 → 승객 딕셔너리 목록 (컬럼별로 한 번에 꺼낸 뒤 묶음)"""
+        codes = self.names.codes[rows]
+        names = self.names.categories.take(np.maximum(codes, 0)).tolist()
+        columns = zip(
+            self.passenger_id[rows].tolist(), self.survived[rows].tolist(), self.pclass[rows].tolist(),
+            names, codes.tolist(), self.sex[rows].tolist(), self.age[rows].tolist(),
+            self.age_band[rows].tolist(), self.fare[rows].tolist(), self.embarked[rows].tolist(),
+            self.score[rows].tolist(),
+        )
+        return [{
+            "PassengerId": passenger_id,
+            "Survived": survived if survived >= 0 else None,
+            "Pclass": pclass,
+            "Name": name if code >= 0 else None,
+            "Sex": _SEX_LABELS.get(sex),
+            "Age": None if age != age else round(age, 2),
+            "AgeBand": AGE_LABELS[band],
+            "Fare": None if fare != fare else round(fare, 4),
+            "Embarked": _EMBARKED_LABELS.get(embarked),
+            "SurvivalScore": None if score != score else round(score, 4),
+        } for passenger_id, survived, pclass, name, code, sex, age, band, fare, embarked, score in columns]
+
+
+# ***********
+# 상주 저장소
+# ***********
+
+_stores: Dict[str, Tuple[Tuple[int, int], PassengerStore]] = {}
+_stores_lock = threading.Lock()
+
+
+def load_store(path: Union[str, Path, None] = None) -> PassengerStore:
+    """
+    CSV 파일의 상주 저장소 (파일 크기/수정 시각이 바뀌었을 때만 다시 적재)
+
+    Args:
+        path: 승객 CSV 경로 (기본값: app/resources/titanic/train.csv)
+
+    Returns:
+        PassengerStore 객체
+    """
+    path = Path(path) if path else TRAIN_PATH
+    stat = os.stat(path)
+    signature = (stat.st_size, stat.st_mtime_ns)
+    key = str(path.resolve())
+    cached = _stores.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    with _stores_lock:
+        cached = _stores.get(key)
+        if cached is None or cached[0] != signature:
+            cached = _stores[key] = (signature, PassengerStore.from_csv(path))
+    return cached[1]
@@ -0,0 +1,332 @@
+"""
+타이타닉 전처리 파이프라인
+
+TitanicMethod의 전처리 단계(drop_feature, fare_ordinal, embarked_nominal,
+gender_nominal, extract_title_from_name, age_ratio, title_nominal)를
+fit / transform 으로 나눈 변환기입니다.
+
+- fit: train 데이터에서 요금 구간 경계, 승선항 결측 대체값 등 상태를 학습
+- transform: 학습된 상태로 DataFrame 변환 (train, test, 단건 예측 모두 동일)
+
+학습된 상태와 변환 결과는 입력 CSV 파일 지문과 파이프라인 버전으로 만든 키로
+디스크에 저장되며, 파일이 바뀌지 않았다면 CSV를 다시 읽지 않고 재사용합니다.
+"""
+import hashlib
+import json
+import logging
+import os
+import shutil
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from app.titanic import titanic_columnar, titanic_profile
+from app.titanic.titanic_dataset import TitanicDataSet
+
+logger = logging.getLogger(__name__)
+
+# 전처리 규칙이 바뀌면 올려서 기존 산출물을 무효화
+PIPELINE_VERSION = "1"
+
+# 산출물 저장 위치
+ARTIFACT_DIR = Path(__file__).resolve().parent / "save" / "preprocess"
+
+DROP_FEATURES = ['SibSp', 'Parch', 'Cabin', 'Ticket']
+
+AGE_BINS = [-1, 0, 5, 12, 18, 24, 35, 60, np.inf]
+AGE_LABELS = ['Unknown', 'Baby', 'Child', 'Teenager', 'Student', 'Young Adult', 'Adult', 'Senior']
+AGE_MAPPING = {'Unknown': 0, 'Baby': 1, 'Child': 2, 'Teenager': 3, 'Student': 4,
+               'Young Adult': 5, 'Adult': 6, 'Senior': 7}
+
+TITLE_GROUPS = {
+    'Royal': ['Countess', 'Lady', 'Sir'],
+    'Rare': ['Capt', 'Col', 'Don', 'Dr', 'Major', 'Rev', 'Jonkheer', 'Dona', 'Mme'],
+    'Mr': ['Mlle'],
+    'Ms': ['Miss'],
+}
+TITLE_MAPPING = {'Mr': 1, 'Ms': 2, 'Mrs': 3, 'Master': 4, 'Royal': 5, 'Rare': 6}
+
+EMBARKED_MAPPING = {'S': 1, 'C': 2, 'Q': 3}
+GENDER_MAPPING = {'male': 0, 'female': 1}
+
+
+class TitanicPipeline:
+    """
+    학습된 상태를 가진 타이타닉 전처리 변환기
+
+    state는 JSON으로 저장 가능한 값만 담습니다.
+    """
+
+    def __init__(self, state: Optional[Dict[str, Any]] = None):
+        self.state = state
+
+    @property
+    def is_fitted(self) -> bool:
+        return self.state is not None
+
+    def fit(self, train: DataFrame) -> "TitanicPipeline":
+        """
+        train 데이터에서 전처리 상태 학습
+
+        Args:
+            train: 원본 train DataFrame
+
+        Returns:
+            self
+        """
+        # 요금 4분위 경계 (양 끝은 무한대로 넓혀 새 데이터도 구간에 들어가도록 함)
+        _, fare_edges = pd.qcut(train['Fare'], 4, retbins=True)
+        fare_edges = [float(edge) for edge in fare_edges]
+        fare_edges[0], fare_edges[-1] = -np.inf, np.inf
+
+        embarked_mode = train['Embarked'].mode()
+        self.state = {
+            "version": PIPELINE_VERSION,
+            "drop_features": DROP_FEATURES,
+            "fare_edges": fare_edges,
+            "fare_fill": 1,
+            "embarked_fill": str(embarked_mode.iloc[0]) if len(embarked_mode) else 'S',
+            "embarked_mapping": EMBARKED_MAPPING,
+            "gender_mapping": GENDER_MAPPING,
+            "age_fill": -0.5,
+            "age_bins": AGE_BINS,
+            "age_labels": AGE_LABELS,
+            "age_mapping": AGE_MAPPING,
+            "title_groups": TITLE_GROUPS,
+            "title_mapping": TITLE_MAPPING,
+            "title_fill": 0,
+        }
+        logger.info(f"[전처리 파이프라인 학습] 요금 구간 경계: {fare_edges[1:-1]}, "
+                    f"승선항 대체값: {self.state['embarked_fill']}")
+        return self
+
+    def transform(self, df: DataFrame) -> DataFrame:
+        """
+        학습된 상태로 DataFrame 변환 (원본은 변경하지 않음)
+
+        Args:
+            df: 원본 형식의 DataFrame (Survived 컬럼은 있으면 유지)
+
+        Returns:
+            전처리된 DataFrame
+        """
+        if self.state is None:
+            raise ValueError("전처리 파이프라인이 학습되지 않았습니다. 먼저 fit()을 실행해주세요.")
+        s = self.state
+        with titanic_profile.stage("drop_feature", rows_in=len(df)) as stage:
+            df = df.drop(columns=[c for c in s["drop_features"] if c in df.columns])
+            stage.capture(df)
+
+        # 학습된 경계로 구간화한 뒤 결측은 1구간
+        with titanic_profile.stage("fare_ordinal", rows_in=len(df)) as stage:
+            fare = pd.cut(df['Fare'], s["fare_edges"], labels=[1, 2, 3, 4])
+            df = df.drop(columns=['Fare'])
+            df['Fare'] = fare
+            df = df.fillna({'Fare': s["fare_fill"]})
+            stage.capture(df)
+
+        with titanic_profile.stage("embarked_nominal", rows_in=len(df)) as stage:
+            df['Embarked'] = df['Embarked'].fillna(s["embarked_fill"]).map(s["embarked_mapping"])
+            stage.capture(df)
+
+        with titanic_profile.stage("gender_nominal", rows_in=len(df)) as stage:
+            df['Gender'] = df['Sex'].map(s["gender_mapping"])
+            df = df.drop(columns=['Sex'])
+            stage.capture(df)
+
+        with titanic_profile.stage("extract_title_from_name", rows_in=len(df)) as stage:
+            df['Title'] = df['Name'].str.extract(r'([A-Za-z]+)\.', expand=False)
+            stage.capture(df)
+
+        with titanic_profile.stage("age_ratio", rows_in=len(df)) as stage:
+            age = df['Age'].fillna(s["age_fill"])
+            age_group = pd.cut(age, s["age_bins"], labels=s["age_labels"]).map(s["age_mapping"])
+            df = df.drop(columns=['Age'])
+            df['Age'] = age_group
+            stage.capture(df)
+
+        with titanic_profile.stage("title_nominal", rows_in=len(df)) as stage:
+            title = df['Title']
+            for group, titles in s["title_groups"].items():
+                title = title.replace(titles, group)
+            title = title.fillna(s["title_fill"]).map(s["title_mapping"]).fillna(s["title_fill"])
+            df['Title'] = title
+            df = df.drop(columns=['Name'])
+            stage.capture(df)
+
+        return df
+
+    def fit_transform(self, train: DataFrame) -> DataFrame:
+        return self.fit(train).transform(train)
+
+
+def _file_signature(path: Path) -> Dict[str, Any]:
+    stat = os.stat(path)
+    return {"name": Path(path).name, "size": stat.st_size, "mtime": stat.st_mtime_ns}
+
+
+def fingerprint(train_path: Path, test_path: Path) -> str:
+    """
+    입력 CSV 파일 크기/수정 시각과 파이프라인 버전으로 만든 지문
+
+    Args:
+        train_path: train CSV 경로
+        test_path: test CSV 경로
+
+    Returns:
+        sha1 지문 문자열
+    """
+    payload = json.dumps({
+        "version": PIPELINE_VERSION,
+        "files": [_file_signature(train_path), _file_signature(test_path)],
+    }, sort_keys=True).encode("utf-8")
+    return hashlib.sha1(payload).hexdigest()
+
+
+def _summary(df: DataFrame) -> Dict[str, Any]:
+    """원본 train 데이터 요약 (preprocess 응답용)"""
+    return {
+        "rows": len(df),
+        "columns": df.columns.tolist(),
+        "column_count": len(df.columns),
+        "null_count": int(df.isnull().sum().sum()),
+        "sample_data": json.loads(df.head(5).to_json(orient="records")),
+        "dtypes": df.dtypes.astype(str).to_dict(),
+    }
+
+
+class PreprocessArtifact:
+    """
+    전처리 산출물 (학습된 파이프라인 + 변환된 train/test)
+
+    저장 구조: save/preprocess/<fingerprint>/{meta.json, train.pkl, test.pkl}
+    """
+
+    def __init__(self, fingerprint: str, pipeline: TitanicPipeline, dataset: TitanicDataSet,
+                 meta: Dict[str, Any]):
+        self.fingerprint = fingerprint
+        self.pipeline = pipeline
+        self.dataset = dataset
+        self.meta = meta
+
+    @staticmethod
+    def path(key: str, artifact_dir: Optional[Path] = None) -> Path:
+        return Path(artifact_dir or ARTIFACT_DIR) / key
+
+    @classmethod
+    def fit(cls, train_path: Path, test_path: Path, key: str) -> "PreprocessArtifact":
+        """
+        CSV를 읽어 파이프라인을 학습하고 train/test 변환
+
+        Args:
+            train_path: train CSV 경로
+            test_path: test CSV 경로
+            key: 산출물 지문
+
+        Returns:
+            PreprocessArtifact 객체
+        """
+        with titanic_profile.stage("read_csv", category="io") as stage:
+            train = titanic_columnar.read_csv(train_path)
+            test = titanic_columnar.read_csv(test_path)
+            stage.rows_out = len(train) + len(test)
+        logger.info(f"[전처리 파이프라인] train {train.shape}, test {test.shape} 읽기 완료")
+
+        with titanic_profile.stage("fit_pipeline", rows_in=len(train)):
+            pipeline = TitanicPipeline().fit(train)
+        dataset = TitanicDataSet()
+        with titanic_profile.stage("transform_train", rows_in=len(train)) as stage:
+            dataset.train = pipeline.transform(train)
+            stage.rows_out = len(dataset.train)
+        with titanic_profile.stage("transform_test", rows_in=len(test)) as stage:
+            dataset.test = pipeline.transform(test)
+            stage.rows_out = len(dataset.test)
+
+        meta = {
+            "fingerprint": key,
+            "version": PIPELINE_VERSION,
+            "created_at": datetime.now().isoformat(),
+            "train_path": str(train_path),
+            "test_path": str(test_path),
+            "state": pipeline.state,
+            "raw_train": _summary(train),
+            "columns": dataset.train.columns.tolist(),
+        }
+        return cls(key, pipeline, dataset, meta)
+
+    def save(self, artifact_dir: Optional[Path] = None) -> Path:
+        """
+        산출물을 임시 폴더에 쓴 뒤 이름을 바꿔 저장 (읽는 쪽이 반쯤 쓰인 산출물을 보지 않도록 함)
+
+        Returns:
+            저장된 폴더 경로
+        """
+        target = self.path(self.fingerprint, artifact_dir)
+        tmp = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+        tmp.mkdir(parents=True, exist_ok=True)
+        self.dataset.train.to_pickle(tmp / "train.pkl")
+        self.dataset.test.to_pickle(tmp / "test.pkl")
+        with open(tmp / "meta.json", "w", encoding="utf-8") as f:
+            json.dump(self.meta, f, ensure_ascii=False, default=str)
+        try:
+            os.replace(tmp, target)
+        except OSError:
+            # 다른 프로세스가 먼저 저장한 경우
+            shutil.rmtree(tmp, ignore_errors=True)
+        return target
+
+    @classmethod
+    def load(cls, key: str, artifact_dir: Optional[Path] = None) -> Optional["PreprocessArtifact"]:
+        """
+        저장된 산출물 로드 (없으면 None)
+
+        Args:
+            key: 산출물 지문
+            artifact_dir: 저장 폴더
+
+        Returns:
+            PreprocessArtifact 객체 또는 None
+        """
+        path = cls.path(key, artifact_dir)
+        if not (path / "meta.json").exists():
+            return None
+        with open(path / "meta.json", "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        dataset = TitanicDataSet()
+        dataset.train = pd.read_pickle(path / "train.pkl")
+        dataset.test = pd.read_pickle(path / "test.pkl")
+        return cls(key, TitanicPipeline(meta["state"]), dataset, meta)
+
+
+def load_or_fit(train_path: Path, test_path: Path,
+                artifact_dir: Optional[Path] = None) -> Tuple[PreprocessArtifact, bool]:
+    """
+    지문이 같은 산출물이 있으면 로드하고, 없으면 학습 후 저장
+
+    Args:
+        train_path: train CSV 경로
+        test_path: test CSV 경로
+        artifact_dir: 저장 폴더 (기본값: app/titanic/save/preprocess)
+
+    Returns:
+        (PreprocessArtifact, 디스크에서 로드했는지 여부) 튜플
+    """
+    key = fingerprint(train_path, test_path)
+    with titanic_profile.stage("load_artifact", category="io") as stage:
+        artifact = PreprocessArtifact.load(key, artifact_dir)
+        if artifact is not None:
+            stage.rows_out = len(artifact.dataset.train) + len(artifact.dataset.test)
+    if artifact is not None:
+        logger.info(f"[전처리 파이프라인] 저장된 산출물 사용: {key}")
+        return artifact, True
+
+    artifact = PreprocessArtifact.fit(train_path, test_path, key)
+    with titanic_profile.stage("save_artifact", category="io"):
+        saved = artifact.save(artifact_dir)
+    logger.info(f"[전처리 파이프라인] 산출물 저장 완료: {saved}")
+    return artifact, False
+
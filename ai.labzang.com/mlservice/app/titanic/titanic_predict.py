@@ -0,0 +1,522 @@
+"""
+타이타닉 생존 예측 (온라인 추론)
+
+요청 한 건마다 DataFrame을 만들지 않도록 TitanicPipeline의 학습된 상태를
+그대로 사용하는 NumPy/딕셔너리 인코더와, 메모리에 올려 둔 모델 묶음을 제공합니다.
+
+- TitanicEncoder: 승객 원본 필드 → 피처 벡터 (단건/배열은 pandas 미사용, 대용량 청크는 encode_frame)
+- PredictorState: 전처리 지문, 인코더, 모델, 예측 테이블을 묶은 읽기 전용 상태 (한 번에 교체)
+- TitanicPredictor: 전처리 산출물로 학습한 모델들을 보관하고 모델별 생존 확률 계산
+"""
+import bisect
+import logging
+import math
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.titanic import titanic_profile
+from app.titanic.titanic_cv import MODEL_SPECS, FoldScoreStore, run_cv_grid
+from app.titanic.titanic_forest import compile_model
+from app.titanic.titanic_lut import TABLE_FILE, PredictionTable, feature_axes
+from app.titanic.titanic_registry import ModelRegistry
+
+logger = logging.getLogger(__name__)
+
+# 예측에 사용하는 피처 (PassengerId는 승객 식별자이므로 제외)
+PREDICT_FEATURES = ['Pclass', 'Embarked', 'Fare', 'Gender', 'Title', 'Age']
+
+# predict_proba 계산 방식
+#   auto: 예측 테이블에 있는 입력은 테이블, 없는 입력(처음 보는 Pclass 등)은 모델
+#   table: 예측 테이블만 사용 (테이블 밖 입력은 ValueError)
+#   model: 항상 모델 호출
+ENGINES = ("auto", "table", "model")
+
+_TITLE_PATTERN = re.compile(r'([A-Za-z]+)\.')
+
+
+def _is_missing(value: Any) -> bool:
+    return value is None or value == "" or (isinstance(value, float) and math.isnan(value))
+
+
+def build_estimator(name: str, params: Optional[Dict[str, Any]] = None):
+    """
+    예측용 모델 객체 생성 (SVM은 생존 확률을 내도록 probability=True)
+
+    Args:
+        name: 모델 키 (MODEL_SPECS)
+        params: 모델 파라미터 (기본값: MODEL_SPECS 설정)
+
+    Returns:
+        학습 전 sklearn 모델 객체
+    """
+    _, model_class, default_params = MODEL_SPECS[name]
+    params = dict(default_params if params is None else params)
+    if name == "svm":
+        params.update(probability=True, random_state=42)
+    return model_class(**params)
+
+
+class TitanicEncoder:
+    """
+    TitanicPipeline.transform 과 같은 규칙의 NumPy/딕셔너리 인코더
+
+    pd.cut(right=True) 구간은 경계 리스트에 대한 bisect_left / searchsorted(side='left')와 같습니다.
+    """
+
+    def __init__(self, state: Dict[str, Any]):
+        self.state = state
+        self.fare_edges = [float(e) for e in state["fare_edges"]]
+        self.age_bins = [float(b) for b in state["age_bins"]]
+        self.age_codes = [state["age_mapping"][label] for label in state["age_labels"]]
+        self.embarked_mapping = state["embarked_mapping"]
+        self.gender_mapping = state["gender_mapping"]
+        self.title_fill = state["title_fill"]
+
+        # 원래 호칭 → 최종 코드 (그룹 치환 후 매핑)
+        self.title_codes = dict(state["title_mapping"])
+        for group, titles in state["title_groups"].items():
+            for title in titles:
+                self.title_codes[title] = state["title_mapping"].get(group, self.title_fill)
+
+        self._fare_edges = np.asarray(self.fare_edges)
+        self._age_bins = np.asarray(self.age_bins)
+        self._age_codes = np.asarray(self.age_codes + [np.nan], dtype=float)
+
+    # ***********
+    # 단일 값 인코딩
+    # ***********
+
+    def _embarked(self, value: Any) -> int:
+        value = self.state["embarked_fill"] if _is_missing(value) else value
+        if value not in self.embarked_mapping:
+            raise ValueError(f"Embarked 값이 올바르지 않습니다: {value} (S, C, Q)")
+        return self.embarked_mapping[value]
+
+    def _gender(self, value: Any) -> int:
+        if value not in self.gender_mapping:
+            raise ValueError(f"Sex 값이 올바르지 않습니다: {value} (male, female)")
+        return self.gender_mapping[value]
+
+    def _title(self, name: Any) -> int:
+        if _is_missing(name):
+            return self.title_fill
+        match = _TITLE_PATTERN.search(str(name))
+        if match is None:
+            return self.title_fill
+        return self.title_codes.get(match.group(1), self.title_fill)
+
+    def _fare(self, value: Any) -> int:
+        if _is_missing(value):
+            return self.state["fare_fill"]
+        return bisect.bisect_left(self.fare_edges, float(value))
+
+    def _age(self, value: Any) -> int:
+        age = self.state["age_fill"] if _is_missing(value) else float(value)
+        index = bisect.bisect_left(self.age_bins, age) - 1
+        if index < 0 or index >= len(self.age_codes):
+            raise ValueError(f"Age 값이 올바르지 않습니다: {value}")
+        return self.age_codes[index]
+
+    def encode(self, passenger: Dict[str, Any]) -> np.ndarray:
+        """
+        승객 한 명의 원본 필드를 피처 벡터로 변환
+
+        Args:
+            passenger: Pclass, Sex 필수 / Name, Age, Fare, Embarked 선택
+
+        Returns:
+            PREDICT_FEATURES 순서의 (1, n_features) 배열
+        """
+        if _is_missing(passenger.get("Pclass")):
+            raise ValueError("Pclass 필드가 필요합니다")
+        return np.array([[
+            float(passenger["Pclass"]),
+            self._embarked(passenger.get("Embarked")),
+            self._fare(passenger.get("Fare")),
+            self._gender(passenger.get("Sex")),
+            self._title(passenger.get("Name")),
+            self._age(passenger.get("Age")),
+        ]], dtype=np.float64)
+
+    # ***********
+    # 배열 인코딩
+    # ***********
+
+    @staticmethod
+    def _numbers(values: Sequence[Any]) -> np.ndarray:
+        return np.array([np.nan if _is_missing(v) else float(v) for v in values], dtype=np.float64)
+
+    def encode_columns(self, columns: Dict[str, Sequence[Any]]) -> np.ndarray:
+        """
+        필드별 배열로 받은 여러 승객을 한 번에 피처 행렬로 변환
+
+        Args:
+            columns: 필드명 → 값 배열 (Pclass, Sex 필수, 모든 배열 길이 동일)
+
+        Returns:
+            (n_passengers, n_features) 배열
+        """
+        for name in ("Pclass", "Sex"):
+            if name not in columns:
+                raise ValueError(f"{name} 필드가 필요합니다")
+        n = len(columns["Pclass"])
+        for name, values in columns.items():
+            if len(values) != n:
+                raise ValueError(f"{name} 배열 길이({len(values)})가 Pclass 배열 길이({n})와 다릅니다")
+
+        missing = [None] * n
+        pclass = self._numbers(columns["Pclass"])
+        if np.isnan(pclass).any():
+            raise ValueError("Pclass 값이 비어 있습니다")
+
+        fare = self._numbers(columns.get("Fare", missing))
+        fare_band = np.where(np.isnan(fare), self.state["fare_fill"],
+                             np.searchsorted(self._fare_edges, fare, side="left"))
+
+        age = self._numbers(columns.get("Age", missing))
+        age = np.where(np.isnan(age), self.state["age_fill"], age)
+        age_index = np.searchsorted(self._age_bins, age, side="left") - 1
+        if ((age_index < 0) | (age_index >= len(self.age_codes))).any():
+            raise ValueError("Age 값이 올바르지 않습니다")
+        age_code = self._age_codes[age_index]
+
+        return np.column_stack([
+            pclass,
+            [self._embarked(v) for v in columns.get("Embarked", missing)],
+            fare_band,
+            [self._gender(v) for v in columns["Sex"]],
+            [self._title(v) for v in columns.get("Name", missing)],
+            age_code,
+        ]).astype(np.float64)
+
+    # ***********
+    # DataFrame(청크) 인코딩
+    # ***********
+
+    @staticmethod
+    def _lookup(values, mapping: Dict[Any, int], field: str, missing: Optional[int] = None) -> np.ndarray:
+        """
+        문자열 Series → 코드 배열 (범주형으로 바꿔 고유 값만 매핑한 뒤 범주 코드로 펼침)
+
+        Args:
+            values: 문자열 또는 category dtype Series
+            mapping: 값 → 코드
+            field: 오류 메시지용 필드 이름
+            missing: 결측 값의 코드 (None이면 ValueError, 매핑에 없는 값은 항상 ValueError)
+        """
+        categorical = values.array if isinstance(values.dtype, pd.CategoricalDtype) else pd.Categorical(values)
+        lookup = np.array([mapping.get(c, -1) for c in categorical.categories]
+                          + [-1 if missing is None else missing], dtype=np.int64)
+        # 결측의 범주 코드 -1 은 lookup 마지막 칸(missing)을 가리킴
+        codes = lookup[categorical.codes]
+        if (codes < 0).any():
+            bad = values[codes < 0].iloc[0]
+            raise ValueError(f"{field} 값이 올바르지 않습니다: {bad}")
+        return codes
+
+    def encode_frame(self, df: pd.DataFrame, dtype=np.float64) -> np.ndarray:
+        """
+        원본 형식 DataFrame을 승객별 파이썬 반복 없이 피처 행렬로 변환 (대용량 청크용)
+
+        문자열 필드는 고유 값만 매핑하므로 같은 값이 반복될수록 빠르고,
+        결과는 encode_columns / TitanicPipeline.transform 과 같습니다.
+
+        Args:
+            df: Pclass, Sex 필수 / Name, Age, Fare, Embarked 선택 컬럼
+            dtype: 결과 dtype (모든 피처가 작은 정수 코드이므로 np.int8 가능)
+
+        Returns:
+            (len(df), n_features) 배열
+        """
+        for name in ("Pclass", "Sex"):
+            if name not in df.columns:
+                raise ValueError(f"{name} 필드가 필요합니다")
+        n = len(df)
+        out = np.empty((n, len(PREDICT_FEATURES)), dtype=dtype)
+
+        pclass = df["Pclass"]
+        if pclass.isna().any():
+            raise ValueError("Pclass 값이 비어 있습니다")
+        out[:, 0] = pclass.to_numpy()
+
+        if "Embarked" in df.columns:
+            fill = self.embarked_mapping.get(self.state["embarked_fill"])
+            out[:, 1] = self._lookup(df["Embarked"], self.embarked_mapping, "Embarked", missing=fill)
+        else:
+            out[:, 1] = self._embarked(None)
+
+        if "Fare" in df.columns:
+            fare = df["Fare"].to_numpy(dtype=np.float64, na_value=np.nan)
+            out[:, 2] = np.where(np.isnan(fare), self.state["fare_fill"],
+                                 np.searchsorted(self._fare_edges, fare, side="left"))
+        else:
+            out[:, 2] = self.state["fare_fill"]
+
+        out[:, 3] = self._lookup(df["Sex"], self.gender_mapping, "Sex")
+
+        if "Name" in df.columns:
+            # 고유 이름에서만 호칭을 추출하고 범주 코드로 펼침
+            names = df["Name"].astype("category").array
+            titles = pd.Series(names.categories).str.extract(_TITLE_PATTERN.pattern, expand=False)
+            lookup = np.array([self.title_codes.get(t, self.title_fill) if isinstance(t, str) else self.title_fill
+                               for t in titles] + [self.title_fill], dtype=np.int64)
+            out[:, 4] = lookup[names.codes]
+        else:
+            out[:, 4] = self.title_fill
+
+        if "Age" in df.columns:
+            age = df["Age"].to_numpy(dtype=np.float64, na_value=np.nan)
+            age = np.where(np.isnan(age), self.state["age_fill"], age)
+        else:
+            age = np.full(n, self.state["age_fill"], dtype=np.float64)
+        age_index = np.searchsorted(self._age_bins, age, side="left") - 1
+        if ((age_index < 0) | (age_index >= len(self.age_codes))).any():
+            raise ValueError("Age 값이 올바르지 않습니다")
+        out[:, 5] = self._age_codes[age_index]
+        return out
+
+
+@dataclass(frozen=True)
+class PredictorState:
+    """
+    예측에 사용하는 상주 상태 한 벌 (읽기 전용)
+
+    ensure_fitted 는 새 상태를 모두 만든 뒤 참조 하나만 바꾸므로, 요청이 처음 읽은 상태로
+    인코딩부터 예측까지 처리하면 다른 버전의 인코더/모델/테이블이 섞이지 않습니다.
+    """
+
+    fingerprint: Optional[str] = None
+    encoder: Optional[TitanicEncoder] = None
+    models: Mapping[str, Any] = field(default_factory=dict)
+    versions: Mapping[str, str] = field(default_factory=dict)
+    tables: Mapping[str, PredictionTable] = field(default_factory=dict)
+
+    def __post_init__(self):
+        for name in ("models", "versions", "tables"):
+            object.__setattr__(self, name, MappingProxyType(dict(getattr(self, name))))
+
+    def predict_proba(self, X: np.ndarray, models: Optional[List[str]] = None,
+                      engine: str = "auto") -> Dict[str, np.ndarray]:
+        """
+        모델별 생존 확률 계산
+
+        Args:
+            X: 인코딩된 피처 행렬
+            models: 사용할 모델 이름 목록 (기본값: 전체)
+            engine: 계산 방식 (auto, table, model)
+
+        Returns:
+            모델 이름 → 생존(Survived=1) 확률 배열
+        """
+        if engine not in ENGINES:
+            raise ValueError(f"알 수 없는 engine입니다: {engine} (사용 가능: {', '.join(ENGINES)})")
+        if engine == "table" and not self.tables:
+            raise ValueError("예측 테이블이 비활성화되어 있습니다")
+        if models:
+            unknown = [m for m in models if m not in self.models]
+            if unknown:
+                raise ValueError(f"알 수 없는 모델입니다: {', '.join(unknown)} (사용 가능: {', '.join(self.models)})")
+
+        index = None
+        if engine != "model" and self.tables:
+            # 입력 공간은 모든 모델이 같으므로 인덱스는 한 번만 계산
+            index = next(iter(self.tables.values())).index(X)
+            outside = index < 0
+            if engine == "table" and outside.any():
+                raise ValueError(f"예측 테이블 밖의 입력입니다: {X[outside][0].tolist()}")
+
+        probabilities = {}
+        for name, model in self.models.items():
+            if models and name not in models:
+                continue
+            table = self.tables.get(name) if index is not None else None
+            if table is None:
+                survived = list(model.classes_).index(1)
+                probabilities[name] = model.predict_proba(X)[:, survived]
+                continue
+            result = table.probabilities[np.maximum(index, 0)]
+            if outside.any():
+                survived = list(model.classes_).index(1)
+                result[outside] = model.predict_proba(X[outside])[:, survived]
+            probabilities[name] = result
+        return probabilities
+
+
+class TitanicPredictor:
+    """
+    메모리에 상주하는 예측 모델 묶음
+
+    모델은 레지스트리의 현재 버전("predict.<모델>")을 사용하며, 현재 버전이 없거나
+    전처리 산출물 지문이 다르면 학습 후 등록/지정합니다.
+    다른 워커에서 현재 버전을 바꾸면 다음 요청에서 새 버전으로 교체됩니다.
+    트리 모델은 호출 고정 비용이 작은 배열 기반 엔진(FlatForest)으로 변환해 사용합니다.
+    use_tables=True 이면 모델 버전마다 전체 입력 공간 예측 테이블(PredictionTable)을 만들어
+    두고 배열 인덱싱만으로 예측합니다.
+    요청 처리 쪽은 state 를 한 번 읽어 그 상태(PredictorState)로 인코딩과 예측을 모두 처리합니다.
+    """
+
+    REGISTRY_PREFIX = "predict."
+
+    def __init__(self, registry: ModelRegistry, models: Optional[List[str]] = None, use_tables: bool = True):
+        self.registry = registry
+        self.model_names = [m for m in MODEL_SPECS if models is None or m in models]
+        self.use_tables = use_tables
+        self.state = PredictorState()
+        # 지정하면 교차 검증 지표 계산 시 저장된 폴드 점수를 재사용
+        self.fold_scores: Optional[FoldScoreStore] = None
+        # 지정하면 학습 데이터에 누적 라벨 승객(titanic_learn.LabeledStore)을 더함
+        self.labeled = None
+        self._lock = threading.Lock()
+
+    @property
+    def fingerprint(self) -> Optional[str]:
+        return self.state.fingerprint
+
+    @property
+    def encoder(self) -> Optional[TitanicEncoder]:
+        return self.state.encoder
+
+    @property
+    def models(self) -> Mapping[str, Any]:
+        return self.state.models
+
+    @property
+    def versions(self) -> Mapping[str, str]:
+        return self.state.versions
+
+    @property
+    def tables(self) -> Mapping[str, PredictionTable]:
+        return self.state.tables
+
+    def _current_models(self, fingerprint: str) -> Dict[str, Any]:
+        """레지스트리에서 전처리 지문과 모델 클래스가 같은 현재 버전만 조회"""
+        current = {}
+        for name in self.model_names:
+            entry = self.registry.current(self.REGISTRY_PREFIX + name)
+            if (entry is not None and entry.meta.get("preprocess_fingerprint") == fingerprint
+                    and entry.meta.get("features") == PREDICT_FEATURES
+                    and entry.meta.get("estimator") == MODEL_SPECS[name][1].__name__):
+                current[name] = entry
+        return current
+
+    def training_data(self, artifact) -> Tuple[np.ndarray, np.ndarray, int]:
+        """
+        예측 모델 학습 데이터 (전처리된 train + 누적 라벨 승객)
+
+        Args:
+            artifact: PreprocessArtifact 객체
+
+        Returns:
+            (X, y, 라벨 승객 수) 튜플
+        """
+        train = artifact.dataset.train
+        X = train[PREDICT_FEATURES].astype(np.float64).to_numpy()
+        y = train['Survived'].to_numpy().astype(np.int64)
+        if self.labeled is None:
+            return X, y, 0
+        X_new, y_new = self.labeled.arrays(TitanicEncoder(artifact.pipeline.state), artifact.fingerprint)
+        return np.vstack([X, X_new]), np.concatenate([y, y_new]), len(y_new)
+
+    def _fit(self, artifact, names: List[str]) -> None:
+        """모델 학습 후 CV 지표, 학습 시간과 함께 레지스트리에 등록하고 현재 버전으로 지정"""
+        X, y, labeled_rows = self.training_data(artifact)
+
+        cv_results = run_cv_grid(X, y, models=names, store=self.fold_scores)["results"]
+        for name in names:
+            started = time.perf_counter()
+            with titanic_profile.stage(f"fit.{name}", category="fit", rows_in=len(X)):
+                estimator = build_estimator(name).fit(X, y)
+            training_seconds = time.perf_counter() - started
+            metrics = {k: v for k, v in cv_results.get(name, {}).items() if k in ("accuracy", "fold_scores")}
+            self.registry.register(
+                self.REGISTRY_PREFIX + name, estimator,
+                preprocess_fingerprint=artifact.fingerprint,
+                features=PREDICT_FEATURES,
+                metrics=metrics,
+                training_seconds=round(training_seconds, 4),
+                promote=True,
+                labeled_rows=labeled_rows,
+            )
+
+    def _is_current(self, artifact, current: Dict[str, Any]) -> bool:
+        state = self.state
+        return (state.fingerprint == artifact.fingerprint and len(current) == len(self.model_names)
+                and dict(state.versions) == {name: entry.version for name, entry in current.items()})
+
+    def ensure_fitted(self, artifact) -> PredictorState:
+        """
+        레지스트리의 현재 버전으로 모델 묶음 갱신 (필요한 모델만 학습)
+
+        새 인코더/모델/예측 테이블을 모두 만든 뒤 잠금 안에서 state 를 한 번에 교체합니다.
+
+        Args:
+            artifact: PreprocessArtifact 객체
+
+        Returns:
+            PredictorState: 현재 상태
+        """
+        current = self._current_models(artifact.fingerprint)
+        if self._is_current(artifact, current):
+            return self.state
+        with self._lock:
+            current = self._current_models(artifact.fingerprint)
+            missing = [m for m in self.model_names if m not in current]
+            if missing:
+                logger.info(f"예측 모델 학습 시작: {missing}")
+                self._fit(artifact, missing)
+                current = self._current_models(artifact.fingerprint)
+            if self._is_current(artifact, current):
+                return self.state
+
+            previous = self.state
+            encoder = (previous.encoder if previous.fingerprint == artifact.fingerprint
+                       else TitanicEncoder(artifact.pipeline.state))
+            models = {name: compile_model(entry.estimator) for name, entry in current.items()}
+            tables = {}
+            if self.use_tables:
+                axes = feature_axes(artifact.pipeline.state, artifact.dataset.train['Pclass'].unique())
+                tables = {name: self._table(entry, models[name], axes) for name, entry in current.items()}
+            self.state = PredictorState(
+                fingerprint=artifact.fingerprint,
+                encoder=encoder,
+                models=models,
+                versions={name: entry.version for name, entry in current.items()},
+                tables=tables,
+            )
+            return self.state
+
+    @staticmethod
+    def _table(entry, model, axes: List[np.ndarray]) -> PredictionTable:
+        """모델 버전의 예측 테이블 (버전 폴더에 저장된 테이블이 있으면 로드, 없으면 계산 후 저장)"""
+        path = entry.path / TABLE_FILE
+        try:
+            table = PredictionTable.load(path)
+        except OSError:
+            # 보존 정책으로 버전 폴더가 삭제되는 중이면 다시 계산
+            table = None
+        if table is not None and table.matches(axes):
+            return table
+        started = time.perf_counter()
+        with titanic_profile.stage(f"table.{entry.name}", category="predict") as stage:
+            table = PredictionTable.build(model, axes)
+            stage.rows_out = table.size
+        try:
+            table.save(path)
+        except OSError as e:
+            # 저장은 다음 로드를 위한 캐시이므로 실패해도 메모리의 테이블을 사용
+            logger.warning(f"[예측 테이블] {entry.name}@{entry.version} 저장 실패: {e}")
+        logger.info(f"[예측 테이블] {entry.name}@{entry.version}: 조합 {table.size}개 "
+                    f"({(time.perf_counter() - started) * 1000:.1f}ms)")
+        return table
+
+    def predict_proba(self, X: np.ndarray, models: Optional[List[str]] = None,
+                      engine: str = "auto") -> Dict[str, np.ndarray]:
+        """현재 상태(state)로 모델별 생존 확률 계산 (PredictorState.predict_proba)"""
+        return self.state.predict_proba(X, models, engine)
@@ -0,0 +1,333 @@
+"""
+타이타닉 파이프라인 계측
+
+전처리 단계(TitanicMethod 단계 이름 기준)와 모델 학습마다 실제 소요 시간(wall),
+CPU 시간, 입력/출력 행 수와 tracemalloc 최대 메모리(TITANIC_PROFILE_MEMORY=1 일 때)를 기록합니다.
+
+    profiler = PipelineProfiler()
+    with profiler.run("evaluate"):
+        ...
+        # 파이프라인 코드에서는 profiler를 넘겨받지 않고 모듈 함수로 계측
+        with titanic_profile.stage("fare_ordinal", rows_in=len(df)) as stage:
+            ...
+            stage.capture(df)
+
+- CPU 시간은 단계를 실행한 스레드의 시간(time.thread_time)이므로 같은 프로세스의 다른 요청/작업 스레드
+  시간은 들어가지 않음 (BLAS 등 라이브러리 내부 스레드 시간도 제외). 프로세스 풀 작업자의 CPU 시간은
+  작업자가 잰 cpu_seconds 를 add()로 따로 기록 (titanic_cv._profile_cells)
+- 단계 기록은 스레드별 스택에 쌓이므로, 실행 중인 run()이 없는 스레드에서는 stage()가 아무것도 기록하지 않음
+- run() 안에서 다시 run()을 호출하면 바깥 실행의 하위 단계로 기록 (evaluate 안의 preprocess 등)
+- stage()는 중첩 가능하며, 하위 단계의 최대 메모리는 상위 단계에도 반영
+- 최근 실행 MAX_RUNS개를 보관하며, /titanic/profile 에서 전체 또는 종류별 최신 실행을 조회
+- debug=True 일 때만 단계별 데이터 샘플(head/dtypes)을 기록 (문자열 변환 비용이 크므로)
+"""
+import functools
+import json
+import logging
+import os
+import threading
+import time
+import tracemalloc
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 보관할 최근 실행 수
+MAX_RUNS = 20
+
+
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name, "").lower() in ("1", "true", "yes")
+
+
+class Stage:
+    """계측 단계 한 개"""
+
+    def __init__(self, name: str, category: str, rows_in: Optional[int] = None):
+        self.name = name
+        self.category = category
+        self.rows_in = rows_in
+        self.rows_out: Optional[int] = None
+        self.wall_ms: Optional[float] = None
+        self.cpu_ms: Optional[float] = None
+        self.peak_kb: Optional[float] = None
+        self.extra: Dict[str, Any] = {}
+        self.sample: Optional[Dict[str, Any]] = None
+        self.children: List["Stage"] = []
+        self._debug = False
+        self._peak = 0
+
+    def capture(self, df) -> None:
+        """출력 DataFrame 행 수 기록 (debug 모드에서는 dtypes와 상위 5행도 기록)"""
+        self.rows_out = len(df)
+        if self._debug:
+            self.sample = {
+                "columns": df.columns.tolist(),
+                "dtypes": df.dtypes.astype(str).to_dict(),
+                # NaN/범주형 값도 JSON으로 응답할 수 있도록 to_json을 거침
+                "head": json.loads(df.head(5).to_json(orient="records")),
+            }
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            "name": self.name,
+            "category": self.category,
+            "wall_ms": self.wall_ms,
+            "cpu_ms": self.cpu_ms,
+            "rows_in": self.rows_in,
+            "rows_out": self.rows_out,
+            "peak_kb": self.peak_kb,
+        }
+        if self.extra:
+            data.update(self.extra)
+        if self.sample is not None:
+            data["sample"] = self.sample
+        if self.children:
+            data["stages"] = [child.to_dict() for child in self.children]
+        return data
+
+
+class ProfileRun(Stage):
+    """최상위 실행 기록 (preprocess, evaluate, submit, tune 등)"""
+
+    def __init__(self, kind: str):
+        super().__init__(kind, "run")
+        self.run_id = uuid.uuid4().hex
+        self.created_at = datetime.now().isoformat()
+        self.status = "running"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"run_id": self.run_id, "kind": self.name, "status": self.status,
+                "created_at": self.created_at, **super().to_dict()}
+
+
+# 스레드별 단계 스택과 실행 중인 계측기
+_local = threading.local()
+
+
+def _stack() -> List[Stage]:
+    if not hasattr(_local, "stack"):
+        _local.stack = []
+    return _local.stack
+
+
+def _measure(record: Stage, trace_memory: bool) -> Iterator[Stage]:
+    # tracemalloc 최대값은 프로세스 전체에 하나뿐이므로, 단계에 들어갈 때마다
+    # 지금까지의 최대값을 상위 단계에 넘겨 두고 초기화한 뒤,
+    # 나올 때 자기 최대값(하위 단계 포함)을 다시 상위 단계에 넘김
+    # (여러 스레드가 동시에 실행되면 다른 스레드의 할당도 함께 잡힘)
+    stack = _stack()
+    tracing = trace_memory and tracemalloc.is_tracing()
+    if tracing:
+        _, peak = tracemalloc.get_traced_memory()
+        if stack:
+            stack[-1]._peak = max(stack[-1]._peak, peak)
+        tracemalloc.reset_peak()
+        base, record._peak = tracemalloc.get_traced_memory()
+    stack.append(record)
+    # 작업은 요청 스레드와 함께 도는 JobManager 스레드에서 실행되므로 프로세스 전체가 아닌 이 스레드의 CPU 시간
+    wall, cpu = time.perf_counter(), time.thread_time()
+    try:
+        yield record
+    finally:
+        record.wall_ms = round((time.perf_counter() - wall) * 1000, 3)
+        record.cpu_ms = round((time.thread_time() - cpu) * 1000, 3)
+        stack.pop()
+        if tracing and tracemalloc.is_tracing():
+            _, peak = tracemalloc.get_traced_memory()
+            record._peak = max(record._peak, peak)
+            record.peak_kb = round((record._peak - base) / 1024, 1)
+            if stack:
+                stack[-1]._peak = max(stack[-1]._peak, record._peak)
+            tracemalloc.reset_peak()
+
+
+@contextmanager
+def stage(name: str, category: str = "step", rows_in: Optional[int] = None) -> Iterator[Stage]:
+    """
+    현재 스레드에서 실행 중인 run()의 하위 단계 계측 (실행 중이 아니면 기록하지 않음)
+
+    Args:
+        name: 단계 이름
+        category: 단계 종류 (step, fit, cv, io 등)
+        rows_in: 입력 행 수
+
+    Yields:
+        Stage 객체 (capture()로 출력 행 수 등을 기록)
+    """
+    stack = _stack()
+    profiler = getattr(_local, "profiler", None)
+    record = Stage(name, category, rows_in)
+    if not stack or profiler is None:
+        yield record
+        return
+    record._debug = profiler.debug
+    stack[-1].children.append(record)
+    yield from _measure(record, profiler.trace_memory)
+
+
+def add(name: str, category: str = "step", **fields) -> Optional[Stage]:
+    """
+    이미 측정된 값을 현재 단계의 하위 단계로 기록 (작업 프로세스에서 측정한 값 등)
+
+    Args:
+        name: 단계 이름
+        category: 단계 종류
+        **fields: wall_ms, cpu_ms, rows_in, rows_out, peak_kb 및 기타 값
+
+    Returns:
+        기록된 Stage 객체 (실행 중이 아니면 None)
+    """
+    stack = _stack()
+    if not stack:
+        return None
+    record = Stage(name, category)
+    for key in ("wall_ms", "cpu_ms", "rows_in", "rows_out", "peak_kb"):
+        if key in fields:
+            setattr(record, key, fields.pop(key))
+    record.extra = fields
+    stack[-1].children.append(record)
+    return record
+
+
+def debug_enabled() -> bool:
+    """현재 스레드의 실행이 debug 모드인지 여부"""
+    profiler = getattr(_local, "profiler", None)
+    return bool(profiler and profiler.debug)
+
+
+def memory_enabled() -> bool:
+    """현재 스레드의 실행이 tracemalloc 메모리를 기록하는지 여부"""
+    profiler = getattr(_local, "profiler", None)
+    return bool(profiler and profiler.trace_memory)
+
+
+def profiled(kind: str) -> Callable:
+    """
+    메서드 전체를 self.profiler.run(kind)로 계측하는 데코레이터
+
+    Args:
+        kind: 실행 종류
+    """
+    def decorator(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.profiler.run(kind):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class PipelineProfiler:
+    """단계별 시간/메모리 계측기"""
+
+    def __init__(self, trace_memory: Optional[bool] = None, debug: Optional[bool] = None):
+        """
+        PipelineProfiler 초기화
+
+        Args:
+            trace_memory: tracemalloc 최대 메모리 기록 여부 (기본값: TITANIC_PROFILE_MEMORY 환경 변수)
+                tracemalloc은 모든 할당을 추적하므로 교차 검증이 몇 배 느려져 기본으로는 꺼 둠
+            debug: 단계별 데이터 샘플 기록 여부 (기본값: TITANIC_DEBUG 환경 변수)
+        """
+        self.trace_memory = _env_flag("TITANIC_PROFILE_MEMORY") if trace_memory is None else trace_memory
+        self.debug = _env_flag("TITANIC_DEBUG") if debug is None else debug
+        self._runs: Deque[ProfileRun] = deque(maxlen=MAX_RUNS)
+        self._lock = threading.Lock()
+        self._tracing = 0
+
+    # ***********
+    # 메모리 추적
+    # ***********
+
+    def _start_tracing(self) -> None:
+        with self._lock:
+            if self._tracing == 0 and not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._owns_tracing = True
+            elif self._tracing == 0:
+                self._owns_tracing = False
+            self._tracing += 1
+
+    def _stop_tracing(self) -> None:
+        with self._lock:
+            self._tracing -= 1
+            if self._tracing == 0 and getattr(self, "_owns_tracing", False):
+                tracemalloc.stop()
+
+    # ***********
+    # 계측
+    # ***********
+
+    @contextmanager
+    def stage(self, name: str, category: str = "step", rows_in: Optional[int] = None) -> Iterator[Stage]:
+        """현재 스레드에서 실행 중인 run()의 하위 단계 계측 (모듈 함수 stage()와 같음)"""
+        with stage(name, category, rows_in) as record:
+            yield record
+
+    @contextmanager
+    def run(self, kind: str) -> Iterator[Stage]:
+        """
+        실행 계측 (현재 스레드에서 이미 실행 중이면 하위 단계로 기록)
+
+        Args:
+            kind: 실행 종류 (preprocess, evaluate, submit, tune 등)
+
+        Yields:
+            ProfileRun 또는 Stage 객체
+        """
+        if _stack():
+            with stage(kind, category="run") as record:
+                yield record
+            return
+
+        record = ProfileRun(kind)
+        record._debug = self.debug
+        if self.trace_memory:
+            self._start_tracing()
+        _local.profiler = self
+        try:
+            yield from _measure(record, self.trace_memory)
+            record.status = "completed"
+        except BaseException:
+            record.status = "failed"
+            raise
+        finally:
+            _local.profiler = None
+            if self.trace_memory:
+                self._stop_tracing()
+            with self._lock:
+                self._runs.append(record)
+            logger.info(f"[프로파일] {kind} {record.status}: {record.wall_ms}ms "
+                        f"(CPU {record.cpu_ms}ms, 최대 메모리 {record.peak_kb}KB)")
+
+    def latest(self, kind: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        가장 최근 실행 기록
+
+        Args:
+            kind: 실행 종류 (기본값: 종류 무관)
+
+        Returns:
+            실행 기록 딕셔너리 또는 None
+        """
+        with self._lock:
+            runs = list(self._runs)
+        for record in reversed(runs):
+            if kind is None or record.name == kind:
+                return record.to_dict()
+        return None
+
+    def runs(self) -> List[Dict[str, Any]]:
+        """최근 실행 요약 (최근 순, 하위 단계 제외)"""
+        with self._lock:
+            runs = list(self._runs)
+        return [
+            {"run_id": r.run_id, "kind": r.name, "status": r.status, "created_at": r.created_at,
+             "wall_ms": r.wall_ms, "cpu_ms": r.cpu_ms, "peak_kb": r.peak_kb}
+            for r in reversed(runs)
+        ]
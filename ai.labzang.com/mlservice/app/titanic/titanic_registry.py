@@ -0,0 +1,341 @@
+"""
+타이타닉 모델 레지스트리
+
+학습된 모델을 버전별로 디스크에 저장하고, 모델 이름별 "현재 버전" 포인터를
+원자적으로 교체(promote)합니다.
+
+저장 구조:
+    save/registry/
+        models/<name>/<version>/model.joblib   학습된 모델 (압축 없이 저장 → mmap 로드 가능)
+        models/<name>/<version>/meta.json      전처리 지문, 피처, CV 지표, 학습 시간
+        current/<name>.json                    현재 버전 포인터
+
+보존 정책: register() 할 때마다 모델 이름별로 현재 버전과 최근 keep_versions 개 버전만 남기고
+나머지 버전 폴더를 삭제합니다. (/titanic/learn 이 호출마다 새 버전을 등록하므로 무한히 쌓이지 않도록 함)
+promote 로 밀려난 이전 현재 버전은 포인터 파일에 교체 시각과 함께 기록하고, grace_seconds 동안은
+삭제하지 않습니다. (다른 워커가 아직 이전 버전을 들고 있다가 처음 사용할 때 로드할 수 있도록 함)
+
+모델은 처음 사용할 때 joblib.load(mmap_mode='c')로 읽으므로 큰 배열은
+프로세스 간에 페이지 캐시를 공유합니다. (일부 sklearn Cython 코드가 쓰기 가능한
+버퍼를 요구하므로 읽기 전용 'r' 대신 copy-on-write 'c' 사용) current()는 호출마다 포인터 파일의
+수정 시각만 확인하므로, 다른 워커에서 promote 하면 재시작 없이 새 버전으로 교체됩니다.
+"""
+import json
+import logging
+import os
+import re
+import shutil
+import threading
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import joblib
+
+from app.config import get_config
+
+logger = logging.getLogger(__name__)
+
+# 레지스트리 저장 위치
+REGISTRY_DIR = Path(__file__).resolve().parent / "save" / "registry"
+
+# 보존 정책 (모델 이름별로 현재 버전 외에 남겨 둘 최근 버전 수)
+KEEP_VERSIONS = get_config().registry_keep_versions
+# 현재 버전에서 밀려난 버전을 삭제하지 않고 남겨 두는 시간 (초)
+PRUNE_GRACE_SECONDS = get_config().registry_prune_grace_seconds
+
+# 모델 이름 ("predict.svm" 처럼 점으로 구분한 이름)과 register() 가 만드는 버전 이름 형식
+NAME_PATTERN = re.compile(r"^[A-Za-z0-9_-]+(?:\.[A-Za-z0-9_-]+)*$")
+VERSION_PATTERN = re.compile(r"^\d{14}-[0-9a-f]{8}$")
+
+
+def _write_json_atomic(path: Path, data: Dict[str, Any]) -> None:
+    """임시 파일에 쓴 뒤 교체하여 읽는 쪽이 반쯤 쓰인 파일을 보지 않도록 함"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, default=str)
+    os.replace(tmp_path, path)
+
+
+class RegisteredModel:
+    """레지스트리에서 읽은 모델 한 버전"""
+
+    def __init__(self, name: str, version: str, meta: Dict[str, Any], path: Path):
+        self.name = name
+        self.version = version
+        self.meta = meta
+        self.path = path
+        self._estimator = None
+        self._lock = threading.Lock()
+
+    @property
+    def estimator(self):
+        """모델 객체 (처음 접근할 때 mmap으로 로드)"""
+        if self._estimator is None:
+            with self._lock:
+                if self._estimator is None:
+                    self._estimator = joblib.load(self.path / "model.joblib", mmap_mode="c")
+                    logger.info(f"[모델 레지스트리] 로드: {self.name}@{self.version}")
+        return self._estimator
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"name": self.name, "version": self.version, **self.meta}
+
+
+class ModelRegistry:
+    """버전별 모델 저장소"""
+
+    def __init__(self, root: Optional[Path] = None, keep_versions: int = KEEP_VERSIONS,
+                 grace_seconds: float = PRUNE_GRACE_SECONDS):
+        """
+        ModelRegistry 초기화
+
+        Args:
+            root: 레지스트리 폴더 (기본값: app/titanic/save/registry)
+            keep_versions: 모델 이름별로 현재 버전 외에 남겨 둘 최근 버전 수 (0 이하이면 삭제하지 않음)
+            grace_seconds: 현재 버전에서 밀려난 버전을 삭제하지 않고 남겨 두는 시간 (초)
+        """
+        self.root = Path(root) if root else REGISTRY_DIR
+        self.keep_versions = keep_versions
+        self.grace_seconds = grace_seconds
+        self._current: Dict[str, tuple] = {}
+        self._loaded: Dict[tuple, RegisteredModel] = {}
+        self._lock = threading.Lock()
+
+    def _model_dir(self, name: str, version: str) -> Path:
+        return self.root / "models" / name / version
+
+    def _pointer_path(self, name: str) -> Path:
+        return self.root / "current" / f"{name}.json"
+
+    def register(self, name: str, estimator, preprocess_fingerprint: str, features: List[str],
+                 metrics: Optional[Dict[str, Any]] = None, training_seconds: Optional[float] = None,
+                 promote: bool = False, **extra) -> RegisteredModel:
+        """
+        학습된 모델을 새 버전으로 저장
+
+        Args:
+            name: 모델 이름 (예: "predict.svm", "submission.svm")
+            estimator: 학습된 모델 객체
+            preprocess_fingerprint: 학습에 사용한 전처리 산출물 지문
+            features: 피처 컬럼 목록 (순서 포함)
+            metrics: CV 지표
+            training_seconds: 학습 시간(초)
+            promote: 저장 후 현재 버전으로 지정할지 여부
+            **extra: meta.json에 함께 기록할 값
+
+        Returns:
+            RegisteredModel 객체
+        """
+        if not NAME_PATTERN.match(name):
+            raise ValueError(f"모델 이름 형식이 올바르지 않습니다: {name}")
+        version = f"{datetime.now():%Y%m%d%H%M%S}-{uuid.uuid4().hex[:8]}"
+        meta = {
+            "created_at": datetime.now().isoformat(),
+            "estimator": type(estimator).__name__,
+            "params": {k: repr(v) for k, v in estimator.get_params().items()},
+            "preprocess_fingerprint": preprocess_fingerprint,
+            "features": list(features),
+            "metrics": metrics or {},
+            "training_seconds": training_seconds,
+            **extra,
+        }
+
+        target = self._model_dir(name, version)
+        tmp = target.with_name(f".{version}.tmp")
+        tmp.mkdir(parents=True, exist_ok=True)
+        try:
+            # 압축하지 않아야 mmap_mode로 읽을 수 있음
+            joblib.dump(estimator, tmp / "model.joblib")
+            with open(tmp / "meta.json", "w", encoding="utf-8") as f:
+                json.dump(meta, f, ensure_ascii=False, default=str)
+            os.replace(tmp, target)
+        except Exception:
+            shutil.rmtree(tmp, ignore_errors=True)
+            raise
+        logger.info(f"[모델 레지스트리] 저장: {name}@{version}")
+
+        model = RegisteredModel(name, version, meta, target)
+        model._estimator = estimator
+        with self._lock:
+            self._loaded[(name, version)] = model
+        if promote:
+            self.promote(name, version)
+        removed = self.prune(name, keep=version)
+        if removed:
+            logger.info(f"[모델 레지스트리] 보존 정책으로 {name} 버전 {len(removed)}개 삭제")
+        return model
+
+    def promote(self, name: str, version: str) -> Dict[str, Any]:
+        """
+        지정한 버전을 현재 버전으로 원자적으로 교체
+
+        Args:
+            name: 모델 이름
+            version: 버전
+
+        Returns:
+            포인터 딕셔너리
+
+        Raises:
+            ValueError: 이름/버전 형식이 다르거나 이 모델 이름에 등록되지 않은 버전
+        """
+        # 이름/버전은 경로에 들어가므로 형식을 먼저 확인 (다른 모델 폴더를 가리키지 못하도록)
+        if not NAME_PATTERN.match(name) or not VERSION_PATTERN.match(version) \
+                or version not in {m["version"] for m in self.versions(name)}:
+            raise ValueError(f"등록되지 않은 모델 버전입니다: {name}@{version}")
+        # 밀려난 버전은 유예 시간 동안 보존 정책에서 제외하도록 교체 시각과 함께 기록
+        now = time.time()
+        previous = self._read_pointer(name) or {}
+        replaced = [entry for entry in previous.get("replaced", [])
+                    if now - entry["replaced_at"] < self.grace_seconds and entry["version"] != version]
+        if previous.get("version") not in (None, version):
+            replaced.insert(0, {"version": previous["version"], "replaced_at": now})
+        pointer = {"name": name, "version": version, "promoted_at": datetime.now().isoformat(),
+                   "replaced": replaced}
+        _write_json_atomic(self._pointer_path(name), pointer)
+        logger.info(f"[모델 레지스트리] 현재 버전 지정: {name}@{version}")
+        return pointer
+
+    def get(self, name: str, version: str) -> Optional[RegisteredModel]:
+        """
+        특정 버전 조회 (모델 객체는 접근할 때 로드)
+
+        Args:
+            name: 모델 이름
+            version: 버전
+
+        Returns:
+            RegisteredModel 객체 또는 None
+        """
+        key = (name, version)
+        with self._lock:
+            if key in self._loaded:
+                return self._loaded[key]
+        path = self._model_dir(name, version)
+        if not (path / "meta.json").exists():
+            return None
+        with open(path / "meta.json", "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        model = RegisteredModel(name, version, meta, path)
+        with self._lock:
+            return self._loaded.setdefault(key, model)
+
+    def current(self, name: str) -> Optional[RegisteredModel]:
+        """
+        현재 버전 조회 (포인터 파일이 바뀌었으면 새 버전으로 교체)
+
+        Args:
+            name: 모델 이름
+
+        Returns:
+            RegisteredModel 객체 또는 None
+        """
+        pointer_path = self._pointer_path(name)
+        try:
+            stat = os.stat(pointer_path)
+        except FileNotFoundError:
+            return None
+        # os.replace로 교체되면 inode가 바뀌므로 수정 시각 해상도와 관계없이 감지됨
+        signature = (stat.st_ino, stat.st_mtime_ns)
+
+        cached = self._current.get(name)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        with open(pointer_path, "r", encoding="utf-8") as f:
+            version = json.load(f)["version"]
+        model = self.get(name, version)
+        previous = cached[1] if cached is not None else None
+        if model is not None and previous is not None and previous.version != version:
+            logger.info(f"[모델 레지스트리] 현재 버전 변경 감지: {name} {previous.version} → {version}")
+            # 이전 버전 객체는 캐시에서 제거하여 메모리를 돌려줌
+            with self._lock:
+                self._loaded.pop((name, previous.version), None)
+        self._current[name] = (signature, model)
+        return model
+
+    def prune(self, name: str, keep: Optional[str] = None) -> List[str]:
+        """
+        보존 정책 적용 (현재 버전과 최근 keep_versions 개 버전 외의 버전 삭제)
+
+        포인터가 가리키는 버전, 유예 시간 안에 현재 버전에서 밀려난 버전(다른 워커가 아직 사용 중일 수 있음),
+        이 프로세스가 사용 중인 현재 버전도 남깁니다.
+
+        Args:
+            name: 모델 이름
+            keep: 함께 남길 버전 (방금 등록한 버전)
+
+        Returns:
+            삭제한 버전 목록
+        """
+        if self.keep_versions <= 0:
+            return []
+        protected = {keep, *self._pointer_versions(name)}
+        cached = self._current.get(name)
+        if cached is not None and cached[1] is not None:
+            protected.add(cached[1].version)
+
+        versions = [m["version"] for m in self.versions(name)]
+        expired = [v for v in versions[:-self.keep_versions] if v not in protected]
+        for version in expired:
+            path = self._model_dir(name, version)
+            # 먼저 숨김 이름으로 바꾸어 versions()/get() 이 지우는 중인 폴더를 읽지 않도록 함
+            trash = path.with_name(f".{version}.{uuid.uuid4().hex[:8]}.deleted")
+            try:
+                os.replace(path, trash)
+            except FileNotFoundError:
+                continue
+            shutil.rmtree(trash, ignore_errors=True)
+            with self._lock:
+                self._loaded.pop((name, version), None)
+        return expired
+
+    def _read_pointer(self, name: str) -> Optional[Dict[str, Any]]:
+        """포인터 파일 내용 (없거나 읽을 수 없으면 None)"""
+        try:
+            with open(self._pointer_path(name), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _pointer_versions(self, name: str) -> List[str]:
+        """포인터가 가리키는 버전과 유예 시간 안에 밀려난 버전"""
+        pointer = self._read_pointer(name)
+        if not pointer or "version" not in pointer:
+            return []
+        now = time.time()
+        return [pointer["version"]] + [entry["version"] for entry in pointer.get("replaced", [])
+                                       if now - entry["replaced_at"] < self.grace_seconds]
+
+    def versions(self, name: str) -> List[Dict[str, Any]]:
+        """
+        모델 이름의 전체 버전 메타 정보 (오래된 순)
+
+        Args:
+            name: 모델 이름
+
+        Returns:
+            메타 정보 딕셔너리 리스트
+        """
+        name_dir = self.root / "models" / name
+        if not name_dir.exists():
+            return []
+        result = []
+        for path in name_dir.iterdir():
+            if path.name.startswith(".") or not (path / "meta.json").exists():
+                continue
+            model = self.get(name, path.name)
+            if model is not None:
+                result.append(model.to_dict())
+        return sorted(result, key=lambda m: m["created_at"])
+
+    def names(self) -> List[str]:
+        """등록된 모델 이름 목록"""
+        models_dir = self.root / "models"
+        if not models_dir.exists():
+            return []
+        return sorted(p.name for p in models_dir.iterdir() if p.is_dir())
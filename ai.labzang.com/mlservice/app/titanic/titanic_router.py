@@ -1,15 +1,20 @@
 """
 타이타닉 관련 라우터
 """
-from fastapi import APIRouter, HTTPException, Query, Body
+from fastapi import APIRouter, HTTPException, Query, Body, File, UploadFile, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from typing import List, Dict, Any, Optional
 from pathlib import Path
+import json
 import sys
 
 # 공통 모듈 경로 추가
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
 from app.titanic.titanic_service import TitanicService
+from app.titanic.titanic_submissions import artifact_response
+from app.titanic.titanic_tune import DEFAULT_GRIDS
 from common.utils import create_response, create_error_response
 import logging
 
@@ -60,28 +65,58 @@ async def preprocess_data():
             status_code=500,
             detail=f"전처리 중 오류가 발생했습니다: {str(e)}"
         )
+def _download_url(request: Request, filename: str) -> str:
+    """제출 파일 다운로드 경로 (앱에 마운트된 download_submission 경로 기준)"""
+    return request.url_for("download_submission", filename=filename).path
+
+
+def _job_data(job, request: Optional[Request] = None, include_result: bool = True) -> Dict[str, Any]:
+    """작업 정보 딕셔너리 (제출 작업 결과에는 다운로드 경로를 붙임)"""
+    data = job.to_dict(include_result=include_result)
+    result = data.get("result")
+    if request is not None and job.kind == "submit" and isinstance(result, dict) and result.get("filename"):
+        data["result"] = {**result, "download_url": _download_url(request, result["filename"])}
+    return data
+
+
+def _job_response(job, kind_label: str, request: Optional[Request] = None):
+    """작업 정보 응답 (완료된 작업이면 결과 포함)"""
+    if job.status == "failed":
+        raise HTTPException(status_code=500, detail=f"{kind_label} 중 오류가 발생했습니다: {job.error}")
+    if job.done:
+        message = f"{kind_label} 작업이 완료되었습니다"
+    else:
+        message = f"{kind_label} 작업이 실행 중입니다"
+    return create_response(data=_job_data(job, request, include_result=job.done), message=message)
+
+
+async def _start_job(kind: str, wait: bool, timeout: float, kind_label: str,
+                     request: Optional[Request] = None):
+    """작업 등록 (같은 데이터의 작업이 있으면 재사용) 후 응답 생성"""
+    service = get_service()
+    job = service.start_job(kind)
+    if wait and not job.done:
+        await run_in_threadpool(job.join, timeout)
+    return _job_response(job, kind_label, request)
+
+
 @router.get("/evaluate")
-async def evaluate_model():
+async def evaluate_model(
+    wait: bool = Query(default=False, description="완료될 때까지 기다린 뒤 결과 반환"),
+    timeout: float = Query(default=300.0, gt=0, description="wait=true 일 때 최대 대기 시간(초)")
+):
     """
-    모델 평가 실행
-    - 전처리, 모델링, 학습, 평가를 순차적으로 실행
-    - 후 모델 평가 결과 반환
+    모델 평가 작업 등록
+    - 전처리 후 모델 × 폴드 교차 검증을 백그라운드 작업으로 실행하고 작업 ID를 바로 반환
+    - 같은 데이터로 실행 중이거나 완료된 작업이 있으면 그 작업을 반환
+    - (데이터, 모델 설정, 폴드)가 같은 칸은 디스크에 저장된 점수를 사용하고 나머지만 학습 (재시작 후에도 유지)
+    - 진행 상황: GET /jobs/{job_id} (폴링), GET /jobs/{job_id}/events (SSE)
     """
     try:
-        service = get_service()
-        
-        # 1. 전처리
-        logger.info("전처리 실행 중...")
-        service.preprocess()
-        
-        # 2. 평가 (K-Fold 교차 검증 사용, 별도 학습 불필요)
-        logger.info("평가 실행 중...")
-        result = service.evaluate()
-        
-        return create_response(
-            data=result,
-            message="모델 평가가 완료되었습니다"
-        )
+        logger.info("평가 작업 등록 중...")
+        return await _start_job("evaluate", wait, timeout, "모델 평가")
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(
             status_code=400,
@@ -94,25 +129,468 @@ async def evaluate_model():
         )
 
 @router.get("/submit")
-async def submit_model():
+async def submit_model(
+    request: Request,
+    wait: bool = Query(default=False, description="완료될 때까지 기다린 뒤 결과 반환"),
+    timeout: float = Query(default=300.0, gt=0, description="wait=true 일 때 최대 대기 시간(초)")
+):
+    """
+    제출 작업 등록
+    - SVM 학습 및 제출 파일 생성을 백그라운드 작업으로 실행하고 작업 ID를 바로 반환
+    """
+    try:
+        logger.info("제출 작업 등록 중...")
+        return await _start_job("submit", wait, timeout, "제출", request)
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=f"제출 중 오류가 발생했습니다: {str(e)}"
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"제출 중 오류가 발생했습니다: {str(e)}"
+        )
+
+
+@router.get("/submissions")
+async def list_submissions(request: Request):
+    """
+    저장된 제출 파일 목록
+    - 예측 벡터 해시로 저장되어 같은 예측은 파일 하나를 재사용
+    - 최근 사용 순 최대 개수/사용되지 않은 기간 기준으로 오래된 파일은 자동 삭제
     """
-    제출 실행
-    """        
     try:
         service = get_service()
-        logger.info("제출 실행 중...")
-        result = service.submit()
+        result = service.list_submissions()
+        for submission in result["submissions"]:
+            submission["download_url"] = _download_url(request, submission["filename"])
         return create_response(
             data=result,
-            message="제출 파일이 생성되었습니다"
+            message=f"제출 파일 {len(result['submissions'])}개를 조회했습니다"
         )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"제출 파일 목록 조회 중 오류가 발생했습니다: {str(e)}"
+        )
+
+
+@router.get("/download/{filename}")
+async def download_submission(filename: str, request: Request):
+    """
+    제출 파일 다운로드
+    - ETag 는 예측 내용 해시 (If-None-Match 가 같으면 304)
+    - Range 요청은 206 부분 응답 (단일 범위), 전체 응답은 sendfile 지원 서버에서 파일을 직접 전송
+    """
+    try:
+        service = get_service()
+        artifact = await run_in_threadpool(service.get_submission, filename)
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"제출 파일 조회 중 오류가 발생했습니다: {str(e)}"
+        )
+    if artifact is None:
+        raise HTTPException(status_code=404, detail=f"파일을 찾을 수 없습니다: {filename}")
+    return artifact_response(artifact, request.headers)
+
+
+@router.post("/tune")
+async def tune_models(
+    grids: Optional[Dict[str, Dict[str, List[Any]]]] = Body(
+        default=None, description="모델 키 → {파라미터: 후보 값 리스트} (기본값: 기본 그리드)"),
+    models: Optional[str] = Query(default=None, description="탐색할 모델 (쉼표 구분, 기본값: 전체)"),
+    eta: int = Query(default=3, ge=2, description="단계마다 상위 1/eta 조합만 남김"),
+    min_folds: int = Query(default=2, ge=1, le=10, description="첫 단계 폴드 수"),
+    wait: bool = Query(default=False, description="완료될 때까지 기다린 뒤 결과 반환"),
+    timeout: float = Query(default=1800.0, gt=0, description="wait=true 일 때 최대 대기 시간(초)")
+):
+    """
+    하이퍼파라미터 탐색 작업 등록 (successive halving)
+    - 모델 종류별 그리드를 적은 폴드부터 평가하며 상위 조합만 남기고, 폴드별 점수는 저장하여 재사용
+    - 최적 조합은 레지스트리에 "predict.<모델>" 새 버전으로 등록 (정확도가 오르면 현재 버전으로 지정)
+    - 진행 상황: GET /jobs/{job_id} (폴링), GET /jobs/{job_id}/events (SSE)
+    """
+    try:
+        service = get_service()
+        selected = _model_list(models)
+        if grids is None:
+            grids = DEFAULT_GRIDS
+        if selected:
+            unknown = [m for m in selected if m not in grids]
+            if unknown:
+                raise ValueError(f"탐색 그리드가 없는 모델입니다: {', '.join(unknown)}")
+            grids = {m: grids[m] for m in selected}
+        job = service.start_tune(grids, eta, min_folds)
+        if wait and not job.done:
+            await run_in_threadpool(job.join, timeout)
+        return _job_response(job, "하이퍼파라미터 탐색")
+    except HTTPException:
+        raise
     except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
         raise HTTPException(
-            status_code=400,
-            detail=f"제출 중 오류가 발생했습니다: {str(e)}"
+            status_code=500,
+            detail=f"하이퍼파라미터 탐색 중 오류가 발생했습니다: {str(e)}"
+        )
+
+
+@router.get("/jobs")
+async def list_jobs():
+    """
+    작업 목록 조회 (최근 순, 결과 제외)
+    """
+    try:
+        service = get_service()
+        return create_response(
+            data=service.list_jobs(),
+            message="작업 목록을 조회했습니다"
         )
     except Exception as e:
         raise HTTPException(
             status_code=500,
-            detail=f"제출 중 오류가 발생했습니다: {str(e)}"
+            detail=f"작업 목록 조회 중 오류가 발생했습니다: {str(e)}"
+        )
+
+
+@router.get("/jobs/{job_id}")
+async def get_job(job_id: str, request: Request):
+    """
+    작업 상태 조회
+    - status(pending/running/completed/failed), 마지막 진행 이벤트, 완료 시 결과
+    """
+    try:
+        service = get_service()
+        job = service.get_job(job_id)
+        return create_response(
+            data=_job_data(job, request),
+            message=f"작업 상태: {job.status}"
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"작업 조회 중 오류가 발생했습니다: {str(e)}"
+        )
+
+
+@router.get("/jobs/{job_id}/events")
+async def stream_job_events(job_id: str, request: Request):
+    """
+    작업 진행 이벤트 스트림 (Server-Sent Events)
+    - 이미 쌓인 이벤트부터 순서대로 보내고, 작업이 끝나면 result 이벤트 후 종료
+    """
+    try:
+        job = get_service().get_job(job_id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+    async def events():
+        sent = 0
+        while True:
+            new_events = await run_in_threadpool(job.wait, sent, 15.0)
+            if not new_events:
+                # 연결 유지용 주석
+                yield ": keep-alive\n\n"
+                continue
+            for event in new_events:
+                yield f"event: progress\ndata: {json.dumps(event, ensure_ascii=False, default=str)}\n\n"
+            sent += len(new_events)
+            if job.done and sent >= len(job.events):
+                break
+        yield f"event: result\ndata: {json.dumps(_job_data(job, request), ensure_ascii=False, default=str)}\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache"})
+
+
+def _model_list(models: Optional[str]) -> Optional[List[str]]:
+    """쉼표로 구분된 모델 이름 문자열을 리스트로 변환"""
+    if not models:
+        return None
+    return [m.strip() for m in models.split(",") if m.strip()]
+
+
+@router.post("/predict")
+async def predict_passenger(
+    passenger: Dict[str, Any] = Body(..., description="승객 원본 필드 (Pclass, Sex, Name, Age, Fare, Embarked)"),
+    models: Optional[str] = Query(default=None, description="사용할 모델 (쉼표 구분, 기본값: 전체)"),
+    engine: str = Query(default="auto", description="auto: 예측 테이블 우선, table: 테이블만, model: 모델 호출")
+):
+    """
+    승객 한 명의 생존 확률 예측
+    - 메모리에 상주한 모델별 생존 확률 반환
+    - 모델 버전마다 미리 계산한 전체 입력 공간 예측 테이블을 배열 인덱싱으로 조회 (모델 복잡도와 무관)
+    """
+    try:
+        service = get_service()
+        # 처음 호출이나 전처리/모델 버전이 바뀐 뒤에는 예측기를 다시 만드므로 이벤트 루프 밖에서 실행
+        result = await run_in_threadpool(service.predict, passenger, _model_list(models), engine)
+        return create_response(
+            data=result,
+            message="생존 예측이 완료되었습니다"
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"예측 중 오류가 발생했습니다: {str(e)}"
+        )
+
+
+@router.post("/predict/batch")
+async def predict_batch(
+    columns: Dict[str, List[Any]] = Body(..., description="필드명 → 값 배열 (모든 배열 길이 동일)"),
+    models: Optional[str] = Query(default=None, description="사용할 모델 (쉼표 구분, 기본값: 전체)"),
+    engine: str = Query(default="auto", description="auto: 예측 테이블 우선, table: 테이블만, model: 모델 호출")
+):
+    """
+    여러 승객의 생존 확률 일괄 예측
+    - 필드별 배열로 받아 한 번에 인코딩 및 예측
+    """
+    try:
+        service = get_service()
+        result = await run_in_threadpool(service.predict_batch, columns, _model_list(models), engine)
+        return create_response(
+            data=result,
+            message=f"{result['count']}명의 생존 예측이 완료되었습니다"
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"예측 중 오류가 발생했습니다: {str(e)}"
+        )
+
+
+@router.post("/learn")
+async def learn_passengers(
+    passengers: List[Dict[str, Any]] = Body(..., description="Survived(0/1)와 원본 필드(Pclass, Sex, Name, Age, Fare, Embarked)를 가진 승객 목록"),
+    wait: bool = Query(default=False, description="전체 재학습 작업이 끝날 때까지 기다린 뒤 결과 반환"),
+    timeout: float = Query(default=300.0, gt=0, description="wait=true 일 때 최대 대기 시간(초)")
+):
+    """
+    새 라벨 승객으로 예측 모델 갱신
+    - Naive Bayes, SGD 로지스틱 회귀는 partial_fit 으로 새 행만 반영하여 바로 새 버전으로 지정
+    - SVM, 랜덤 포레스트 등은 train + 누적 라벨 전체로 다시 학습하는 백그라운드 작업을 예약하고,
+      모델마다 학습이 끝나는 즉시 새 버전으로 지정 (진행 상황: GET /jobs/{job_id})
+    """
+    try:
+        service = get_service()
+        result = await run_in_threadpool(service.learn, passengers)
+        if wait:
+            job = service.get_job(result["refit_job"]["job_id"])
+            await run_in_threadpool(job.join, timeout)
+            result["refit_job"] = job.to_dict(include_result=job.done)
+        return create_response(
+            data=result,
+            message=f"승객 {result['accepted']}명을 학습했습니다"
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"점진 학습 중 오류가 발생했습니다: {str(e)}"
+        )
+
+
+@router.post("/score")
+async def score_csv(
+    file: UploadFile = File(..., description="승객 CSV (Pclass, Sex 필수 / PassengerId, Name, Age, Fare, Embarked 선택)"),
+    model: str = Query(default="svm", description="사용할 모델"),
+    chunk_size: int = Query(default=10_000, ge=1, le=1_000_000, description="청크 크기 (행)")
+):
+    """
+    승객 CSV 스트리밍 채점
+    - 업로드 파일을 청크 단위로 전처리/예측하여 PassengerId, Survived, Probability CSV를 바로 스트리밍
+    - 파일 크기와 관계없이 메모리에는 청크 하나만 유지
+    - 처리 행 수와 초당 행 수: 응답 헤더 X-Score-Run-Id 로 GET /score/{run_id} 조회
+    """
+    try:
+        service = get_service()
+        run, chunks = await run_in_threadpool(
+            service.score_csv, file.file, model, chunk_size, file.filename
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"채점 중 오류가 발생했습니다: {str(e)}"
+        )
+    stem = Path(file.filename or "passengers.csv").stem
+    return StreamingResponse(
+        chunks,
+        media_type="text/csv",
+        headers={
+            "X-Score-Run-Id": run.run_id,
+            "Content-Disposition": f'attachment; filename="{stem}_scored.csv"',
+        },
+    )
+
+
+@router.get("/score/{run_id}")
+async def get_score_run(run_id: str):
+    """
+    CSV 채점 기록 조회
+    - status, 처리 행 수, 청크 수, 생존 예측 수, 소요 시간, 초당 행 수
+    """
+    try:
+        service = get_service()
+        return create_response(
+            data=service.get_score_run(run_id),
+            message="채점 기록을 조회했습니다"
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"채점 기록 조회 중 오류가 발생했습니다: {str(e)}"
+        )
+
+
+@router.get("/models")
+async def list_models():
+    """
+    모델 레지스트리 조회
+    - 모델 이름별 현재 버전, 버전별 전처리 지문/CV 지표/학습 시간
+    """
+    try:
+        service = get_service()
+        return create_response(
+            data=service.list_models(),
+            message="모델 레지스트리를 조회했습니다"
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"모델 레지스트리 조회 중 오류가 발생했습니다: {str(e)}"
+        )
+
+
+@router.post("/models/{name}/promote")
+async def promote_model(
+    name: str,
+    version: str = Query(..., description="현재 버전으로 지정할 모델 버전")
+):
+    """
+    모델 버전을 현재 버전으로 지정
+    - 포인터 파일을 원자적으로 교체하며, 모든 워커가 재시작 없이 새 버전을 사용
+    """
+    try:
+        service = get_service()
+        return create_response(
+            data=service.promote_model(name, version),
+            message=f"{name} 모델의 현재 버전을 {version}(으)로 지정했습니다"
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"모델 버전 지정 중 오류가 발생했습니다: {str(e)}"
+        )
+
+
+@router.get("/profile")
+async def get_profile(
+    kind: Optional[str] = Query(None, description="실행 종류 (preprocess, evaluate, submit, tune, predictor)")
+):
+    """
+    최근 실행의 단계별 계측 결과 조회
+    - 전처리 단계(drop_feature, fare_ordinal 등)와 모델 학습별 wall/CPU 시간(ms), 입출력 행 수
+    - tracemalloc 최대 메모리(KB)는 TITANIC_PROFILE_MEMORY=1 일 때만 기록 (추적 비용이 커서 기본값은 꺼짐)
+    - 단계별 데이터 샘플(dtypes, 상위 5행)은 TITANIC_DEBUG=1 일 때만 포함
+    """
+    try:
+        service = get_service()
+        result = service.get_profile(kind)
+        return create_response(
+            data=result,
+            message=f"{result['latest']['kind']} 실행 계측 결과입니다"
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"계측 결과 조회 중 오류가 발생했습니다: {str(e)}"
+        )
+
+
+@router.get("/passengers")
+async def query_passengers(
+    pclass: Optional[List[int]] = Query(None, description="등급 (여러 번 지정 가능)"),
+    sex: Optional[List[str]] = Query(None, description="성별 male, female (여러 번 지정 가능)"),
+    age_band: Optional[List[str]] = Query(None, description="나이 구간 Unknown, Baby, Child, Teenager, Student, Young Adult, Adult, Senior"),
+    fare_min: Optional[float] = Query(None, description="최소 요금 (포함)"),
+    fare_max: Optional[float] = Query(None, description="최대 요금 (포함)"),
+    survived: Optional[int] = Query(None, description="생존 여부 (0, 1)"),
+    sort: str = Query("passenger_id", description="정렬 키 (passenger_id, score, fare, age)"),
+    descending: bool = Query(False, description="내림차순 정렬"),
+    limit: int = Query(10, ge=1, le=1000, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor")
+):
+    """
+    승객 필터/정렬 조회
+    - 메모리에 상주한 컬럼형 승객 저장소의 정렬 인덱스로 조회 (등급×성별×나이 구간 조합 인덱스, 요금 범위 인덱스)
+    - next_cursor 로 다음 페이지 조회 (데이터가 다시 적재되면 커서는 만료되어 400)
+    """
+    try:
+        service = get_service()
+        result = service.query_passengers(
+            pclass=pclass, sex=sex, age_band=age_band, fare_min=fare_min, fare_max=fare_max,
+            survived=survived, sort=sort, descending=descending, limit=limit, cursor=cursor
+        )
+        return create_response(
+            data=result,
+            message=f"승객 {result['count']}명을 조회했습니다"
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"승객 조회 중 오류가 발생했습니다: {str(e)}"
+        )
+
+
+@router.get("/survival-analysis")
+async def survival_analysis(
+    limit: int = Query(10, ge=1, le=50, description="각 그룹(높은/낮은)에서 반환할 승객 수"),
+    pclass: Optional[List[int]] = Query(None, description="등급 (여러 번 지정 가능)"),
+    sex: Optional[List[str]] = Query(None, description="성별 male, female (여러 번 지정 가능)"),
+    age_band: Optional[List[str]] = Query(None, description="나이 구간"),
+    fare_min: Optional[float] = Query(None, description="최소 요금 (포함)"),
+    fare_max: Optional[float] = Query(None, description="최대 요금 (포함)")
+):
+    """
+    생존 가능성 분석
+    - 생존 점수: (등급, 성별, 나이 구간) 그룹의 생존율을 전체 생존율 쪽으로 평활한 값
+    - 생존 점수 상위/하위 limit명 반환 (동점이면 승객 번호 순)
+    """
+    try:
+        service = get_service()
+        result = service.survival_analysis(
+            limit, pclass=pclass, sex=sex, age_band=age_band, fare_min=fare_min, fare_max=fare_max
+        )
+        return create_response(
+            data=result,
+            message=f"생존 가능성 분석 결과 (상위/하위 {limit}명)"
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"생존 가능성 분석 중 오류가 발생했습니다: {str(e)}"
         )
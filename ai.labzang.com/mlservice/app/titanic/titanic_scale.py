@@ -0,0 +1,369 @@
+"""
+대용량 타이타닉 형식 데이터 처리 (수백만~수천만 행)
+
+TitanicService 는 891행 train.csv 전체를 DataFrame 으로 읽고 단계마다 새 DataFrame 을 만들지만,
+같은 전처리 규칙을 수천만 행에 적용하면 메모리에 모두 올릴 수 없습니다. 이 모듈은
+
+- synthesize(): train.csv 승객을 복원 추출하고 요금/나이에 잡음을 더한 합성 승객 청크 생성
+- ChunkedPreprocessor.fit(): 1차 패스 - 청크를 읽으며 행 수, 승선항 빈도, 요금 저수지 표본을 모아
+  TitanicPipeline 상태 학습 (요금 구간 경계는 표본 분위수, 승선항 대체값은 전체 최빈값)
+- ChunkedPreprocessor.transform(): 2차 패스 - 작은 dtype(int8, float32, category)으로 청크를 읽어
+  TitanicEncoder.encode_frame 으로 만든 int8 피처를 파일에 이어 쓰고 메모리 맵으로 반환
+- sampled_cv(): 전체 대신 모델별 크기 상한을 둔 층화 표본으로 교차 검증
+  (표본 크기/비율과 폴드 점수 기반 95% 신뢰 구간을 함께 보고)
+
+메모리 사용량은 전체 행 수가 아니라 청크 크기와 표본 크기에 비례합니다.
+
+저장 구조:
+    <out_dir>/meta.json     행 수, 피처 목록, 파이프라인 상태
+    <out_dir>/X.int8        (rows, n_features) int8 피처
+    <out_dir>/y.int8        (rows,) int8 라벨 (원본에 Survived 가 있을 때)
+"""
+import json
+import logging
+import math
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from app.titanic import titanic_profile
+from app.titanic.titanic_cv import MODEL_SPECS, FoldScoreStore, run_cv_grid
+from app.titanic.titanic_pipeline import TitanicPipeline
+from app.titanic.titanic_predict import PREDICT_FEATURES, TitanicEncoder
+
+logger = logging.getLogger(__name__)
+
+# 합성 데이터의 바탕이 되는 원본 승객
+BASE_PATH = Path(__file__).resolve().parent / "train.csv"
+
+# 청크 한 개의 행 수
+CHUNK_SIZE = 500_000
+
+# 요금 구간 경계를 학습할 저수지 표본 크기
+FIT_SAMPLE_SIZE = 1_000_000
+
+# 청크를 읽을 때 컬럼별 dtype (Name 은 고유 값이 많아 encode_frame 에서 범주형으로 변환)
+READ_DTYPES = {
+    "Survived": "int8",
+    "Pclass": "int8",
+    "Name": "object",
+    "Sex": "category",
+    "Age": "float32",
+    "Fare": "float64",
+    "Embarked": "category",
+}
+
+# 모델별 교차 검증 표본 크기 상한 (SVC/KNN 은 행 수에 따라 비용이 빠르게 늘어나므로 작게)
+CV_SAMPLE_ROWS = {"svm": 5_000, "knn": 50_000}
+DEFAULT_CV_SAMPLE_ROWS = 200_000
+
+Source = Union[str, Path, Callable[[], Iterable[DataFrame]]]
+
+
+# ***********
+# 합성 데이터
+# ***********
+
+def synthesize(n_rows: int, seed: int = 0, chunk_size: int = CHUNK_SIZE,
+               base: Optional[DataFrame] = None) -> Iterator[DataFrame]:
+    """
+    원본 승객을 복원 추출한 합성 승객 청크 생성
+
+    Args:
+        n_rows: 전체 행 수
+        seed: 난수 시드
+        chunk_size: 청크 한 개의 행 수
+        base: 추출할 원본 승객 (기본값: app/titanic/train.csv)
+
+    Yields:
+        원본과 같은 컬럼의 DataFrame 청크 (PassengerId 는 1부터 이어지는 번호)
+    """
+    base = pd.read_csv(BASE_PATH) if base is None else base
+    rng = np.random.default_rng(seed)
+    for start in range(0, n_rows, chunk_size):
+        size = min(chunk_size, n_rows - start)
+        chunk = base.take(rng.integers(0, len(base), size=size)).reset_index(drop=True)
+        chunk["PassengerId"] = np.arange(start + 1, start + size + 1)
+        # 요금은 ±10% 안팎 로그정규 잡음, 나이는 0.5살 단위 정규 잡음 (결측은 결측 그대로)
+        chunk["Fare"] = (chunk["Fare"] * rng.lognormal(0.0, 0.1, size=size)).round(4)
+        chunk["Age"] = (chunk["Age"] + np.round(rng.normal(0.0, 2.0, size=size) * 2) / 2).clip(0.42, 80.0)
+        yield chunk
+
+
+def write_csv(path: Union[str, Path], n_rows: int, seed: int = 0, chunk_size: int = CHUNK_SIZE) -> Path:
+    """
+    합성 승객을 CSV 파일로 저장 (청크 단위로 이어 씀)
+
+    Args:
+        path: 저장할 CSV 경로
+        n_rows: 전체 행 수
+        seed: 난수 시드
+        chunk_size: 청크 한 개의 행 수
+
+    Returns:
+        저장된 파일 경로
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8", newline="") as f:
+        for i, chunk in enumerate(synthesize(n_rows, seed, chunk_size)):
+            chunk.to_csv(f, header=(i == 0), index=False)
+    os.replace(tmp, path)
+    logger.info(f"[합성 데이터] {n_rows:,}행 저장: {path}")
+    return path
+
+
+# ***********
+# 청크 전처리
+# ***********
+
+class EncodedDataset:
+    """인코딩된 int8 피처/라벨 파일의 메모리 맵"""
+
+    def __init__(self, root: Path, meta: Dict[str, Any]):
+        self.root = Path(root)
+        self.meta = meta
+        rows = meta["rows"]
+        self.X = np.memmap(self.root / "X.int8", dtype=np.int8, mode="r", shape=(rows, len(meta["features"]))) \
+            if rows else np.empty((0, len(meta["features"])), dtype=np.int8)
+        self.y = None
+        if meta["has_labels"]:
+            self.y = np.memmap(self.root / "y.int8", dtype=np.int8, mode="r", shape=(rows,)) \
+                if rows else np.empty(0, dtype=np.int8)
+
+    @property
+    def rows(self) -> int:
+        return self.meta["rows"]
+
+    @classmethod
+    def open(cls, root: Union[str, Path]) -> "EncodedDataset":
+        """저장된 데이터셋 열기"""
+        with open(Path(root) / "meta.json", "r", encoding="utf-8") as f:
+            return cls(Path(root), json.load(f))
+
+
+class ChunkedPreprocessor:
+    """
+    청크 단위 2-패스 전처리기
+
+        preprocessor = ChunkedPreprocessor().fit("big.csv")
+        dataset = preprocessor.transform("big.csv", "save/scale/big")
+    """
+
+    def __init__(self, chunk_size: int = CHUNK_SIZE, sample_size: int = FIT_SAMPLE_SIZE, seed: int = 0):
+        """
+        ChunkedPreprocessor 초기화
+
+        Args:
+            chunk_size: CSV 청크 한 개의 행 수
+            sample_size: 요금 구간 경계를 학습할 저수지 표본 크기
+                (전체 행 수가 이보다 작으면 TitanicPipeline.fit(전체)와 같은 상태)
+            seed: 저수지 표본 시드
+        """
+        self.chunk_size = chunk_size
+        self.sample_size = sample_size
+        self.seed = seed
+        self.pipeline: Optional[TitanicPipeline] = None
+        self.encoder: Optional[TitanicEncoder] = None
+        self.rows = 0
+
+    def chunks(self, source: Source) -> Iterator[DataFrame]:
+        """
+        원본 청크 읽기
+
+        Args:
+            source: CSV 경로 또는 DataFrame 청크를 내는 함수 (synthesize 등)
+        """
+        if callable(source):
+            yield from source()
+            return
+        yield from pd.read_csv(source, chunksize=self.chunk_size, dtype=READ_DTYPES,
+                               usecols=lambda column: column in READ_DTYPES)
+
+    def fit(self, source: Source) -> "ChunkedPreprocessor":
+        """
+        1차 패스: 행 수, 승선항 빈도, 요금 저수지 표본으로 파이프라인 상태 학습
+
+        저수지 표본은 행마다 난수 키를 주고 키가 가장 작은 sample_size 행을 남기는
+        방식이어서, 청크 순서와 무관하게 전체에서 균등하게 뽑은 표본과 같습니다.
+
+        Args:
+            source: CSV 경로 또는 DataFrame 청크를 내는 함수
+
+        Returns:
+            self
+        """
+        rng = np.random.default_rng(self.seed)
+        keys = np.empty(0)
+        fares = np.empty(0)
+        embarked = pd.Series(dtype="int64")
+        rows = 0
+        with titanic_profile.stage("scale.fit_pass", category="io") as stage:
+            for chunk in self.chunks(source):
+                rows += len(chunk)
+                counts = chunk["Embarked"].value_counts()
+                embarked = embarked.add(counts[counts > 0].astype("int64"), fill_value=0)
+                keys = np.concatenate([keys, rng.random(len(chunk))])
+                fares = np.concatenate([fares, chunk["Fare"].to_numpy(dtype=np.float64, na_value=np.nan)])
+                if len(keys) > self.sample_size:
+                    keep = np.argpartition(keys, self.sample_size)[:self.sample_size]
+                    keys, fares = keys[keep], fares[keep]
+            stage.rows_out = rows
+
+        self.rows = rows
+        self.pipeline = TitanicPipeline().fit(DataFrame({"Fare": fares, "Embarked": None}))
+        # 최빈값은 표본이 아닌 전체 빈도로 결정 (동률이면 Series.mode 처럼 정렬 순서상 첫 값)
+        if len(embarked):
+            self.pipeline.state["embarked_fill"] = str(sorted(embarked.index[embarked == embarked.max()])[0])
+        self.encoder = TitanicEncoder(self.pipeline.state)
+        logger.info(f"[청크 전처리] {rows:,}행 학습 (요금 표본 {len(fares):,}행, "
+                    f"승선항 대체값 {self.pipeline.state['embarked_fill']})")
+        return self
+
+    def transform(self, source: Source, out_dir: Union[str, Path]) -> EncodedDataset:
+        """
+        2차 패스: 청크별 int8 인코딩 후 파일에 이어 쓰기
+
+        Args:
+            source: CSV 경로 또는 DataFrame 청크를 내는 함수
+            out_dir: 결과 폴더
+
+        Returns:
+            EncodedDataset (메모리 맵)
+        """
+        if self.encoder is None:
+            raise ValueError("청크 전처리기가 학습되지 않았습니다. 먼저 fit()을 실행해주세요.")
+        out_dir = Path(out_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        rows = 0
+        has_labels = None
+        with titanic_profile.stage("scale.transform_pass") as stage, \
+                open(out_dir / "X.int8", "wb") as fx, open(out_dir / "y.int8", "wb") as fy:
+            for chunk in self.chunks(source):
+                if has_labels is None:
+                    has_labels = "Survived" in chunk.columns
+                fx.write(self.encoder.encode_frame(chunk, dtype=np.int8).tobytes())
+                if has_labels:
+                    fy.write(chunk["Survived"].to_numpy(dtype=np.int8).tobytes())
+                rows += len(chunk)
+            stage.rows_out = rows
+        if not has_labels:
+            os.remove(out_dir / "y.int8")
+
+        meta = {
+            "rows": rows,
+            "features": PREDICT_FEATURES,
+            "has_labels": bool(has_labels),
+            "state": self.pipeline.state,
+        }
+        with open(out_dir / "meta.json", "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False, indent=2, default=float)
+        logger.info(f"[청크 전처리] {rows:,}행 인코딩 완료: {out_dir}")
+        return EncodedDataset(out_dir, meta)
+
+    def fit_transform(self, source: Source, out_dir: Union[str, Path]) -> EncodedDataset:
+        return self.fit(source).transform(source, out_dir)
+
+
+# ***********
+# 표본 교차 검증
+# ***********
+
+def stratified_sample(y: np.ndarray, size: int, seed: int = 0, block: int = 1 << 20) -> np.ndarray:
+    """
+    클래스 비율을 유지한 비복원 표본의 행 번호 (y 를 블록 단위로 읽어 메모리 맵에서도 사용 가능)
+
+    Args:
+        y: 라벨 배열 (0 이상의 정수)
+        size: 표본 크기
+        seed: 난수 시드
+        block: 한 번에 읽을 행 수
+
+    Returns:
+        정렬된 행 번호 배열
+    """
+    n = len(y)
+    if size >= n:
+        return np.arange(n)
+    counts = np.zeros(0, dtype=np.int64)
+    for start in range(0, n, block):
+        part = np.bincount(np.asarray(y[start:start + block]))
+        counts = np.pad(counts, (0, max(0, len(part) - len(counts))))
+        counts[:len(part)] += part
+
+    # 클래스별 할당량 (최대 나머지 방식으로 합이 size 가 되도록)
+    exact = counts * size / n
+    quotas = np.floor(exact).astype(np.int64)
+    quotas[np.argsort(quotas - exact)[:size - quotas.sum()]] += 1
+
+    # 클래스 안에서의 순위를 먼저 뽑고, 블록을 다시 읽으며 순위를 행 번호로 바꿈
+    rng = np.random.default_rng(seed)
+    ranks = [np.sort(rng.choice(count, quota, replace=False)) for count, quota in zip(counts, quotas)]
+    seen = np.zeros(len(counts), dtype=np.int64)
+    picked: List[np.ndarray] = []
+    for start in range(0, n, block):
+        part = np.asarray(y[start:start + block])
+        for label, label_ranks in enumerate(ranks):
+            where = np.flatnonzero(part == label)
+            lo, hi = np.searchsorted(label_ranks, [seen[label], seen[label] + len(where)])
+            picked.append(start + where[label_ranks[lo:hi] - seen[label]])
+            seen[label] += len(where)
+    return np.sort(np.concatenate(picked))
+
+
+def sampled_cv(dataset: EncodedDataset, models: Optional[List[str]] = None, n_splits: int = 10,
+               random_state: int = 0, sample_rows: Optional[Dict[str, int]] = None,
+               store: Optional[FoldScoreStore] = None) -> Dict[str, Any]:
+    """
+    모델별 층화 표본으로 교차 검증
+
+    같은 크기의 표본은 모델끼리 공유하며, 표본 정확도의 95% 신뢰 구간은
+    폴드 점수 표준편차 기반(±1.96·σ/√k)으로 계산합니다.
+
+    Args:
+        dataset: 라벨이 있는 EncodedDataset
+        models: 평가할 모델 키 목록 (기본값: 전체)
+        n_splits: 폴드 수
+        random_state: 표본 추출/폴드 셔플 시드
+        sample_rows: 모델별 표본 크기 상한 (기본값: CV_SAMPLE_ROWS, 나머지 DEFAULT_CV_SAMPLE_ROWS)
+        store: 폴드 점수 저장소
+
+    Returns:
+        results(모델별 accuracy, ci95, sample_rows, sample_fraction 등), rows, wall_seconds 딕셔너리
+    """
+    if dataset.y is None:
+        raise ValueError("Survived 라벨이 없는 데이터셋은 교차 검증할 수 없습니다.")
+    limits = {**CV_SAMPLE_ROWS, **(sample_rows or {})}
+    models = [m for m in MODEL_SPECS if models is None or m in models]
+    started = time.time()
+
+    by_size: Dict[int, List[str]] = {}
+    for model in models:
+        size = min(limits.get(model, DEFAULT_CV_SAMPLE_ROWS), dataset.rows)
+        by_size.setdefault(size, []).append(model)
+
+    results: Dict[str, Any] = {}
+    for size, group in sorted(by_size.items()):
+        with titanic_profile.stage(f"scale.sample_{size}", rows_in=dataset.rows) as stage:
+            index = stratified_sample(dataset.y, size, seed=random_state)
+            X = np.asarray(dataset.X[index], dtype=np.float64)
+            y = np.asarray(dataset.y[index], dtype=np.int64)
+            stage.rows_out = len(index)
+        grid = run_cv_grid(X, y, models=group, n_splits=n_splits, random_state=random_state, store=store)
+        for model, result in grid["results"].items():
+            scores = result.get("fold_scores")
+            if scores:
+                result["ci95"] = round(1.96 * float(np.std(scores, ddof=1)) / math.sqrt(len(scores)) * 100, 2)
+            result["sample_rows"] = size
+            result["sample_fraction"] = round(size / dataset.rows, 6) if dataset.rows else None
+            results[model] = result
+            logger.info(f"  {MODEL_SPECS[model][0]} 표본 {size:,}행 ({result['sample_fraction']:.4%}) "
+                        f"정확도 {result.get('accuracy')}% ± {result.get('ci95')}")
+
+    return {"results": results, "rows": dataset.rows, "wall_seconds": round(time.time() - started, 4)}
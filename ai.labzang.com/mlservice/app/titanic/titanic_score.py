@@ -0,0 +1,187 @@
+"""
+타이타닉 승객 CSV 스트리밍 채점
+
+업로드된 CSV를 고정 크기 청크로 읽어 학습된 전처리(TitanicEncoder)와 모델을 거친 뒤,
+채점된 CSV를 청크마다 바로 내보냅니다. 한 번에 메모리에 올라가는 행은 청크 하나뿐이므로
+파일 크기와 관계없이 메모리 사용량이 일정합니다.
+
+채점 진행 상황(행 수, 청크 수, 초당 행 수)은 ScoreRun에 기록되어 응답이 끝난 뒤에도 조회할 수 있습니다.
+"""
+import io
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import IO, Any, Dict, Iterator, Optional, Tuple
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# 기본 청크 크기 (행)
+DEFAULT_CHUNK_SIZE = 10_000
+
+# 보관할 채점 기록 수
+MAX_TRACKED_RUNS = 100
+
+# 인코더가 사용하는 원본 필드 (나머지 컬럼은 읽지 않음)
+INPUT_FIELDS = ["PassengerId", "Pclass", "Sex", "Name", "Age", "Fare", "Embarked"]
+REQUIRED_FIELDS = ["Pclass", "Sex"]
+
+
+class ScoreRun:
+    """채점 요청 한 건의 진행 기록"""
+
+    def __init__(self, model: str, chunk_size: int, filename: Optional[str] = None):
+        self.run_id = uuid.uuid4().hex
+        self.model = model
+        self.chunk_size = chunk_size
+        self.filename = filename
+        self.status = "running"
+        self.created_at = datetime.now().isoformat()
+        self.started = time.perf_counter()
+        self.elapsed: Optional[float] = None
+        self.rows = 0
+        self.chunks = 0
+        self.survived = 0
+        self.error: Optional[str] = None
+
+    def finish(self, status: str, error: Optional[str] = None) -> None:
+        self.status = status
+        self.error = error
+        self.elapsed = time.perf_counter() - self.started
+
+    def to_dict(self) -> Dict[str, Any]:
+        elapsed = self.elapsed if self.elapsed is not None else time.perf_counter() - self.started
+        data = {
+            "run_id": self.run_id,
+            "model": self.model,
+            "filename": self.filename,
+            "status": self.status,
+            "created_at": self.created_at,
+            "chunk_size": self.chunk_size,
+            "rows": self.rows,
+            "chunks": self.chunks,
+            "survived": self.survived,
+            "elapsed_seconds": round(elapsed, 4),
+            "rows_per_second": round(self.rows / elapsed, 1) if elapsed > 0 else None,
+        }
+        if self.error is not None:
+            data["error"] = self.error
+        return data
+
+
+class CsvScorer:
+    """
+    청크 단위 CSV 채점기
+
+    score()는 첫 청크를 미리 읽어 컬럼/값 오류를 확인한 뒤 CSV 텍스트 조각을
+    내보내는 이터레이터를 반환합니다. (잘못된 파일은 응답을 시작하기 전에 ValueError)
+    """
+
+    def __init__(self):
+        self._runs: "OrderedDict[str, ScoreRun]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _track(self, run: ScoreRun) -> None:
+        with self._lock:
+            self._runs[run.run_id] = run
+            while len(self._runs) > MAX_TRACKED_RUNS:
+                self._runs.popitem(last=False)
+
+    def get_run(self, run_id: str) -> Optional[ScoreRun]:
+        """채점 기록 조회"""
+        with self._lock:
+            return self._runs.get(run_id)
+
+    @staticmethod
+    def _score_chunk(chunk: pd.DataFrame, state, model: str, header: bool) -> Tuple[str, int]:
+        """청크 하나를 인코딩, 예측하여 (CSV 텍스트, 생존 예측 수)로 변환"""
+        columns = {field: chunk[field].tolist() for field in INPUT_FIELDS if field in chunk.columns}
+        X = state.encoder.encode_columns(columns)
+        probability = state.predict_proba(X, [model])[model]
+
+        survived = (probability >= 0.5).astype(int)
+        out = pd.DataFrame({
+            # PassengerId가 없으면 1부터 시작하는 행 번호 (청크 인덱스는 파일 전체 기준으로 이어짐)
+            "PassengerId": chunk["PassengerId"].to_numpy() if "PassengerId" in chunk.columns
+            else chunk.index.to_numpy() + 1,
+            "Survived": survived,
+            "Probability": probability.round(6),
+        })
+        buffer = io.StringIO()
+        out.to_csv(buffer, index=False, header=header)
+        return buffer.getvalue(), int(survived.sum())
+
+    def score(self, source: IO, state, model: str, chunk_size: int = DEFAULT_CHUNK_SIZE,
+              filename: Optional[str] = None) -> Tuple[ScoreRun, Iterator[str]]:
+        """
+        CSV 채점 시작
+
+        Args:
+            source: 업로드된 CSV 파일 객체 (바이너리 또는 텍스트)
+            state: 예측 상태 (TitanicPredictor.state, 채점 도중 모델이 바뀌어도 이 상태로 끝까지 채점)
+            model: 사용할 모델 이름
+            chunk_size: 청크 크기 (행)
+            filename: 업로드 파일 이름 (기록용)
+
+        Returns:
+            (ScoreRun, CSV 텍스트 조각 이터레이터) 튜플
+        """
+        if model not in state.models:
+            raise ValueError(f"알 수 없는 모델입니다: {model} (사용 가능: {', '.join(state.models)})")
+        if chunk_size < 1:
+            raise ValueError("chunk_size는 1 이상이어야 합니다")
+
+        try:
+            reader = pd.read_csv(source, chunksize=chunk_size,
+                                 usecols=lambda column: column in INPUT_FIELDS)
+            first = next(reader, None)
+        except (pd.errors.ParserError, pd.errors.EmptyDataError, UnicodeDecodeError) as e:
+            raise ValueError(f"CSV 파일을 읽을 수 없습니다: {e}")
+        if first is None:
+            raise ValueError("CSV 파일에 데이터 행이 없습니다")
+        missing = [field for field in REQUIRED_FIELDS if field not in first.columns]
+        if missing:
+            reader.close()
+            raise ValueError(f"필수 컬럼이 없습니다: {', '.join(missing)}")
+
+        run = ScoreRun(model, chunk_size, filename)
+        # 첫 청크는 응답 시작 전에 채점하여 값 오류를 400으로 돌려줌
+        try:
+            first_scored = self._score_chunk(first, state, model, header=True)
+        except Exception:
+            reader.close()
+            raise
+        self._track(run)
+
+        def chunks() -> Iterator[str]:
+            (text, survived), chunk = first_scored, first
+            try:
+                while True:
+                    run.rows += len(chunk)
+                    run.chunks += 1
+                    run.survived += survived
+                    yield text
+                    chunk = next(reader, None)
+                    if chunk is None:
+                        break
+                    text, survived = self._score_chunk(chunk, state, model, header=False)
+            except GeneratorExit:
+                # 클라이언트가 응답을 끝까지 받지 않고 연결을 끊은 경우
+                run.finish("cancelled")
+                raise
+            except Exception as e:
+                run.finish("failed", str(e))
+                logger.error(f"[CSV 채점] {run.run_id} 실패 ({run.rows}행 처리 후): {e}")
+                raise
+            finally:
+                reader.close()
+            run.finish("completed")
+            stats = run.to_dict()
+            logger.info(f"[CSV 채점] {run.run_id} 완료: {stats['rows']}행, 청크 {stats['chunks']}개, "
+                        f"{stats['rows_per_second']}행/초")
+
+        return run, chunks()
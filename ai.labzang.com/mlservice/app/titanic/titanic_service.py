@@ -2,9 +2,13 @@
 타이타닉 데이터 서비스
 판다스, 넘파이, 사이킷런을 사용한 데이터 처리 및 머신러닝 서비스
 """
+import hashlib
+import json
 import sys
+import threading
+import time
 from pathlib import Path
-from typing import List, Dict, Optional, Any, ParamSpecArgs
+from typing import List, Dict, Optional, Any, Callable, IO, Iterator, Tuple, ParamSpecArgs
 import pandas as pd
 import numpy as np
 from sklearn.model_selection import train_test_split
@@ -21,8 +25,20 @@ try:
     LIGHTGBM_AVAILABLE = True
 except ImportError:
     LIGHTGBM_AVAILABLE = False
-from app.titanic.titanic_method import TitanicMethod
 from app.titanic.titanic_dataset import TitanicDataSet
+from app.titanic.titanic_pipeline import PreprocessArtifact, fingerprint, load_or_fit
+from app.titanic.titanic_cv import FoldScoreStore, run_cv_grid
+from app.titanic.titanic_jobs import Job, JobManager
+from app.titanic.titanic_passengers import load_store
+from app.titanic.titanic_learn import INCREMENTAL_MODELS, MAX_BATCH, LabeledStore, columns, labels, partial_update
+from app.titanic.titanic_predict import PREDICT_FEATURES, TitanicPredictor, build_estimator
+from app.titanic.titanic_tune import (DEFAULT_GRIDS, expand_grid, params_key, rung_budgets,
+                                      successive_halving)
+from app.titanic.titanic_registry import ModelRegistry
+from app.titanic.titanic_score import DEFAULT_CHUNK_SIZE, CsvScorer, ScoreRun
+from app.titanic.titanic_submissions import SubmissionArtifact, get_store
+from app.titanic import titanic_profile
+from app.titanic.titanic_profile import PipelineProfiler, profiled
 
 # 공통 모듈 경로 추가
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
@@ -35,6 +51,9 @@ except ImportError:
     import logging
     logger = logging.getLogger("titanic_service")
 
+# 제출용 SVM의 레지스트리 이름
+SUBMISSION_MODEL = "submission.svm"
+
 # LightGBM 경고 메시지
 if not LIGHTGBM_AVAILABLE:
     logger.warning("LightGBM이 설치되지 않았습니다. LightGBM 모델을 사용할 수 없습니다.")
@@ -57,6 +76,18 @@ class TitanicService:
         
         # 전처리된 데이터 저장용
         self.processed_data: Optional[TitanicDataSet] = None
+        self.preprocess_artifact: Optional[PreprocessArtifact] = None
+        self.registry = ModelRegistry()
+        self.predictor = TitanicPredictor(self.registry)
+        self.jobs = JobManager(max_workers=2)
+        self.fold_scores: Optional[FoldScoreStore] = None
+        self.scorer = CsvScorer()
+        self.submissions = get_store()
+        self.profiler = PipelineProfiler()
+        self.labeled = LabeledStore()
+        self.predictor.labeled = self.labeled
+        self._learn_lock = threading.Lock()
+        self._refit_job: Optional[Job] = None
         self.models: Dict[str, Any] = {}
         
         # 경로 검증
@@ -87,105 +118,44 @@ class TitanicService:
     def preprocess(self) -> Dict[str, Any]:
         """
         타이타닉 데이터 전처리 실행
+        
+        입력 CSV 지문이 같은 전처리 산출물이 있으면 CSV를 다시 읽거나
+        파이프라인을 다시 학습하지 않고 재사용합니다. (메모리 → 디스크 순서로 조회)
+        
         Returns:
             전처리 결과 정보 딕셔너리
         """
-        logger.info("=" * 80)
-        logger.info("전처리 시작")
-        logger.info("=" * 80)
-        
-        the_method = TitanicMethod()
-
         train_csv_path = self._get_csv_path('train.csv')
-        logger.info(f"Train CSV 파일 경로: {train_csv_path}")
-        logger.info(f"Train CSV 파일 존재 여부: {train_csv_path.exists()}")
-        
-        df_train = the_method.read_csv(str(train_csv_path))
-        # Survived 라벨을 유지한 상태로 복사 (평가 시 필요)
-        this_train = df_train.copy()
-        
-        logger.info("-" * 80)
-        logger.info("[Train 데이터셋 정보]")
-        logger.info(f"  타입: {type(this_train).__name__}")
-        logger.info(f"  컬럼 수: {len(this_train.columns)}")
-        logger.info(f"  컬럼 목록: {', '.join(this_train.columns.tolist())}")
-        logger.info(f"  행 수: {len(this_train)}")
-        logger.info(f"  Null 값 개수: {the_method.check_null(this_train)}개")
-        logger.info("-" * 80)
-        logger.info("[Train 데이터 상위 5개 행]")
-        logger.info(f"\n{this_train.head(5).to_string()}\n")
-
         test_csv_path = self._get_csv_path('test.csv')
-        logger.info(f"Test CSV 파일 경로: {test_csv_path}")
-        logger.info(f"Test CSV 파일 존재 여부: {test_csv_path.exists()}")
-        
-        df_test = the_method.read_csv(str(test_csv_path))
-        this_test = the_method.create_df(df_test, 'Survived')
-        
-        logger.info("-" * 80)
-        logger.info("[Test 데이터셋 정보]")
-        logger.info(f"  타입: {type(this_test).__name__}")
-        logger.info(f"  컬럼 수: {len(this_test.columns)}")
-        logger.info(f"  컬럼 목록: {', '.join(this_test.columns.tolist())}")
-        logger.info(f"  행 수: {len(this_test)}")
-        logger.info(f"  Null 값 개수: {the_method.check_null(this_test)}개")
-        logger.info("-" * 80)
-        logger.info("[Test 데이터 상위 5개 행]")
-        logger.info(f"\n{this_test.head(5).to_string()}\n")
-        
-        this = TitanicDataSet()
-
-        this.train = this_train
-        this.test = this_test
-
-        drop_features = ['SibSp', 'Parch', 'Cabin', 'Ticket']
-        this = the_method.drop_feature(this, *drop_features)
-        this = the_method.pclass_ordinal(this)
-        this = the_method.fare_ordinal(this)
-        this = the_method.embarked_nominal(this)
-        this = the_method.gender_nominal(this)
-        this = the_method.extract_title_from_name(this)  # Name에서 Title 추출
-        this = the_method.age_ratio(this)
-        this = the_method.title_nominal(this)
-        drop_name = ['Name']
-        this = the_method.drop_feature(this, *drop_name)
-
-        logger.info("=" * 80)
-        logger.info("[Train 전처리 완료]")
-        logger.info("-" * 80)
-        logger.info(f"  타입: {type(this.train).__name__}")
-        logger.info(f"  컬럼 수: {len(this.train.columns)}")
-        logger.info(f"  컬럼 목록: {', '.join(this.train.columns.tolist())}")
-        logger.info(f"  행 수: {len(this.train)}")
-        logger.info(f"  Null 값 개수: {the_method.check_null(this.train)}개")
-        logger.info("-" * 80)
-        logger.info("[Train 전처리 후 상위 5개 행]")
-        logger.info(f"\n{this.train.head(5).to_string()}\n")
-
-        logger.info("=" * 80)
-        logger.info("[Test 전처리 완료]")
-        logger.info("-" * 80)
-        logger.info(f"  타입: {type(this.test).__name__}")
-        logger.info(f"  컬럼 수: {len(this.test.columns)}")
-        logger.info(f"  컬럼 목록: {', '.join(this.test.columns.tolist())}")
-        logger.info(f"  행 수: {len(this.test)}")
-        logger.info(f"  Null 값 개수: {the_method.check_null(this.test)}개")
-        logger.info("-" * 80)
-        logger.info("[Test 전처리 후 상위 5개 행]")
-        logger.info(f"\n{this.test.head(5).to_string()}\n")
-        
-        # 전처리된 데이터 저장
-        self.processed_data = this
-        
-        # 전처리 결과 정보 반환
+        key = fingerprint(train_csv_path, test_csv_path)
+        
+        if self.preprocess_artifact is not None and self.preprocess_artifact.fingerprint == key:
+            source = "memory"
+        else:
+            with self.profiler.run("preprocess") as run:
+                artifact, loaded = load_or_fit(train_csv_path, test_csv_path)
+                self.preprocess_artifact = artifact
+                source = "disk" if loaded else "fitted"
+                run.extra["source"] = source
+            
+            this = artifact.dataset
+            logger.info(f"전처리 완료 ({source}): train {this.train.shape}, test {this.test.shape}")
+            # 컬럼/dtype/상위 행 덤프는 debug 모드(TITANIC_DEBUG=1)에서만 출력
+            if self.profiler.debug:
+                for name, df in [("Train", this.train), ("Test", this.test)]:
+                    logger.info(f"[{name} 전처리 완료] 컬럼: {', '.join(df.columns.tolist())}\n"
+                                f"{df.dtypes.to_string()}\n{df.head(5).to_string()}")
+        
+        # 전처리된 데이터 저장 (이후 단계는 drop/select_dtypes 로 새 DataFrame 을 만들 뿐 원본을 바꾸지 않으므로 복사 없이 공유)
+        self.processed_data = self.preprocess_artifact.dataset
+        
+        # 전처리 결과 정보 반환 (원본 train 데이터 요약)
         return {
             "status": "success",
-            "rows": len(this_train),
-            "columns": this_train.columns.tolist(),
-            "column_count": len(this_train.columns),
-            "null_count": int(the_method.check_null(this_train)),
-            "sample_data": this_train.head(5).to_dict(orient="records"),
-            "dtypes": this_train.dtypes.astype(str).to_dict()
+            **self.preprocess_artifact.meta["raw_train"],
+            "fingerprint": key,
+            "pipeline_version": self.preprocess_artifact.meta["version"],
+            "source": source,
         }
 
     def modeling(self):
@@ -232,8 +202,8 @@ class TitanicService:
         if self.processed_data is None:
             raise ValueError("전처리된 데이터가 없습니다. 먼저 preprocess()를 실행해주세요.")
         
-        # 전처리된 데이터 준비
-        train_data = self.processed_data.train.copy()
+        # 전처리된 데이터 준비 (읽기만 하므로 복사하지 않음)
+        train_data = self.processed_data.train
         
         # Survived 컬럼이 있는지 확인 (train 데이터에만 있음)
         if 'Survived' not in train_data.columns:
@@ -258,8 +228,20 @@ class TitanicService:
         
         return {"status": "ready_for_evaluation"}
 
-    def evaluate(self) -> Dict[str, Any]:
-        """모델 평가 - K-Fold 교차 검증 사용"""
+    @profiled("evaluate")
+    def evaluate(self, progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """
+        모델 평가 - K-Fold 교차 검증 사용
+        
+        (전처리된 데이터 해시, 모델 클래스와 파라미터, 폴드 시드/번호)가 같은 칸은
+        폴드 점수 저장소의 점수를 사용하고 없는 칸만 학습합니다.
+        
+        Args:
+            progress: (모델, 폴드) 한 칸이 끝날 때마다 호출할 함수
+            
+        Returns:
+            모델별 평가 결과 딕셔너리
+        """
         logger.info("=" * 80)
         logger.info("평가 시작 (K-Fold 교차 검증)")
         logger.info("=" * 80)
@@ -267,8 +249,8 @@ class TitanicService:
         if self.processed_data is None:
             raise ValueError("전처리된 데이터가 없습니다. 먼저 preprocess()를 실행해주세요.")
         
-        # 전처리된 데이터 준비
-        train_data = self.processed_data.train.copy()
+        # 전처리된 데이터 준비 (읽기만 하므로 복사하지 않음)
+        train_data = self.processed_data.train
         
         # 피처와 타겟 분리
         X_train = train_data.drop(columns=['Survived'])
@@ -280,91 +262,13 @@ class TitanicService:
         logger.info(f"평가 데이터 shape: {X_train.shape}")
         logger.info(f"평가 피처: {X_train.columns.tolist()}")
         
-        # TitanicMethod 인스턴스 생성 (K-Fold 교차 검증 메서드 사용)
-        the_method = TitanicMethod()
-        
-        # 각 모델 평가 (K-Fold 교차 검증)
-        results = {}
-        
-        # KNN 평가
-        try:
-            logger.info("- KNN 평가 중...")
-            accuracy = the_method.accuracy_by_knn(X_train.values, y_train.values)
-            results['knn'] = {
-                "accuracy": float(accuracy),
-                "status": "success"
-            }
-            logger.info(f"  KNN 검증 정확도: {accuracy}%")
-        except Exception as e:
-            logger.error(f"  KNN 평가 실패: {str(e)}")
-            results['knn'] = {
-                "accuracy": None,
-                "status": f"error: {str(e)}"
-            }
-        
-        # Decision Tree 평가
-        try:
-            logger.info("- Decision Tree 평가 중...")
-            accuracy = the_method.accuracy_by_dtree(X_train.values, y_train.values)
-            results['decision_tree'] = {
-                "accuracy": float(accuracy),
-                "status": "success"
-            }
-            logger.info(f"  Decision Tree 검증 정확도: {accuracy}%")
-        except Exception as e:
-            logger.error(f"  Decision Tree 평가 실패: {str(e)}")
-            results['decision_tree'] = {
-                "accuracy": None,
-                "status": f"error: {str(e)}"
-            }
-        
-        # Random Forest 평가
-        try:
-            logger.info("- Random Forest 평가 중...")
-            accuracy = the_method.accuracy_by_rforest(X_train.values, y_train.values)
-            results['random_forest'] = {
-                "accuracy": float(accuracy),
-                "status": "success"
-            }
-            logger.info(f"  Random Forest 검증 정확도: {accuracy}%")
-        except Exception as e:
-            logger.error(f"  Random Forest 평가 실패: {str(e)}")
-            results['random_forest'] = {
-                "accuracy": None,
-                "status": f"error: {str(e)}"
-            }
-        
-        # Naive Bayes 평가
-        try:
-            logger.info("- Naive Bayes 평가 중...")
-            accuracy = the_method.accuracy_by_nb(X_train.values, y_train.values)
-            results['naive_bayes'] = {
-                "accuracy": float(accuracy),
-                "status": "success"
-            }
-            logger.info(f"  Naive Bayes 검증 정확도: {accuracy}%")
-        except Exception as e:
-            logger.error(f"  Naive Bayes 평가 실패: {str(e)}")
-            results['naive_bayes'] = {
-                "accuracy": None,
-                "status": f"error: {str(e)}"
-            }
-        
-        # SVM 평가
-        try:
-            logger.info("- SVM 평가 중...")
-            accuracy = the_method.accuracy_by_svm(X_train.values, y_train.values)
-            results['svm'] = {
-                "accuracy": float(accuracy),
-                "status": "success"
-            }
-            logger.info(f"  SVM 검증 정확도: {accuracy}%")
-        except Exception as e:
-            logger.error(f"  SVM 평가 실패: {str(e)}")
-            results['svm'] = {
-                "accuracy": None,
-                "status": f"error: {str(e)}"
-            }
+        # 모델 × 폴드 교차 검증을 프로세스 풀에서 병렬 실행
+        # (TitanicMethod.accuracy_by_* 와 같은 모델 설정과 10-Fold 분할 사용)
+        # 데이터/모델 설정/폴드가 같은 칸은 저장된 점수를 사용하고 나머지만 학습
+        grid = run_cv_grid(X_train.values, y_train.values, on_progress=progress, store=self._fold_store())
+        results = grid["results"]
+        logger.info(f"교차 검증 그리드 소요 시간: {grid['wall_seconds']}초 "
+                    f"(새로 학습 {grid['computed']}칸, 저장된 점수 {grid['cached']}칸)")
         
         logger.info("=" * 80)
         logger.info("평가 완료")
@@ -378,25 +282,32 @@ class TitanicService:
                 key=lambda x: x[1],
                 default=(None, None)
             )[0] if any(r.get("accuracy") is not None for r in results.values()) else None,
-            "results": results
+            "results": results,
+            "wall_seconds": grid["wall_seconds"],
+            "computed_cells": grid["computed"],
+            "cached_cells": grid["cached"]
         }
         
         return summary
 
-    def submit(self):
-        """Kaggle 제출용 CSV 생성 (SVM 사용)"""
+    @profiled("submit")
+    def submit(self, progress: Optional[Callable[[Dict[str, Any]], None]] = None):
+        """
+        Kaggle 제출용 CSV 생성 (SVM 사용)
+        
+        Args:
+            progress: 진행 상황을 받을 함수 (학습 단계, SVM 교차 검증 폴드)
+        """
         logger.info("=" * 80)
         logger.info("제출 시작 (SVM 전체 학습 후 예측)")
         logger.info("=" * 80)
 
-        # 전처리 확인
-        if self.processed_data is None:
-            logger.info("전처리가 수행되지 않아 preprocess()를 먼저 실행합니다.")
-            self.preprocess()
+        # 전처리 확인 (입력 파일이 바뀌지 않았다면 저장된 산출물을 재사용)
+        self.preprocess()
 
-        # 전처리된 데이터
-        train_data = self.processed_data.train.copy()
-        test_data = self.processed_data.test.copy()
+        # 전처리된 데이터 (읽기만 하므로 복사하지 않음)
+        train_data = self.processed_data.train
+        test_data = self.processed_data.test
 
         # Survived 존재 여부 확인
         if "Survived" not in train_data.columns:
@@ -408,15 +319,42 @@ class TitanicService:
         X_train = X_train.select_dtypes(include=[np.number])
         X_test = test_data.select_dtypes(include=[np.number])
 
-        # SVM 학습 (전체 데이터)
-        svm_model = SVC(random_state=42, probability=True)
-        logger.info("SVM 전체 학습 중...")
-        svm_model.fit(X_train, y_train)
-        logger.info("SVM 전체 학습 완료")
+        # 같은 전처리 산출물로 학습한 SVM이 레지스트리에 있으면 재사용
+        features = X_train.columns.tolist()
+        entry = self.registry.current(SUBMISSION_MODEL)
+        if (entry is not None
+                and entry.meta.get("preprocess_fingerprint") == self.preprocess_artifact.fingerprint
+                and entry.meta.get("features") == features):
+            logger.info(f"레지스트리의 SVM 사용: {SUBMISSION_MODEL}@{entry.version}")
+        else:
+            # SVM 학습 (전체 데이터)
+            if progress is not None:
+                progress({"stage": "training", "model": "svm"})
+            svm_model = SVC(random_state=42, probability=True)
+            logger.info("SVM 전체 학습 중...")
+            started = time.perf_counter()
+            with titanic_profile.stage("fit.svm", category="fit", rows_in=len(X_train)):
+                svm_model.fit(X_train, y_train)
+            training_seconds = time.perf_counter() - started
+            logger.info("SVM 전체 학습 완료")
+            
+            cv = run_cv_grid(X_train.values, y_train.values, models=["svm"],
+                             on_progress=progress, store=self._fold_store())["results"]["svm"]
+            entry = self.registry.register(
+                SUBMISSION_MODEL, svm_model,
+                preprocess_fingerprint=self.preprocess_artifact.fingerprint,
+                features=features,
+                metrics={k: v for k, v in cv.items() if k in ("accuracy", "fold_scores")},
+                training_seconds=round(training_seconds, 4),
+                promote=True
+            )
+        svm_model = entry.estimator
 
         # 예측
         logger.info("SVM 테스트 예측 중...")
-        test_pred = svm_model.predict(X_test)
+        with titanic_profile.stage("predict.svm", category="predict", rows_in=len(X_test)) as stage:
+            test_pred = svm_model.predict(X_test)
+            stage.rows_out = len(test_pred)
         logger.info("SVM 테스트 예측 완료")
 
         # 제출 DataFrame 구성
@@ -425,10 +363,12 @@ class TitanicService:
             "Survived": test_pred.astype(int)
         })
 
-        # 저장 경로
-        submission_path = self.test_csv_path.parent / "submission.csv"
-        submission.to_csv(submission_path, index=False)
-        logger.info(f"제출 파일 저장 완료: {submission_path}")
+        # 제출 파일 저장소에 저장 (같은 예측이면 기존 파일 재사용)
+        with titanic_profile.stage("write_submission", category="io", rows_in=len(submission)):
+            artifact, created = self.submissions.put(
+                submission["PassengerId"].to_numpy(), submission["Survived"].to_numpy(), SUBMISSION_MODEL
+            )
+        logger.info(f"제출 파일 {'저장' if created else '재사용'} 완료: {artifact.path}")
 
         logger.info("=" * 80)
         logger.info("제출 완료")
@@ -436,7 +376,515 @@ class TitanicService:
 
         return {
             "status": "success",
-            "saved_path": str(submission_path),
+            "saved_path": str(artifact.path),
+            "filename": artifact.filename,
+            "digest": artifact.digest,
+            "reused": not created,
             "rows": len(submission),
-            "head": submission.head(5).to_dict(orient="records")
-        }
\ No newline at end of file
+            "head": submission.head(5).to_dict(orient="records"),
+            "model_version": entry.version
+        }
+
+    def _fold_store(self) -> FoldScoreStore:
+        """교차 검증 폴드 점수 저장소 (처음 사용할 때 열고 예측 모델 학습에도 공유)"""
+        if self.fold_scores is None:
+            self.fold_scores = FoldScoreStore()
+            self.predictor.fold_scores = self.fold_scores
+        return self.fold_scores
+
+    def _ensure_predictor(self) -> TitanicPredictor:
+        """전처리 산출물을 확인하고 상주 모델이 최신인지 보장"""
+        if self.preprocess_artifact is None:
+            self.preprocess()
+        if self.predictor.fingerprint != self.preprocess_artifact.fingerprint:
+            # 첫 로드 또는 전처리 변경: 모델 학습/테이블 생성이 일어날 수 있으므로 계측
+            self._fold_store()
+            with self.profiler.run("predictor"):
+                self.predictor.ensure_fitted(self.preprocess_artifact)
+        else:
+            self.predictor.ensure_fitted(self.preprocess_artifact)
+        return self.predictor
+
+    def predict(self, passenger: Dict[str, Any], models: Optional[List[str]] = None,
+                engine: str = "auto") -> Dict[str, Any]:
+        """
+        승객 한 명의 모델별 생존 확률 예측
+        
+        DataFrame을 만들지 않고 전처리 산출물의 학습 상태로 바로 인코딩합니다.
+        
+        Args:
+            passenger: 승객 원본 필드 (Pclass, Sex 필수 / Name, Age, Fare, Embarked 선택)
+            models: 사용할 모델 이름 목록 (기본값: 전체)
+            engine: 계산 방식 (auto: 예측 테이블 우선, table: 테이블만, model: 모델 호출)
+            
+        Returns:
+            인코딩된 피처와 모델별 생존 확률 딕셔너리
+        """
+        # server_ms 는 최신 여부 확인(및 필요한 경우 다시 만들기)까지 포함
+        started = time.perf_counter()
+        # 상태를 한 번만 읽어 인코딩/예측/버전 표시가 같은 버전을 사용하도록 함
+        state = self._ensure_predictor().state
+        x = state.encoder.encode(passenger)
+        probabilities = state.predict_proba(x, models, engine)
+        server_ms = (time.perf_counter() - started) * 1000
+        return {
+            "features": dict(zip(PREDICT_FEATURES, x[0].tolist())),
+            "probabilities": {name: float(p[0]) for name, p in probabilities.items()},
+            "predictions": {name: int(p[0] >= 0.5) for name, p in probabilities.items()},
+            "preprocess_fingerprint": state.fingerprint,
+            "model_versions": dict(state.versions),
+            "engine": engine,
+            "server_ms": round(server_ms, 4),
+        }
+
+    def predict_batch(self, columns: Dict[str, List[Any]], models: Optional[List[str]] = None,
+                      engine: str = "auto") -> Dict[str, Any]:
+        """
+        필드별 배열로 받은 여러 승객의 모델별 생존 확률 예측
+        
+        Args:
+            columns: 필드명 → 값 배열 (예: {"Pclass": [1, 3], "Sex": ["female", "male"], ...})
+            models: 사용할 모델 이름 목록 (기본값: 전체)
+            engine: 계산 방식 (auto, table, model)
+            
+        Returns:
+            모델별 생존 확률 배열 딕셔너리
+        """
+        started = time.perf_counter()
+        state = self._ensure_predictor().state
+        X = state.encoder.encode_columns(columns)
+        probabilities = state.predict_proba(X, models, engine)
+        server_ms = (time.perf_counter() - started) * 1000
+        return {
+            "count": len(X),
+            "probabilities": {name: p.round(6).tolist() for name, p in probabilities.items()},
+            "predictions": {name: (p >= 0.5).astype(int).tolist() for name, p in probabilities.items()},
+            "preprocess_fingerprint": state.fingerprint,
+            "model_versions": dict(state.versions),
+            "engine": engine,
+            "server_ms": round(server_ms, 4),
+        }
+
+    def score_csv(self, source: IO, model: str = "svm", chunk_size: int = DEFAULT_CHUNK_SIZE,
+                  filename: Optional[str] = None) -> Tuple[ScoreRun, Iterator[str]]:
+        """
+        업로드된 승객 CSV를 청크 단위로 채점
+        
+        첫 청크는 바로 채점하여 컬럼/값 오류를 확인하고, 나머지는 반환된 이터레이터를
+        읽는 동안 청크마다 채점합니다.
+        
+        Args:
+            source: CSV 파일 객체
+            model: 사용할 모델 이름
+            chunk_size: 청크 크기 (행)
+            filename: 업로드 파일 이름
+            
+        Returns:
+            (ScoreRun, 채점된 CSV 텍스트 조각 이터레이터) 튜플
+        """
+        state = self._ensure_predictor().state
+        return self.scorer.score(source, state, model, chunk_size, filename)
+
+    def get_score_run(self, run_id: str) -> Dict[str, Any]:
+        """
+        CSV 채점 기록 조회 (행 수, 청크 수, 초당 행 수)
+        
+        Args:
+            run_id: 채점 ID
+            
+        Returns:
+            채점 기록 딕셔너리
+        """
+        run = self.scorer.get_run(run_id)
+        if run is None:
+            raise ValueError(f"채점 기록을 찾을 수 없습니다: {run_id}")
+        return run.to_dict()
+
+    def list_models(self) -> Dict[str, Any]:
+        """
+        레지스트리에 등록된 모델 이름별 현재 버전과 전체 버전 목록
+        
+        Returns:
+            모델 이름 → {"current": 현재 버전, "versions": 메타 정보 리스트} 딕셔너리
+        """
+        result = {}
+        for name in self.registry.names():
+            current = self.registry.current(name)
+            result[name] = {
+                "current": current.version if current is not None else None,
+                "versions": self.registry.versions(name),
+            }
+        return result
+
+    def promote_model(self, name: str, version: str) -> Dict[str, Any]:
+        """
+        모델 버전을 현재 버전으로 지정 (모든 워커가 다음 요청에서 교체)
+        
+        Args:
+            name: 모델 이름
+            version: 버전
+            
+        Returns:
+            포인터 딕셔너리
+        """
+        return self.registry.promote(name, version)
+
+    @profiled("tune")
+    def tune(self, grids: Optional[Dict[str, Dict[str, List[Any]]]] = None, eta: int = 3,
+             min_folds: int = 2, progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """
+        모델 종류별 하이퍼파라미터 탐색 후 최적 조합을 레지스트리에 등록
+        
+        예측 피처(PREDICT_FEATURES)로 successive halving 탐색을 실행하고, 모델마다
+        최적 조합을 전체 데이터로 학습하여 "predict.<모델>" 새 버전으로 등록합니다.
+        현재 버전보다 교차 검증 정확도가 높으면 현재 버전으로 지정되어 예측 API에 바로 반영됩니다.
+        
+        Args:
+            grids: 모델 키 → 파라미터 그리드 (기본값: DEFAULT_GRIDS 전체)
+            eta: 단계마다 상위 1/eta 조합만 남김
+            min_folds: 첫 단계 폴드 수
+            progress: 진행 이벤트를 받을 함수
+            
+        Returns:
+            모델별 탐색 결과와 등록 버전 딕셔너리
+        """
+        logger.info("=" * 80)
+        logger.info("하이퍼파라미터 탐색 시작 (successive halving)")
+        logger.info("=" * 80)
+        
+        self.preprocess()
+        artifact = self.preprocess_artifact
+        # 예측 모델과 같은 학습 데이터 (train + 누적 라벨 승객)
+        X, y, labeled_rows = self.predictor.training_data(artifact)
+        
+        data_key = FoldScoreStore.data_key(X, y, n_splits=10, random_state=0)
+        search = successive_halving(X, y, grids or DEFAULT_GRIDS, self._fold_store(), data_key,
+                                    eta=eta, min_folds=min_folds, on_progress=progress)
+        
+        for name, result in search["results"].items():
+            if result["status"] != "success":
+                continue
+            registry_name = TitanicPredictor.REGISTRY_PREFIX + name
+            current = self.registry.current(registry_name)
+            current_accuracy = None
+            if (current is not None
+                    and current.meta.get("preprocess_fingerprint") == artifact.fingerprint
+                    and current.meta.get("features") == PREDICT_FEATURES):
+                current_accuracy = current.meta.get("metrics", {}).get("accuracy")
+                # 현재 버전이 이미 같은 최적 조합이면 다시 학습/등록하지 않음
+                if params_key(current.meta.get("tuned_params") or {}) == params_key(result["best_params"]):
+                    result.update({"version": current.version, "promoted": False,
+                                   "previous_accuracy": current_accuracy})
+                    continue
+            promote = current_accuracy is None or result["accuracy"] > current_accuracy
+            
+            if progress is not None:
+                progress({"stage": "registering", "model": name})
+            started = time.perf_counter()
+            with titanic_profile.stage(f"fit.{name}", category="fit", rows_in=len(X)):
+                estimator = build_estimator(name, result["best_params"]).fit(X, y)
+            training_seconds = time.perf_counter() - started
+            
+            entry = self.registry.register(
+                registry_name, estimator,
+                preprocess_fingerprint=artifact.fingerprint,
+                features=PREDICT_FEATURES,
+                metrics={"accuracy": result["accuracy"], "fold_scores": result["fold_scores"]},
+                training_seconds=round(training_seconds, 4),
+                promote=promote,
+                tuned_params=result["best_params"],
+                labeled_rows=labeled_rows,
+            )
+            result.update({"version": entry.version, "promoted": promote,
+                           "previous_accuracy": current_accuracy})
+        
+        logger.info(f"하이퍼파라미터 탐색 소요 시간: {search['wall_seconds']}초")
+        logger.info("=" * 80)
+        return search
+
+    # ***********
+    # 점진 학습
+    # ***********
+
+    def learn(self, passengers: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        새 라벨 승객으로 예측 모델 갱신
+        
+        점진 학습 모델(INCREMENTAL_MODELS)은 현재 버전에 partial_fit 으로 새 행만 반영하여
+        바로 새 버전으로 등록/지정하고, 나머지 모델은 train + 누적 라벨 전체로 다시 학습하는
+        백그라운드 작업을 예약합니다. (재학습이 끝난 모델부터 새 버전으로 지정)
+        
+        Args:
+            passengers: Survived(0/1)와 원본 필드(Pclass, Sex 필수 / Name, Age, Fare, Embarked)를 가진 승객 목록
+            
+        Returns:
+            저장된 승객 수, 갱신된 모델 버전, 재학습 작업 정보 딕셔너리
+        """
+        if not passengers:
+            raise ValueError("승객 목록이 비어 있습니다")
+        if len(passengers) > MAX_BATCH:
+            raise ValueError(f"한 번에 최대 {MAX_BATCH}명까지 학습할 수 있습니다")
+        
+        predictor = self._ensure_predictor()
+        artifact = self.preprocess_artifact
+        # 저장 전에 인코딩/라벨을 검증하여 잘못된 행이 누적되지 않도록 함
+        X = predictor.state.encoder.encode_columns(columns(passengers))
+        y = labels(passengers)
+        
+        updated = {}
+        with self._learn_lock:
+            labeled_rows = self.labeled.append(passengers)
+            for name in INCREMENTAL_MODELS:
+                if name not in predictor.model_names:
+                    continue
+                registry_name = TitanicPredictor.REGISTRY_PREFIX + name
+                current = self.registry.current(registry_name)
+                started = time.perf_counter()
+                estimator = partial_update(current.estimator, X, y)
+                training_seconds = time.perf_counter() - started
+                entry = self.registry.register(
+                    registry_name, estimator,
+                    preprocess_fingerprint=artifact.fingerprint,
+                    features=PREDICT_FEATURES,
+                    training_seconds=round(training_seconds, 6),
+                    promote=True,
+                    tuned_params=current.meta.get("tuned_params"),
+                    labeled_rows=labeled_rows,
+                    update="partial_fit",
+                    parent_version=current.version,
+                )
+                updated[name] = {"version": entry.version, "parent_version": current.version,
+                                 "training_ms": round(training_seconds * 1000, 3)}
+            # 새 버전을 바로 상주 모델로 교체
+            predictor.ensure_fitted(artifact)
+        logger.info(f"[점진 학습] 승객 {len(passengers)}명 추가 (누적 {labeled_rows}명), "
+                    f"partial_fit: {', '.join(updated) or '없음'}")
+        
+        job = self.start_refit()
+        return {
+            "accepted": len(passengers),
+            "labeled_rows": labeled_rows,
+            "updated": updated,
+            "refit_job": job.to_dict(include_result=False),
+        }
+
+    def start_refit(self) -> Job:
+        """
+        점진 학습을 지원하지 않는 모델의 전체 재학습 작업 예약
+        
+        아직 시작하지 않은 재학습 작업이 있으면 그 작업을 반환합니다.
+        (작업은 시작할 때의 누적 라벨 전체를 사용하므로 연속된 요청을 한 번의 재학습으로 합침)
+        
+        Returns:
+            Job 객체
+        """
+        with self._learn_lock:
+            job = self._refit_job
+            if job is not None and job.status == "pending":
+                return job
+            key = f"{self.preprocess_artifact.fingerprint}:{self.labeled.count()}"
+            self._refit_job = self.jobs.submit("refit", key, self._run_refit)
+            return self._refit_job
+
+    # ***********
+    # 백그라운드 작업
+    # ***********
+
+    def _run_evaluate(self, progress: Callable[[Dict[str, Any]], None]) -> Dict[str, Any]:
+        self.preprocess()
+        progress({"stage": "preprocessed"})
+        return self.evaluate(progress)
+
+    def _run_submit(self, progress: Callable[[Dict[str, Any]], None]) -> Dict[str, Any]:
+        return self.submit(progress)
+
+    @profiled("refit")
+    def _run_refit(self, progress: Callable[[Dict[str, Any]], None]) -> Dict[str, Any]:
+        self.preprocess()
+        artifact = self.preprocess_artifact
+        X, y, labeled_rows = self.predictor.training_data(artifact)
+        results = {}
+        for name in self.predictor.model_names:
+            if name in INCREMENTAL_MODELS:
+                continue
+            registry_name = TitanicPredictor.REGISTRY_PREFIX + name
+            current = self.registry.current(registry_name)
+            params = current.meta.get("tuned_params") if current is not None else None
+            progress({"stage": "refitting", "model": name, "rows": len(X)})
+            started = time.perf_counter()
+            with titanic_profile.stage(f"fit.{name}", category="fit", rows_in=len(X)):
+                estimator = build_estimator(name, params).fit(X, y)
+            training_seconds = time.perf_counter() - started
+            with self._learn_lock:
+                # 더 많은 라벨로 학습한 버전이 먼저 지정되었으면 덮어쓰지 않음
+                latest = self.registry.current(registry_name)
+                promote = (latest is None or latest.meta.get("preprocess_fingerprint") != artifact.fingerprint
+                           or (latest.meta.get("labeled_rows") or 0) <= labeled_rows)
+                entry = self.registry.register(
+                    registry_name, estimator,
+                    preprocess_fingerprint=artifact.fingerprint,
+                    features=PREDICT_FEATURES,
+                    training_seconds=round(training_seconds, 4),
+                    promote=promote,
+                    tuned_params=params,
+                    labeled_rows=labeled_rows,
+                    update="refit",
+                )
+            results[name] = {"version": entry.version, "promoted": promote,
+                             "training_seconds": round(training_seconds, 4)}
+            progress({"stage": "published", "model": name, "version": entry.version, "promoted": promote})
+        return {"labeled_rows": labeled_rows, "rows": len(X), "models": results}
+
+    def start_job(self, kind: str) -> Job:
+        """
+        evaluate / submit 을 백그라운드 작업으로 등록
+        
+        입력 CSV 지문이 같은 작업이 실행 중이거나 완료되어 있으면 새로 실행하지 않고
+        그 작업을 반환합니다. submit 은 제출용 SVM(submission.svm)의 현재 레지스트리 버전도
+        키에 포함하므로, 다른 버전을 지정(promote)하면 새 제출 파일을 만듭니다.
+        
+        Args:
+            kind: 작업 종류 ("evaluate", "submit")
+            
+        Returns:
+            Job 객체
+        """
+        runners = {"evaluate": self._run_evaluate, "submit": self._run_submit}
+        if kind not in runners:
+            raise ValueError(f"알 수 없는 작업 종류입니다: {kind} (사용 가능: {', '.join(runners)})")
+        key = fingerprint(self._get_csv_path('train.csv'), self._get_csv_path('test.csv'))
+        if kind == "submit":
+            entry = self.registry.current(SUBMISSION_MODEL)
+            key = f"{key}:{entry.version if entry is not None else 'none'}"
+        return self.jobs.submit(kind, key, runners[kind])
+
+    def start_tune(self, grids: Optional[Dict[str, Dict[str, List[Any]]]] = None,
+                   eta: int = 3, min_folds: int = 2) -> Job:
+        """
+        하이퍼파라미터 탐색을 백그라운드 작업으로 등록
+        
+        같은 데이터, 같은 탐색 설정의 작업이 실행 중이거나 완료되어 있으면 그 작업을 반환합니다.
+        
+        Args:
+            grids: 모델 키 → 파라미터 그리드 (기본값: DEFAULT_GRIDS 전체)
+            eta: 단계마다 상위 1/eta 조합만 남김
+            min_folds: 첫 단계 폴드 수
+            
+        Returns:
+            Job 객체
+        """
+        grids = grids or DEFAULT_GRIDS
+        # 작업 등록 전에 그리드와 단계 설정을 검증하여 잘못된 요청은 바로 400으로 응답
+        rung_budgets(10, min_folds, eta)
+        for model, grid in grids.items():
+            expand_grid(model, grid)
+        
+        settings = json.dumps({"grids": grids, "eta": eta, "min_folds": min_folds,
+                               "labeled_rows": self.labeled.count()}, sort_keys=True)
+        key = fingerprint(self._get_csv_path('train.csv'), self._get_csv_path('test.csv'))
+        key = f"{key}:{hashlib.sha1(settings.encode('utf-8')).hexdigest()[:12]}"
+        return self.jobs.submit("tune", key, lambda progress: self.tune(grids, eta, min_folds, progress))
+
+    def get_job(self, job_id: str) -> Job:
+        """
+        작업 ID로 작업 조회
+        
+        Args:
+            job_id: 작업 ID
+            
+        Returns:
+            Job 객체
+        """
+        job = self.jobs.get(job_id)
+        if job is None:
+            raise ValueError(f"작업을 찾을 수 없습니다: {job_id}")
+        return job
+
+    def list_jobs(self) -> List[Dict[str, Any]]:
+        """전체 작업 요약 (최근 순)"""
+        return self.jobs.list()
+
+    # ***********
+    # 계측
+    # ***********
+
+    def get_profile(self, kind: Optional[str] = None) -> Dict[str, Any]:
+        """
+        가장 최근 실행의 단계별 시간/메모리 기록
+        
+        Args:
+            kind: 실행 종류 (preprocess, evaluate, submit, tune, predictor / 기본값: 종류 무관)
+            
+        Returns:
+            latest(최근 실행 단계 트리)와 runs(최근 실행 요약) 딕셔너리
+        """
+        latest = self.profiler.latest(kind)
+        if latest is None:
+            raise ValueError(f"계측된 실행이 없습니다{f': {kind}' if kind else ''}")
+        return {
+            "latest": latest,
+            "runs": self.profiler.runs(),
+            "trace_memory": self.profiler.trace_memory,
+            "debug": self.profiler.debug,
+        }
+
+    # ***********
+    # 승객 조회
+    # ***********
+
+    def query_passengers(self, **filters) -> Dict[str, Any]:
+        """
+        train 승객 필터/정렬 조회 (상주 컬럼형 저장소, 커서 페이지네이션)
+        
+        Args:
+            **filters: PassengerStore.query 인자 (pclass, sex, age_band, fare_min, fare_max,
+                survived, sort, descending, limit, cursor)
+            
+        Returns:
+            passengers, count, next_cursor, total_rows 딕셔너리
+        """
+        store = load_store(self._get_csv_path('train.csv'))
+        return {**store.query(**filters), "total_rows": store.rows}
+
+    def survival_analysis(self, limit: int = 10, **filters) -> Dict[str, Any]:
+        """
+        생존 점수 상위/하위 승객
+        
+        Args:
+            limit: 그룹별 승객 수
+            **filters: PassengerStore.extremes 필터 (pclass, sex, age_band, fare_min, fare_max)
+            
+        Returns:
+            high_survival, low_survival 승객 목록 딕셔너리
+        """
+        store = load_store(self._get_csv_path('train.csv'))
+        return store.extremes(limit, **filters)
+
+    # ***********
+    # 제출 파일
+    # ***********
+
+    def list_submissions(self) -> Dict[str, Any]:
+        """
+        저장된 제출 파일 목록 (최근 사용 순)
+        
+        Returns:
+            submissions, max_artifacts, max_age_seconds 딕셔너리
+        """
+        return {
+            "submissions": [artifact.to_dict() for artifact in self.submissions.list()],
+            "max_artifacts": self.submissions.max_artifacts,
+            "max_age_seconds": self.submissions.max_age_seconds,
+        }
+
+    def get_submission(self, filename: str) -> Optional[SubmissionArtifact]:
+        """
+        다운로드할 제출 파일 조회 (조회하면 보존 기간이 연장됨)
+        
+        Args:
+            filename: "<sha256>.csv"
+            
+        Returns:
+            제출 파일 (없으면 None)
+        """
+        return self.submissions.get(filename)
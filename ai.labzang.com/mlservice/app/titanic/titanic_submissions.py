@@ -0,0 +1,396 @@
+"""
+타이타닉 제출 파일 저장소 (내용 주소 방식)
+
+제출 파일은 (PassengerId, Survived) 예측 벡터의 sha256 으로 이름을 붙여 저장합니다.
+같은 예측을 다시 제출하면 파일을 새로 쓰지 않고 기존 파일을 돌려주며,
+모델이 여러 개여도 예측이 같으면 파일 하나를 함께 사용합니다.
+
+저장 구조:
+    save/submissions/
+        objects/<sha256>.csv    제출 CSV (쓰기는 임시 파일 → os.replace)
+        index.sqlite            digest, 모델, 행 수, 크기, 생성/최근 사용 시각
+
+여러 워커 프로세스가 같은 폴더를 함께 쓰므로 인덱스를 바꾸는 작업(put, 보존 정책, 정리)은
+BEGIN IMMEDIATE 트랜잭션으로 프로세스 사이에서도 직렬화합니다. 새 파일은 인덱스 행을 넣은 같은
+트랜잭션 안에서 제자리로 옮기므로, 다른 저장소의 정리 작업이 커밋 전 파일을 지우지 않습니다.
+
+보존 정책: put() 할 때마다 최근 사용 순으로 max_artifacts 개를 넘는 파일과
+max_age_seconds 동안 사용(생성, 재사용, 다운로드)되지 않은 파일을 지웁니다.
+
+다운로드 응답(artifact_response)은 내용 해시를 강한 ETag 로 사용하여
+If-None-Match(304), Range/If-Range(206, 416)를 처리합니다. 전체 파일 응답은 FileResponse 로
+보내므로 서버가 지원하면 sendfile(pathsend)로 전송됩니다.
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from fastapi.responses import FileResponse, Response, StreamingResponse
+
+from app.config import get_config
+
+logger = logging.getLogger(__name__)
+
+# 저장 위치
+STORE_DIR = Path(__file__).resolve().parent / "save" / "submissions"
+
+# 보존 정책
+MAX_ARTIFACTS = get_config().submission_max_artifacts
+MAX_AGE_SECONDS = get_config().submission_max_age_days * 24 * 3600
+
+# 범위 응답을 읽는 단위
+READ_CHUNK_SIZE = 64 * 1024
+
+DIGEST_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+# 정리할 때 이 시간 안에 바뀐 파일은 다른 프로세스가 쓰는 중일 수 있으므로 남겨 둠 (초)
+RECONCILE_GRACE_SECONDS = 600
+
+
+def prediction_digest(passenger_ids, predictions) -> str:
+    """
+    예측 벡터의 내용 해시
+
+    Args:
+        passenger_ids: 승객 번호 배열
+        predictions: 예측값 배열 (0, 1)
+
+    Returns:
+        sha256 문자열
+    """
+    ids = np.ascontiguousarray(passenger_ids, dtype=np.int64)
+    values = np.ascontiguousarray(predictions, dtype=np.int8)
+    if ids.shape != values.shape or ids.ndim != 1:
+        raise ValueError(f"승객 번호와 예측값의 길이가 다릅니다: {ids.shape} != {values.shape}")
+    digest = hashlib.sha256()
+    digest.update(json.dumps({"columns": ["PassengerId", "Survived"], "rows": len(ids)}).encode("utf-8"))
+    digest.update(ids.tobytes())
+    digest.update(values.tobytes())
+    return digest.hexdigest()
+
+
+class SubmissionArtifact:
+    """저장소의 제출 파일 하나"""
+
+    def __init__(self, digest: str, path: Path, model: str, rows: int, size: int,
+                 created_at: float, last_used_at: float, uses: int):
+        self.digest = digest
+        self.path = path
+        self.model = model
+        self.rows = rows
+        self.size = size
+        self.created_at = created_at
+        self.last_used_at = last_used_at
+        self.uses = uses
+
+    @property
+    def filename(self) -> str:
+        return f"{self.digest}.csv"
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.digest}"'
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "digest": self.digest,
+            "filename": self.filename,
+            "model": self.model,
+            "rows": self.rows,
+            "size": self.size,
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.created_at)),
+            "last_used_at": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.last_used_at)),
+            "uses": self.uses,
+        }
+
+
+class SubmissionStore:
+    """
+    예측 벡터 해시 → 제출 CSV 저장소
+
+    인덱스는 SQLite 파일이라 여러 워커 프로세스가 함께 사용할 수 있습니다.
+    쓰기는 같은 프로세스 안에서는 잠금으로, 프로세스 사이에서는 BEGIN IMMEDIATE 로 직렬화합니다.
+    프로세스마다 get_store() 로 하나를 만들어 함께 사용합니다.
+    """
+
+    def __init__(self, root: Optional[Path] = None, max_artifacts: int = MAX_ARTIFACTS,
+                 max_age_seconds: float = MAX_AGE_SECONDS):
+        """
+        SubmissionStore 초기화
+
+        Args:
+            root: 저장 폴더 (기본값: app/titanic/save/submissions)
+            max_artifacts: 남겨 둘 최대 파일 수
+            max_age_seconds: 이 시간 동안 사용되지 않은 파일은 삭제
+        """
+        self.root = Path(root) if root else STORE_DIR
+        self.objects_dir = self.root / "objects"
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self.max_artifacts = max_artifacts
+        self.max_age_seconds = max_age_seconds
+        self._lock = threading.Lock()
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS artifacts ("
+                " digest TEXT PRIMARY KEY, model TEXT NOT NULL,"
+                " rows INTEGER NOT NULL, size INTEGER NOT NULL,"
+                " created_at REAL NOT NULL, last_used_at REAL NOT NULL, uses INTEGER NOT NULL)"
+            )
+        self._reconcile()
+
+    def _connect(self) -> sqlite3.Connection:
+        # 스레드마다 새 연결 사용 (작업 스레드와 요청 스레드가 다름)
+        return sqlite3.connect(self.root / "index.sqlite", timeout=30)
+
+    @staticmethod
+    def _begin(conn: sqlite3.Connection) -> None:
+        """쓰기 잠금을 먼저 잡는 트랜잭션 시작 (다른 프로세스의 쓰기와 직렬화)"""
+        conn.execute("BEGIN IMMEDIATE")
+
+    def _path(self, digest: str) -> Path:
+        return self.objects_dir / f"{digest}.csv"
+
+    def _artifact(self, row: Tuple) -> SubmissionArtifact:
+        digest, model, rows, size, created_at, last_used_at, uses = row
+        return SubmissionArtifact(digest, self._path(digest), model, rows, size, created_at, last_used_at, uses)
+
+    def _reconcile(self) -> None:
+        """인덱스에 없는 파일(중단된 쓰기 포함)과 파일이 없는 인덱스 행 정리"""
+        cutoff = time.time() - RECONCILE_GRACE_SECONDS
+        with self._lock, self._connect() as conn:
+            self._begin(conn)
+            known = {digest for (digest,) in conn.execute("SELECT digest FROM artifacts")}
+            present = set()
+            for path in self.objects_dir.iterdir():
+                if path.suffix == ".csv" and path.stem in known:
+                    present.add(path.stem)
+                    continue
+                try:
+                    if path.stat().st_mtime < cutoff:
+                        path.unlink()
+                except FileNotFoundError:
+                    pass
+            missing = known - present
+            conn.executemany("DELETE FROM artifacts WHERE digest = ?", [(d,) for d in missing])
+        if missing:
+            logger.warning(f"파일이 없는 제출 기록 {len(missing)}건 정리")
+
+    def put(self, passenger_ids, predictions, model: str) -> Tuple[SubmissionArtifact, bool]:
+        """
+        제출 파일 저장 (같은 예측이 이미 있으면 재사용)
+
+        Args:
+            passenger_ids: 승객 번호 배열
+            predictions: 예측값 배열 (0, 1)
+            model: 예측한 모델 이름 (처음 저장한 모델이 기록됨)
+
+        Returns:
+            (제출 파일, 새로 썼는지 여부)
+        """
+        digest = prediction_digest(passenger_ids, predictions)
+        path = self._path(digest)
+        now = time.time()
+        with self._lock:
+            with self._connect() as conn:
+                self._begin(conn)
+                row = conn.execute("SELECT * FROM artifacts WHERE digest = ?", (digest,)).fetchone()
+                created = row is None or not path.exists()
+                if created:
+                    submission = pd.DataFrame({
+                        "PassengerId": np.asarray(passenger_ids, dtype=np.int64),
+                        "Survived": np.asarray(predictions).astype(int)
+                    })
+                    tmp_path = path.with_name(f".{digest}.{os.getpid()}.{threading.get_ident()}.tmp")
+                    try:
+                        submission.to_csv(tmp_path, index=False)
+                        # 인덱스 행을 먼저 넣고 같은 트랜잭션 안에서 옮김 (커밋 전에는 다른 쓰기가 끼어들지 못함)
+                        conn.execute("INSERT OR REPLACE INTO artifacts VALUES (?, ?, ?, ?, ?, ?, ?)",
+                                     (digest, model, len(submission), tmp_path.stat().st_size, now, now, 1))
+                        os.replace(tmp_path, path)
+                    finally:
+                        tmp_path.unlink(missing_ok=True)
+                else:
+                    conn.execute("UPDATE artifacts SET last_used_at = ?, uses = uses + 1 WHERE digest = ?",
+                                 (now, digest))
+                row = conn.execute("SELECT * FROM artifacts WHERE digest = ?", (digest,)).fetchone()
+            removed = self._prune(keep=digest)
+        if created:
+            logger.info(f"제출 파일 저장: {path.name} ({model})")
+        else:
+            logger.info(f"같은 예측의 제출 파일 재사용: {path.name} ({model})")
+        if removed:
+            logger.info(f"보존 정책으로 제출 파일 {removed}개 삭제")
+        return self._artifact(row), created
+
+    def get(self, filename: str, touch: bool = True) -> Optional[SubmissionArtifact]:
+        """
+        제출 파일 조회
+
+        Args:
+            filename: "<sha256>.csv" 또는 "<sha256>"
+            touch: 최근 사용 시각 갱신 여부 (다운로드는 보존 기간을 연장)
+
+        Returns:
+            제출 파일 (없거나 이름 형식이 다르면 None)
+        """
+        digest = filename[:-4] if filename.endswith(".csv") else filename
+        if not DIGEST_PATTERN.match(digest):
+            return None
+        with self._connect() as conn:
+            if touch:
+                conn.execute("UPDATE artifacts SET last_used_at = ? WHERE digest = ?", (time.time(), digest))
+            row = conn.execute("SELECT * FROM artifacts WHERE digest = ?", (digest,)).fetchone()
+        if row is None or not self._path(digest).exists():
+            return None
+        return self._artifact(row)
+
+    def list(self) -> List[SubmissionArtifact]:
+        """제출 파일 목록 (최근 사용 순)"""
+        with self._connect() as conn:
+            rows = conn.execute("SELECT * FROM artifacts ORDER BY last_used_at DESC").fetchall()
+        return [self._artifact(row) for row in rows]
+
+    def prune(self) -> int:
+        """
+        보존 정책 적용
+
+        Returns:
+            삭제한 파일 수
+        """
+        with self._lock:
+            return self._prune()
+
+    def _prune(self, keep: Optional[str] = None) -> int:
+        cutoff = time.time() - self.max_age_seconds
+        with self._connect() as conn:
+            self._begin(conn)
+            rows = conn.execute("SELECT digest, last_used_at FROM artifacts ORDER BY last_used_at DESC").fetchall()
+            expired = [digest for i, (digest, last_used_at) in enumerate(rows)
+                       if digest != keep and (i >= self.max_artifacts or last_used_at < cutoff)]
+            for digest in expired:
+                self._path(digest).unlink(missing_ok=True)
+            conn.executemany("DELETE FROM artifacts WHERE digest = ?", [(d,) for d in expired])
+        return len(expired)
+
+
+_store: Optional[SubmissionStore] = None
+_store_lock = threading.Lock()
+
+
+def get_store() -> SubmissionStore:
+    """프로세스 공용 제출 파일 저장소 (처음 호출할 때 폴더 정리)"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = SubmissionStore()
+        return _store
+
+
+# ***********
+# 다운로드 응답
+# ***********
+
+def parse_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    Range 헤더 해석 (단일 바이트 범위만 지원)
+
+    Args:
+        header: Range 헤더 값
+        size: 파일 크기
+
+    Returns:
+        (시작, 끝) 포함 범위, 형식이 다르거나 여러 범위면 None (전체 응답)
+
+    Raises:
+        ValueError: 파일 크기를 벗어난 범위 (416)
+    """
+    match = RANGE_PATTERN.match(header.strip()) if header else None
+    if match is None or match.group(1) == match.group(2) == "":
+        return None
+    first, last = match.groups()
+    if first == "":
+        # 마지막 n바이트
+        length = int(last)
+        if length == 0:
+            raise ValueError("빈 범위")
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        raise ValueError("범위가 파일 크기를 벗어났습니다")
+    return start, end
+
+
+def _etag_matches(header: Optional[str], etag: str) -> bool:
+    """If-None-Match / If-Range 비교 (약한 비교)"""
+    if not header:
+        return False
+    tags = [tag.strip() for tag in header.split(",")]
+    return "*" in tags or any(tag.removeprefix("W/") == etag for tag in tags)
+
+
+def _read_range(path: Path, start: int, end: int) -> Iterator[bytes]:
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = f.read(min(READ_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def artifact_response(artifact: SubmissionArtifact, request_headers: Mapping[str, str],
+                      download_name: Optional[str] = None) -> Response:
+    """
+    제출 파일 다운로드 응답
+
+    Args:
+        artifact: 제출 파일
+        request_headers: 요청 헤더 (If-None-Match, Range, If-Range)
+        download_name: 내려받을 파일 이름 (기본값: submission_<digest 앞 12자>.csv)
+
+    Returns:
+        200 (FileResponse), 206 (부분 응답), 304 (변경 없음), 416 (범위 오류) 응답
+    """
+    headers = {
+        "ETag": artifact.etag,
+        "Accept-Ranges": "bytes",
+        # 주소가 내용 해시이므로 같은 URL 의 내용은 바뀌지 않음
+        "Cache-Control": "public, max-age=31536000, immutable",
+    }
+    if _etag_matches(request_headers.get("if-none-match"), artifact.etag):
+        return Response(status_code=304, headers=headers)
+
+    # 같은 예측을 낸 모델이 여럿이면 파일 하나를 함께 쓰므로 처음 저장한 모델 이름은 넣지 않음
+    name = download_name or f"submission_{artifact.digest[:12]}.csv"
+    range_header = request_headers.get("range")
+    if_range = request_headers.get("if-range")
+    if range_header and (if_range is None or _etag_matches(if_range, artifact.etag)):
+        try:
+            byte_range = parse_range(range_header, artifact.size)
+        except ValueError:
+            return Response(status_code=416, headers={**headers, "Content-Range": f"bytes */{artifact.size}"})
+        if byte_range is not None:
+            start, end = byte_range
+            headers.update({
+                "Content-Range": f"bytes {start}-{end}/{artifact.size}",
+                "Content-Length": str(end - start + 1),
+                "Content-Disposition": f'attachment; filename="{name}"',
+            })
+            return StreamingResponse(_read_range(artifact.path, start, end), status_code=206,
+                                     media_type="text/csv", headers=headers)
+
+    return FileResponse(path=artifact.path, filename=name, media_type="text/csv", headers=headers)
@@ -0,0 +1,206 @@
+"""
+타이타닉 모델 하이퍼파라미터 탐색 (successive halving)
+
+모델 종류별 파라미터 그리드의 모든 조합을 적은 폴드로 먼저 평가하고,
+상위 1/eta 조합만 남겨 폴드 수를 늘려 가며 다시 평가합니다.
+마지막 단계에서는 남은 조합을 전체 폴드로 평가하여 최적 조합을 고릅니다.
+
+- 각 단계의 (모델, 파라미터, 폴드) 작업은 모델 종류 구분 없이 한꺼번에
+  프로세스 풀(titanic_cv.run_fold_tasks)에 넣어 모든 코어에서 실행
+- 폴드별 점수는 evaluate와 함께 쓰는 SQLite 저장소(titanic_cv.FoldScoreStore)에 저장하며,
+  같은 데이터/폴드 분할로 다시 탐색하면 이미 평가한 (모델 설정, 폴드)는 건너뛰므로
+  그리드를 넓혀도 새 조합만 계산
+"""
+import itertools
+import json
+import logging
+import math
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from app.titanic.titanic_cv import MODEL_SPECS, RESULT_ORDER, FoldScoreStore, estimator_key, run_fold_tasks
+
+logger = logging.getLogger(__name__)
+
+# 모델 종류별 기본 탐색 그리드 (random_state는 결과를 캐시할 수 있도록 고정)
+DEFAULT_GRIDS: Dict[str, Dict[str, List[Any]]] = {
+    "svm": {"C": [0.1, 1.0, 10.0, 100.0], "gamma": ["scale", 0.01, 0.1, 1.0]},
+    "random_forest": {"n_estimators": [13, 50, 100, 200], "max_depth": [None, 4, 6, 8],
+                      "min_samples_leaf": [1, 3], "random_state": [0]},
+    "knn": {"n_neighbors": [3, 5, 7, 9, 11, 13, 15, 19, 25], "weights": ["uniform", "distance"]},
+    "decision_tree": {"max_depth": [None, 3, 4, 5, 6, 8], "min_samples_leaf": [1, 2, 4, 8],
+                      "random_state": [0]},
+    "naive_bayes": {"var_smoothing": [1e-9, 1e-8, 1e-7, 1e-6, 1e-5]},
+    "logistic_regression": {"loss": ["log_loss"], "alpha": [1e-5, 1e-4, 1e-3, 1e-2],
+                            "penalty": ["l2", "l1"], "random_state": [0]},
+}
+
+# 리더보드에 남길 상위 조합 수
+LEADERBOARD_SIZE = 5
+
+
+def params_key(params: Dict[str, Any]) -> str:
+    """파라미터 조합의 저장 키 (키 순서와 무관)"""
+    return json.dumps(params, sort_keys=True)
+
+
+def expand_grid(model: str, grid: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """
+    파라미터 그리드를 조합 리스트로 펼침 (모델이 받지 않는 파라미터는 ValueError)
+
+    Args:
+        model: 모델 키 (MODEL_SPECS)
+        grid: 파라미터 이름 → 후보 값 리스트
+
+    Returns:
+        파라미터 딕셔너리 리스트
+    """
+    if model not in MODEL_SPECS:
+        raise ValueError(f"알 수 없는 모델입니다: {model} (사용 가능: {', '.join(MODEL_SPECS)})")
+    accepted = MODEL_SPECS[model][1]().get_params()
+    unknown = [name for name in grid if name not in accepted]
+    if unknown:
+        raise ValueError(f"{model} 모델이 받지 않는 파라미터입니다: {', '.join(unknown)}")
+    for name, values in grid.items():
+        if not isinstance(values, list) or not values:
+            raise ValueError(f"{model}.{name} 후보 값은 비어 있지 않은 리스트여야 합니다")
+
+    names = sorted(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*(grid[n] for n in names))]
+
+
+def rung_budgets(n_splits: int, min_folds: int, eta: int) -> List[int]:
+    """
+    단계별 폴드 수 (예: 10폴드, min_folds=2, eta=3 → [2, 6, 10])
+
+    Args:
+        n_splits: 전체 폴드 수
+        min_folds: 첫 단계 폴드 수
+        eta: 단계마다 남길 비율의 역수 (폴드 수 증가 배율)
+
+    Returns:
+        폴드 수 리스트
+    """
+    if eta < 2:
+        raise ValueError("eta는 2 이상이어야 합니다")
+    if not 1 <= min_folds <= n_splits:
+        raise ValueError(f"min_folds는 1 이상 {n_splits} 이하여야 합니다")
+    budgets = []
+    budget = min_folds
+    while budget < n_splits:
+        budgets.append(budget)
+        budget *= eta
+    budgets.append(n_splits)
+    return budgets
+
+
+def successive_halving(X: np.ndarray, y: np.ndarray, grids: Dict[str, Dict[str, List[Any]]],
+                       store: FoldScoreStore, data_key: str, n_splits: int = 10, random_state: int = 0,
+                       eta: int = 3, min_folds: int = 2,
+                       on_progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+    """
+    모델 종류별 successive halving 탐색
+
+    Args:
+        X: 피처 행렬
+        y: 라벨 배열
+        grids: 모델 키 → 파라미터 그리드
+        store: 폴드 점수 저장소
+        data_key: 저장소 데이터 키 (FoldScoreStore.data_key)
+        n_splits: 폴드 수
+        random_state: 폴드 셔플 시드
+        eta: 단계마다 상위 1/eta 조합만 남김
+        min_folds: 첫 단계 폴드 수
+        on_progress: 진행 이벤트를 받을 함수
+
+    Returns:
+        results(모델별 best_params, accuracy, fold_scores, leaderboard, rungs)와
+        budgets, wall_seconds 딕셔너리
+    """
+    started = time.time()
+    budgets = rung_budgets(n_splits, min_folds, eta)
+    candidates = {model: expand_grid(model, grid) for model, grid in grids.items()}
+    keys = {model: [estimator_key(model, params) for params in configs] for model, configs in candidates.items()}
+    scores = store.load(data_key)
+    alive = {model: list(range(len(configs))) for model, configs in candidates.items()}
+    failed: Dict[str, Dict[int, str]] = {model: {} for model in candidates}
+    history: Dict[str, List[Dict[str, Any]]] = {model: [] for model in candidates}
+
+    def mean_score(model: str, index: int, budget: int) -> float:
+        key = keys[model][index]
+        return float(np.mean([scores[(key, fold)] for fold in range(budget)]))
+
+    for rung, budget in enumerate(budgets):
+        last = rung == len(budgets) - 1
+        tasks = []
+        cached = {model: 0 for model in candidates}
+        for model, indices in alive.items():
+            for index in indices:
+                params, key = candidates[model][index], keys[model][index]
+                for fold in range(budget):
+                    if (key, fold) in scores:
+                        cached[model] += 1
+                    else:
+                        tasks.append((model, params, fold))
+
+        logger.info(f"[하이퍼파라미터 탐색] {rung + 1}단계: 폴드 {budget}개, "
+                    f"조합 {sum(len(v) for v in alive.values())}개, 새 작업 {len(tasks)}개")
+
+        def progress(cell: Dict[str, Any], rung=rung, budget=budget) -> None:
+            if on_progress is not None:
+                on_progress({**cell, "rung": rung, "rung_folds": budget})
+
+        cells = run_fold_tasks(X, y, tasks, n_splits, random_state, on_progress=progress)
+        store.save(data_key, cells)
+        for cell in cells:
+            key = estimator_key(cell["model"], cell["params"])
+            if "error" in cell:
+                for index, candidate_key in enumerate(keys[cell["model"]]):
+                    if candidate_key == key:
+                        failed[cell["model"]][index] = cell["error"]
+            else:
+                scores[(key, cell["fold"])] = cell["score"]
+
+        for model, indices in alive.items():
+            indices = [i for i in indices if i not in failed[model]]
+            # 점수 내림차순, 같은 점수는 그리드 순서
+            ranked = sorted(indices, key=lambda i: (-mean_score(model, i, budget), i))
+            keep = len(ranked) if last else max(1, math.ceil(len(ranked) / eta))
+            history[model].append({
+                "rung": rung,
+                "folds": budget,
+                "configs": len(indices),
+                "evaluated": sum(1 for m, _, _ in tasks if m == model),
+                "cached": cached[model],
+                "kept": keep,
+            })
+            alive[model] = ranked[:keep]
+
+    results = {}
+    for model in sorted(candidates, key=RESULT_ORDER.index):
+        ranked = alive[model]
+        if not ranked:
+            errors = sorted(set(failed[model].values()))
+            results[model] = {"status": f"error: {errors[0] if errors else '평가 가능한 조합이 없습니다'}"}
+            continue
+        best = ranked[0]
+        best_key = keys[model][best]
+        results[model] = {
+            "status": "success",
+            "best_params": candidates[model][best],
+            "accuracy": float(round(mean_score(model, best, n_splits) * 100, 2)),
+            "fold_scores": [round(scores[(best_key, fold)], 4) for fold in range(n_splits)],
+            "leaderboard": [
+                {"params": candidates[model][i], "accuracy": float(round(mean_score(model, i, n_splits) * 100, 2))}
+                for i in ranked[:LEADERBOARD_SIZE]
+            ],
+            "grid_size": len(candidates[model]),
+            "failed": len(failed[model]),
+            "rungs": history[model],
+        }
+        logger.info(f"  {MODEL_SPECS[model][0]} 최적 조합: {candidates[model][best]} "
+                    f"({results[model]['accuracy']}%)")
+
+    return {"results": results, "budgets": budgets, "wall_seconds": round(time.time() - started, 4)}
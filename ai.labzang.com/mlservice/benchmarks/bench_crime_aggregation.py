@@ -0,0 +1,138 @@
+"""
+자치구별 범죄 집계 벤치마크
+
+crime.csv 형식(천 단위 쉼표가 들어간 건수 문자열)의 가짜 전국/여러 해 관서 표를 만들어
+다음 두 방식의 집계 시간을 비교합니다.
+
+- iterrows: 기존 SeoulCrimeMapService/SeoulCrimeHeatmapService 방식 (행마다 parse_number 10회, dict 누적)
+- groupby: crime_aggregation.load_crime_table + aggregate_by_district
+
+두 결과(자치구별 발생/검거 건수, 검거율)가 다르면 종료 코드 1로 끝납니다.
+iterrows 는 --legacy-max-rows 보다 큰 표에서는 건너뜁니다.
+
+실행 (mlservice 폴더에서):
+    PYTHONPATH=..:. python benchmarks/bench_crime_aggregation.py
+    PYTHONPATH=..:. python benchmarks/bench_crime_aggregation.py --rows 1000 100000 1000000 --years 10
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.seoul_crime.crime_aggregation import (ARREST_COLUMNS, COUNT_COLUMNS, OCCURRENCE_COLUMNS,
+                                               aggregate_by_district, load_crime_table)
+
+
+def make_table(rows: int, years: int, seed: int) -> pd.DataFrame:
+    """관서별 범죄 통계 표 (건수는 쉼표가 들어간 문자열, 일부 칸은 비어 있음)"""
+    rng = np.random.default_rng(seed)
+    districts = np.array([f"시군구{i:03d}" for i in range(max(rows // (5 * years), 1))], dtype=object)
+    data: Dict[str, object] = {
+        "관서명": [f"관서{i}" for i in range(rows)],
+        "연도": rng.integers(2024 - years, 2024, rows),
+    }
+    for occurrence, arrest in zip(OCCURRENCE_COLUMNS, ARREST_COLUMNS):
+        counts = rng.integers(0, 5000, rows)
+        data[occurrence] = counts
+        data[arrest] = (counts * rng.uniform(0.3, 1.0, rows)).astype(np.int64)
+    df = pd.DataFrame(data)
+    for column in COUNT_COLUMNS:
+        df[column] = df[column].map("{:,}".format).astype(object)
+        df.loc[rng.random(rows) < 0.01, column] = ""
+    df["자치구"] = districts[rng.integers(0, len(districts), rows)]
+    df.loc[rng.random(rows) < 0.005, "자치구"] = None
+    return df
+
+
+def parse_number(value) -> int:
+    """기존 서비스의 parse_number"""
+    if pd.isna(value) or value == '':
+        return 0
+    if isinstance(value, (int, float)):
+        return int(value)
+    return int(str(value).replace(',', ''))
+
+
+def legacy_aggregate(path: Path) -> pd.DataFrame:
+    """기존 iterrows 집계 (SeoulCrimeMapService.aggregate_by_district)"""
+    crime_df = pd.read_csv(path, encoding='utf-8')
+    district_crimes: Dict[str, Dict[str, int]] = {}
+    for _, row in crime_df.iterrows():
+        district = row['자치구']
+        if pd.isna(district):
+            continue
+        total_crimes = sum(parse_number(row[column]) for column in OCCURRENCE_COLUMNS)
+        total_arrests = sum(parse_number(row[column]) for column in ARREST_COLUMNS)
+        if district not in district_crimes:
+            district_crimes[district] = {'범죄건수': 0, '검거건수': 0}
+        district_crimes[district]['범죄건수'] += total_crimes
+        district_crimes[district]['검거건수'] += total_arrests
+    data_list = []
+    for district, data in district_crimes.items():
+        crime_count, arrest_count = data['범죄건수'], data['검거건수']
+        data_list.append({'자치구': district, '범죄건수': crime_count, '검거건수': arrest_count,
+                          '검거율': (arrest_count / crime_count * 100) if crime_count > 0 else 0.0})
+    return pd.DataFrame(data_list)
+
+
+def vectorized_aggregate(path: Path) -> pd.DataFrame:
+    return aggregate_by_district(load_crime_table(path))[['자치구', '범죄건수', '검거건수', '검거율']]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 20000, 200000])
+    parser.add_argument("--years", type=int, default=5, help="연도 수 (연도별 집계도 함께 측정)")
+    parser.add_argument("--legacy-max-rows", type=int, default=50000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    failures = 0
+    print(f"{'rows':>9} {'districts':>9} {'iterrows':>10} {'groupby':>10} {'연도별':>10} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in args.rows:
+            path = Path(tmp) / f"crime_{rows}.csv"
+            make_table(rows, args.years, args.seed).to_csv(path, index=False)
+
+            t0 = time.perf_counter()
+            result = vectorized_aggregate(path)
+            vectorized_s = time.perf_counter() - t0
+
+            t0 = time.perf_counter()
+            by_year = aggregate_by_district(load_crime_table(path), by=["연도", "자치구"])
+            by_year_s = time.perf_counter() - t0
+            totals = by_year.groupby("자치구", sort=False)[["범죄건수", "검거건수"]].sum()
+            if not (totals.loc[result["자치구"]].to_numpy() == result[["범죄건수", "검거건수"]].to_numpy()).all():
+                print(f"{rows}행: 연도별 합계가 자치구 합계와 다름", file=sys.stderr)
+                failures += 1
+
+            legacy: List[str] = ["-", "-"]
+            if rows <= args.legacy_max_rows:
+                t0 = time.perf_counter()
+                expected = legacy_aggregate(path)
+                legacy_s = time.perf_counter() - t0
+                legacy = [f"{legacy_s:.3f}s", f"{legacy_s / vectorized_s:.1f}x"]
+                try:
+                    pd.testing.assert_frame_equal(result.reset_index(drop=True), expected, check_dtype=False)
+                except AssertionError as e:
+                    print(f"{rows}행: 결과 불일치\n{e}", file=sys.stderr)
+                    failures += 1
+
+            print(f"{rows:>9} {len(result):>9} {legacy[0]:>10} {vectorized_s:>9.3f}s {by_year_s:>9.3f}s "
+                  f"{legacy[1]:>8}")
+
+    if failures:
+        print(f"결과 불일치: {failures}건", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+"""
+공유 범죄 데이터 저장소 벤치마크
+
+임시 폴더에 crime.csv 형식의 가짜 관서 표(--rows 행)를 만들고 CrimeDataRepository 로 다음을 측정합니다.
+
+- snapshot() 조회 지연 시간 (µs): 확인 간격 안 / 매번 파일 확인(check_interval=0)
+- 파일이 바뀐 뒤 다시 읽는 시간 (CSV 파싱 + 자치구 집계)
+- kr_/heatmap 서비스가 각자 읽던 방식 대비 메모리: 서비스 2개가 스냅샷 하나를 함께 사용
+
+두 서비스가 같은 스냅샷 객체를 사용하는지, publish()/외부 파일 교체 후 버전과 집계가 바뀌는지,
+스냅샷 배열에 쓰기가 막혀 있는지 확인하며 다르면 종료 코드 1로 끝납니다.
+
+실행 (mlservice 폴더에서):
+    PYTHONPATH=..:. python benchmarks/bench_crime_repository.py
+    PYTHONPATH=..:. python benchmarks/bench_crime_repository.py --rows 500000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import app.seoul_crime.crime_repository as crime_repository
+from app.seoul_crime.crime_aggregation import ARREST_COLUMNS, OCCURRENCE_COLUMNS, load_crime_table
+from app.seoul_crime.crime_repository import CrimeDataRepository
+
+
+def make_table(rows: int, seed: int) -> pd.DataFrame:
+    """관서별 범죄 통계 표 (자치구 25개)"""
+    rng = np.random.default_rng(seed)
+    data = {"관서명": [f"관서{i}" for i in range(rows)]}
+    for occurrence, arrest in zip(OCCURRENCE_COLUMNS, ARREST_COLUMNS):
+        counts = rng.integers(0, 5000, rows)
+        data[occurrence] = counts
+        data[arrest] = (counts * rng.uniform(0.3, 1.0, rows)).astype(np.int64)
+    data["자치구"] = np.array([f"자치구{i:02d}" for i in range(25)], dtype=object)[rng.integers(0, 25, rows)]
+    return pd.DataFrame(data)
+
+
+def median_us(fn, repeat: int) -> float:
+    fn()
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return float(np.median(times)) * 1e6
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    failures = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "crime.csv"
+        table = make_table(args.rows, args.seed)
+        table.to_csv(path, index=False, encoding="utf-8-sig")
+
+        repository = CrimeDataRepository(path, check_interval=1.0)
+        crime_repository._repository = repository
+        from app.heatmap.service import SeoulCrimeHeatmapService
+        from app.kr_.service import SeoulCrimeMapService
+
+        t0 = time.perf_counter()
+        first = repository.snapshot()
+        load_s = time.perf_counter() - t0
+
+        kr, heatmap = SeoulCrimeMapService(), SeoulCrimeHeatmapService()
+        kr.aggregate_by_district()
+        heatmap.get_heatmap_data()
+        if kr.crime_data is not heatmap.crime_data or kr.data_version != heatmap.data_version:
+            print("두 서비스가 같은 스냅샷을 사용하지 않음", file=sys.stderr)
+            failures += 1
+        try:
+            first.table.iloc[0, 1] = -1
+            print("스냅샷 배열에 쓰기가 막혀 있지 않음", file=sys.stderr)
+            failures += 1
+        except ValueError:
+            pass
+
+        cached_us = median_us(repository.snapshot, args.repeat)
+        repository.check_interval = 0
+        stat_us = median_us(repository.snapshot, args.repeat)
+
+        # 전처리 결과 저장 (publish) → 두 서비스 모두 새 버전
+        changed = table.copy()
+        changed[OCCURRENCE_COLUMNS[0]] += 1
+        t0 = time.perf_counter()
+        repository.publish(changed)
+        publish_s = time.perf_counter() - t0
+        expected = int(changed[OCCURRENCE_COLUMNS].to_numpy().sum())
+        for name, total in (("kr_", int(kr.aggregate_by_district()["범죄건수"].sum())),
+                            ("heatmap", int(heatmap.aggregate_by_district()["범죄"].sum()))):
+            if total != expected:
+                print(f"{name}: publish 후 합계 {total} != {expected}", file=sys.stderr)
+                failures += 1
+
+        # 다른 프로세스가 파일을 교체한 경우 (수정 시각 변경 감지)
+        other = Path(tmp) / "crime.new.csv"
+        table.to_csv(other, index=False, encoding="utf-8-sig")
+        os.replace(other, path)
+        t0 = time.perf_counter()
+        reloaded = repository.snapshot()
+        reload_s = time.perf_counter() - t0
+        if reloaded.version != first.version + 2 or heatmap.get_heatmap_data() is None \
+                or heatmap.data_version != reloaded.version:
+            print(f"외부 교체 후 버전 불일치: v{reloaded.version}, heatmap v{heatmap.data_version}", file=sys.stderr)
+            failures += 1
+
+        shared_mb = reloaded.table.memory_usage(deep=True).sum() / 1e6
+        separate_mb = 2 * load_crime_table(path).memory_usage(deep=True).sum() / 1e6
+
+    print(f"관서 {args.rows:,}개")
+    print(f"  {'첫 로드 (파싱 + 집계)':<28} {load_s * 1000:>9.1f}ms")
+    print(f"  {'snapshot() 확인 간격 안':<28} {cached_us:>9.2f}µs")
+    print(f"  {'snapshot() 매번 stat':<28} {stat_us:>9.2f}µs")
+    print(f"  {'publish (저장 + 다시 읽기)':<28} {publish_s * 1000:>9.1f}ms")
+    print(f"  {'외부 교체 후 다시 읽기':<28} {reload_s * 1000:>9.1f}ms")
+    print(f"  {'메모리 (서비스 2개)':<28} 공유 {shared_mb:.1f}MB / 각자 {separate_mb:.1f}MB")
+
+    if failures:
+        print(f"결과 불일치: {failures}건", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
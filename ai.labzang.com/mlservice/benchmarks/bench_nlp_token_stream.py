@@ -0,0 +1,100 @@
+"""
+토큰 리스트 스트리밍 파서 벤치마크
+
+{"tokens": [...], ...} 본문을 여러 조각 크기로 나누어 TokenStreamParser 에 넣고
+json.loads 결과와 같은지, 처리 속도(MB/s)가 어떤지 확인합니다.
+
+- 조각 크기 1/7/64KB: 토큰, 옵션이 json.loads 와 같아야 함
+- 끝나지 않은 긴 문자열(--pending-mb): 최대 길이(MAX_PENDING_CHARS)를 넘는 즉시 ValueError
+- 최대 길이보다 약간 짧은 문자열 토큰을 4KB 조각으로: 조각마다 다시 디코딩하지 않으므로 본문 길이에 비례
+
+결과가 다르거나 긴 값 처리가 --max-seconds 를 넘으면 종료 코드 1로 끝납니다.
+
+실행 (mlservice 폴더에서):
+    PYTHONPATH=..:. python benchmarks/bench_nlp_token_stream.py
+    PYTHONPATH=..:. python benchmarks/bench_nlp_token_stream.py --tokens 1000000 --pending-mb 64
+"""
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.nlp.emma.token_stream import MAX_PENDING_CHARS, TokenStreamParser
+
+
+def parse(body: str, chunk: int) -> Tuple[List[Any], dict]:
+    parser = TokenStreamParser()
+    tokens = []
+    for i in range(0, len(body), chunk):
+        tokens.extend(parser.feed(body[i:i + chunk]))
+    tokens.extend(parser.feed("", eof=True))
+    return tokens, parser.options
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tokens", type=int, default=200000)
+    parser.add_argument("--pending-mb", type=int, default=64, help="끝나지 않은 문자열 본문 크기 (MB)")
+    parser.add_argument("--max-seconds", type=float, default=2.0, help="긴 값 하나 처리 허용 시간")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    words = ["the", "Emma", "Woodhouse", 'say "hi"', "back\\slash", "한글", 1, 2.5, -3e5, True, None]
+    tokens = [rng.choice(words) for _ in range(args.tokens)]
+    options = {"width": 800, "stopwords": ["Mr.", "Mrs."], "nested": {"a": ["]}", 1]}}
+    body = json.dumps({**options, "tokens": tokens}, ensure_ascii=False)
+
+    failures = 0
+    print(f"토큰 {args.tokens:,}개, 본문 {len(body) / 1e6:.1f}M자")
+    for chunk in (1, 7, 64 * 1024):
+        if chunk == 1 and len(body) > 2_000_000:
+            continue
+        t0 = time.perf_counter()
+        parsed, parsed_options = parse(body, chunk)
+        elapsed = time.perf_counter() - t0
+        if parsed != tokens or parsed_options != options:
+            print(f"조각 {chunk}: json.loads 결과와 다름", file=sys.stderr)
+            failures += 1
+        print(f"  {'chunk ' + str(chunk):<28} {elapsed:>8.3f}s {len(body) / 1e6 / elapsed:>8.1f} M자/s")
+
+    # 끝나지 않은 문자열: 최대 길이를 넘으면 바로 거절
+    pending = '{"tokens": ["' + "a" * (args.pending_mb << 20)
+    t0 = time.perf_counter()
+    try:
+        parse(pending, 64 * 1024)
+        print("끝나지 않은 긴 문자열이 거절되지 않음", file=sys.stderr)
+        failures += 1
+    except ValueError:
+        pass
+    rejected_s = time.perf_counter() - t0
+
+    # 최대 길이보다 짧은 긴 토큰: 조각마다 처음부터 다시 디코딩하지 않아야 함
+    long_token = "x" * (MAX_PENDING_CHARS - 100)
+    t0 = time.perf_counter()
+    parsed, _ = parse(json.dumps({"tokens": [long_token, "y"]}), 4096)
+    long_s = time.perf_counter() - t0
+    if parsed != [long_token, "y"]:
+        print("긴 토큰 파싱 결과가 다름", file=sys.stderr)
+        failures += 1
+
+    print(f"  {'unterminated ' + str(args.pending_mb) + 'MB':<28} {rejected_s:>8.3f}s (거절)")
+    print(f"  {'long token (4KB chunks)':<28} {long_s:>8.3f}s")
+    for name, elapsed in (("끝나지 않은 문자열", rejected_s), ("긴 토큰", long_s)):
+        if elapsed > args.max_seconds:
+            print(f"{name} 처리 시간 {elapsed:.2f}s > {args.max_seconds}s", file=sys.stderr)
+            failures += 1
+
+    if failures:
+        print(f"결과 불일치: {failures}건", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,213 @@
+"""
+카카오맵 지오코딩 클라이언트 벤치마크 (로컬 스텁 서버)
+
+카카오맵 keyword 검색 API 를 흉내 내는 로컬 HTTP 서버를 띄우고 (응답 지연, 429/500 비율 지정),
+crime.csv 의 경찰서 검색어를 다음 두 방식으로 조회하여 소요 시간을 비교합니다.
+
+- sequential: requests.Session 으로 한 건씩 조회 (기존 preprocess 방식)
+- async: AsyncGeocoder (연결 재사용, 동시 요청 수/초당 요청 수 제한, 429/5xx 재시도)
+
+async 결과가 입력 순서대로 스텁 서버의 기대 결과와 같은지, 초당 요청 수 제한을 지키는지 확인하며
+다르면 종료 코드 1로 끝납니다. 캐시를 채운 뒤 다시 조회하여 요청이 0건이고 캐시 사용 수가 고유 검색어 수와
+같은지, 서버가 큰 Retry-After(1시간)를 보내도 대기 시간이 max_retry_after 로 제한되는지도 확인합니다.
+
+실행 (mlservice 폴더에서):
+    PYTHONPATH=..:. python benchmarks/bench_seoul_geocode.py
+    PYTHONPATH=..:. python benchmarks/bench_seoul_geocode.py --latency 0.2 --error-rate 0.2 --rate-limit 10
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List
+from urllib.parse import parse_qs, urlparse
+
+import pandas as pd
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.seoul_crime.geocode_cache import GeocodeCache
+from app.seoul_crime.geocode_client import AsyncGeocoder, format_documents
+
+CRIME_PATH = Path(__file__).resolve().parent.parent / "app" / "seoul_crime" / "data" / "crime.csv"
+
+
+def stub_documents(query: str) -> List[Dict[str, Any]]:
+    """검색어로 정해지는 가짜 검색 결과 ("없음" 이 들어간 검색어는 결과 없음)"""
+    if "없음" in query:
+        return []
+    h = int(hashlib.sha1(query.encode("utf-8")).hexdigest()[:8], 16)
+    return [{
+        "place_name": query,
+        "address_name": f"서울 스텁{h % 25}구 스텁동 {h % 1000}",
+        "x": str(126.8 + (h % 4000) / 10000),
+        "y": str(37.4 + (h >> 12) % 3000 / 10000),
+        "address": {"region_1depth_name": "서울", "region_2depth_name": f"스텁{h % 25}구",
+                    "region_3depth_name": "스텁동"},
+    }]
+
+
+class StubServer:
+    """카카오맵 keyword 검색 스텁 서버 (요청 시각 기록)"""
+
+    def __init__(self, latency: float, error_rate: float, seed: int):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.retry_after = "0.05"
+        self.rng = random.Random(seed)
+        self.requests: List[float] = []
+        self.lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                with server.lock:
+                    server.requests.append(time.monotonic())
+                    roll = server.rng.random()
+                time.sleep(server.latency)
+                if roll < server.error_rate:
+                    status, body, headers = (429, b"{}", {"Retry-After": server.retry_after}) if roll < server.error_rate / 2 \
+                        else (500, b"{}", {})
+                else:
+                    query = parse_qs(urlparse(self.path).query).get("query", [""])[0].strip()
+                    status, headers = 200, {}
+                    body = json.dumps({"documents": stub_documents(query)}, ensure_ascii=False).encode("utf-8")
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def max_per_window(self, start: float, window: float = 1.0) -> int:
+        """start 이후 요청 중 임의의 window 초 구간에 들어간 최대 요청 수"""
+        times = sorted(t for t in self.requests if t >= start)
+        best, j = 0, 0
+        for i, t in enumerate(times):
+            while times[j] < t - window:
+                j += 1
+            best = max(best, i - j + 1)
+        return best
+
+    def close(self) -> None:
+        self.httpd.shutdown()
+
+
+def sequential(url: str, queries: List[str]) -> List[List[Dict[str, Any]]]:
+    """requests.Session 으로 한 건씩 조회 (오류이면 빈 결과)"""
+    session = requests.Session()
+    results = []
+    for query in queries:
+        response = session.get(f"{url}/search/keyword.json", params={"query": query}, timeout=5)
+        results.append(format_documents(query, response.json().get("documents", []))
+                       if response.status_code == 200 else [])
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency", type=float, default=0.1, help="스텁 서버 응답 지연 (초)")
+    parser.add_argument("--error-rate", type=float, default=0.1, help="429/500 응답 비율")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--rate-limit", type=float, default=20.0, help="초당 최대 요청 수")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    stations = pd.read_csv(CRIME_PATH)["관서명"]
+    queries = ["서울" + str(name[:-1]) + "경찰서" for name in stations]
+    # 결과 없음, 중복 검색어(정규화 기준 같은 검색어)도 포함
+    queries += ["서울없음경찰서", "  " + queries[0] + " "]
+    expected = [format_documents(q, stub_documents(q.strip())) for q in queries]
+
+    failures = 0
+    server = StubServer(args.latency, args.error_rate, args.seed)
+    try:
+        server.error_rate = 0.0
+        t0 = time.perf_counter()
+        sequential_results = sequential(server.url, queries)
+        sequential_s = time.perf_counter() - t0
+        server.error_rate = args.error_rate
+
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = GeocodeCache(Path(tmp) / "geocode.sqlite")
+            geocoder = AsyncGeocoder("stub-key", base_url=server.url, concurrency=args.concurrency,
+                                     rate_limit=args.rate_limit, cache=cache)
+            start = time.monotonic()
+            t0 = time.perf_counter()
+            results = asyncio.run(geocoder.geocode_many(queries))
+            async_s = time.perf_counter() - t0
+            peak = server.max_per_window(start)
+
+            cached = AsyncGeocoder(lambda: (_ for _ in ()).throw(RuntimeError("API 키가 필요하지 않아야 함")),
+                                   base_url=server.url, cache=cache)
+            t0 = time.perf_counter()
+            cached_results = asyncio.run(cached.geocode_many(queries))
+            cached_s = time.perf_counter() - t0
+
+        # 모든 요청이 429 + Retry-After 1시간 → max_retry_after(0.2초) 만큼만 기다린 뒤 실패해야 함
+        server.error_rate, server.retry_after = 2.0, "3600"
+        limited = AsyncGeocoder("stub-key", base_url=server.url, max_retries=2, max_retry_after=0.2)
+        t0 = time.perf_counter()
+        limited_results = asyncio.run(limited.geocode_many([queries[0]]))
+        limited_s = time.perf_counter() - t0
+    finally:
+        server.close()
+
+    if sequential_results != expected:
+        print("sequential 결과 불일치", file=sys.stderr)
+        failures += 1
+    if results != expected:
+        mismatched = sum(r != e for r, e in zip(results, expected))
+        print(f"async 결과 불일치: {mismatched}건 (재시도 한도를 넘은 실패 포함)", file=sys.stderr)
+        failures += 1
+    if cached_results != expected or cached.api_calls:
+        print(f"캐시 재조회 불일치 (요청 {cached.api_calls}회)", file=sys.stderr)
+        failures += 1
+    unique = len({q.strip().lower() for q in queries})
+    if cached.cache_hits != unique or geocoder.cache_hits:
+        print(f"캐시 사용 수 불일치: {cached.cache_hits}건 (고유 검색어 {unique}개), "
+              f"첫 조회 {geocoder.cache_hits}건", file=sys.stderr)
+        failures += 1
+    if limited_results != [[]] or limited.retries != 2 or limited_s > 2.0:
+        print(f"Retry-After 상한 미적용: {limited_s:.2f}초, 재시도 {limited.retries}회", file=sys.stderr)
+        failures += 1
+    # 토큰 버킷: 1초 구간에 최대 burst + rate 개
+    if args.rate_limit > 0 and peak > args.concurrency + args.rate_limit:
+        print(f"초당 요청 수 제한 위반: {peak}회/초", file=sys.stderr)
+        failures += 1
+
+    print(f"검색어 {len(queries)}개 (고유 {unique}개), 지연 {args.latency * 1000:.0f}ms, "
+          f"오류 비율 {args.error_rate:.0%}")
+    print(f"  {'sequential (오류 없음)':<24} {sequential_s:>7.2f}s  요청 {len(queries)}회")
+    print(f"  {'async':<24} {async_s:>7.2f}s  요청 {geocoder.api_calls}회, 재시도 {geocoder.retries}회, "
+          f"최대 {peak}회/초")
+    print(f"  {'async (캐시)':<24} {cached_s:>7.2f}s  요청 {cached.api_calls}회, 캐시 사용 {cached.cache_hits}건")
+    print(f"  {'Retry-After 3600':<24} {limited_s:>7.2f}s  요청 {limited.api_calls}회 (대기 상한 0.2초)")
+
+    if failures:
+        print(f"결과 불일치: {failures}건", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
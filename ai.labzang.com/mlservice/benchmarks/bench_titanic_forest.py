@@ -0,0 +1,92 @@
+"""
+랜덤 포레스트 추론 벤치마크
+
+RandomForestClassifier.predict_proba 와 FlatForest.predict_proba 를
+배치 크기별로 비교하고, 모든 배치에서 두 결과가 정확히 같은지 확인합니다.
+
+실행 (mlservice 폴더에서):
+    PYTHONPATH=..:. python benchmarks/bench_titanic_forest.py
+    PYTHONPATH=..:. python benchmarks/bench_titanic_forest.py --trees 13 100 --batches 1 10 1000
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestClassifier
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.titanic.titanic_forest import FlatForest
+from app.titanic.titanic_pipeline import TitanicPipeline
+from app.titanic.titanic_predict import PREDICT_FEATURES
+
+RESOURCES_DIR = Path(__file__).resolve().parent.parent / "app" / "resources" / "titanic"
+
+DEFAULT_BATCHES = [1, 10, 100, 1_000, 10_000, 100_000]
+DEFAULT_TREES = [13, 100]
+
+
+def load_features():
+    """train.csv를 전처리하여 (X, y) 반환"""
+    train = pd.read_csv(RESOURCES_DIR / "train.csv")
+    df = TitanicPipeline().fit_transform(train)
+    return df[PREDICT_FEATURES].astype(np.float64).to_numpy(), df["Survived"].to_numpy()
+
+
+def best_seconds(fn: Callable[[], object], min_time: float = 0.2, max_repeat: int = 1000) -> float:
+    """min_time 동안 반복 실행한 뒤 가장 빠른 1회 시간(초)"""
+    fn()
+    times: List[float] = []
+    started = time.perf_counter()
+    while len(times) < max_repeat and (len(times) < 3 or time.perf_counter() - started < min_time):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--trees", type=int, nargs="+", default=DEFAULT_TREES, help="트리 수 목록")
+    parser.add_argument("--batches", type=int, nargs="+", default=DEFAULT_BATCHES, help="배치 크기 목록")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    X, y = load_features()
+    rng = np.random.default_rng(args.seed)
+    mismatches = 0
+
+    print(f"{'trees':>5} {'batch':>7} {'sklearn_ms':>11} {'flat_ms':>9} {'speedup':>8} {'identical':>9}")
+    for n_trees in args.trees:
+        model = RandomForestClassifier(n_estimators=n_trees, random_state=args.seed).fit(X, y)
+        flat = FlatForest.from_sklearn(model)
+
+        # 중복 행이 없는 연속값 입력으로도 확인 (중복 제거를 거치지 않는 경로)
+        random_X = rng.uniform(X.min(axis=0) - 1, X.max(axis=0) + 1, size=(10_000, X.shape[1]))
+        if not np.array_equal(model.predict_proba(random_X), flat.predict_proba(random_X)):
+            print(f"연속값 입력 결과 불일치: trees={n_trees}", file=sys.stderr)
+            mismatches += 1
+
+        for batch in args.batches:
+            batch_X = X[rng.integers(0, len(X), size=batch)]
+
+            identical = np.array_equal(model.predict_proba(batch_X), flat.predict_proba(batch_X))
+            mismatches += not identical
+
+            sklearn_s = best_seconds(lambda: model.predict_proba(batch_X))
+            flat_s = best_seconds(lambda: flat.predict_proba(batch_X))
+            print(f"{n_trees:>5} {batch:>7} {sklearn_s * 1000:>11.3f} {flat_s * 1000:>9.3f} "
+                  f"{sklearn_s / flat_s:>7.1f}x {str(identical):>9}")
+
+    if mismatches:
+        print(f"결과 불일치: {mismatches}건", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,153 @@
+"""
+타이타닉 점진 학습(/titanic/learn) 안정성 점검
+
+임시 폴더의 저장소로 TitanicService 를 띄우고, 모델이 가장 확신하는 사망 승객과 같은 승객
+--batch 명을 생존(Survived=1)으로 한 번 학습시킨 뒤 partial_fit 모델의 예측 변화를 확인합니다.
+
+- 학습한 승객의 생존 확률 변화
+- train 전체 중 예측(0.5 기준)이 바뀐 승객 수와 partial_fit 소요 시간
+
+SGD 로지스틱 회귀는 학습 데이터로 맞춘 표준화와 평균 SGD 를 사용하므로 작은 배치 하나로는
+예측이 뒤집히지 않아야 합니다. 이어서 --rounds 번 더 학습한 뒤 모델 레지스트리의 버전 폴더가
+모델마다 현재 버전 + 최근 --keep-versions 개 이하로 유지되는지 확인합니다. (유예 시간 0)
+유예 시간을 두고 두 번 더 학습해도 다른 레지스트리 인스턴스(워커)가 들고 있던 이전 현재 버전은
+최근 버전 수와 관계없이 남아 있어 처음 사용할 때 로드할 수 있어야 합니다.
+학습 전에 읽어 둔 예측 상태(PredictorState)는 바뀌지 않아야 하고, 학습하는 동안 다른 스레드의
+predict_batch 요청은 오류 없이 응답해야 합니다.
+둘 중 하나라도 어긋나면 종료 코드 1로 끝납니다.
+
+실행 (mlservice 폴더에서):
+    PYTHONPATH=..:. python benchmarks/bench_titanic_learn.py
+    PYTHONPATH=..:. python benchmarks/bench_titanic_learn.py --batch 20 --max-flip-rate 0.01
+"""
+import argparse
+import json
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bench_titanic_pipeline import isolate_save_dirs
+
+# 예측이 뒤집히면 안 되는 모델 (naive_bayes 는 클래스별 평균/분산을 그대로 갱신하므로 참고용으로만 출력)
+CHECKED_MODELS = ("logistic_regression",)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch", type=int, default=50, help="한 번에 학습할 같은 승객 수")
+    parser.add_argument("--max-flip-rate", type=float, default=0.0, help="허용할 train 예측 변경 비율")
+    parser.add_argument("--rounds", type=int, default=5, help="보존 정책 확인용 추가 학습 횟수")
+    parser.add_argument("--keep-versions", type=int, default=2, help="모델별로 남길 최근 버전 수")
+    args = parser.parse_args()
+
+    failures = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        isolate_save_dirs(Path(tmp))
+        from app.titanic.titanic_learn import INCREMENTAL_MODELS
+        from app.titanic.titanic_predict import PREDICT_FEATURES
+        from app.titanic.titanic_score import INPUT_FIELDS
+        from app.titanic.titanic_service import TitanicService
+
+        service = TitanicService()
+        predictor = service._ensure_predictor()
+        train = service.preprocess_artifact.dataset.train
+        X = train[PREDICT_FEATURES].astype(np.float64).to_numpy()
+        before = predictor.predict_proba(X, list(INCREMENTAL_MODELS), engine="model")
+
+        raw_train = pd.read_csv(service._get_csv_path("train.csv"))
+        target = int(np.argmin(before["logistic_regression"]))
+        record = json.loads(raw_train.iloc[[target]].to_json(orient="records"))[0]
+        passenger = {k: v for k, v in record.items() if k in INPUT_FIELDS}
+        state = predictor.state
+        versions = dict(state.versions)
+        result = service.learn([{**passenger, "Survived": 1}] * args.batch)
+        if predictor.state is state or dict(state.versions) != versions:
+            print("학습 후 예측 상태가 새 객체로 교체되지 않음", file=sys.stderr)
+            failures += 1
+
+        after = predictor.predict_proba(X, list(INCREMENTAL_MODELS), engine="model")
+        print(f"승객 {target}번과 같은 승객 {args.batch}명을 생존으로 학습 (train {len(X)}명)")
+        print(f"  {'model':<22} {'p(before)':>10} {'p(after)':>10} {'flips':>7} {'partial_fit_ms':>15}")
+        for name in INCREMENTAL_MODELS:
+            flips = int(((before[name] > 0.5) != (after[name] > 0.5)).sum())
+            training_ms = result["updated"].get(name, {}).get("training_ms")
+            print(f"  {name:<22} {before[name][target]:>10.4f} {after[name][target]:>10.4f} "
+                  f"{flips:>7} {training_ms:>15}")
+            if name in CHECKED_MODELS and flips > args.max_flip_rate * len(X):
+                print(f"{name}: 배치 하나로 예측 {flips}건이 바뀜", file=sys.stderr)
+                failures += 1
+
+        # 보존 정책: /learn 마다 partial_fit + 재학습 버전이 등록되어도 버전 폴더 수가 유지되어야 함
+        service.registry.keep_versions = args.keep_versions
+        service.registry.grace_seconds = 0
+        stop = threading.Event()
+        errors = []
+        requests = [0]
+
+        def read_predictions():
+            batch = {field: [value] * 100 for field, value in passenger.items()}
+            while not stop.is_set():
+                try:
+                    service.predict_batch(batch, engine="auto")
+                    requests[0] += 1
+                except Exception as e:
+                    errors.append(repr(e))
+
+        reader = threading.Thread(target=read_predictions)
+        reader.start()
+        try:
+            for _ in range(args.rounds):
+                service.learn([{**passenger, "Survived": 0}])
+                service._refit_job.join()
+        finally:
+            stop.set()
+            reader.join()
+        print(f"추가 학습 중 예측 요청 {requests[0]}건, 오류 {len(errors)}건")
+        if errors:
+            print(f"학습 중 예측 요청 오류: {errors[:3]}", file=sys.stderr)
+            failures += 1
+        limit = args.keep_versions + 1
+        counts = {name: len(service.registry.versions(name)) for name in service.registry.names()}
+        print(f"추가 학습 {args.rounds}회 후 버전 수 (허용 {limit}): "
+              + ", ".join(f"{name}={count}" for name, count in counts.items()))
+        for name, count in counts.items():
+            directories = [p for p in (service.registry.root / "models" / name).iterdir()]
+            if count > limit or len(directories) != count:
+                print(f"{name}: 버전 {count}개, 폴더 {len(directories)}개가 남음", file=sys.stderr)
+                failures += 1
+            current = service.registry.current(name)
+            if current is None or current.estimator is None:
+                print(f"{name}: 현재 버전을 읽을 수 없음", file=sys.stderr)
+                failures += 1
+
+        # 유예 시간: 다른 워커가 들고 있는 이전 현재 버전은 최근 버전 수를 넘어도 남아 있어야 처음 사용할 때 로드됨
+        from app.titanic.titanic_registry import ModelRegistry
+        service.registry.keep_versions = 1
+        service.registry.grace_seconds = 3600
+        other = ModelRegistry(service.registry.root)
+        held = {name: other.current(name) for name in other.names()}
+        for _ in range(2):
+            service.learn([{**passenger, "Survived": 1}])
+            service._refit_job.join()
+        for name, entry in held.items():
+            try:
+                if entry is not None and entry.estimator is None:
+                    raise FileNotFoundError(entry.path)
+            except OSError as e:
+                print(f"{name}: 다른 워커가 들고 있던 버전 {entry.version} 을 로드할 수 없음 ({e})", file=sys.stderr)
+                failures += 1
+
+    if failures:
+        print(f"결과 불일치: {failures}건", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,150 @@
+"""
+승객 조회 저장소 벤치마크
+
+train.csv 와 합성 승객(행 수별)으로 PassengerStore 를 만들고, 필터 조합별 조회 지연 시간(µs)을
+측정합니다. 모든 조회는 커서로 끝까지 넘긴 결과(작은 저장소) 또는 첫 페이지(큰 저장소)를
+NumPy 전체 스캔 + 정렬 결과와 비교하여, 하나라도 다르면 종료 코드 1로 끝납니다.
+
+실행 (mlservice 폴더에서):
+    PYTHONPATH=..:. python benchmarks/bench_titanic_passengers.py
+    PYTHONPATH=..:. python benchmarks/bench_titanic_passengers.py --rows 1000000 --queries 200
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.titanic.titanic_passengers import AGE_LABELS, GENDER_MAPPING, PassengerStore
+from app.titanic.titanic_scale import synthesize
+
+RESOURCES_DIR = Path(__file__).resolve().parent.parent / "app" / "resources" / "titanic"
+
+DEFAULT_ROWS = [100_000, 1_000_000, 10_000_000]
+
+# 측정할 조회 종류
+CASES = {
+    "no filter / score desc": {"sort": "score", "descending": True},
+    "pclass=3 / fare": {"pclass": [3], "sort": "fare"},
+    "pclass=1 & female & Child / age": {"pclass": [1], "sex": ["female"], "age_band": ["Child"], "sort": "age"},
+    "fare 200~210 / passenger_id": {"fare_min": 200, "fare_max": 210},
+    "male & fare>=50 & survived / score": {"sex": ["male"], "fare_min": 50, "survived": 1, "sort": "score"},
+}
+
+
+def brute_force(store: PassengerStore, query: Dict[str, Any]) -> List[int]:
+    """전체 스캔 + 정렬로 구한 승객 번호 순서"""
+    mask = np.ones(store.rows, dtype=bool)
+    if query.get("pclass"):
+        mask &= np.isin(store.pclass, query["pclass"])
+    if query.get("sex"):
+        mask &= np.isin(store.sex, [GENDER_MAPPING[s] for s in query["sex"]])
+    if query.get("age_band"):
+        mask &= np.isin(store.age_band, [AGE_LABELS.index(a) for a in query["age_band"]])
+    if query.get("fare_min") is not None:
+        mask &= store.fare >= query["fare_min"]
+    if query.get("fare_max") is not None:
+        mask &= store.fare <= query["fare_max"]
+    if query.get("survived") is not None:
+        mask &= store.survived == query["survived"]
+    rows = np.flatnonzero(mask)
+    values = getattr(store, query.get("sort", "passenger_id"))[rows].astype(np.float64)
+    primary = -values if query.get("descending") else values
+    return store.passenger_id[rows[np.lexsort((store.passenger_id[rows], primary))]].tolist()
+
+
+def all_pages(store: PassengerStore, query: Dict[str, Any], limit: int) -> List[int]:
+    """커서로 마지막 페이지까지 넘긴 승객 번호"""
+    ids, cursor = [], None
+    while True:
+        page = store.query(**query, limit=limit, cursor=cursor)
+        ids += [p["PassengerId"] for p in page["passengers"]]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return ids
+
+
+def random_query(rng: random.Random) -> Dict[str, Any]:
+    query: Dict[str, Any] = {"sort": rng.choice(["passenger_id", "score", "fare", "age"]),
+                             "descending": rng.random() < 0.5}
+    if rng.random() < 0.5:
+        query["pclass"] = rng.sample([1, 2, 3], rng.randint(1, 2))
+    if rng.random() < 0.5:
+        query["sex"] = [rng.choice(["male", "female"])]
+    if rng.random() < 0.4:
+        query["age_band"] = rng.sample(AGE_LABELS, rng.randint(1, 3))
+    if rng.random() < 0.4:
+        query["fare_min"] = rng.choice([0, 7.925, 10, 30])
+        query["fare_max"] = rng.choice([None, 15, 100, 600])
+        if query["fare_max"] is not None and query["fare_min"] > query["fare_max"]:
+            query["fare_max"] = None
+    if rng.random() < 0.2:
+        query["survived"] = rng.choice([0, 1])
+    return query
+
+
+def median_us(fn, repeat: int = 200) -> float:
+    fn()
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return float(np.median(times)) * 1e6
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=DEFAULT_ROWS, help="합성 승객 수 목록")
+    parser.add_argument("--queries", type=int, default=100, help="결과를 확인할 무작위 조회 수")
+    parser.add_argument("--limit", type=int, default=20, help="페이지 크기")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    mismatches = 0
+    stores = [("train.csv", lambda: PassengerStore.from_csv(RESOURCES_DIR / "train.csv"))]
+    stores += [(f"{rows:,}", lambda rows=rows: PassengerStore.from_frames(synthesize(rows, seed=args.seed)))
+               for rows in args.rows]
+
+    for label, build in stores:
+        t0 = time.perf_counter()
+        store = build()
+        build_s = time.perf_counter() - t0
+        print(f"\n[{label}] {store.rows:,}명, 적재 {build_s:.2f}초")
+
+        for _ in range(args.queries):
+            query = random_query(rng)
+            expected = brute_force(store, query)
+            if store.rows <= 100_000:
+                got = all_pages(store, query, rng.choice([1, 7, args.limit, 1000]))
+            else:
+                got = [p["PassengerId"] for p in store.query(**query, limit=args.limit)["passengers"]]
+                expected = expected[:args.limit]
+            if got != expected:
+                mismatches += 1
+                print(f"  결과 불일치: {query}", file=sys.stderr)
+
+        print(f"  {'query':<38} {'first_page_us':>13} {'next_page_us':>12}")
+        for name, query in CASES.items():
+            first = store.query(**query, limit=args.limit)
+            first_us = median_us(lambda: store.query(**query, limit=args.limit))
+            cursor = first["next_cursor"]
+            next_us = median_us(lambda: store.query(**query, limit=args.limit, cursor=cursor)) if cursor else float("nan")
+            print(f"  {name:<38} {first_us:>13.1f} {next_us:>12.1f}")
+        extremes_us = median_us(lambda: store.extremes(10, pclass=[2]))
+        print(f"  {'extremes k=10 (pclass=2)':<38} {extremes_us:>13.1f}")
+
+    if mismatches:
+        print(f"결과 불일치: {mismatches}건", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
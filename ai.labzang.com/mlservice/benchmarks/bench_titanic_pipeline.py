@@ -0,0 +1,451 @@
+"""
+타이타닉 파이프라인 종단 간 벤치마크
+
+데이터셋(번들 train/test.csv, 합성 승객 배율별) × 구현(titanic_service / 기존 service.py) 마다
+파이프라인 단계와 엔드포인트의 실제 소요 시간(wall), CPU 시간, 최대 RSS 를 측정하고
+기준선 파일과 비교합니다. 허용 범위를 넘는 회귀가 있으면 종료 코드 1로 끝납니다.
+
+- 측정 단위마다 별도 프로세스를 띄우고 app/titanic/save 아래 저장소(전처리 산출물, 폴드 점수,
+  모델 레지스트리, 제출 파일 등)를 임시 폴더로 돌려 두므로 항상 빈 저장소에서 시작 (cold)
+- 같은 단계를 한 번 더 호출한 값도 기록 (warm: 디스크/메모리 캐시 재사용 경로)
+- 엔드포인트는 TestClient 로 같은 프로세스 안에서 호출 (evaluate/submit 은 wait=true)
+- CPU 시간과 RSS 는 교차 검증 프로세스 풀 같은 자식 프로세스를 포함 (/proc 이 없으면 자기 프로세스만)
+- 기존 구현(service.py)은 app/titanic/*.csv 를 직접 읽으므로 번들 데이터에서만 측정하며,
+  import 할 수 없는 환경(datasets 미설치 등)에서는 이유와 함께 건너뜀
+- 반복 측정값은 wall/CPU 는 중앙값, RSS 는 최대값으로 기록
+
+기준선 파일(JSON)에는 측정값과 함께 허용 범위(tolerance)가 저장되며, 명령행에서 덮어쓸 수 있습니다.
+기준선 파일이 없으면 측정하지 않고 종료 코드 1로 끝납니다 (--update-baseline 으로 먼저 저장).
+회귀 판정: 현재 값 > 기준값 × (1 + 허용 비율) 이고 차이가 최소 차이(잡음 하한)보다 클 때
+
+실행 (mlservice 폴더에서):
+    PYTHONPATH=..:. python benchmarks/bench_titanic_pipeline.py --update-baseline
+    PYTHONPATH=..:. python benchmarks/bench_titanic_pipeline.py
+    PYTHONPATH=..:. python benchmarks/bench_titanic_pipeline.py --scales 2000 20000 --repeat 3 --tolerance 0.3
+"""
+import argparse
+import glob
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+RESOURCES_DIR = Path(__file__).resolve().parent.parent / "app" / "resources" / "titanic"
+BASELINE_PATH = Path(__file__).resolve().parent / "baselines" / "titanic_pipeline.json"
+
+DEFAULT_SCALES = [5_000]
+IMPLEMENTATIONS = ["titanic_service", "legacy_service"]
+MODES = ["stages", "endpoints"]
+
+# 기본 허용 범위 (비율, 최소 차이)
+DEFAULT_TOLERANCE = {
+    "wall_s": {"ratio": 0.5, "min_delta": 0.05},
+    "cpu_s": {"ratio": 0.5, "min_delta": 0.05},
+    "peak_rss_mb": {"ratio": 0.25, "min_delta": 20.0},
+}
+
+# 엔드포인트 측정에 쓰는 승객
+PASSENGER = {"Pclass": 3, "Sex": "male", "Name": "Braund, Mr. Owen Harris", "Age": 22, "Fare": 7.25,
+             "Embarked": "S"}
+
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+HAS_PROC = Path("/proc/self/stat").exists()
+
+
+# ***********
+# 측정
+# ***********
+
+def _children() -> List[int]:
+    """현재 프로세스의 살아 있는 자식 프로세스 번호 (모든 스레드 기준)"""
+    pids: List[int] = []
+    for path in glob.glob("/proc/self/task/*/children"):
+        try:
+            pids += [int(pid) for pid in Path(path).read_text().split()]
+        except OSError:
+            continue
+    return pids
+
+
+def _proc_cpu(pid: int) -> float:
+    try:
+        # comm 에 공백이 있을 수 있으므로 마지막 ')' 뒤부터 분리 (utime, stime 은 14, 15번째 필드)
+        fields = Path(f"/proc/{pid}/stat").read_text().rsplit(")", 1)[1].split()
+        return (int(fields[11]) + int(fields[12])) / CLOCK_TICKS
+    except (OSError, IndexError, ValueError):
+        return 0.0
+
+
+def _proc_rss(pid: str) -> int:
+    try:
+        return int(Path(f"/proc/{pid}/statm").read_text().split()[1]) * PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        return 0
+
+
+def cpu_seconds() -> Dict[int, float]:
+    """자기 프로세스(키 0), 회수된 자식(키 -1), 살아 있는 자식별 누적 CPU 시간"""
+    times = os.times()
+    cpu = {0: time.process_time(), -1: times.children_user + times.children_system}
+    if HAS_PROC:
+        cpu.update({pid: _proc_cpu(pid) for pid in _children()})
+    return cpu
+
+
+def rss_bytes() -> int:
+    """자기 프로세스와 살아 있는 자식 프로세스의 RSS 합계"""
+    if not HAS_PROC:
+        return int(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024)
+    return _proc_rss("self") + sum(_proc_rss(str(pid)) for pid in _children())
+
+
+class Meter:
+    """
+    구간 하나의 wall/CPU/최대 RSS 측정
+
+    RSS 는 백그라운드 스레드가 interval 초마다 읽은 값의 최대값입니다.
+    """
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.result: Dict[str, float] = {}
+        self._stop = threading.Event()
+        self._peak = 0
+
+    def _sample(self) -> None:
+        while not self._stop.is_set():
+            self._peak = max(self._peak, rss_bytes())
+            self._stop.wait(self.interval)
+
+    def __enter__(self) -> "Meter":
+        self._peak = rss_bytes()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+        self._cpu = cpu_seconds()
+        self._t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        wall = time.perf_counter() - self._t0
+        cpu = cpu_seconds()
+        self._stop.set()
+        self._thread.join()
+        self._peak = max(self._peak, rss_bytes())
+        # 측정 중 생긴 자식은 0부터, 측정 중 끝난 자식은 마지막으로 읽은 값을 잃음
+        used = sum(value - self._cpu.get(key, 0.0) for key, value in cpu.items())
+        self.result = {"wall_s": round(wall, 4), "cpu_s": round(max(used, 0.0), 4),
+                       "peak_rss_mb": round(self._peak / 2 ** 20, 1)}
+
+
+def isolate_save_dirs(root: Path) -> None:
+    """app/titanic/save 아래 저장소 위치를 root 아래로 변경 (이 프로세스 안에서만)"""
+    from app.titanic import (titanic_columnar, titanic_cv, titanic_learn, titanic_pipeline,
+                             titanic_registry, titanic_submissions)
+    titanic_pipeline.ARTIFACT_DIR = root / "preprocess"
+    titanic_registry.REGISTRY_DIR = root / "registry"
+    titanic_cv.STORE_PATH = root / "cv" / "fold_scores.sqlite"
+    titanic_learn.LABELED_PATH = root / "learn" / "labeled.jsonl"
+    titanic_columnar.CACHE_DIR = root / "columnar"
+    titanic_submissions.STORE_DIR = root / "submissions"
+
+
+# ***********
+# 데이터셋
+# ***********
+
+def prepare_dataset(name: str, work_dir: Path, seed: int) -> Dict[str, Path]:
+    """
+    데이터셋 CSV 경로 준비
+
+    Args:
+        name: "bundled" 또는 "synthetic_<행 수>"
+        work_dir: 합성 CSV 저장 폴더
+        seed: 합성 난수 시드
+
+    Returns:
+        train, test 경로 딕셔너리
+    """
+    if name == "bundled":
+        return {"train": RESOURCES_DIR / "train.csv", "test": RESOURCES_DIR / "test.csv"}
+    from app.titanic.titanic_scale import synthesize
+
+    rows = int(name.split("_", 1)[1])
+    paths = {"train": work_dir / f"{name}_train.csv", "test": work_dir / f"{name}_test.csv"}
+    if not all(path.exists() for path in paths.values()):
+        train = pd.concat(synthesize(rows, seed=seed), ignore_index=True)
+        # test 는 train 의 절반 크기, 라벨 없이 PassengerId 를 이어서 부여 (원본 train/test 비율과 비슷)
+        test = pd.concat(synthesize(max(rows // 2, 1), seed=seed + 1), ignore_index=True)
+        test["PassengerId"] += rows
+        train.to_csv(paths["train"], index=False)
+        test.drop(columns=["Survived"]).to_csv(paths["test"], index=False)
+    return paths
+
+
+# ***********
+# 측정 단위 (자식 프로세스)
+# ***********
+
+def _timed(results: Dict[str, Any], name: str, fn: Callable[[], Any]) -> Any:
+    with Meter() as meter:
+        value = fn()
+    results[name] = meter.result
+    return value
+
+
+def _check(response, name: str) -> None:
+    if response.status_code != 200:
+        raise RuntimeError(f"{name}: HTTP {response.status_code} {response.text[:200]}")
+
+
+def run_current(mode: str, paths: Dict[str, Path]) -> Dict[str, Any]:
+    """titanic_service 구현 측정"""
+    from app.titanic.titanic_service import TitanicService
+
+    results: Dict[str, Any] = {}
+    service = _timed(results, "init", TitanicService)
+    service.train_csv_path, service.test_csv_path = paths["train"], paths["test"]
+
+    if mode == "stages":
+        for stage in ("preprocess", "evaluate", "submit"):
+            _timed(results, f"{stage}.cold", getattr(service, stage))
+            _timed(results, f"{stage}.warm", getattr(service, stage))
+        _timed(results, "predict.cold", lambda: service.predict(PASSENGER))
+        _timed(results, "predict.warm", lambda: service.predict(PASSENGER))
+        _timed(results, "query_passengers.cold", lambda: service.query_passengers(limit=20))
+        _timed(results, "query_passengers.warm", lambda: service.query_passengers(limit=20))
+        return results
+
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from app.titanic import titanic_router
+
+    titanic_router._service_instance = service
+    app = FastAPI()
+    app.include_router(titanic_router.router)
+    client = TestClient(app)
+    requests = {
+        "GET /titanic/preprocess": lambda: client.get("/titanic/preprocess"),
+        "GET /titanic/evaluate": lambda: client.get("/titanic/evaluate", params={"wait": True, "timeout": 86400}),
+        "GET /titanic/submit": lambda: client.get("/titanic/submit", params={"wait": True, "timeout": 86400}),
+        "POST /titanic/predict": lambda: client.post("/titanic/predict", json=PASSENGER),
+        "GET /titanic/passengers": lambda: client.get("/titanic/passengers", params={"limit": 20}),
+    }
+    for name, call in requests.items():
+        _check(_timed(results, f"{name}.cold", call), name)
+        if name in ("GET /titanic/evaluate", "GET /titanic/submit"):
+            # 완료된 작업이 재사용되지 않도록 작업 기록을 비운 뒤 다시 호출 (저장소 캐시 경로)
+            service.jobs = type(service.jobs)(max_workers=2)
+        _check(_timed(results, f"{name}.warm", call), name)
+    return results
+
+
+def run_legacy(mode: str, paths: Dict[str, Path]) -> Dict[str, Any]:
+    """기존 service.py 구현 측정 (paths 와 상관없이 app/titanic/train.csv, test.csv 를 읽음)"""
+    try:
+        from app.titanic import service as legacy
+    except Exception as e:
+        return {"skipped": f"기존 구현을 불러올 수 없습니다: {type(e).__name__}: {e}"}
+
+    results: Dict[str, Any] = {}
+    if mode == "stages":
+        service = _timed(results, "init", legacy.TitanicService)
+        for stage in ("preprocess", "modeling", "learning", "evaluate", "submit"):
+            _timed(results, f"{stage}.cold", getattr(service, stage))
+        _timed(results, "get_top_10_passengers.cold", legacy.get_top_10_passengers)
+        _timed(results, "get_top_10_passengers.warm", legacy.get_top_10_passengers)
+        return results
+
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from app.titanic import router as legacy_router
+
+    app = FastAPI()
+    app.include_router(legacy_router.router)
+    client = TestClient(app)
+    # 기존 라우터는 요청마다 새 서비스로 전처리부터 다시 실행
+    for path in ("/titanic/", "/titanic/survival-analysis", "/titanic/preprocess", "/titanic/evaluate",
+                 "/titanic/submit"):
+        _check(_timed(results, f"GET {path}.cold", lambda: client.get(path)), path)
+        _check(_timed(results, f"GET {path}.warm", lambda: client.get(path)), path)
+    return results
+
+
+def run_unit(implementation: str, mode: str, dataset: str, work_dir: Path, seed: int) -> Dict[str, Any]:
+    """측정 단위 하나 실행 (자식 프로세스에서 호출)"""
+    if implementation == "legacy_service" and dataset != "bundled":
+        return {"skipped": "기존 구현은 app/titanic/*.csv 만 읽으므로 번들 데이터에서만 측정"}
+    paths = prepare_dataset(dataset, work_dir, seed)
+    with tempfile.TemporaryDirectory(dir=work_dir) as save_dir:
+        isolate_save_dirs(Path(save_dir))
+        runner = run_current if implementation == "titanic_service" else run_legacy
+        return runner(mode, paths)
+
+
+def run_child(args: List[str]) -> Dict[str, Any]:
+    """이 스크립트를 자식 프로세스로 실행하여 마지막 줄의 JSON 결과 반환"""
+    completed = subprocess.run([sys.executable, __file__, *args], capture_output=True, text=True)
+    lines = completed.stdout.strip().splitlines()
+    if completed.returncode != 0 or not lines:
+        return {"error": (completed.stderr.strip().splitlines() or ["알 수 없는 오류"])[-1]}
+    return json.loads(lines[-1])
+
+
+# ***********
+# 집계 / 기준선 비교
+# ***********
+
+def aggregate(runs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """반복 측정 결과 묶기 (wall/CPU 중앙값, RSS 최대값)"""
+    if any("skipped" in run or "error" in run for run in runs):
+        return next(run for run in runs if "skipped" in run or "error" in run)
+    merged: Dict[str, Any] = {}
+    for name in runs[0]:
+        values = [run[name] for run in runs if name in run]
+        merged[name] = {
+            "wall_s": round(float(np.median([v["wall_s"] for v in values])), 4),
+            "cpu_s": round(float(np.median([v["cpu_s"] for v in values])), 4),
+            "peak_rss_mb": max(v["peak_rss_mb"] for v in values),
+        }
+    return merged
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any],
+            tolerance: Dict[str, Dict[str, float]]) -> List[str]:
+    """
+    기준선 대비 회귀 목록
+
+    Args:
+        current: 이번 측정 결과 (단위 키 → 단계 → 지표)
+        baseline: 기준선 측정 결과
+        tolerance: 지표 → {ratio, min_delta}
+
+    Returns:
+        회귀 설명 문자열 리스트
+    """
+    regressions = []
+    for unit, stages in current.items():
+        base_stages = baseline.get(unit)
+        if not isinstance(base_stages, dict) or "skipped" in stages or "error" in stages:
+            continue
+        for stage, metrics in stages.items():
+            base = base_stages.get(stage)
+            if not isinstance(base, dict):
+                continue
+            for metric, limit in tolerance.items():
+                if metric not in metrics or metric not in base:
+                    continue
+                allowed = base[metric] * (1 + limit["ratio"])
+                if metrics[metric] > allowed and metrics[metric] - base[metric] > limit["min_delta"]:
+                    regressions.append(f"{unit} {stage} {metric}: {base[metric]} → {metrics[metric]} "
+                                       f"(허용 {allowed:.4g})")
+    return regressions
+
+
+def print_table(results: Dict[str, Any], baseline: Dict[str, Any]) -> None:
+    print(f"  {'stage':<34} {'wall_s':>9} {'cpu_s':>9} {'rss_mb':>8} {'base_wall_s':>11} {'base_rss_mb':>11}")
+    for unit, stages in results.items():
+        print(f"\n[{unit}]")
+        if "skipped" in stages or "error" in stages:
+            print(f"  {'건너뜀' if 'skipped' in stages else '오류'}: {stages.get('skipped') or stages.get('error')}")
+            continue
+        base_stages = baseline.get(unit) if isinstance(baseline.get(unit), dict) else {}
+        for stage, m in stages.items():
+            base = base_stages.get(stage) or {}
+            print(f"  {stage:<34} {m['wall_s']:>9.3f} {m['cpu_s']:>9.3f} {m['peak_rss_mb']:>8.0f} "
+                  f"{base.get('wall_s', float('nan')):>11.3f} {base.get('peak_rss_mb', float('nan')):>11.0f}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", type=int, nargs="*", default=DEFAULT_SCALES,
+                        help="합성 train 행 수 목록 (test 는 절반, 빈 목록이면 번들 데이터만)")
+    parser.add_argument("--implementations", nargs="+", choices=IMPLEMENTATIONS, default=IMPLEMENTATIONS)
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=MODES)
+    parser.add_argument("--repeat", type=int, default=1, help="측정 단위별 반복 횟수 (매번 새 프로세스)")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="기준선 JSON 경로")
+    parser.add_argument("--update-baseline", action="store_true", help="이번 결과로 기준선 파일을 저장")
+    parser.add_argument("--tolerance", type=float, help="wall/CPU 허용 증가 비율 (기본값: 기준선 파일 설정)")
+    parser.add_argument("--memory-tolerance", type=float, help="RSS 허용 증가 비율 (기본값: 기준선 파일 설정)")
+    parser.add_argument("--output", type=Path, help="이번 결과를 저장할 JSON 경로")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--work-dir", type=Path, default=Path(tempfile.gettempdir()) / "titanic_pipeline_bench")
+    # 자식 프로세스용
+    parser.add_argument("--unit", nargs=3, metavar=("IMPLEMENTATION", "MODE", "DATASET"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    args.work_dir.mkdir(parents=True, exist_ok=True)
+    if args.unit:
+        implementation, mode, dataset = args.unit
+        print(json.dumps(run_unit(implementation, mode, dataset, args.work_dir, args.seed)))
+        return 0
+
+    if not args.baseline.exists() and not args.update_baseline:
+        # 비교할 기준이 없으면 회귀를 잡을 수 없으므로 통과로 처리하지 않음
+        print(f"기준선 파일이 없습니다 ({args.baseline}). --update-baseline 으로 먼저 저장하세요.", file=sys.stderr)
+        return 1
+    stored = json.loads(args.baseline.read_text(encoding="utf-8")) if args.baseline.exists() else {}
+    tolerance = {metric: dict(limit) for metric, limit in stored.get("tolerance", DEFAULT_TOLERANCE).items()}
+    if args.tolerance is not None:
+        tolerance["wall_s"]["ratio"] = tolerance["cpu_s"]["ratio"] = args.tolerance
+    if args.memory_tolerance is not None:
+        tolerance["peak_rss_mb"]["ratio"] = args.memory_tolerance
+
+    datasets = ["bundled"] + [f"synthetic_{rows}" for rows in args.scales]
+    results: Dict[str, Any] = {}
+    for dataset in datasets:
+        for implementation in args.implementations:
+            for mode in args.modes:
+                unit = f"{dataset}/{implementation}/{mode}"
+                print(f"측정 중: {unit}", file=sys.stderr)
+                runs = [run_child(["--unit", implementation, mode, dataset, "--seed", str(args.seed),
+                                   "--work-dir", str(args.work_dir)]) for _ in range(args.repeat)]
+                results[unit] = aggregate(runs)
+
+    print_table(results, stored.get("results", {}))
+    errors = [unit for unit, stages in results.items() if "error" in stages]
+    regressions = compare(results, stored.get("results", {}), tolerance)
+
+    report = {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "machine": {"python": platform.python_version(), "platform": platform.platform(),
+                    "cpu_count": os.cpu_count()},
+        "repeat": args.repeat,
+        "tolerance": tolerance,
+        "results": results,
+    }
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    if args.update_baseline:
+        if errors:
+            print(f"오류가 있어 기준선을 저장하지 않습니다: {', '.join(errors)}", file=sys.stderr)
+            return 1
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"\n기준선 저장: {args.baseline}")
+        return 0
+
+    if stored.get("machine", {}).get("platform") != platform.platform():
+        print(f"\n기준선과 측정 환경이 다릅니다: {stored['machine'].get('platform')}", file=sys.stderr)
+    for regression in regressions:
+        print(f"회귀: {regression}", file=sys.stderr)
+    for unit in errors:
+        print(f"오류: {unit}: {results[unit]['error']}", file=sys.stderr)
+    return 1 if regressions or errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
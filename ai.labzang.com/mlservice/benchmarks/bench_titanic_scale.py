@@ -0,0 +1,190 @@
+"""
+대용량 합성 타이타닉 데이터 청크 전처리 벤치마크
+
+행 수별로 합성 CSV 를 만든 뒤 ChunkedPreprocessor 의 1차(학습)/2차(int8 인코딩) 패스
+처리량(rows/s)과 최대 RSS 를 측정합니다. 최대 RSS 는 프로세스 전체 수명의 최대값이므로
+행 수마다 별도 프로세스에서 측정하며, CSV 생성도 따로 실행하여 측정에 섞이지 않게 합니다.
+--eager-max 이하 행 수는 CSV 전체를 읽어 TitanicPipeline.transform 하는 기존 방식도 함께 측정합니다.
+
+시작 전에 train.csv/test.csv 와 합성 데이터에서 청크 인코딩 결과가
+TitanicPipeline.transform 과 정확히 같은지 확인합니다 (다르면 종료 코드 1).
+
+실행 (mlservice 폴더에서):
+    PYTHONPATH=..:. python benchmarks/bench_titanic_scale.py
+    PYTHONPATH=..:. python benchmarks/bench_titanic_scale.py --rows 1000000 --cv
+"""
+import argparse
+import json
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.titanic.titanic_pipeline import TitanicPipeline
+from app.titanic.titanic_predict import PREDICT_FEATURES
+from app.titanic.titanic_scale import ChunkedPreprocessor, EncodedDataset, sampled_cv, synthesize, write_csv
+
+RESOURCES_DIR = Path(__file__).resolve().parent.parent / "app" / "resources" / "titanic"
+
+DEFAULT_ROWS = [1_000_000, 10_000_000, 50_000_000]
+DEFAULT_EAGER_MAX = 1_000_000
+
+
+def peak_rss_mb() -> float:
+    """현재 프로세스의 최대 RSS (MB, Linux 는 KB 단위로 반환)"""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def reference(train: pd.DataFrame, df: pd.DataFrame) -> np.ndarray:
+    """TitanicPipeline 으로 변환한 int8 피처 행렬"""
+    transformed = TitanicPipeline().fit(train).transform(df)
+    return transformed[PREDICT_FEATURES].to_numpy(dtype=np.float64).astype(np.int8)
+
+
+def check(work_dir: Path) -> int:
+    """청크 인코딩 결과와 TitanicPipeline.transform 비교 (불일치 건수 반환)"""
+    mismatches = 0
+    train = pd.read_csv(RESOURCES_DIR / "train.csv")
+    test = pd.read_csv(RESOURCES_DIR / "test.csv")
+
+    # 작은 청크로 나눠도 전체를 한 번에 변환한 결과와 같아야 함
+    preprocessor = ChunkedPreprocessor(chunk_size=100).fit(RESOURCES_DIR / "train.csv")
+    for name, df in (("train", train), ("test", test)):
+        dataset = preprocessor.transform(RESOURCES_DIR / f"{name}.csv", work_dir / f"check_{name}")
+        if not np.array_equal(np.asarray(dataset.X), reference(train, df)):
+            print(f"{name}.csv 인코딩 결과 불일치", file=sys.stderr)
+            mismatches += 1
+    if dataset.y is not None:
+        print("test.csv 에 라벨 파일이 생성됨", file=sys.stderr)
+        mismatches += 1
+
+    # 합성 데이터 (전체가 요금 표본에 들어가는 크기이므로 학습 상태도 같아야 함)
+    synthetic = pd.concat(synthesize(200_000, seed=1, chunk_size=30_000), ignore_index=True)
+    path = work_dir / "check_synthetic.csv"
+    synthetic.to_csv(path, index=False)
+    preprocessor = ChunkedPreprocessor(chunk_size=30_000)
+    dataset = preprocessor.fit_transform(path, work_dir / "check_synthetic")
+    if preprocessor.pipeline.state != TitanicPipeline().fit(synthetic).state:
+        print("합성 데이터 파이프라인 상태 불일치", file=sys.stderr)
+        mismatches += 1
+    if not np.array_equal(np.asarray(dataset.X), reference(synthetic, synthetic)) \
+            or not np.array_equal(np.asarray(dataset.y), synthetic["Survived"].to_numpy(dtype=np.int8)):
+        print("합성 데이터 인코딩 결과 불일치", file=sys.stderr)
+        mismatches += 1
+    return mismatches
+
+
+# ***********
+# 행 수별 측정 (별도 프로세스)
+# ***********
+
+def run_child(args: List[str]) -> Dict[str, Any]:
+    """이 스크립트를 자식 프로세스로 실행하여 마지막 줄의 JSON 결과 반환"""
+    completed = subprocess.run([sys.executable, __file__, *args], check=True, capture_output=True, text=True)
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def measure_chunked(csv_path: Path, out_dir: Path, chunk_size: int, cv: bool) -> Dict[str, Any]:
+    preprocessor = ChunkedPreprocessor(chunk_size=chunk_size)
+    t0 = time.perf_counter()
+    preprocessor.fit(csv_path)
+    t1 = time.perf_counter()
+    dataset = preprocessor.transform(csv_path, out_dir)
+    t2 = time.perf_counter()
+    result = {
+        "rows": dataset.rows,
+        "fit_seconds": round(t1 - t0, 3),
+        "transform_seconds": round(t2 - t1, 3),
+        "rows_per_second": round(dataset.rows / (t2 - t0)),
+        "encoded_mb": round((dataset.X.nbytes + dataset.y.nbytes) / 2 ** 20, 1),
+    }
+    if cv:
+        t3 = time.perf_counter()
+        result["cv"] = {model: {key: r.get(key) for key in ("accuracy", "ci95", "sample_rows", "fit_seconds")}
+                        for model, r in sampled_cv(EncodedDataset.open(out_dir))["results"].items()}
+        result["cv_seconds"] = round(time.perf_counter() - t3, 3)
+    result["peak_rss_mb"] = round(peak_rss_mb(), 1)
+    return result
+
+
+def measure_eager(csv_path: Path) -> Dict[str, Any]:
+    t0 = time.perf_counter()
+    df = pd.read_csv(csv_path)
+    transformed = TitanicPipeline().fit(df).transform(df)
+    X = transformed[PREDICT_FEATURES].to_numpy(dtype=np.float64)
+    seconds = time.perf_counter() - t0
+    return {"rows": len(X), "seconds": round(seconds, 3), "rows_per_second": round(len(X) / seconds),
+            "peak_rss_mb": round(peak_rss_mb(), 1)}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=DEFAULT_ROWS, help="행 수 목록")
+    parser.add_argument("--chunk-size", type=int, default=500_000)
+    parser.add_argument("--eager-max", type=int, default=DEFAULT_EAGER_MAX,
+                        help="전체 로드 방식도 측정할 최대 행 수 (0이면 측정하지 않음)")
+    parser.add_argument("--cv", action="store_true", help="표본 교차 검증도 측정")
+    parser.add_argument("--work-dir", type=Path, default=Path(tempfile.gettempdir()) / "titanic_scale")
+    parser.add_argument("--keep", action="store_true", help="합성 CSV 와 인코딩 결과를 지우지 않음")
+    # 자식 프로세스용
+    parser.add_argument("--generate", type=Path, help=argparse.SUPPRESS)
+    parser.add_argument("--chunked", type=Path, help=argparse.SUPPRESS)
+    parser.add_argument("--eager", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.generate:
+        t0 = time.perf_counter()
+        write_csv(args.generate, args.rows[0], chunk_size=args.chunk_size)
+        print(json.dumps({"seconds": round(time.perf_counter() - t0, 3)}))
+        return 0
+    if args.chunked:
+        print(json.dumps(measure_chunked(args.chunked, args.work_dir / f"encoded_{args.rows[0]}",
+                                         args.chunk_size, args.cv)))
+        return 0
+    if args.eager:
+        print(json.dumps(measure_eager(args.eager)))
+        return 0
+
+    args.work_dir.mkdir(parents=True, exist_ok=True)
+    mismatches = check(args.work_dir)
+    print(f"인코딩 일치 확인: {'실패' if mismatches else '통과'}")
+
+    print(f"{'rows':>11} {'gen_s':>7} {'fit_s':>7} {'enc_s':>7} {'rows/s':>10} {'rss_mb':>7} "
+          f"{'eager_rows/s':>12} {'eager_rss_mb':>12}")
+    for rows in args.rows:
+        csv_path = args.work_dir / f"synthetic_{rows}.csv"
+        common = ["--rows", str(rows), "--chunk-size", str(args.chunk_size), "--work-dir", str(args.work_dir)]
+        generated = run_child([*common, "--generate", str(csv_path)])
+        chunked = run_child([*common, "--chunked", str(csv_path), *(["--cv"] if args.cv else [])])
+        eager = run_child([*common, "--eager", str(csv_path)]) if rows <= args.eager_max else None
+        print(f"{rows:>11,} {generated['seconds']:>7.1f} {chunked['fit_seconds']:>7.1f} "
+              f"{chunked['transform_seconds']:>7.1f} {chunked['rows_per_second']:>10,} "
+              f"{chunked['peak_rss_mb']:>7.0f} "
+              f"{(format(eager['rows_per_second'], ',') if eager else '-'):>12} "
+              f"{(format(eager['peak_rss_mb'], '.0f') if eager else '-'):>12}")
+        for model, result in chunked.get("cv", {}).items():
+            print(f"{'':>11} cv {model}: {result['accuracy']}% ± {result['ci95']} "
+                  f"(표본 {result['sample_rows']:,}행, 학습 {result['fit_seconds']}초)")
+        if not args.keep:
+            csv_path.unlink(missing_ok=True)
+            shutil.rmtree(args.work_dir / f"encoded_{rows}", ignore_errors=True)
+
+    if not args.keep:
+        shutil.rmtree(args.work_dir, ignore_errors=True)
+    if mismatches:
+        print(f"결과 불일치: {mismatches}건", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,150 @@
+"""
+제출 파일 저장소 벤치마크
+
+임시 폴더의 SubmissionStore 로 제출 파일 저장(새 예측 / 같은 예측 재사용) 시간과
+다운로드 응답(전체, Range, If-None-Match) 지연 시간(µs)을 측정합니다.
+라우터는 app/main.py 와 같이 /titanic 아래에 마운트하고, 다운로드는 /submissions 응답의 download_url 을
+TestClient 로 호출합니다. 응답 본문/상태 코드가 파일 내용과 다르거나, 내려받는 파일 이름에 모델 이름이
+들어 있거나, 보존 정책이 지켜지지 않으면 종료 코드 1로 끝납니다.
+여러 저장소 인스턴스(다른 워커)가 같은 폴더에 동시에 저장하는 동안 새 저장소를 계속 만들어(시작 시 정리)
+저장한 파일이 하나라도 사라지면 역시 실패로 봅니다.
+
+실행 (mlservice 폴더에서):
+    PYTHONPATH=..:. python benchmarks/bench_titanic_submissions.py
+    PYTHONPATH=..:. python benchmarks/bench_titanic_submissions.py --rows 100000 --max-artifacts 5
+"""
+import argparse
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.titanic import titanic_router
+from app.titanic.titanic_submissions import SubmissionStore
+
+
+def median_us(fn, repeat: int) -> float:
+    fn()
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return float(np.median(times)) * 1e6
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=418, help="제출 파일 행 수 (test.csv 는 418)")
+    parser.add_argument("--max-artifacts", type=int, default=5, help="보존할 최대 파일 수")
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    failures = 0
+    ids = np.arange(892, 892 + args.rows)
+
+    with tempfile.TemporaryDirectory() as root:
+        store = SubmissionStore(Path(root), max_artifacts=args.max_artifacts)
+        predictions = [rng.integers(0, 2, args.rows) for _ in range(args.max_artifacts * 2)]
+
+        new_us = []
+        for values in predictions:
+            t0 = time.perf_counter()
+            store.put(ids, values, "svm")
+            new_us.append((time.perf_counter() - t0) * 1e6)
+        artifact, created = store.put(ids, predictions[-1], "svm")
+        reuse_us = median_us(lambda: store.put(ids, predictions[-1], "svm"), args.repeat)
+
+        files = len(list((Path(root) / "objects").iterdir()))
+        if created or files != args.max_artifacts or len(store.list()) != args.max_artifacts:
+            print(f"보존 정책 불일치: 파일 {files}개, 새로 씀={created}", file=sys.stderr)
+            failures += 1
+
+        # 다른 워커의 저장소가 동시에 저장하는 동안 새 저장소가 만들어져도 저장한 파일은 남아야 함
+        shared = Path(root) / "shared"
+        SubmissionStore(shared)
+        stop = threading.Event()
+        saved, errors = [], []
+
+        def write(worker: int):
+            writer = SubmissionStore(shared, max_artifacts=1000)
+            worker_rng = np.random.default_rng(args.seed + worker + 1)
+            for _ in range(20):
+                try:
+                    saved.append(writer.put(ids, worker_rng.integers(0, 2, args.rows), f"worker{worker}")[0])
+                except Exception as e:
+                    errors.append(repr(e))
+
+        def reconcile():
+            while not stop.is_set():
+                SubmissionStore(shared, max_artifacts=1000)
+
+        writers = [threading.Thread(target=write, args=(i,)) for i in range(4)]
+        cleaner = threading.Thread(target=reconcile)
+        cleaner.start()
+        for thread in writers:
+            thread.start()
+        for thread in writers:
+            thread.join()
+        stop.set()
+        cleaner.join()
+        lost = [a.digest for a in saved if not a.path.exists() or SubmissionStore(shared).get(a.digest) is None]
+        print(f"동시 저장 {len(saved)}건 (저장소 4개 + 정리 반복): 사라진 파일 {len(lost)}건, 오류 {len(errors)}건")
+        if lost or errors:
+            print(f"동시 저장 중 파일 손실: {lost[:3]} {errors[:3]}", file=sys.stderr)
+            failures += 1
+
+        service = titanic_router.get_service()
+        service.submissions = store
+        app = FastAPI()
+        # app/main.py 와 같은 마운트 경로 (라우터 prefix + 마운트 prefix)
+        app.include_router(titanic_router.router, prefix="/titanic")
+        client = TestClient(app)
+        submissions = client.get("/titanic/titanic/submissions").json()["data"]["submissions"]
+        listed = {item["digest"]: item for item in submissions}
+        download_url = listed.get(artifact.digest, {}).get("download_url")
+        if download_url != f"/titanic/titanic/download/{artifact.filename}":
+            print(f"다운로드 경로 불일치: {download_url}", file=sys.stderr)
+            failures += 1
+            download_url = f"/titanic/titanic/download/{artifact.filename}"
+        disposition = client.get(download_url).headers.get("content-disposition", "")
+        if artifact.model in disposition or artifact.digest[:12] not in disposition:
+            print(f"내려받는 파일 이름 불일치: {disposition}", file=sys.stderr)
+            failures += 1
+        body = artifact.path.read_bytes()
+        half = len(body) // 2
+        cases = {
+            "full (200)": ({}, 200, body),
+            "range first half (206)": ({"Range": f"bytes=0-{half - 1}"}, 206, body[:half]),
+            "range suffix 100 (206)": ({"Range": "bytes=-100"}, 206, body[-100:]),
+            "if-none-match (304)": ({"If-None-Match": artifact.etag}, 304, b""),
+        }
+
+        print(f"제출 파일 {args.rows:,}행, {len(body):,} bytes")
+        print(f"  {'put new (median)':<26} {np.median(new_us):>10.1f} us")
+        print(f"  {'put same predictions':<26} {reuse_us:>10.1f} us")
+        for name, (headers, status, expected) in cases.items():
+            response = client.get(download_url, headers=headers)
+            if response.status_code != status or response.content != expected:
+                print(f"다운로드 응답 불일치: {name} ({response.status_code})", file=sys.stderr)
+                failures += 1
+            elapsed = median_us(lambda: client.get(download_url, headers=headers), args.repeat)
+            print(f"  {'get ' + name:<26} {elapsed:>10.1f} us")
+
+    if failures:
+        print(f"결과 불일치: {failures}건", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())